@@ -0,0 +1,160 @@
+#!/usr/bin/env python
+"""Benchmark the REST execution backends: batch throughput and /health latency under load.
+
+Drives the real FastAPI app in-process with raw ASGI calls. Concurrent
+clients post JSON-array batches to /api/v1/calculate:batch while a probe
+calls /health; every backend (inline, thread, process) is measured with each
+worker count, so the process pool's scaling with cores shows directly.
+Requests shed with 503 (API_EXECUTION_MAX_QUEUE_DEPTH) are counted.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+from collections.abc import MutableMapping
+from pathlib import Path
+from typing import Any
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+os.environ.setdefault("TOOL_USAGE_LOGGING_ENABLED", "false")
+
+from src.infrastructure.api.execution import EXECUTION_BACKENDS, ExecutionBackend, ExecutionConfig  # noqa: E402
+from src.infrastructure.api.server import _ensure_app_state, app  # noqa: E402
+
+ROWS = [
+    {"tool_id": "sofa_score", "params": {"pao2_fio2_ratio": 250, "platelets": 90, "bilirubin": 2.5, "map_value": 65, "gcs_score": 13, "creatinine": 2.2}},
+    {"tool_id": "ckd_epi_2021", "params": {"serum_creatinine": 1.4, "age": 71, "sex": "female"}},
+    {
+        "tool_id": "news2_score",
+        "params": {
+            "respiratory_rate": 24,
+            "spo2": 93,
+            "on_supplemental_o2": True,
+            "temperature": 38.4,
+            "systolic_bp": 98,
+            "heart_rate": 118,
+            "consciousness": "A",
+        },
+    },
+    {"tool_id": "qsofa_score", "params": {"respiratory_rate": 24, "systolic_bp": 95, "altered_mentation": True}},
+]
+
+
+async def call(method: str, path: str, body: bytes = b"") -> tuple[int, bytes]:
+    """One request through the full ASGI stack; returns status and body."""
+    scope: dict[str, Any] = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"bench"), (b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())],
+        "client": ("127.0.0.1", 50000),
+        "server": ("bench", 80),
+    }
+    status = 0
+    chunks: list[bytes] = []
+    sent = False
+
+    async def receive() -> dict[str, Any]:
+        nonlocal sent
+        if sent:
+            await asyncio.sleep(3600)
+        sent = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message: MutableMapping[str, Any]) -> None:
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return status, b"".join(chunks)
+
+
+async def client(stop: asyncio.Event, body: bytes, rows: int, counts: dict[str, int]) -> None:
+    while not stop.is_set():
+        status, payload = await call("POST", "/api/v1/calculate:batch", body)
+        if status == 503:
+            counts["shed"] += 1
+            await asyncio.sleep(0.01)
+            continue
+        if status != 200 or payload.count(b"\n") != rows:
+            raise RuntimeError(f"batch failed with {status}")
+        counts["rows"] += rows
+
+
+async def probe(stop: asyncio.Event, latencies: list[float]) -> None:
+    while not stop.is_set():
+        started = time.perf_counter()
+        status, _ = await call("GET", "/health")
+        if status != 200:
+            raise RuntimeError(f"/health failed with {status}")
+        latencies.append((time.perf_counter() - started) * 1000)
+        await asyncio.sleep(0.01)
+
+
+async def run_once(config: ExecutionConfig, clients: int, batch_rows: int, duration: float) -> tuple[float, float, float, int]:
+    backend = ExecutionBackend(app.state.calculate_use_case, config)
+    backend.start()
+    app.state.execution_backend = backend
+    body = json.dumps([ROWS[i % len(ROWS)] for i in range(batch_rows)]).encode()
+    stop = asyncio.Event()
+    counts = {"rows": 0, "shed": 0}
+    latencies: list[float] = []
+    try:
+        tasks = [asyncio.create_task(client(stop, body, batch_rows, counts)) for _ in range(clients)]
+        tasks.append(asyncio.create_task(probe(stop, latencies)))
+        await asyncio.sleep(duration)
+        stop.set()
+        await asyncio.gather(*tasks)
+    finally:
+        backend.shutdown()
+    ordered = sorted(latencies) or [0.0]
+    return counts["rows"] / duration, statistics.median(ordered), ordered[min(len(ordered) - 1, int(0.99 * len(ordered)))], counts["shed"]
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="REST batch throughput and /health latency per execution backend and worker count")
+    parser.add_argument("--backends", nargs="+", default=list(EXECUTION_BACKENDS), choices=EXECUTION_BACKENDS)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8], help="Pool sizes to compare (ignored for inline).")
+    parser.add_argument("--clients", type=int, default=8, help="Concurrent batch clients.")
+    parser.add_argument("--batch-rows", type=int, default=100, help="Rows per batch request.")
+    parser.add_argument("--duration", type=float, default=5.0, help="Seconds per measurement.")
+    parser.add_argument("--max-queue-depth", type=int, default=256)
+    return parser
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    _ensure_app_state(app)
+    print(f"CPUs available: {os.cpu_count()}")
+    print(f"{'backend':<8} {'workers':>7} {'rows/s':>10} {'health_p50':>11} {'health_p99':>11} {'shed':>6}")
+    for backend in args.backends:
+        for workers in [1] if backend == "inline" else args.workers:
+            config = ExecutionConfig(backend=backend, max_workers=workers, max_queue_depth=args.max_queue_depth)
+            rps, p50, p99, shed = await run_once(config, args.clients, args.batch_rows, args.duration)
+            print(f"{backend:<8} {workers if backend != 'inline' else '-':>7} {rps:>10,.0f} {p50:>9.2f}ms {p99:>9.2f}ms {shed:>6}")
+
+
+def main() -> int:
+    asyncio.run(main_async(build_parser().parse_args()))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
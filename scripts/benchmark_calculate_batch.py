@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+"""Benchmark calculate_batch executors: batch wall time and p99 latency of concurrent calls."""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.application.use_cases import CalculateUseCase  # noqa: E402
+from src.domain.registry.tool_registry import ToolRegistry  # noqa: E402
+from src.domain.services.calculators import CALCULATORS  # noqa: E402
+from src.infrastructure.mcp.batch_executor import BatchExecutor  # noqa: E402
+from src.infrastructure.mcp.config import BATCH_EXECUTORS, BatchConfig  # noqa: E402
+
+PROBE_INTERVAL = 0.005
+
+
+def build_items(size: int) -> list[tuple[str, dict[str, Any]]]:
+    """Mixed unique items so deduplication does not hide the executor cost."""
+    items: list[tuple[str, dict[str, Any]]] = []
+    for i in range(size):
+        kind = i % 3
+        if kind == 0:
+            items.append(("ckd_epi_2021", {"age": 18 + i % 90, "sex": "female" if i % 2 else "male", "serum_creatinine": 0.5 + (i % 400) / 100}))
+        elif kind == 1:
+            items.append(("qsofa_score", {"respiratory_rate": 10 + i % 30, "systolic_bp": 70 + i % 80, "altered_mentation": bool(i % 2)}))
+        else:
+            items.append(("cockcroft_gault", {"age": 20 + i % 80, "weight_kg": 40 + i % 90, "creatinine_mg_dl": 0.6 + (i % 300) / 100, "sex": "male"}))
+    return items
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def run_once(executor: BatchExecutor, use_case: CalculateUseCase, items: list[tuple[str, dict[str, Any]]]) -> tuple[float, list[float]]:
+    """Run one batch while another session issues small calls on the same event loop."""
+    latencies: list[float] = []
+    done = asyncio.Event()
+
+    async def concurrent_session() -> None:
+        probe = [("qsofa_score", {"respiratory_rate": 24, "systolic_bp": 95, "altered_mentation": True})]
+        inline = BatchExecutor(use_case, BatchConfig(executor="inline"))
+        while not done.is_set():
+            # Latency is measured from when the call was due, so time spent
+            # waiting for a blocked event loop counts against the probe.
+            due = time.perf_counter() + PROBE_INTERVAL
+            await asyncio.sleep(PROBE_INTERVAL)
+            await inline.run(probe)
+            latencies.append((time.perf_counter() - due) * 1000)
+
+    session = asyncio.create_task(concurrent_session())
+    await asyncio.sleep(0)
+    started = time.perf_counter()
+    await executor.run(items)
+    elapsed = time.perf_counter() - started
+    done.set()
+    await session
+    return elapsed, latencies
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Benchmark calculate_batch executors")
+    parser.add_argument("--size", type=int, default=2000, help="Number of batch items.")
+    parser.add_argument("--workers", type=int, default=None, help="Worker pool size (default: BatchConfig default).")
+    parser.add_argument("--repeat", type=int, default=3, help="Repetitions per executor.")
+    parser.add_argument("--executors", nargs="+", default=list(BATCH_EXECUTORS), choices=BATCH_EXECUTORS)
+    return parser
+
+
+def main() -> int:
+    args = build_parser().parse_args()
+
+    registry = ToolRegistry()
+    for calculator_cls in CALCULATORS:
+        registry.register(calculator_cls())
+    use_case = CalculateUseCase(registry)
+    items = build_items(args.size)
+
+    print(f"{'executor':<10} {'batch_s':>9} {'items/s':>10} {'probe_p50_ms':>13} {'probe_p99_ms':>13}")
+    for name in args.executors:
+        config = BatchConfig(executor=name) if args.workers is None else BatchConfig(executor=name, max_workers=args.workers)
+        executor = BatchExecutor(use_case, config)
+        try:
+            asyncio.run(executor.run(items[:16]))  # warm the pool
+            timings: list[float] = []
+            latencies: list[float] = []
+            for _ in range(args.repeat):
+                elapsed, probe = asyncio.run(run_once(executor, use_case, items))
+                timings.append(elapsed)
+                latencies.extend(probe)
+        finally:
+            executor.shutdown()
+        batch_s = statistics.median(timings)
+        p50 = percentile(latencies, 50) if latencies else float("nan")
+        p99 = percentile(latencies, 99) if latencies else float("nan")
+        print(f"{name:<10} {batch_s:>9.3f} {args.size / batch_s:>10.0f} {p50:>13.2f} {p99:>13.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
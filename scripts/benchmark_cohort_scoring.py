@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+"""Benchmark `medcalc score`: a synthetic cohort file scored by several calculators.
+
+Generates a CSV (or reuses --input) with columns for ckd_epi_2021 (renal batch
+engine), phq2 (questionnaire batch engine) and qsofa_score (scalar engine),
+scores it with each worker count, and compares against the per-row
+CalculateUseCase.execute() loop the pipeline replaces (timed on a sample and
+extrapolated).
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.application.dto import CalculateRequest  # noqa: E402
+from src.application.use_cases import CalculateUseCase  # noqa: E402
+from src.infrastructure.cohort import build_registry, parse_text_value, score_file  # noqa: E402
+
+TOOLS = ("ckd_epi_2021", "phq2", "qsofa_score")
+COLUMNS = ("patient_id", "age", "sex", "creatinine", "interest_pleasure", "feeling_down", "respiratory_rate", "systolic_bp", "altered_mentation")
+ROW_PARAMS = {
+    "ckd_epi_2021": ("age", "sex", "creatinine"),
+    "phq2": ("interest_pleasure", "feeling_down"),
+    "qsofa_score": ("respiratory_rate", "systolic_bp", "altered_mentation"),
+}
+
+
+def write_cohort(path: Path, rows: int, seed: int = 0) -> None:
+    rng = random.Random(seed)
+    with open(path, "w", newline="") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(COLUMNS)
+        for index in range(rows):
+            writer.writerow(
+                (
+                    index,
+                    rng.randint(18, 95),
+                    rng.choice(("female", "male")),
+                    round(rng.uniform(0.4, 6.0), 2),
+                    rng.randint(0, 3),
+                    rng.randint(0, 3) if rng.random() > 0.01 else "",
+                    rng.randint(8, 40),
+                    rng.randint(60, 180),
+                    rng.choice(("true", "false")),
+                )
+            )
+
+
+def use_case_loop_seconds(path: Path, sample: int) -> float:
+    """Seconds per row for the CalculateUseCase loop, one execute() per tool per row."""
+    use_case = CalculateUseCase(build_registry())
+    with open(path, newline="") as handle:
+        rows = [row for _, row in zip(range(sample), csv.DictReader(handle), strict=False)]
+    started = time.perf_counter()
+    for row in rows:
+        for tool_id, names in ROW_PARAMS.items():
+            params = {name: parse_text_value(row[name]) for name in names}
+            use_case.execute(CalculateRequest(tool_id=tool_id, params={k: v for k, v in params.items() if v is not None}))
+    return (time.perf_counter() - started) / len(rows)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Throughput of medcalc score on a synthetic cohort")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Rows to generate.")
+    parser.add_argument("--input", type=Path, help="Existing cohort CSV (with the benchmark columns) instead of generating one.")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4], help="Worker counts to compare.")
+    parser.add_argument("--chunk-size", type=int, default=10_000)
+    parser.add_argument("--output-suffix", default=".csv", choices=(".csv", ".jsonl", ".parquet"))
+    parser.add_argument("--loop-sample", type=int, default=5_000, help="Rows timed through CalculateUseCase (0 to skip).")
+    return parser
+
+
+def main() -> int:
+    args = build_parser().parse_args()
+    with tempfile.TemporaryDirectory() as tmp:
+        source = args.input or Path(tmp) / "cohort.csv"
+        if args.input is None:
+            started = time.perf_counter()
+            write_cohort(source, args.rows)
+            print(f"generated {args.rows:,} rows in {time.perf_counter() - started:.1f}s")
+
+        rows = 0
+        print(f"{'workers':>7} {'seconds':>8} {'rows/s':>10}  row errors")
+        for workers in args.workers:
+            summary = score_file(source, Path(tmp) / f"scored{args.output_suffix}", TOOLS, chunk_size=args.chunk_size, workers=workers)
+            rows = summary.rows
+            errors = ", ".join(f"{tool}={count}" for tool, count in summary.errors.items())
+            print(f"{workers:>7} {summary.seconds:>8.2f} {summary.rows_per_second:>10,.0f}  {errors}")
+
+        if args.loop_sample:
+            per_row = use_case_loop_seconds(source, args.loop_sample)
+            print(f"CalculateUseCase loop: {per_row * 1e6:.0f} µs/row -> ~{per_row * rows:.0f}s for {rows:,} rows (sampled {args.loop_sample:,})")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
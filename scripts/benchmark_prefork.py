@@ -0,0 +1,173 @@
+#!/usr/bin/env python
+"""Benchmark pre-forked REST workers against independent single-process replicas.
+
+Starts the REST API twice on real sockets:
+
+    replicas  N independent ``python -m src.infrastructure.api.server``
+              processes (today's way to run N copies); each imports,
+              registers and indexes everything itself
+    prefork   one ``--workers N`` server; the parent warms up once and
+              forks N workers that share those structures copy-on-write
+
+For each mode it reports the wall time until every process answers /health,
+and per-process memory from /proc/<pid>/smaps_rollup after a short load of
+calculate and search requests: RSS (counts shared pages in every process),
+PSS (shared pages split between their users) and private (pages only that
+process has). Summed PSS is the real memory cost of the deployment.
+
+Linux only (/proc and os.fork).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import signal
+import socket
+import subprocess  # nosec B404
+import sys
+import time
+import urllib.request
+from pathlib import Path
+from typing import Any
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+REQUESTS = [
+    (
+        "/api/v1/calculate/sofa_score",
+        {"params": {"pao2_fio2_ratio": 250, "platelets": 90, "bilirubin": 2.5, "map_value": 65, "gcs_score": 13, "creatinine": 2.2}},
+    ),
+    ("/api/v1/calculate/ckd_epi_2021", {"params": {"serum_creatinine": 1.4, "age": 71, "sex": "female"}}),
+    ("/api/v1/calculate/qsofa_score", {"params": {"respiratory_rate": 24, "systolic_bp": 95, "altered_mentation": True}}),
+    ("/api/v1/search?q=sepsis", None),
+]
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return int(sock.getsockname()[1])
+
+
+def request(port: int, path: str, body: dict[str, Any] | None = None) -> int:
+    data = json.dumps(body).encode() if body is not None else None
+    req = urllib.request.Request(f"http://127.0.0.1:{port}{path}", data=data, headers={"content-type": "application/json"})
+    with urllib.request.urlopen(req, timeout=10) as response:  # nosec B310
+        response.read()
+        return int(response.status)
+
+
+def wait_healthy(port: int, timeout: float) -> None:
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            request(port, "/health")
+            return
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(0.02)
+
+
+def child_pids(pid: int) -> list[int]:
+    children = Path(f"/proc/{pid}/task/{pid}/children").read_text().split()
+    return [int(child) for child in children]
+
+
+def memory_kb(pid: int) -> dict[str, int]:
+    fields: dict[str, int] = {}
+    for line in Path(f"/proc/{pid}/smaps_rollup").read_text().splitlines()[1:]:
+        name, value = line.split(":", 1)
+        fields[name] = int(value.split()[0])
+    private = fields.get("Private_Clean", 0) + fields.get("Private_Dirty", 0)
+    return {"rss": fields["Rss"], "pss": fields["Pss"], "private": private}
+
+
+def start(port: int, workers: int | None) -> subprocess.Popen[bytes]:
+    command = [sys.executable, "-m", "src.infrastructure.api.server", "--host", "127.0.0.1", "--port", str(port)]
+    if workers is not None:
+        command += ["--workers", str(workers)]
+    env = {**os.environ, "TOOL_USAGE_LOGGING_ENABLED": "false"}
+    return subprocess.Popen(command, cwd=PROJECT_ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)  # nosec B603
+
+
+def load(port: int, rounds: int) -> None:
+    for _ in range(rounds):
+        for path, body in REQUESTS:
+            request(port, path, body)
+
+
+def run_replicas(workers: int, rounds: int, timeout: float) -> dict[str, Any]:
+    ports = [free_port() for _ in range(workers)]
+    started = time.perf_counter()
+    processes = [start(port, None) for port in ports]
+    try:
+        for port in ports:
+            wait_healthy(port, timeout)
+        startup = time.perf_counter() - started
+        for port in ports:
+            load(port, rounds)
+        return {"startup_s": startup, "processes": [memory_kb(process.pid) for process in processes]}
+    finally:
+        stop(processes)
+
+
+def run_prefork(workers: int, rounds: int, timeout: float) -> dict[str, Any]:
+    port = free_port()
+    started = time.perf_counter()
+    process = start(port, workers)
+    try:
+        wait_healthy(port, timeout)
+        deadline = time.monotonic() + timeout
+        while len(child_pids(process.pid)) < workers and time.monotonic() < deadline:
+            time.sleep(0.02)
+        startup = time.perf_counter() - started
+        # Fresh connections are spread over the workers by the kernel
+        load(port, rounds * workers)
+        pids = [process.pid, *child_pids(process.pid)]
+        return {"startup_s": startup, "processes": [memory_kb(pid) for pid in pids]}
+    finally:
+        stop([process])
+
+
+def stop(processes: list[subprocess.Popen[bytes]]) -> None:
+    for process in processes:
+        process.send_signal(signal.SIGTERM)
+    for process in processes:
+        try:
+            process.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+
+
+def report(name: str, result: dict[str, Any]) -> None:
+    processes = result["processes"]
+    print(f"\n{name}: ready in {result['startup_s']:.2f}s")
+    print(f"  {'process':<10}{'RSS MiB':>10}{'PSS MiB':>10}{'private MiB':>14}")
+    for index, memory in enumerate(processes):
+        label = "parent" if name == "prefork" and index == 0 else f"worker {index if name == 'prefork' else index + 1}"
+        print(f"  {label:<10}{memory['rss'] / 1024:>10.1f}{memory['pss'] / 1024:>10.1f}{memory['private'] / 1024:>14.1f}")
+    total = sum(memory["pss"] for memory in processes) / 1024
+    print(f"  {'total PSS':<10}{total:>10.1f} MiB")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, default=4, help="Workers / replicas to start (default: 4)")
+    parser.add_argument("--rounds", type=int, default=50, help="Request rounds per worker before measuring memory (default: 50)")
+    parser.add_argument("--timeout", type=float, default=60.0, help="Seconds to wait for startup (default: 60)")
+    args = parser.parse_args()
+
+    if not Path("/proc/self/smaps_rollup").exists():
+        raise SystemExit("This benchmark needs Linux /proc/<pid>/smaps_rollup")
+
+    print(f"REST API, {args.workers} workers, {args.rounds} request rounds per worker")
+    report("replicas", run_replicas(args.workers, args.rounds, args.timeout))
+    report("prefork", run_prefork(args.workers, args.rounds, args.timeout))
+
+
+if __name__ == "__main__":
+    main()
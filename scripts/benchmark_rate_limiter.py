@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+"""Benchmark RateLimiter contention: many threads hammering many client ids, by shard count
+(in-memory backend) or by lease size (SQLite backend)."""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.infrastructure.security.rate_limiter import DEFAULT_SHARDS, RateLimiter  # noqa: E402
+from src.infrastructure.security.sqlite_backend import SQLiteRateLimiterBackend  # noqa: E402
+
+
+def run_once(limiter: RateLimiter, client_ids: list[str], threads: int, calls_per_thread: int) -> float:
+    """Run ``threads`` workers that each check ``calls_per_thread`` random clients; returns wall seconds."""
+    barrier = threading.Barrier(threads + 1)
+    rng = random.Random(0)
+    schedules = [[client_ids[rng.randrange(len(client_ids))] for _ in range(calls_per_thread)] for _ in range(threads)]
+
+    def worker(schedule: list[str]) -> None:
+        is_allowed = limiter.is_allowed
+        barrier.wait()
+        for client_id in schedule:
+            is_allowed(client_id)
+
+    workers = [threading.Thread(target=worker, args=(schedule,)) for schedule in schedules]
+    for thread in workers:
+        thread.start()
+    barrier.wait()
+    started = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    return time.perf_counter() - started
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Benchmark RateLimiter under thread contention")
+    parser.add_argument("--threads", type=int, default=32, help="Concurrent worker threads.")
+    parser.add_argument("--clients", type=int, default=100_000, help="Distinct client ids.")
+    parser.add_argument("--calls", type=int, default=20_000, help="is_allowed() calls per thread.")
+    parser.add_argument("--repeat", type=int, default=3, help="Repetitions per shard count.")
+    parser.add_argument("--shards", type=int, nargs="+", default=[1, 8, DEFAULT_SHARDS], help="Shard counts to compare (1 = single global lock).")
+    parser.add_argument("--cleanup-interval", type=float, default=300.0, help="Timer-wheel span in seconds (e.g. 2 to include eviction churn).")
+    parser.add_argument("--backend", choices=("memory", "sqlite"), default="memory", help="Bucket storage to benchmark.")
+    parser.add_argument("--lease", type=int, nargs="+", default=[1, 4, 16], help="SQLite lease sizes to compare.")
+    return parser
+
+
+def build_limiter(args: argparse.Namespace, variant: int, directory: str) -> RateLimiter:
+    if args.backend == "sqlite":
+        backend = SQLiteRateLimiterBackend(f"{directory}/lease-{variant}.sqlite3", lease_size=variant, cleanup_interval=args.cleanup_interval)
+        return RateLimiter(requests_per_minute=600, burst=20, backend=backend)
+    return RateLimiter(requests_per_minute=600, burst=20, cleanup_interval=args.cleanup_interval, shards=variant)
+
+
+def main() -> int:
+    args = build_parser().parse_args()
+    client_ids = [f"10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}" for i in range(args.clients)]
+    total_calls = args.threads * args.calls
+
+    label, variants = ("lease", args.lease) if args.backend == "sqlite" else ("shards", args.shards)
+    print(f"{args.backend} backend: {args.threads} threads x {args.calls} calls over {args.clients} client ids")
+    print(f"{label:>6} {'wall_s':>8} {'calls/s':>11} {'clients_left':>13}")
+    with tempfile.TemporaryDirectory() as directory:
+        for variant in variants:
+            timings: list[float] = []
+            active = 0
+            for _ in range(args.repeat):
+                limiter = build_limiter(args, variant, directory)
+                limiter.reset()
+                timings.append(run_once(limiter, client_ids, args.threads, args.calls))
+                active = limiter.get_stats()["active_clients"]
+            wall = statistics.median(timings)
+            print(f"{variant:>6} {wall:>8.3f} {total_calls / wall:>11.0f} {active:>13}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+"""Build the discovery index snapshot shared by every process that builds a registry."""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.domain.registry.discovery_snapshot import (  # noqa: E402
+    DEFAULT_SNAPSHOT_PATH,
+    SNAPSHOT_ENV_VAR,
+    compute_snapshot_key,
+    default_snapshot_path,
+    read_snapshot_key,
+    write_discovery_snapshot,
+)
+from src.domain.registry.tool_registry import ToolRegistry  # noqa: E402
+from src.domain.services.calculators import CALCULATORS  # noqa: E402
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--output", type=Path, default=None, help="Snapshot path (default: MEDCALC_DISCOVERY_SNAPSHOT or build/discovery_snapshot.bin).")
+    parser.add_argument("--check", action="store_true", help="Exit with status 1 if the snapshot is missing or stale instead of building it.")
+    return parser
+
+
+def main() -> int:
+    args = build_parser().parse_args()
+    output = args.output or default_snapshot_path() or DEFAULT_SNAPSHOT_PATH
+
+    # Always build from scratch: never restore the indexes from an existing snapshot
+    os.environ[SNAPSHOT_ENV_VAR] = "off"
+    registry = ToolRegistry()
+    for calculator_cls in CALCULATORS:
+        registry.register(calculator_cls())
+
+    if args.check:
+        if read_snapshot_key(output) == compute_snapshot_key(registry):
+            print(f"Discovery snapshot is up to date: {output}")
+            return 0
+        print(f"Discovery snapshot is missing or stale: {output}. Run `uv run python scripts/build_discovery_snapshot.py`.")
+        return 1
+
+    started = time.perf_counter()
+    path = write_discovery_snapshot(registry.export_discovery_snapshot(), output)
+    elapsed = time.perf_counter() - started
+    print(f"Wrote {path} ({registry.count()} calculators, {path.stat().st_size / 1024:.0f} KiB) in {elapsed:.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
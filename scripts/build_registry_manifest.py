@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+"""Build the registry manifest used for fast (lazy-import) server cold start."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.domain.registry.manifest import (  # noqa: E402
+    build_registry_manifest,
+    default_manifest_path,
+    load_registry_manifest,
+    write_registry_manifest,
+)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--output", type=Path, default=None, help="Manifest path (default: MEDCALC_REGISTRY_MANIFEST or build/registry_manifest.pickle).")
+    parser.add_argument("--check", action="store_true", help="Exit with status 1 if the manifest is missing or stale instead of building it.")
+    return parser
+
+
+def main() -> int:
+    args = build_parser().parse_args()
+    output = args.output or default_manifest_path()
+
+    if args.check:
+        if load_registry_manifest(output) is not None:
+            print(f"Registry manifest is up to date: {output}")
+            return 0
+        print(f"Registry manifest is missing or stale: {output}. Run `uv run python scripts/build_registry_manifest.py`.")
+        return 1
+
+    started = time.perf_counter()
+    manifest = build_registry_manifest()
+    path = write_registry_manifest(manifest, output)
+    elapsed = time.perf_counter() - started
+    print(f"Wrote {path} ({len(manifest.metadata)} calculators, {path.stat().st_size / 1024:.0f} KiB) in {elapsed:.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
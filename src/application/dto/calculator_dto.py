@@ -16,10 +16,12 @@ class CalculateRequest:
     Attributes:
         tool_id: The calculator to use
         params: Dictionary of input parameters
+        debug_timings: Attach per-stage timings to component_scores["_timings"]
     """
 
     tool_id: str
     params: dict[str, Any]
+    debug_timings: bool = False
 
 
 @dataclass
@@ -4,10 +4,21 @@ Application Use Cases
 Use cases orchestrate application logic.
 """
 
-from .calculate_use_case import CalculateUseCase
+from .calculate_use_case import CalculateUseCase, ToolCallRecorder
+from .cohort_scoring_use_case import CohortScoringUseCase, ToolBinding
 from .discovery_use_case import DiscoveryUseCase
+from .patient_scoring_use_case import ALL_APPLICABLE, PatientScoringPlan, PatientScoringUseCase
+from .tool_schema_use_case import SerializedSchema, ToolSchemaUseCase
 
 __all__ = [
     "DiscoveryUseCase",
     "CalculateUseCase",
+    "ToolCallRecorder",
+    "CohortScoringUseCase",
+    "ToolBinding",
+    "PatientScoringUseCase",
+    "PatientScoringPlan",
+    "ALL_APPLICABLE",
+    "ToolSchemaUseCase",
+    "SerializedSchema",
 ]
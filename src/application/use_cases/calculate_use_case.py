@@ -1,6 +1,9 @@
 """Application layer use case for executing calculations with smart recovery hints."""
 
-from typing import Any
+import os
+import time
+from collections.abc import Iterable, Mapping
+from typing import Any, Optional, Protocol
 
 from ...domain.entities.score_result import ScoreResult
 from ...domain.registry.tool_registry import ToolRegistry
@@ -17,7 +20,9 @@ from ...domain.validation.boundaries import (
     ValidationSeverity,
     get_boundary_registry,
 )
-from ...shared.smart_input import ResolutionResult, resolve_identifier
+from ...shared.result_cache import ResultCache, canonical_key
+from ...shared.smart_input import ResolutionResult
+from ...shared.stage_timer import StageTimer
 from ..dto import (
     CalculateRequest,
     CalculateResponse,
@@ -26,6 +31,40 @@ from ..dto import (
 )
 
 
+class ToolCallRecorder(Protocol):
+    """Sink for per-call usage events (implemented by infrastructure's ToolUsageLogger)."""
+
+    def record_tool_call(
+        self,
+        tool_id: str,
+        param_names: Iterable[str],
+        *,
+        success: bool,
+        duration_ms: float,
+        category: str = "",
+        has_warnings: bool = False,
+        warning_types: Iterable[str] = (),
+        error_type: Optional[str] = None,
+        stage_durations_ms: Optional[Mapping[str, float]] = None,
+    ) -> None: ...
+
+
+# Error type recorded for a failed call, keyed by the error message prefix the response builders below use
+ERROR_TYPE_PREFIXES: tuple[tuple[str, str], ...] = (
+    ("Calculator '", "tool_not_found"),
+    ("No parameters provided", "empty_params"),
+    ("Validation error", "validation_error"),
+    ("Invalid parameters", "type_error"),
+    ("Calculation error", "calculation_error"),
+)
+
+# Stages timed by CalculateUseCase, in pipeline order (a failed call stops at the stage that rejected it)
+CALCULATE_STAGES: tuple[str, ...] = ("resolve", "match", "boundaries", "validate", "calculate", "to_response")
+
+# Enables stage timing for every call when CalculateUseCase(stage_timing=None)
+STAGE_TIMING_ENV_VAR = "CALCULATE_STAGE_TIMING"
+
+
 class CalculateUseCase:
     """
     Use case for executing medical calculations.
@@ -41,13 +80,51 @@ class CalculateUseCase:
     - Alias match: "cr" → "serum_creatinine"
     - Suffix match: "creatinine" → "serum_creatinine"
     - Fuzzy match: "creatnine" → "creatinine" (typo tolerance)
+
+    Usage logging:
+    - If a ToolCallRecorder is given, every call is recorded (tool, parameter
+      names, outcome, duration) after the response is built; the recorder
+      must not block (ToolUsageLogger only enqueues the event)
+
+    Stage timing (opt-in):
+    - With stage_timing enabled (or CALCULATE_STAGE_TIMING=true), each call
+      measures CALCULATE_STAGES with perf_counter_ns and passes them to the
+      recorder as stage_durations_ms; when disabled a call pays one
+      comparison per stage
+    - CalculateRequest(debug_timings=True) times that one request and also
+      attaches the stage durations (and "total") in milliseconds to
+      component_scores["_timings"]
+
+    Result cache (opt-in):
+    - With a ResultCache (or CALCULATE_RESULT_CACHE=true), successful results
+      of calculators with ``cacheable = True`` are memoized under the
+      resolved tool_id and a canonical hash of the matched parameters; a hit
+      skips boundary checks, validation, calculate() and response building.
+      Request-specific fields (_param_mapping, _tool_resolved_from, guidance,
+      _timings) are still added per call
     """
 
-    def __init__(self, registry: ToolRegistry):
+    def __init__(
+        self,
+        registry: ToolRegistry,
+        usage_logger: Optional[ToolCallRecorder] = None,
+        stage_timing: Optional[bool] = None,
+        result_cache: Optional[ResultCache[CalculateResponse]] = None,
+    ):
         self._registry = registry
         self._validator = ParameterValidator()
         self._param_matcher = get_param_matcher()
         self._boundary_registry = get_boundary_registry()
+        self._usage_logger = usage_logger
+        if stage_timing is None:
+            stage_timing = os.environ.get(STAGE_TIMING_ENV_VAR, "false").lower() in {"true", "1", "yes", "on"}
+        self._stage_timing = stage_timing
+        self._result_cache = result_cache if result_cache is not None else ResultCache.from_env()
+
+    @property
+    def result_cache(self) -> Optional[ResultCache[CalculateResponse]]:
+        """The result cache, or None when caching is disabled."""
+        return self._result_cache
 
     def execute(self, request: CalculateRequest) -> CalculateResponse:
         """
@@ -59,13 +136,69 @@ class CalculateUseCase:
         Returns:
             CalculateResponse with result or detailed error
         """
+        timer = StageTimer() if self._stage_timing or request.debug_timings else None
+        if self._usage_logger is None and timer is None:
+            return self._execute(request, None)
+
+        started = timer.started_ns if timer is not None else time.perf_counter_ns()
+        response = self._execute(request, timer)
+        duration_ms = (time.perf_counter_ns() - started) / 1_000_000
+
+        stage_durations_ms = timer.durations_ms() if timer is not None else None
+        if request.debug_timings and stage_durations_ms is not None:
+            timings = {stage: round(ms, 3) for stage, ms in stage_durations_ms.items()}
+            timings["total"] = round(duration_ms, 3)
+            response.component_scores["_timings"] = timings
+        if self._usage_logger is not None:
+            self._record_usage(request, response, duration_ms, stage_durations_ms)
+        return response
+
+    def _record_usage(
+        self,
+        request: CalculateRequest,
+        response: CalculateResponse,
+        duration_ms: float,
+        stage_durations_ms: Optional[Mapping[str, float]] = None,
+    ) -> None:
+        """Report a finished call to the usage logger (names only, never parameter values)."""
+        assert self._usage_logger is not None  # nosec B101 - checked by execute()
+        tool_id = response.tool_id or request.tool_id
+        metadata = self._registry.get(tool_id)
+        specialties = metadata.high_level.specialties if metadata is not None else ()
+
+        warning_types = []
+        if response.component_scores and "_boundary_warnings" in response.component_scores:
+            warning_types.append("boundary_warning")
+        if response.interpretation is not None and response.interpretation.details.get("warnings"):
+            warning_types.append("interpretation_warning")
+
+        error_type = None
+        if not response.success:
+            error = response.error or ""
+            error_type = next((kind for prefix, kind in ERROR_TYPE_PREFIXES if error.startswith(prefix)), "param_mismatch")
+
+        self._usage_logger.record_tool_call(
+            tool_id,
+            (request.params or {}).keys(),
+            success=response.success,
+            duration_ms=duration_ms,
+            category=specialties[0].value if specialties else "",
+            has_warnings=bool(warning_types),
+            warning_types=warning_types,
+            error_type=error_type,
+            stage_durations_ms=stage_durations_ms,
+        )
+
+    def _execute(self, request: CalculateRequest, timer: Optional[StageTimer]) -> CalculateResponse:
         resolved_tool_id = request.tool_id
         try:
-            tool_resolution = resolve_identifier(request.tool_id, self._registry.list_all_ids())
+            tool_resolution = self._registry.get_tool_resolver().resolve(request.tool_id)
             resolved_tool_id = tool_resolution.resolved_value or request.tool_id
 
             # Get calculator
             calculator = self._registry.get_calculator(resolved_tool_id)
+            if timer is not None:
+                timer.lap("resolve")
             if calculator is None:
                 return self._tool_not_found_response(request.tool_id, tool_resolution)
 
@@ -80,7 +213,10 @@ class CalculateUseCase:
             match_result = self._param_matcher.match(
                 provided_params=request.params,
                 calculator=calculator,
+                plan=self._registry.get_calculate_plan(resolved_tool_id),
             )
+            if timer is not None:
+                timer.lap("match")
 
             if not match_result.success:
                 return self._param_mismatch_response(
@@ -92,12 +228,22 @@ class CalculateUseCase:
 
             # Use matched params
             matched_params = match_result.matched_params
+            cache_key = None
+            if self._result_cache is not None and calculator.cacheable:
+                cache_key = canonical_key(resolved_tool_id, matched_params)
+                cached = self._result_cache.get(cache_key) if cache_key is not None else None
+                if cached is not None:
+                    return self._finish_response(request, resolved_tool_id, calculator, match_result.match_details, cached, timer)
 
             # Step 2: Boundary validation (clinical range check)
             boundary_warnings = self._validate_boundaries(matched_params)
+            if timer is not None:
+                timer.lap("boundaries")
 
             # Step 3: Pre-validate using domain validation
             validation_result = self._validate_params(matched_params)
+            if timer is not None:
+                timer.lap("validate")
             if not validation_result.is_valid:
                 return CalculateResponse(
                     success=False,
@@ -119,25 +265,14 @@ class CalculateUseCase:
 
             # Step 4: Execute calculation with matched params
             result = calculator.calculate(**matched_params)
+            if timer is not None:
+                timer.lap("calculate")
 
             # Step 5: Convert to response (include match details if aliases were used)
             response = self._to_response(resolved_tool_id, result, boundary_warnings)
-
-            # Add match details if any aliasing occurred
-            if match_result.match_details:
-                aliased = {k: v for k, v in match_result.match_details.items() if k != v}
-                if aliased and response.component_scores is not None:
-                    response.component_scores["_param_mapping"] = aliased
-
-            if resolved_tool_id != request.tool_id and response.component_scores is not None:
-                response.component_scores["_tool_resolved_from"] = request.tool_id
-                response.guidance = self._build_guidance(
-                    resolved_tool_id,
-                    calculator,
-                    supplied_tool_id=request.tool_id,
-                )
-
-            return response
+            if cache_key is not None and self._result_cache is not None:
+                self._result_cache.put(cache_key, response)
+            return self._finish_response(request, resolved_tool_id, calculator, match_result.match_details, response, timer)
 
         except TypeError as e:
             return self._type_error_response(request, str(e))
@@ -153,6 +288,34 @@ class CalculateUseCase:
                 error=f"Calculation error: {str(e)}. Please check input values and try again.",
             )
 
+    def _finish_response(
+        self,
+        request: CalculateRequest,
+        resolved_tool_id: str,
+        calculator: Any,
+        match_details: Mapping[str, str],
+        response: CalculateResponse,
+        timer: Optional[StageTimer],
+    ) -> CalculateResponse:
+        """Add the request-specific fields to a computed (or cached) response."""
+        # Add match details if any aliasing occurred
+        if match_details:
+            aliased = {k: v for k, v in match_details.items() if k != v}
+            if aliased and response.component_scores is not None:
+                response.component_scores["_param_mapping"] = aliased
+
+        if resolved_tool_id != request.tool_id and response.component_scores is not None:
+            response.component_scores["_tool_resolved_from"] = request.tool_id
+            response.guidance = self._build_guidance(
+                resolved_tool_id,
+                calculator,
+                supplied_tool_id=request.tool_id,
+            )
+
+        if timer is not None:
+            timer.lap("to_response")
+        return response
+
     def _tool_not_found_response(self, tool_id: str, resolution: ResolutionResult) -> CalculateResponse:
         """Generate response for tool not found."""
         error = f"Calculator '{tool_id}' not found."
@@ -0,0 +1,287 @@
+"""
+Cohort Scoring Use Case
+
+Scores whole datasets: a set of calculators is bound to a file's columns once,
+then every chunk of rows is scored column-wise. Per-row work is reduced to the
+calculation itself - no identifier resolution, parameter matching or response
+DTO construction per row.
+
+Binding (once per file):
+    - tool ids are resolved with the registry's tool resolver (aliases work)
+    - columns are matched to each calculator's parameters with ParamMatcher
+      (exact names first, then aliases, unit suffixes and prefixes/suffixes);
+      explicit ``column_map`` entries win over matching, and a key naming no
+      parameter of a selected tool is rejected rather than ignored
+    - a tool whose required parameters have no column is rejected up front;
+      for questionnaire scales (``calculate(**params)``) every item is required
+
+Engines (per chunk):
+    - renal_batch: ckd_epi_2021, cockcroft_gault, fena, kdigo_aki
+    - questionnaire_batch: every QuestionnaireDefinition scale
+    - scalar: every other calculator, calculate() per row
+
+Output columns per tool: ``<tool_id>_value``, ``<tool_id>_stage``,
+``<tool_id>_warnings`` (clinical boundary warnings, "; "-joined) and
+``<tool_id>_error``. Missing cells (None) are left out of a row's
+parameters, exactly as an omitted parameter.
+"""
+
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from ...domain.registry.tool_registry import ToolRegistry
+from ...domain.services.base import BaseCalculator
+from ...domain.services.param_matcher import ParamMatcher, normalize_param_name
+from ...domain.validation.boundaries import BoundarySpec, ValidationSeverity, get_boundary_registry
+
+# Columnar chunk: column name -> one value per row
+Columns = Mapping[str, Sequence[Any]]
+
+OUTPUT_FIELDS = ("value", "stage", "warnings", "error")
+
+# Separator between several boundary warnings in one cell
+WARNING_SEPARATOR = "; "
+
+
+@dataclass(frozen=True)
+class ToolBinding:
+    """One calculator bound to a file's columns."""
+
+    requested: str
+    tool_id: str
+    engine: str  # "renal_batch", "questionnaire_batch" or "scalar"
+    columns: dict[str, str]  # parameter -> input column
+
+    @property
+    def output_columns(self) -> tuple[str, ...]:
+        return tuple(f"{self.tool_id}_{field}" for field in OUTPUT_FIELDS)
+
+
+def _engine_for(tool_id: str) -> str:
+    # Batch engines import calculator modules; load them on first use so
+    # importing the use cases package stays cheap for a manifest-backed server
+    from ...domain.services.questionnaire_batch import QUESTIONNAIRE_BATCH_TOOL_IDS
+    from ...domain.services.renal_batch import RENAL_BATCH_TOOL_IDS
+
+    if tool_id in RENAL_BATCH_TOOL_IDS:
+        return "renal_batch"
+    if tool_id in QUESTIONNAIRE_BATCH_TOOL_IDS:
+        return "questionnaire_batch"
+    return "scalar"
+
+
+def _questionnaire_items(tool_id: str) -> tuple[str, ...]:
+    from ...domain.services.questionnaire_batch import questionnaire_definition
+
+    return tuple(spec.name for spec in questionnaire_definition(tool_id).item_specs)
+
+
+def _boundary_check(spec: BoundarySpec) -> Callable[[Any], Optional[str]]:
+    """Per-cell warning check; values inside every bound skip BoundarySpec.validate() entirely."""
+    lows = [bound for bound in (spec.physiological_min, spec.warning_min) if bound is not None]
+    highs = [bound for bound in (spec.physiological_max, spec.warning_max) if bound is not None]
+    low, high = (max(lows) if lows else float("-inf")), (min(highs) if highs else float("inf"))
+
+    def check(value: Any) -> Optional[str]:
+        if type(value) in (int, float) and low <= value <= high:
+            return None
+        result = spec.validate(value)
+        if result.severity == ValidationSeverity.CRITICAL:
+            return f"⚠️ CRITICAL: {result.message}"
+        if result.severity in (ValidationSeverity.WARNING, ValidationSeverity.ERROR):
+            return result.message
+        return None
+
+    return check
+
+
+class CohortScoringUseCase:
+    """
+    Score many rows with several calculators, binding columns to parameters once.
+
+    Usage:
+        use_case = CohortScoringUseCase(registry, ["ckd_epi_2021", "phq2"], columns=header)
+        scored = use_case.score({"age": [65, 40], "sex": ["female", "male"], ...})
+        scored["ckd_epi_2021_value"], scored["phq2_stage"]
+    """
+
+    def __init__(
+        self,
+        registry: ToolRegistry,
+        tool_ids: Sequence[str],
+        columns: Sequence[str],
+        column_map: Optional[Mapping[str, str]] = None,
+        param_matcher: Optional[ParamMatcher] = None,
+    ) -> None:
+        """
+        Args:
+            registry: Registry holding the calculators
+            tool_ids: Tools to run on every row (ids or resolvable aliases)
+            columns: Input column names
+            column_map: Explicit bindings, ``param`` or ``tool_id.param`` -> column
+            param_matcher: Matcher used to bind the remaining columns
+
+        Raises:
+            ValueError: Unknown tool, unknown mapped column, ``column_map`` key matching no
+                parameter of the selected tools, or required parameters without a column
+        """
+        if not tool_ids:
+            raise ValueError("At least one tool is required")
+        self._registry = registry
+        self._matcher = param_matcher or ParamMatcher()
+        self.input_columns = tuple(columns)
+        unknown = sorted(set((column_map or {}).values()) - set(self.input_columns))
+        if unknown:
+            raise ValueError(f"Mapped columns not in input: {', '.join(unknown)}")
+
+        self._calculators: dict[str, BaseCalculator] = {}
+        self._required: dict[str, frozenset[str]] = {}
+        bindings: dict[str, ToolBinding] = {}
+        mapped: set[str] = set()
+        for requested in tool_ids:
+            binding = self._bind(requested, column_map or {}, mapped)
+            bindings.setdefault(binding.tool_id, binding)
+        self.bindings = tuple(bindings.values())
+        unmatched = sorted(set(column_map or {}) - mapped)
+        if unmatched:
+            raise ValueError(f"column_map keys match no parameter of the selected tools: {', '.join(unmatched)}")
+
+        boundary_registry = get_boundary_registry()
+        self._boundary_checks: dict[str, list[tuple[str, Callable[[Any], Optional[str]]]]] = {}
+        for binding in self.bindings:
+            checks = []
+            for param, column in binding.columns.items():
+                spec = boundary_registry.get_boundary(param)
+                if spec is not None:
+                    checks.append((column, _boundary_check(spec)))
+            self._boundary_checks[binding.tool_id] = checks
+
+    @property
+    def output_columns(self) -> tuple[str, ...]:
+        """Scored column names, in tool order."""
+        return tuple(name for binding in self.bindings for name in binding.output_columns)
+
+    @property
+    def used_columns(self) -> tuple[str, ...]:
+        """Input columns bound to at least one parameter (the only ones scoring reads)."""
+        used = {column for binding in self.bindings for column in binding.columns.values()}
+        return tuple(column for column in self.input_columns if column in used)
+
+    def _bind(self, requested: str, column_map: Mapping[str, str], mapped: set[str]) -> ToolBinding:
+        """Bind ``requested``'s parameters to columns, adding the ``column_map`` keys it uses to ``mapped``."""
+        resolution = self._registry.get_tool_resolver().resolve(requested)
+        tool_id = resolution.resolved_value or requested
+        calculator = self._registry.get_calculator(tool_id)
+        if calculator is None:
+            hint = f" Did you mean: {', '.join(resolution.suggestions)}?" if resolution.suggestions else ""
+            raise ValueError(f"Calculator '{requested}' not found.{hint}")
+
+        plan = self._registry.get_calculate_plan(tool_id)
+        assert plan is not None  # nosec B101 - registered calculators always have a plan
+        expected = set(plan.expected_params)
+        explicit: dict[str, str] = {}
+        for key, column in column_map.items():
+            scope, _, param = key.rpartition(".")
+            if scope in (tool_id, requested) and param not in expected:
+                raise ValueError(f"{tool_id}: column_map key '{key}' names no parameter of the tool (expected: {', '.join(plan.expected_params)})")
+            if scope in ("", tool_id, requested) and param in expected:
+                explicit[param] = column
+                mapped.add(key)
+
+        # Columns named exactly like a parameter are matched first, so a
+        # prefix/suffix match cannot claim the parameter before them
+        normalized = set(plan.normalized_expected)
+        candidates = [column for column in self.input_columns if column not in explicit.values()]
+        candidates.sort(key=lambda column: normalize_param_name(column) not in normalized)
+        match = self._matcher.match({column: None for column in candidates}, calculator, plan)
+
+        bound = {param: column for column, param in match.match_details.items() if param not in explicit}
+        bound.update(explicit)
+        engine = _engine_for(tool_id)
+        required = list(plan.required_params)
+        if engine == "questionnaire_batch":
+            # Scales take calculate(**params), so their items are not in the
+            # plan's required parameters although every one of them is
+            required += [name for name in _questionnaire_items(tool_id) if name not in required]
+        missing = [param for param in required if param not in bound]
+        if missing:
+            raise ValueError(f"{tool_id}: no column for required parameters: {', '.join(missing)} (bind with column_map)")
+
+        self._calculators[tool_id] = calculator
+        self._required[tool_id] = frozenset(required)
+        ordered = {param: bound[param] for param in plan.expected_params if param in bound}
+        return ToolBinding(requested=requested, tool_id=tool_id, engine=engine, columns=ordered)
+
+    def score(self, chunk: Columns) -> dict[str, list[Any]]:
+        """
+        Score one chunk of rows.
+
+        Args:
+            chunk: Column name -> values (at least every column in ``used_columns``)
+
+        Returns:
+            Output column name -> one value per row, for every tool
+        """
+        row_count = len(next(iter(chunk.values()))) if chunk else 0
+        scored: dict[str, list[Any]] = {}
+        for binding in self.bindings:
+            params = {param: chunk[column] for param, column in binding.columns.items()}
+            values, stages, errors = self._run(binding, params, row_count)
+            if not len(values) == len(stages) == len(errors) == row_count:
+                raise RuntimeError(f"{binding.tool_id}: {binding.engine} returned {len(values)} rows for a chunk of {row_count}")
+            value_name, stage_name, warnings_name, error_name = binding.output_columns
+            scored[value_name] = values
+            scored[stage_name] = stages
+            scored[warnings_name] = self._warnings(binding, chunk, row_count)
+            scored[error_name] = errors
+        return scored
+
+    def _run(self, binding: ToolBinding, params: dict[str, Sequence[Any]], row_count: int) -> tuple[list[Any], list[Optional[str]], list[Optional[str]]]:
+        from ...domain.services.questionnaire_batch import calculate_questionnaire_batch
+        from ...domain.services.renal_batch import calculate_renal_batch
+
+        if binding.engine == "renal_batch":
+            renal = calculate_renal_batch(binding.tool_id, params)
+            values: list[Any] = [None if error is not None else value for value, error in zip(renal.values, renal.errors, strict=True)]
+            return values, renal.stages, renal.errors
+        if binding.engine == "questionnaire_batch":
+            questionnaire = calculate_questionnaire_batch(binding.tool_id, params)
+            return list(questionnaire.totals), questionnaire.stages, questionnaire.errors
+        return self._run_scalar(binding, params, row_count)
+
+    def _run_scalar(self, binding: ToolBinding, params: dict[str, Sequence[Any]], row_count: int) -> tuple[list[Any], list[Optional[str]], list[Optional[str]]]:
+        calculator = self._calculators[binding.tool_id]
+        required = self._required[binding.tool_id]
+        values: list[Any] = [None] * row_count
+        stages: list[Optional[str]] = [None] * row_count
+        errors: list[Optional[str]] = [None] * row_count
+        names = tuple(params)
+        for index, row in enumerate(zip(*params.values(), strict=True)):
+            kwargs = {name: value for name, value in zip(names, row, strict=True) if value is not None}
+            if len(kwargs) < len(names) and not required.issubset(kwargs):
+                errors[index] = f"Missing required parameters: {', '.join(name for name in names if name in required and name not in kwargs)}"
+                continue
+            try:
+                result = calculator.calculate(**kwargs)
+            except (TypeError, ValueError) as e:
+                errors[index] = str(e)
+                continue
+            except Exception as e:
+                errors[index] = f"Calculation error: {e}"
+                continue
+            values[index] = result.value
+            stages[index] = result.interpretation.stage if result.interpretation else None
+        return values, stages, errors
+
+    def _warnings(self, binding: ToolBinding, chunk: Columns, row_count: int) -> list[Optional[str]]:
+        warnings: list[Optional[str]] = [None] * row_count
+        for column, check in self._boundary_checks[binding.tool_id]:
+            for index, value in enumerate(chunk[column]):
+                if value is None:
+                    continue
+                message = check(value)
+                if message is not None:
+                    previous = warnings[index]
+                    warnings[index] = message if previous is None else previous + WARNING_SEPARATOR + message
+        return warnings
@@ -5,7 +5,6 @@ from typing import Optional
 from ...domain.entities.tool_metadata import ToolMetadata
 from ...domain.registry.tool_registry import ToolRegistry
 from ...domain.value_objects.tool_keys import ClinicalContext, Specialty
-from ...shared.smart_input import resolve_identifier
 from ..dto import (
     DiscoveryMode,
     DiscoveryRequest,
@@ -114,7 +113,7 @@ class DiscoveryUseCase:
             )
 
         # Try to match specialty
-        specialty_resolution = resolve_identifier(specialty_str, [specialty.value for specialty in self._registry.list_specialties()])
+        specialty_resolution = self._registry.get_specialty_resolver().resolve(specialty_str)
         specialty = self._match_specialty(specialty_resolution.resolved_value or specialty_str)
         if specialty is None:
             return DiscoveryResponse(
@@ -155,7 +154,7 @@ class DiscoveryUseCase:
             )
 
         # Try to match context
-        context_resolution = resolve_identifier(context_str, [context.value for context in self._registry.list_contexts()])
+        context_resolution = self._registry.get_context_resolver().resolve(context_str)
         context = self._match_context(context_resolution.resolved_value or context_str)
         if context is None:
             return DiscoveryResponse(
@@ -211,7 +210,7 @@ class DiscoveryUseCase:
         if not tool_id:
             return DiscoveryResponse(mode=DiscoveryMode.GET_INFO, success=False, count=0, error="tool_id is required")
 
-        resolution = resolve_identifier(tool_id, self._registry.list_all_ids())
+        resolution = self._registry.get_tool_resolver().resolve(tool_id)
         resolved_tool_id = resolution.resolved_value or tool_id
 
         metadata = self._registry.get(resolved_tool_id)
@@ -266,7 +265,7 @@ class DiscoveryUseCase:
             name=metadata.low_level.name,
             purpose=metadata.low_level.purpose,
             specialties=[s.value for s in metadata.high_level.specialties],
-            input_params=metadata.low_level.input_params,
+            input_params=list(metadata.low_level.input_params),
             output_type=metadata.low_level.output_type,
         )
 
@@ -276,7 +275,7 @@ class DiscoveryUseCase:
             tool_id=metadata.low_level.tool_id,
             name=metadata.low_level.name,
             purpose=metadata.low_level.purpose,
-            input_params=metadata.low_level.input_params,
+            input_params=list(metadata.low_level.input_params),
             output_type=metadata.low_level.output_type,
             specialties=[s.value for s in metadata.high_level.specialties],
             conditions=list(metadata.high_level.conditions),
@@ -0,0 +1,375 @@
+"""
+Patient Scoring Use Case
+
+Scores one patient record with several calculators at once:
+
+    score_patient({"systolic_bp": 92, "diastolic_bp": 54, "pao2": 70, "fio2": 0.5, ...},
+                  tools=["sofa_score", "qsofa_score", "apache_ii"])  # or "all_applicable"
+
+Planning (once per record, no calculation yet):
+    - record fields are keyed by canonical parameter name (exact, alias and
+      unit-suffix matching; no prefix/suffix or fuzzy guessing across a
+      record of unrelated fields)
+    - a field whose name states a unit ("height_m", "glucose_mmol_l") only
+      feeds parameters and derivations taking that unit, or one it converts
+      to without knowing the analyte (m/cm/in); otherwise it is unused
+    - derived quantities (MAP, P/F ratio, GCS total, BMI - see
+      derived_params) are planned when a measured value is missing, and
+      computed once only if some selected tool takes them
+    - each tool's parameters are bound by canonical name; a tool without
+      every required input is skipped and its missing inputs reported
+    - ``all_applicable`` takes its candidates from find_tools_by_params()
+      and keeps those with at least one required parameter, all bound
+
+Execution: every planned tool is an independent (tool_id, params) item run
+through CalculateUseCase (validation, boundaries, usage logging), on the
+caller's executor if one is given, otherwise sequentially. The MCP and REST
+adapters run PatientScoringPlan.items on their own worker pools instead and
+assemble the answer with PatientScoringPlan.to_dict().
+"""
+
+from collections.abc import Mapping, Sequence
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from ...domain.registry.tool_registry import ToolRegistry
+from ...domain.services.derived_params import DERIVATIONS, Derivation, plan_derivations
+from ...domain.services.param_matcher import (
+    PARAM_ALIASES,
+    canonical_param_name,
+    convert_unit,
+    expected_unit,
+    normalize_param_name,
+    param_unit,
+)
+from ..dto import CalculateRequest, CalculateResponse
+from .calculate_use_case import CalculateUseCase
+
+# tools= value selecting every calculator the record can feed
+ALL_APPLICABLE = "all_applicable"
+
+# Source label of a parameter filled from a derived quantity
+DERIVED_PREFIX = "derived:"
+
+ToolSelection = str | Sequence[str]
+
+
+@dataclass(frozen=True)
+class DerivedValue:
+    """A derived quantity computed for the record (value, or error when its inputs were unusable)."""
+
+    name: str
+    formula: str
+    inputs: dict[str, Any]  # source field -> value
+    value: Optional[float] = None
+    error: Optional[str] = None
+    used_by: tuple[str, ...] = ()
+
+    def to_dict(self) -> dict[str, Any]:
+        derived: dict[str, Any] = {"formula": self.formula, "inputs": self.inputs, "used_by": list(self.used_by)}
+        if self.error is not None:
+            derived["error"] = self.error
+        else:
+            derived["value"] = self.value
+        return derived
+
+
+@dataclass(frozen=True)
+class PlannedTool:
+    """A tool bound to the record: exact calculate() parameters and where each came from."""
+
+    tool_id: str
+    params: dict[str, Any]
+    sources: dict[str, str]  # param -> record field or "derived:<name>"
+    defaulted: tuple[str, ...]  # optional params left to their defaults
+
+
+@dataclass(frozen=True)
+class SkippedTool:
+    """A requested or candidate tool that was not run."""
+
+    tool_id: str
+    reason: str
+    missing: tuple[str, ...] = ()
+
+    def to_dict(self) -> dict[str, Any]:
+        skipped: dict[str, Any] = {"tool_id": self.tool_id, "reason": self.reason}
+        if self.missing:
+            skipped["missing"] = list(self.missing)
+        return skipped
+
+
+@dataclass
+class PatientScoringPlan:
+    """Planned tools, skipped tools and derived quantities for one record."""
+
+    tools: list[PlannedTool] = field(default_factory=list)
+    skipped: list[SkippedTool] = field(default_factory=list)
+    derived: dict[str, DerivedValue] = field(default_factory=dict)
+    unused_fields: tuple[str, ...] = ()
+
+    @property
+    def items(self) -> list[tuple[str, dict[str, Any]]]:
+        """(tool_id, params) per planned tool, independent of each other."""
+        return [(tool.tool_id, tool.params) for tool in self.tools]
+
+    def to_dict(self, responses: Sequence[CalculateResponse]) -> dict[str, Any]:
+        """
+        Assemble the answer from one response per planned tool (in ``tools`` order).
+
+        Raises:
+            ValueError: Response count does not match the planned tools
+        """
+        if len(responses) != len(self.tools):
+            raise ValueError(f"Expected {len(self.tools)} responses, got {len(responses)}")
+        results: list[dict[str, Any]] = []
+        for tool, response in zip(self.tools, responses, strict=True):
+            result: dict[str, Any] = {
+                "tool_id": response.tool_id or tool.tool_id,
+                "success": response.success,
+                "score_name": response.score_name,
+                "result": response.result,
+                "unit": response.unit,
+                "inputs": tool.sources,
+            }
+            if tool.defaulted:
+                result["defaulted"] = list(tool.defaulted)
+            if response.error:
+                result["error"] = response.error
+            if response.interpretation:
+                result["interpretation"] = response.interpretation.summary
+            results.append(result)
+        successful = sum(1 for result in results if result["success"])
+        return {
+            "all_success": successful == len(results),
+            "count": len(results),
+            "results": results,
+            "derived": {name: derived.to_dict() for name, derived in self.derived.items()},
+            "skipped": [skipped.to_dict() for skipped in self.skipped],
+            "unused_fields": list(self.unused_fields),
+            "summary": {
+                "evaluated": len(results),
+                "successful": successful,
+                "failed": len(results) - successful,
+                "skipped": len(self.skipped),
+            },
+        }
+
+
+class PatientScoringUseCase:
+    """
+    Plan and run several calculators over one patient record.
+
+    Usage:
+        use_case = PatientScoringUseCase(registry)
+        answer = use_case.score_patient(record, tools="all_applicable")
+        answer["results"], answer["derived"], answer["skipped"]
+    """
+
+    def __init__(
+        self,
+        registry: ToolRegistry,
+        calculate_use_case: Optional[CalculateUseCase] = None,
+        derivations: Sequence[Derivation] = DERIVATIONS,
+    ) -> None:
+        """
+        Args:
+            registry: Registry holding the calculators
+            calculate_use_case: Runs each planned tool (a plain CalculateUseCase if omitted)
+            derivations: Derived quantities the planner may compute
+        """
+        self._registry = registry
+        self._calculate_use_case = calculate_use_case or CalculateUseCase(registry)
+        self._derivations = tuple(derivations)
+
+    def score_patient(self, record: Mapping[str, Any], tools: ToolSelection = ALL_APPLICABLE, executor: Optional[Executor] = None) -> dict[str, Any]:
+        """
+        Score one record with the selected tools.
+
+        Args:
+            record: Patient fields (any parameter names or aliases); None values count as missing
+            tools: Tool ids / aliases, or ``"all_applicable"``
+            executor: Runs the planned tools concurrently (sequentially if omitted)
+
+        Returns:
+            results (one per planned tool), derived, skipped, unused_fields and summary
+        """
+        plan = self.plan(record, tools)
+        return plan.to_dict(self.run(plan, executor))
+
+    def run(self, plan: PatientScoringPlan, executor: Optional[Executor] = None) -> list[CalculateResponse]:
+        """Run the planned tools on ``executor`` (sequentially if None); responses in plan order."""
+        requests = [CalculateRequest(tool_id=tool_id, params=params) for tool_id, params in plan.items]
+        if executor is None or len(requests) <= 1:
+            return [self._calculate_use_case.execute(request) for request in requests]
+        return list(executor.map(self._calculate_use_case.execute, requests))
+
+    # ------------------------------------------------------------------
+    # Planning
+    # ------------------------------------------------------------------
+
+    def plan(self, record: Mapping[str, Any], tools: ToolSelection = ALL_APPLICABLE) -> PatientScoringPlan:
+        """
+        Bind the record to the selected tools and compute the derived quantities they need.
+
+        Raises:
+            ValueError: tools is an empty list or a string other than "all_applicable"
+        """
+        fields = self._canonical_fields(record)
+        # Measured values in the canonical unit: what derivations take
+        values: dict[str, Any] = {}
+        for canonical, (key, value) in fields.items():
+            try:
+                values[canonical] = convert_unit(value, param_unit(key), expected_unit(canonical))
+            except ValueError:
+                continue
+        derivable = {derivation.name: derivation for derivation in plan_derivations(values, self._derivations)}
+        available = set(fields) | set(derivable)
+
+        plan = PatientScoringPlan()
+        if isinstance(tools, str):
+            if tools != ALL_APPLICABLE:
+                raise ValueError(f"tools must be a list of tool ids or '{ALL_APPLICABLE}', got {tools!r}")
+            candidates, explicit = self._applicable_candidates(record, available), False
+        else:
+            if not tools:
+                raise ValueError("At least one tool is required")
+            candidates, explicit = self._resolve_tools(tools, plan), True
+
+        bindings: list[tuple[str, dict[str, str], tuple[str, ...], tuple[str, ...]]] = []
+        for tool_id in candidates:
+            calculate_plan = self._registry.get_calculate_plan(tool_id)
+            if calculate_plan is None:  # pragma: no cover - registered calculators always have a plan
+                continue
+            bound = {param: canonical_param_name(param) for param in calculate_plan.expected_params if self._can_bind(param, fields, derivable)}
+            missing = tuple(param for param in calculate_plan.required_params if param not in bound)
+            unconvertible = sorted({fields[canonical][0] for canonical in map(canonical_param_name, missing) if canonical in fields})
+            if unconvertible:
+                plan.skipped.append(SkippedTool(tool_id, f"could not convert {', '.join(unconvertible)}", missing))
+                continue
+            if missing:
+                plan.skipped.append(SkippedTool(tool_id, "missing required inputs", missing))
+                continue
+            if not explicit and not calculate_plan.required_params:
+                continue
+            defaulted = tuple(param for param in calculate_plan.expected_params if param not in bound)
+            bindings.append((tool_id, bound, calculate_plan.required_params, defaulted))
+
+        self._derive(bindings, fields, derivable, values, plan)
+
+        used: set[str] = set()
+        for tool_id, bound, required, defaulted in bindings:
+            failed = [param for param in required if bound[param] in derivable and bound[param] not in values]
+            if failed:
+                names = ", ".join(sorted({bound[param] for param in failed}))
+                plan.skipped.append(SkippedTool(tool_id, f"could not derive {names}", tuple(failed)))
+                continue
+            params: dict[str, Any] = {}
+            sources: dict[str, str] = {}
+            for param, canonical in bound.items():
+                if canonical in fields and canonical not in derivable:
+                    key, value = fields[canonical]
+                    params[param] = convert_unit(value, param_unit(key), expected_unit(param))
+                    sources[param] = key
+                    used.add(key)
+                elif canonical in values:
+                    params[param] = convert_unit(values[canonical], expected_unit(canonical), expected_unit(param))
+                    sources[param] = DERIVED_PREFIX + canonical
+                # else: optional input whose derivation failed, left to its default
+            defaulted += tuple(param for param in bound if param not in params)
+            plan.tools.append(PlannedTool(tool_id=tool_id, params=params, sources=sources, defaulted=defaulted))
+
+        for derived in plan.derived.values():
+            used.update(derived.inputs)
+        plan.unused_fields = tuple(key for key, _ in fields.values() if key not in used)
+        plan.skipped.sort(key=lambda skipped: len(skipped.missing))
+        return plan
+
+    @staticmethod
+    def _canonical_fields(record: Mapping[str, Any]) -> dict[str, tuple[str, Any]]:
+        """Canonical name -> (record field, value); a field named exactly like the canonical name wins."""
+        fields: dict[str, tuple[str, Any]] = {}
+        for key, value in record.items():
+            if value is None:
+                continue
+            canonical = canonical_param_name(key)
+            if canonical not in fields or normalize_param_name(key) == canonical:
+                fields[canonical] = (key, value)
+        return fields
+
+    @staticmethod
+    def _can_bind(param: str, fields: Mapping[str, tuple[str, Any]], derivable: Mapping[str, Derivation]) -> bool:
+        """Whether a measured field convertible to the unit ``param`` takes, or a derivation, supplies ``param``."""
+        canonical = canonical_param_name(param)
+        if canonical in derivable:
+            return True
+        if canonical not in fields:
+            return False
+        key, value = fields[canonical]
+        try:
+            convert_unit(value, param_unit(key), expected_unit(param))
+        except ValueError:
+            return False
+        return True
+
+    def _resolve_tools(self, tools: Sequence[str], plan: PatientScoringPlan) -> list[str]:
+        """Resolve requested ids / aliases in order, dropping duplicates; unknown ones are skipped."""
+        resolver = self._registry.get_tool_resolver()
+        resolved: list[str] = []
+        for requested in tools:
+            resolution = resolver.resolve(requested)
+            tool_id = resolution.resolved_value or requested
+            if self._registry.get(tool_id) is None:
+                hint = f" Did you mean: {', '.join(resolution.suggestions)}?" if resolution.suggestions else ""
+                plan.skipped.append(SkippedTool(requested, f"Calculator '{requested}' not found.{hint}"))
+            elif tool_id not in resolved:
+                resolved.append(tool_id)
+        return resolved
+
+    def _applicable_candidates(self, record: Mapping[str, Any], available: set[str]) -> list[str]:
+        """Tools find_tools_by_params() relates to the record's (and derivable) names, in registry order."""
+        names = set(record)
+        for canonical in available:
+            names.add(canonical)
+            names.update(PARAM_ALIASES.get(canonical, ()))
+        found = {metadata.tool_id for metadata in self._registry.find_tools_by_params(sorted(names))}
+        return [tool_id for tool_id in self._registry.list_all_ids() if tool_id in found]
+
+    def _derive(
+        self,
+        bindings: Sequence[tuple[str, dict[str, str], tuple[str, ...], tuple[str, ...]]],
+        fields: Mapping[str, tuple[str, Any]],
+        derivable: Mapping[str, Derivation],
+        values: dict[str, Any],
+        plan: PatientScoringPlan,
+    ) -> None:
+        """Compute each derived quantity the bound tools need (and its derived inputs) once, in dependency order."""
+        users: dict[str, list[str]] = {}
+        for tool_id, bound, _, _ in bindings:
+            for canonical in bound.values():
+                if canonical in derivable:
+                    users.setdefault(canonical, []).append(tool_id)
+        needed = set(users)
+        pending = list(needed)
+        while pending:
+            for name in derivable[pending.pop()].inputs:
+                if name in derivable and name not in needed:
+                    needed.add(name)
+                    pending.append(name)
+
+        for name, derivation in derivable.items():  # plan_derivations() order: inputs first
+            if name not in needed:
+                continue
+            inputs = {
+                fields[source][0] if source in fields else DERIVED_PREFIX + source: fields[source][1] if source in fields else values.get(source)
+                for source in derivation.inputs
+            }
+            try:
+                unavailable = [source for source in derivation.inputs if source not in values]
+                if unavailable:
+                    raise ValueError(f"input not available: {', '.join(unavailable)}")
+                values[name] = derivation(*(values[source] for source in derivation.inputs))
+                plan.derived[name] = DerivedValue(name, derivation.formula, inputs, value=values[name], used_by=tuple(users.get(name, ())))
+            except ValueError as e:
+                plan.derived[name] = DerivedValue(name, derivation.formula, inputs, error=str(e), used_by=tuple(users.get(name, ())))
@@ -0,0 +1,374 @@
+"""
+Application layer use case for tool schemas (get_tool_schema).
+
+A tool schema depends only on the tool and two flags (include_references,
+include_param_sources), so every variant is built once - at registration
+via precompute(), or on first request for tools registered later - and kept
+together with its serialized forms:
+
+- json_bytes: compact UTF-8 JSON, served as-is by the REST API
+- text: indented JSON, the text content of the MCP tool result (rendered on first use)
+- etag: strong ETag over json_bytes for HTTP revalidation
+
+Requests through an alias (e.g. "sofa" → "sofa_score") get a fresh copy with
+``resolved_tool_id`` added; alias spellings are unbounded, so they are not
+cached.
+"""
+
+import hashlib
+import json
+from typing import Any, Optional
+
+from ...domain.entities.tool_metadata import ToolMetadata
+from ...domain.registry.tool_registry import ToolRegistry
+from ...shared.smart_input import ResolutionResult
+
+# Every (include_references, include_param_sources) combination
+SCHEMA_VARIANTS: tuple[tuple[bool, bool], ...] = ((True, True), (True, False), (False, True), (False, False))
+
+# Parameter source mapping (where to find these values clinically)
+PARAM_SOURCES: dict[str, dict[str, Any]] = {
+    # Lab values
+    "serum_creatinine": {
+        "type": "number",
+        "unit": "mg/dL",
+        "description": "Serum creatinine level",
+        "clinical_hint": "Measured from blood sample",
+        "normal_range": [0.6, 1.2],
+        "common_sources": ["BMP", "CMP", "Renal panel"],
+    },
+    "creatinine": {
+        "type": "number",
+        "unit": "mg/dL",
+        "description": "Serum creatinine",
+        "clinical_hint": "From metabolic panel",
+        "normal_range": [0.6, 1.2],
+        "common_sources": ["BMP", "CMP", "Renal panel"],
+    },
+    "bilirubin": {
+        "type": "number",
+        "unit": "mg/dL",
+        "description": "Total bilirubin",
+        "clinical_hint": "From liver function tests",
+        "normal_range": [0.1, 1.2],
+        "common_sources": ["LFT", "Hepatic panel"],
+    },
+    "platelets": {
+        "type": "number",
+        "unit": "×10³/µL",
+        "description": "Platelet count",
+        "clinical_hint": "From complete blood count",
+        "normal_range": [150, 400],
+        "common_sources": ["CBC"],
+    },
+    "inr": {
+        "type": "number",
+        "unit": "",
+        "description": "International Normalized Ratio",
+        "clinical_hint": "From coagulation panel",
+        "normal_range": [0.9, 1.1],
+        "common_sources": ["PT/INR", "Coag panel"],
+    },
+    "sodium": {
+        "type": "number",
+        "unit": "mEq/L",
+        "description": "Serum sodium",
+        "clinical_hint": "From metabolic panel",
+        "normal_range": [136, 145],
+        "common_sources": ["BMP", "CMP"],
+    },
+    "potassium": {
+        "type": "number",
+        "unit": "mEq/L",
+        "description": "Serum potassium",
+        "clinical_hint": "From metabolic panel",
+        "normal_range": [3.5, 5.0],
+        "common_sources": ["BMP", "CMP"],
+    },
+    "glucose": {
+        "type": "number",
+        "unit": "mg/dL",
+        "description": "Blood glucose",
+        "clinical_hint": "From metabolic panel or point-of-care",
+        "normal_range": [70, 100],
+        "common_sources": ["BMP", "CMP", "POC glucose"],
+    },
+    "albumin": {
+        "type": "number",
+        "unit": "g/dL",
+        "description": "Serum albumin",
+        "clinical_hint": "From liver function tests",
+        "normal_range": [3.5, 5.0],
+        "common_sources": ["LFT", "CMP"],
+    },
+    # Vital signs
+    "heart_rate": {
+        "type": "number",
+        "unit": "bpm",
+        "description": "Heart rate",
+        "clinical_hint": "From vital signs monitor",
+        "normal_range": [60, 100],
+        "common_sources": ["Vital signs", "ECG monitor", "Pulse oximeter"],
+    },
+    "systolic_bp": {
+        "type": "number",
+        "unit": "mmHg",
+        "description": "Systolic blood pressure",
+        "clinical_hint": "From vital signs",
+        "normal_range": [90, 140],
+        "common_sources": ["Vital signs", "Arterial line"],
+    },
+    "respiratory_rate": {
+        "type": "number",
+        "unit": "/min",
+        "description": "Respiratory rate",
+        "clinical_hint": "Count breaths per minute",
+        "normal_range": [12, 20],
+        "common_sources": ["Vital signs", "Bedside observation"],
+    },
+    "temperature": {
+        "type": "number",
+        "unit": "°C",
+        "description": "Body temperature",
+        "clinical_hint": "From vital signs",
+        "normal_range": [36.5, 37.5],
+        "common_sources": ["Vital signs"],
+    },
+    "spo2": {
+        "type": "number",
+        "unit": "%",
+        "description": "Oxygen saturation",
+        "clinical_hint": "From pulse oximeter",
+        "normal_range": [95, 100],
+        "common_sources": ["Pulse oximeter", "Vital signs"],
+    },
+    # Blood gas
+    "pao2_fio2_ratio": {
+        "type": "number",
+        "unit": "mmHg",
+        "description": "PaO2/FiO2 ratio (P/F ratio)",
+        "clinical_hint": "Calculate: PaO2 ÷ FiO2 (as decimal)",
+        "normal_range": [400, 500],
+        "common_sources": ["ABG + Ventilator FiO2"],
+    },
+    "ph": {
+        "type": "number",
+        "unit": "",
+        "description": "Arterial blood pH",
+        "clinical_hint": "From arterial blood gas",
+        "normal_range": [7.35, 7.45],
+        "common_sources": ["ABG"],
+    },
+    "pco2": {
+        "type": "number",
+        "unit": "mmHg",
+        "description": "Partial pressure of CO2",
+        "clinical_hint": "From arterial blood gas",
+        "normal_range": [35, 45],
+        "common_sources": ["ABG"],
+    },
+    "hco3": {
+        "type": "number",
+        "unit": "mEq/L",
+        "description": "Bicarbonate",
+        "clinical_hint": "From ABG or metabolic panel",
+        "normal_range": [22, 26],
+        "common_sources": ["ABG", "BMP"],
+    },
+    # Demographics
+    "age": {
+        "type": "number",
+        "unit": "years",
+        "description": "Patient age",
+        "clinical_hint": "From patient demographics",
+        "normal_range": [0, 120],
+        "common_sources": ["EMR demographics", "Patient interview"],
+    },
+    "sex": {
+        "type": "string",
+        "unit": "",
+        "description": "Biological sex",
+        "clinical_hint": "male or female",
+        "valid_values": ["male", "female"],
+        "common_sources": ["EMR demographics"],
+    },
+    "weight": {
+        "type": "number",
+        "unit": "kg",
+        "description": "Body weight",
+        "clinical_hint": "Measured weight in kilograms",
+        "normal_range": [2, 300],
+        "common_sources": ["Nursing assessment", "Admission weight"],
+    },
+    "height": {
+        "type": "number",
+        "unit": "cm",
+        "description": "Height",
+        "clinical_hint": "Measured height in centimeters",
+        "normal_range": [50, 250],
+        "common_sources": ["Nursing assessment"],
+    },
+    # Scores
+    "gcs_score": {
+        "type": "number",
+        "unit": "",
+        "description": "Glasgow Coma Scale total",
+        "clinical_hint": "Sum of E + V + M components",
+        "normal_range": [3, 15],
+        "common_sources": ["Neurological assessment", "glasgow_coma_scale"],
+    },
+}
+
+
+class SerializedSchema:
+    """
+    A tool schema with its pre-serialized forms.
+
+    ``payload`` is shared by every caller and must not be mutated. ``text``
+    is rendered on first use: indented JSON goes through the pure-Python
+    encoder, which would dominate precompute() for a form only MCP needs.
+    """
+
+    __slots__ = ("payload", "json_bytes", "etag", "_text")
+
+    def __init__(self, payload: dict[str, Any]) -> None:
+        self.payload = payload
+        self.json_bytes = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode()
+        self.etag = f'"{hashlib.sha256(self.json_bytes).hexdigest()[:32]}"'
+        self._text: Optional[str] = None
+
+    @property
+    def text(self) -> str:
+        """Indented JSON (the MCP tool result text)."""
+        if self._text is None:
+            self._text = json.dumps(self.payload, ensure_ascii=False, indent=2)
+        return self._text
+
+
+class ToolSchemaUseCase:
+    """
+    Use case for serving tool schemas from a precomputed cache.
+
+    Usage:
+        schemas = ToolSchemaUseCase(registry)
+        schemas.precompute()
+        schema = schemas.get("ckd_epi_2021", include_references=False)
+        if schema is None:
+            resolution = schemas.resolve("ckd_epi_2021")  # suggestions for the error
+    """
+
+    def __init__(self, registry: ToolRegistry):
+        self._registry = registry
+        self._schemas: dict[tuple[str, bool, bool], SerializedSchema] = {}
+
+    def precompute(self) -> int:
+        """Build every variant of every registered tool; returns the number of schemas cached."""
+        for metadata in self._registry.list_all():
+            for include_references, include_param_sources in SCHEMA_VARIANTS:
+                self._cached(metadata, include_references, include_param_sources)
+        return len(self._schemas)
+
+    def resolve(self, tool_id: str) -> ResolutionResult:
+        """Resolve a tool id or alias (for suggestions when get() returns None)."""
+        return self._registry.get_tool_resolver().resolve(tool_id)
+
+    def get(self, tool_id: str, include_references: bool = True, include_param_sources: bool = True) -> Optional[SerializedSchema]:
+        """
+        Schema for a tool id or alias.
+
+        Args:
+            tool_id: Tool id or alias
+            include_references: Include references (citation, PMID, DOI)
+            include_param_sources: Include clinical hints, common sources and normal ranges
+
+        Returns:
+            SerializedSchema, or None if the tool is not registered
+        """
+        schema = self._schemas.get((tool_id, include_references, include_param_sources))
+        if schema is not None:
+            return schema
+
+        resolved_tool_id = self.resolve(tool_id).resolved_value or tool_id
+        metadata = self._registry.get(resolved_tool_id)
+        if metadata is None:
+            return None
+
+        schema = self._cached(metadata, include_references, include_param_sources)
+        if resolved_tool_id == tool_id:
+            return schema
+        return SerializedSchema({**schema.payload, "resolved_tool_id": resolved_tool_id})
+
+    def _cached(self, metadata: ToolMetadata, include_references: bool, include_param_sources: bool) -> SerializedSchema:
+        key = (metadata.low_level.tool_id, include_references, include_param_sources)
+        schema = self._schemas.get(key)
+        if schema is None:
+            schema = self._schemas[key] = SerializedSchema(build_tool_schema(metadata, include_references, include_param_sources))
+        return schema
+
+
+def build_tool_schema(metadata: ToolMetadata, include_references: bool = True, include_param_sources: bool = True) -> dict[str, Any]:
+    """Build the get_tool_schema payload for a tool (uncached)."""
+    low_level = metadata.low_level
+    high_level = metadata.high_level
+
+    # Build parameter schemas with source mapping
+    if include_param_sources:
+        param_schemas = build_param_schemas(metadata)
+    else:
+        # Minimal schema (just type info)
+        param_schemas = {param: {"type": "number", "required": True} for param in low_level.input_params}
+
+    result: dict[str, Any] = {
+        "success": True,
+        "tool_id": low_level.tool_id,
+        "name": low_level.name,
+        "purpose": low_level.purpose,
+        "formula_source_type": metadata.formula_source_type,
+        # High-Level 分類資訊
+        "clinical_context": {
+            "specialties": [s.value for s in high_level.specialties],
+            "contexts": [c.value for c in high_level.clinical_contexts],
+            "conditions": list(high_level.conditions) if high_level.conditions else [],
+        },
+        # Low-Level 參數資訊
+        "required_params": list(low_level.input_params),
+        "param_schemas": param_schemas,
+        "output": {
+            "type": low_level.output_type,
+        },
+        # 導航
+        "next_step": f"calculate('{low_level.tool_id}', {{...params}})",
+    }
+
+    # 參考文獻 (可選)
+    if include_references and metadata.references:
+        result["references"] = [{"citation": ref.citation, "doi": ref.doi, "pmid": ref.pmid, "year": ref.year} for ref in metadata.references]
+
+    return result
+
+
+def build_param_schemas(metadata: ToolMetadata) -> dict[str, dict[str, Any]]:
+    """
+    Build detailed parameter schemas with source mapping.
+
+    Args:
+        metadata: Tool metadata
+
+    Returns:
+        Dictionary of param_name -> schema details
+    """
+    schemas: dict[str, dict[str, Any]] = {}
+    for param in metadata.low_level.input_params:
+        if param in PARAM_SOURCES:
+            schemas[param] = PARAM_SOURCES[param]
+        else:
+            # Generate generic schema
+            schemas[param] = {
+                "type": "number",
+                "unit": "",
+                "description": param.replace("_", " ").title(),
+                "clinical_hint": "See calculator documentation",
+                "common_sources": ["Clinical assessment"],
+            }
+
+    return schemas
@@ -5,7 +5,8 @@ Contains all metadata about a medical calculator tool.
 Used for tool registration and discovery.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields, is_dataclass
+from enum import Enum
 from typing import Any
 
 from src.domain.value_objects.reference import Reference
@@ -75,10 +76,43 @@ class ToolMetadata:
             "tool_id": self.tool_id,
             "name": self.name,
             "purpose": self.purpose,
-            "input_params": self.low_level.input_params,
+            "input_params": list(self.low_level.input_params),
             "output_type": self.low_level.output_type,
             "specialties": [s.value for s in self.high_level.specialties],
             "conditions": list(self.high_level.conditions),
             "clinical_contexts": [c.value for c in self.high_level.clinical_contexts],
             "formula_source_type": self.formula_source_type,
         }
+
+
+_IMMUTABLE_SCALARS = (str, int, float, bool, bytes, type(None), Enum)
+
+
+def ensure_frozen_metadata(metadata: ToolMetadata) -> None:
+    """
+    Verify that a metadata graph is deeply immutable.
+
+    The registry shares one ToolMetadata instance per calculator with every
+    consumer (discovery, search, schemas), so a mutable container anywhere in
+    the graph would let one request corrupt another's view of the tool.
+
+    Raises:
+        TypeError: If any nested value is not a frozen dataclass, tuple or scalar.
+    """
+    _ensure_frozen(metadata, "metadata")
+
+
+def _ensure_frozen(value: Any, path: str) -> None:
+    if isinstance(value, _IMMUTABLE_SCALARS):
+        return
+    if isinstance(value, tuple):
+        for index, item in enumerate(value):
+            _ensure_frozen(item, f"{path}[{index}]")
+        return
+    if is_dataclass(value) and not isinstance(value, type):
+        if not value.__dataclass_params__.frozen:  # type: ignore[attr-defined]
+            raise TypeError(f"{path} ({type(value).__name__}) is not a frozen dataclass")
+        for data_field in fields(value):
+            _ensure_frozen(getattr(value, data_field.name), f"{path}.{data_field.name}")
+        return
+    raise TypeError(f"{path} holds mutable {type(value).__name__}; shared tool metadata must be immutable")
@@ -6,6 +6,7 @@ from .auto_discovery import (
     EnrichedHighLevelKey,
     get_discovery_engine,
 )
+from .search_index import FIELD_WEIGHTS, KeywordSearchIndex
 from .taxonomy import (
     CONTEXT_DESCRIPTIONS,
     RELATED_SPECIALTIES,
@@ -29,6 +30,9 @@ __all__ = [
     "DiscoveryResult",
     "EnrichedHighLevelKey",
     "get_discovery_engine",
+    # Keyword Search Index (n-gram substring index)
+    "KeywordSearchIndex",
+    "FIELD_WEIGHTS",
     # Tool Relation Graph (networkx or fallback)
     "ToolRelationGraph",
     "RelationType",
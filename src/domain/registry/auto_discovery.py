@@ -26,15 +26,38 @@ from __future__ import annotations
 
 import re
 from collections import defaultdict
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
+from .substring_index import ContainmentIndex
+
 if TYPE_CHECKING:
     from ..services.base import BaseCalculator
     from ..value_objects.tool_keys import ClinicalContext, Specialty
     from .tool_registry import ToolRegistry
 
 
+# Query words considered by AutoDiscoveryEngine.search
+_QUERY_WORD_PATTERN = re.compile(r"\b[a-z]{3,}\b")
+
+
+@dataclass(frozen=True)
+class _ScoredDimension:
+    """
+    Compiled form of one containment-matched inverted index.
+
+    Keys keep the insertion order of the source index; ``postings`` holds the
+    tool slots of each key (in the source set's iteration order) and
+    ``reasons`` the precomputed match-reason string of each key.
+    """
+
+    points: float
+    index: ContainmentIndex
+    postings: tuple[tuple[int, ...], ...]
+    reasons: tuple[str, ...]
+
+
 # =============================================================================
 # Medical Term Dictionaries (for auto-extraction)
 # =============================================================================
@@ -219,17 +242,17 @@ class EnrichedHighLevelKey:
     @property
     def all_conditions(self) -> tuple[str, ...]:
         """Combine manual and extracted conditions."""
-        return tuple(set(self.manual_conditions + self.extracted_conditions))
+        return tuple(sorted(set(self.manual_conditions + self.extracted_conditions)))
 
     @property
     def all_keywords(self) -> tuple[str, ...]:
         """Combine manual and extracted keywords."""
-        return tuple(set(self.manual_keywords + self.extracted_keywords))
+        return tuple(sorted(set(self.manual_keywords + self.extracted_keywords)))
 
     @property
     def all_questions(self) -> tuple[str, ...]:
         """Combine manual and extracted questions."""
-        return tuple(set(self.manual_questions + self.extracted_questions))
+        return tuple(sorted(set(self.manual_questions + self.extracted_questions)))
 
 
 class AutoDiscoveryEngine:
@@ -261,6 +284,12 @@ class AutoDiscoveryEngine:
         # Pre-computed similarity (tool_id -> [(related_tool_id, score)])
         self._related_tools: dict[str, list[tuple[str, float]]] = {}
 
+        # Compiled search structures (tool slot <-> tool_id, containment indexes)
+        self._slot_tools: list[str] = []
+        self._dimensions: tuple[_ScoredDimension, ...] = ()
+        self._question_postings: dict[str, tuple[int, ...]] = {}
+        self._conditions: ContainmentIndex = ContainmentIndex(())
+
         # Build status
         self._is_built = False
 
@@ -287,6 +316,9 @@ class AutoDiscoveryEngine:
         # Step 2: Pre-compute related tools
         self._compute_all_similarities(registry)
 
+        # Step 3: Compile containment indexes for search
+        self._compile_search_indexes()
+
         self._is_built = True
 
     def _clear(self) -> None:
@@ -298,8 +330,45 @@ class AutoDiscoveryEngine:
         self._by_param.clear()
         self._by_question_word.clear()
         self._related_tools.clear()
+        self._slot_tools = []
+        self._dimensions = ()
+        self._question_postings = {}
+        self._conditions = ContainmentIndex(())
         self._is_built = False
 
+    def _compile_search_indexes(self) -> None:
+        """
+        Compile the inverted indexes into containment indexes for search().
+
+        Each dimension gets an Aho-Corasick automaton ("key in word") and an
+        n-gram index ("word in key") over its keys, plus tool postings as
+        integer slots so search() can accumulate scores into flat arrays.
+        """
+        slots: dict[str, int] = {}
+
+        def to_slots(tools: set[str]) -> tuple[int, ...]:
+            # Sorted: set order depends on the process's hash seed
+            return tuple(slots.setdefault(tool_id, len(slots)) for tool_id in sorted(tools))
+
+        def compile_dimension(index: dict[str, set[str]], points: float, label: str) -> _ScoredDimension:
+            return _ScoredDimension(
+                points=points,
+                index=ContainmentIndex(list(index)),
+                postings=tuple(to_slots(tools) for tools in index.values()),
+                reasons=tuple(f"{label}:{key}" for key in index),
+            )
+
+        # Order and weights mirror the original search(): conditions weigh most
+        self._dimensions = (
+            compile_dimension(self._by_condition, 3.0, "condition"),
+            compile_dimension(self._by_domain, 2.0, "domain"),
+            compile_dimension(self._by_keyword, 1.5, "keyword"),
+            compile_dimension(self._by_param, 1.0, "param"),
+        )
+        self._question_postings = {word: to_slots(tools) for word, tools in self._by_question_word.items()}
+        self._conditions = self._dimensions[0].index
+        self._slot_tools = list(slots)
+
     def _enrich_tool(self, calc: BaseCalculator) -> EnrichedHighLevelKey:
         """
         Extract additional metadata from a calculator.
@@ -351,7 +420,7 @@ class AutoDiscoveryEngine:
 
         return conditions
 
-    def _extract_keywords(self, text: str, params: list[str]) -> set[str]:
+    def _extract_keywords(self, text: str, params: Sequence[str]) -> set[str]:
         """Extract keywords from text and parameter names."""
         keywords: set[str] = set()
 
@@ -421,7 +490,7 @@ class AutoDiscoveryEngine:
 
         return questions
 
-    def _extract_domains(self, params: list[str]) -> set[str]:
+    def _extract_domains(self, params: Sequence[str]) -> set[str]:
         """Extract clinical domains from parameter names."""
         domains: set[str] = set()
 
@@ -552,54 +621,42 @@ class AutoDiscoveryEngine:
         if not self._is_built:
             return []
 
-        query_lower = query.lower()
-        query_words = set(re.findall(r"\b[a-z]{3,}\b", query_lower))
-
-        scores: dict[str, tuple[float, list[str]]] = {}
-
-        def add_score(tool_id: str, points: float, reason: str) -> None:
-            if tool_id not in scores:
-                scores[tool_id] = (0.0, [])
-            current, reasons = scores[tool_id]
-            scores[tool_id] = (current + points, reasons + [reason])
-
-        # Search conditions (highest weight)
-        for word in query_words:
-            for condition, tools in self._by_condition.items():
-                if word in condition or condition in word:
-                    for tool_id in tools:
-                        add_score(tool_id, 3.0, f"condition:{condition}")
-
-        # Search domains
+        query_words = sorted(set(_QUERY_WORD_PATTERN.findall(query.lower())))
+
+        # Flat per-slot accumulators; `touched` records which slots scored
+        slot_count = len(self._slot_tools)
+        scores = [0.0] * slot_count
+        reasons: list[list[str] | None] = [None] * slot_count
+        touched: list[int] = []
+
+        def add_score(slots: tuple[int, ...], points: float, reason: str) -> None:
+            for slot in slots:
+                slot_reasons = reasons[slot]
+                if slot_reasons is None:
+                    reasons[slot] = [reason]
+                    touched.append(slot)
+                else:
+                    slot_reasons.append(reason)
+                scores[slot] += points
+
+        # Conditions, domains, keywords, parameters: "word in key or key in word"
+        for dimension in self._dimensions:
+            for word in query_words:
+                for key_pos in dimension.index.matches(word):
+                    add_score(dimension.postings[key_pos], dimension.points, dimension.reasons[key_pos])
+
+        # Question words: exact match
         for word in query_words:
-            for domain, tools in self._by_domain.items():
-                if word in domain or domain in word:
-                    for tool_id in tools:
-                        add_score(tool_id, 2.0, f"domain:{domain}")
-
-        # Search keywords
-        for word in query_words:
-            for keyword, tools in self._by_keyword.items():
-                if word in keyword or keyword in word:
-                    for tool_id in tools:
-                        add_score(tool_id, 1.5, f"keyword:{keyword}")
-
-        # Search parameters
-        for word in query_words:
-            for param, tools in self._by_param.items():
-                if word in param or param in word:
-                    for tool_id in tools:
-                        add_score(tool_id, 1.0, f"param:{param}")
-
-        # Search question words
-        for word in query_words:
-            if word in self._by_question_word:
-                for tool_id in self._by_question_word[word]:
-                    add_score(tool_id, 0.5, f"question:{word}")
+            question_slots = self._question_postings.get(word)
+            if question_slots is not None:
+                add_score(question_slots, 0.5, f"question:{word}")
 
         # Build and sort results
-        results = [DiscoveryResult(tool_id=tid, score=score, match_reasons=reasons) for tid, (score, reasons) in scores.items() if score > 0]
-        results.sort(key=lambda x: x.score, reverse=True)
+        results = [
+            DiscoveryResult(tool_id=self._slot_tools[slot], score=scores[slot], match_reasons=reasons[slot] or []) for slot in touched if scores[slot] > 0
+        ]
+        # Ties by tool_id, so rebuilt and snapshot-restored engines rank alike
+        results.sort(key=lambda x: (-x.score, x.tool_id))
 
         return results[:limit]
 
@@ -633,8 +690,8 @@ class AutoDiscoveryEngine:
             for tool_id in self._by_param.get(norm, set()):
                 matching[tool_id] += 1
 
-        # Sort by match count
-        sorted_tools = sorted(matching.items(), key=lambda x: x[1], reverse=True)
+        # Sort by match count, ties by tool_id
+        sorted_tools = sorted(matching.items(), key=lambda x: (-x[1], x[0]))
         return [tool_id for tool_id, _ in sorted_tools]
 
     def find_tools_by_condition(self, condition: str) -> list[str]:
@@ -645,18 +702,17 @@ class AutoDiscoveryEngine:
         condition_lower = condition.lower()
         matching: set[str] = set()
 
-        for cond, tools in self._by_condition.items():
-            if condition_lower in cond or cond in condition_lower:
-                matching.update(tools)
+        for key_pos in self._conditions.matches(condition_lower):
+            matching.update(self._by_condition[self._conditions.keys[key_pos]])
 
-        return list(matching)
+        return sorted(matching)
 
     def find_tools_by_domain(self, domain: str) -> list[str]:
         """Find tools related to a clinical domain (renal, cardiac, etc.)."""
         if not self._is_built:
             return []
 
-        return list(self._by_domain.get(domain.lower(), set()))
+        return sorted(self._by_domain.get(domain.lower(), set()))
 
     def get_enriched_key(self, tool_id: str) -> EnrichedHighLevelKey | None:
         """Get the enriched HighLevelKey for a tool."""
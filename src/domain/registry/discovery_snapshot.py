@@ -0,0 +1,169 @@
+"""
+Discovery Index Snapshot
+
+On-disk snapshot of the indexes ToolRegistry.build_discovery_indexes()
+derives from the registered calculators: the keyword search index, the
+AutoDiscoveryEngine and the ToolRelationGraph. Rebuilding them costs a few
+hundred milliseconds in every process (SSE workers, the REST API, benchmark
+scripts); loading the snapshot costs a few tens. It is a cold-start cache,
+not shared memory: every process decodes its own copy of the indexes.
+
+File layout (little-endian)::
+
+    magic "MCDS" | format version (u32) | key (32-byte sha256) | payload length (u64) | payload
+
+The key hashes the calculator metadata and docstrings the indexes are
+extracted from, plus the registry package sources and Python version, so any
+change to the catalog or to the indexing code produces a new key. The file is
+read through mmap so a stale snapshot is rejected after reading the header
+only; a matching payload is unpickled from the mapped pages.
+
+The runtime only reads snapshots: a missing or stale one makes the registry
+build its indexes in memory. Snapshots are written by
+``python scripts/build_discovery_snapshot.py`` (run by the Docker image
+build). Set MEDCALC_DISCOVERY_SNAPSHOT to another path, or to ``off`` to
+disable loading.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import mmap
+import os
+import pickle  # nosec B403 - snapshots are build artifacts written by this package
+import struct
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from .auto_discovery import AutoDiscoveryEngine
+    from .search_index import KeywordSearchIndex
+    from .tool_graph import ToolRelationGraph
+    from .tool_registry import ToolRegistry
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FORMAT_VERSION = 1
+SNAPSHOT_MAGIC = b"MCDS"
+SNAPSHOT_ENV_VAR = "MEDCALC_DISCOVERY_SNAPSHOT"
+SNAPSHOT_DISABLED_VALUES = frozenset({"off", "0", "false", "none"})
+
+HEADER = struct.Struct("<4sI32sQ")
+
+REGISTRY_ROOT = Path(__file__).resolve().parent
+DEFAULT_SNAPSHOT_PATH = REGISTRY_ROOT.parents[2] / "build" / "discovery_snapshot.bin"
+
+
+@dataclass(frozen=True)
+class DiscoverySnapshot:
+    """Discovery indexes restored from (or written to) a snapshot file."""
+
+    key: str
+    search_index: KeywordSearchIndex
+    discovery_engine: AutoDiscoveryEngine
+    relation_graph: ToolRelationGraph
+
+
+def default_snapshot_path() -> Optional[Path]:
+    """Snapshot location (MEDCALC_DISCOVERY_SNAPSHOT or build/discovery_snapshot.bin); None if disabled."""
+    override = os.environ.get(SNAPSHOT_ENV_VAR)
+    if override is None:
+        return DEFAULT_SNAPSHOT_PATH
+    if override.strip().lower() in SNAPSHOT_DISABLED_VALUES:
+        return None
+    return Path(override)
+
+
+def compute_snapshot_key(registry: ToolRegistry) -> str:
+    """
+    Hash everything the discovery indexes are derived from.
+
+    Covers each registered calculator's metadata and docstrings (in
+    registration order), the registry package sources and the Python version.
+    """
+    digest = hashlib.sha256(f"{SNAPSHOT_FORMAT_VERSION}:{sys.version_info.major}.{sys.version_info.minor}".encode())
+    for path in sorted(REGISTRY_ROOT.glob("*.py")):
+        digest.update(path.name.encode())
+        digest.update(b"\0")
+        digest.update(path.read_bytes())
+        digest.update(b"\0")
+    for tool_id in registry.list_all_ids():
+        calculator = registry.get_calculator(tool_id)
+        if calculator is None:
+            continue
+        for part in (tool_id, repr(calculator.metadata), type(calculator).__doc__ or "", calculator.calculate.__doc__ or ""):
+            digest.update(part.encode())
+            digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def write_discovery_snapshot(snapshot: DiscoverySnapshot, path: Path) -> Path:
+    """Atomically write a snapshot (temp file + rename) and return its path."""
+    payload = pickle.dumps(snapshot, protocol=pickle.HIGHEST_PROTOCOL)
+    header = HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_FORMAT_VERSION, bytes.fromhex(snapshot.key), len(payload))
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with temp.open("wb") as f:
+        f.write(header)
+        f.write(payload)
+    os.replace(temp, path)
+    return path
+
+
+def read_snapshot_key(path: Path) -> Optional[str]:
+    """Return the key stored in a snapshot header, or None if absent or not a snapshot."""
+    try:
+        with path.open("rb") as f:
+            header = f.read(HEADER.size)
+    except OSError:
+        return None
+    if len(header) < HEADER.size:
+        return None
+    magic, version, key, _ = HEADER.unpack(header)
+    if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_FORMAT_VERSION:
+        return None
+    return bytes(key).hex()
+
+
+def load_discovery_snapshot(path: Path, key: str) -> Optional[DiscoverySnapshot]:
+    """
+    Map a snapshot file and decode it if its header matches ``key``.
+
+    Args:
+        path: Snapshot file
+        key: Expected key (see compute_snapshot_key())
+
+    Returns:
+        The snapshot, or None if missing, unreadable, corrupt, or stale
+    """
+    try:
+        with path.open("rb") as f:
+            if os.fstat(f.fileno()).st_size < HEADER.size:
+                logger.warning(f"Discovery snapshot truncated: {path}")
+                return None
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                magic, version, stored_key, length = HEADER.unpack_from(mapped)
+                if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_FORMAT_VERSION:
+                    logger.info(f"Ignoring discovery snapshot with unsupported format: {path}")
+                    return None
+                if stored_key.hex() != key:
+                    logger.info(f"Ignoring stale discovery snapshot (calculator metadata changed): {path}")
+                    return None
+                if HEADER.size + length != len(mapped):
+                    logger.warning(f"Discovery snapshot truncated: {path}")
+                    return None
+                with memoryview(mapped)[HEADER.size :] as payload:
+                    snapshot = pickle.loads(payload)  # nosec B301 - trusted build artifact, key-checked above
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Discovery snapshot could not be loaded ({path}): {e}")
+        return None
+
+    if not isinstance(snapshot, DiscoverySnapshot) or snapshot.key != key:
+        logger.warning(f"Discovery snapshot payload does not match its header: {path}")
+        return None
+    return snapshot
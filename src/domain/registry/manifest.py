@@ -0,0 +1,132 @@
+"""
+Registry Manifest
+
+Build-time snapshot of everything ToolRegistry derives from the calculator
+catalog, so a server can answer discovery requests without importing ~150
+calculator modules or recomputing discovery indexes on every launch:
+
+- tool_id → (module, class name) for lazy calculator imports
+- frozen ToolMetadata and compiled CalculatePlans
+- the keyword search index, AutoDiscoveryEngine and ToolRelationGraph edges
+
+The manifest is stamped with a fingerprint of the domain package sources
+(plus the Python version and manifest format). A manifest whose fingerprint
+does not match the running code is ignored and the registry is built eagerly,
+so a stale build artifact can never serve outdated metadata.
+
+Build it with ``python scripts/build_registry_manifest.py``; the path can be
+overridden with the MEDCALC_REGISTRY_MANIFEST environment variable.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import pickle  # nosec B403 - manifests are build artifacts written by this package
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from ..entities.tool_metadata import ToolMetadata
+    from ..services.param_matcher import CalculatePlan
+    from .auto_discovery import AutoDiscoveryEngine
+    from .search_index import KeywordSearchIndex
+    from .tool_graph import ToolRelationGraph
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FORMAT_VERSION = 1
+MANIFEST_ENV_VAR = "MEDCALC_REGISTRY_MANIFEST"
+
+DOMAIN_ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_MANIFEST_PATH = DOMAIN_ROOT.parents[1] / "build" / "registry_manifest.pickle"
+
+
+@dataclass(frozen=True)
+class RegistryManifest:
+    """Prebuilt registry state (see ToolRegistry.export_manifest / load_manifest)."""
+
+    format_version: int
+    fingerprint: str
+    class_paths: dict[str, tuple[str, str]]
+    metadata: dict[str, ToolMetadata]
+    plans: dict[str, CalculatePlan]
+    search_index: KeywordSearchIndex
+    discovery_engine: AutoDiscoveryEngine
+    relation_graph: ToolRelationGraph
+
+
+def default_manifest_path() -> Path:
+    """Manifest location (MEDCALC_REGISTRY_MANIFEST or build/registry_manifest.pickle)."""
+    override = os.environ.get(MANIFEST_ENV_VAR)
+    return Path(override) if override else DEFAULT_MANIFEST_PATH
+
+
+def compute_source_fingerprint(root: Path = DOMAIN_ROOT) -> str:
+    """Hash every domain source file (calculators, metadata, registry code)."""
+    digest = hashlib.sha256(f"{MANIFEST_FORMAT_VERSION}:{sys.version_info.major}.{sys.version_info.minor}".encode())
+    for path in sorted(root.rglob("*.py")):
+        digest.update(path.relative_to(root).as_posix().encode())
+        digest.update(b"\0")
+        digest.update(path.read_bytes())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def build_registry_manifest() -> RegistryManifest:
+    """Register every calculator in a fresh registry and snapshot it."""
+    from ..services.calculators import CALCULATORS
+    from .tool_registry import ToolRegistry
+
+    registry = ToolRegistry()
+    for calculator_cls in CALCULATORS:
+        registry.register(calculator_cls())
+    return registry.export_manifest(compute_source_fingerprint())
+
+
+def write_registry_manifest(manifest: RegistryManifest, path: Optional[Path] = None) -> Path:
+    """Atomically write a manifest (temp file + rename) and return its path."""
+    target = path or default_manifest_path()
+    target.parent.mkdir(parents=True, exist_ok=True)
+    temp = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+    temp.write_bytes(pickle.dumps(manifest, protocol=pickle.HIGHEST_PROTOCOL))
+    os.replace(temp, target)
+    return target
+
+
+def load_registry_manifest(path: Optional[Path] = None, fingerprint: Optional[str] = None) -> Optional[RegistryManifest]:
+    """
+    Load a manifest if it exists and matches the running code.
+
+    Args:
+        path: Manifest file (default: default_manifest_path())
+        fingerprint: Expected fingerprint (default: compute_source_fingerprint())
+
+    Returns:
+        The manifest, or None if missing, unreadable, or stale
+    """
+    source = path or default_manifest_path()
+    try:
+        data = source.read_bytes()
+    except FileNotFoundError:
+        return None
+    except OSError as e:
+        logger.warning(f"Registry manifest unreadable ({source}): {e}")
+        return None
+
+    try:
+        manifest = pickle.loads(data)  # nosec B301 - trusted build artifact, fingerprint-checked below
+    except Exception as e:
+        logger.warning(f"Registry manifest could not be decoded ({source}): {e}")
+        return None
+
+    if not isinstance(manifest, RegistryManifest) or manifest.format_version != MANIFEST_FORMAT_VERSION:
+        logger.info(f"Ignoring registry manifest with unsupported format: {source}")
+        return None
+    if manifest.fingerprint != (fingerprint or compute_source_fingerprint()):
+        logger.info(f"Ignoring stale registry manifest (sources changed since it was built): {source}")
+        return None
+    return manifest
@@ -0,0 +1,133 @@
+"""
+Keyword Search Index
+
+Sub-linear free-text search over tool metadata for ToolRegistry.search().
+
+The registry's ranking rule is "case-insensitive substring of the query in a
+field, weighted per field". Rather than scanning every field of every tool per
+query, this index:
+
+1. Deduplicates every searchable field value (lowercased) into a string table
+   with postings of (tool, summed field weight) per string
+2. Builds a SubstringIndex (1..3 character grams) over the string table
+3. Answers a query by looking up the strings that contain it and summing the
+   weights of those strings per tool
+
+Rankings are identical to the original linear scorer: same field weights,
+same tie order (registration order).
+
+Zero external dependencies - pure Python stdlib only.
+"""
+
+from __future__ import annotations
+
+import heapq
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING
+
+from .substring_index import SubstringIndex
+
+if TYPE_CHECKING:
+    from ..entities.tool_metadata import ToolMetadata
+
+
+# Field weights used by ToolRegistry.search (do not change without updating rankings)
+FIELD_WEIGHTS: dict[str, int] = {
+    "tool_id": 10,
+    "name": 8,
+    "purpose": 5,
+    "specialty": 7,
+    "condition": 6,
+    "keyword": 4,
+    "clinical_question": 3,
+}
+
+
+def _iter_fields(metadata: ToolMetadata) -> Iterator[tuple[str, int]]:
+    """Yield (lowercased field value, weight) for every searchable field."""
+    low = metadata.low_level
+    high = metadata.high_level
+
+    yield low.tool_id.lower(), FIELD_WEIGHTS["tool_id"]
+    yield low.name.lower(), FIELD_WEIGHTS["name"]
+    yield low.purpose.lower(), FIELD_WEIGHTS["purpose"]
+    for specialty in high.specialties:
+        yield specialty.value.lower(), FIELD_WEIGHTS["specialty"]
+    for condition in high.conditions:
+        yield condition.lower(), FIELD_WEIGHTS["condition"]
+    for keyword in high.keywords:
+        yield keyword.lower(), FIELD_WEIGHTS["keyword"]
+    for question in high.clinical_questions:
+        yield question.lower(), FIELD_WEIGHTS["clinical_question"]
+
+
+class KeywordSearchIndex:
+    """
+    N-gram substring index over tool metadata.
+
+    Build once after all tools are registered; rebuild (or discard and
+    rebuild lazily) when the registry changes.
+    """
+
+    def __init__(self) -> None:
+        self._tool_ids: list[str] = []
+        self._strings: list[str] = []
+        self._postings: list[tuple[tuple[int, int], ...]] = []  # string id -> ((tool idx, weight), ...)
+        self._substrings = SubstringIndex(())
+
+    def build(self, metadata: Iterable[ToolMetadata]) -> None:
+        """Index the given metadata, in registration order."""
+        string_ids: dict[str, int] = {}
+        weights: list[dict[int, int]] = []
+        self._tool_ids = []
+
+        for tool_index, meta in enumerate(metadata):
+            self._tool_ids.append(meta.tool_id)
+            for text, weight in _iter_fields(meta):
+                string_id = string_ids.get(text)
+                if string_id is None:
+                    string_id = string_ids[text] = len(weights)
+                    weights.append({})
+                per_tool = weights[string_id]
+                per_tool[tool_index] = per_tool.get(tool_index, 0) + weight
+
+        self._strings = list(string_ids)
+        self._postings = [tuple(per_tool.items()) for per_tool in weights]
+        self._substrings = SubstringIndex(self._strings)
+
+    @property
+    def size(self) -> int:
+        """Number of indexed tools."""
+        return len(self._tool_ids)
+
+    def score(self, query: str) -> dict[str, int]:
+        """Return tool_id -> relevance score for every tool matching the query."""
+        return {self._tool_ids[tool_index]: total for tool_index, total in self._score_by_index(query.lower()).items()}
+
+    def _score_by_index(self, query_lower: str) -> dict[int, int]:
+        scores: dict[int, int] = defaultdict(int)
+        for string_id in self._substrings.find(query_lower):
+            for tool_index, weight in self._postings[string_id]:
+                scores[tool_index] += weight
+        return scores
+
+    def search(self, query: str, limit: int = 10) -> list[str]:
+        """
+        Return up to ``limit`` tool ids ranked by score (highest first).
+
+        Ties keep registration order, matching the original stable sort.
+        """
+        if limit <= 0:
+            return []
+        scores = self._score_by_index(query.lower())
+        top = heapq.nsmallest(limit, scores.items(), key=lambda item: (-item[1], item[0]))
+        return [self._tool_ids[tool_index] for tool_index, _ in top]
+
+    def get_statistics(self) -> dict[str, int]:
+        """Get index statistics."""
+        return {
+            "tools": len(self._tool_ids),
+            "strings": len(self._strings),
+            "grams": self._substrings.gram_count,
+        }
@@ -0,0 +1,160 @@
+"""
+Substring Indexes
+
+Two small, dependency-free structures for containment lookups over a fixed
+vocabulary of strings (index keys, field values):
+
+- SubstringIndex: n-gram postings answering "which strings contain `query`?"
+- AhoCorasickAutomaton: multi-pattern automaton answering "which strings
+  occur inside `text`?"
+- ContainmentIndex: both directions at once, as used by the discovery engine's
+  ``word in key or key in word`` matching
+
+All lookups cost roughly O(len(query) + matches) instead of a scan over the
+whole vocabulary, so discovery latency stays flat as the catalog grows.
+Postings and failure links are stored as compact ``array("I")`` buffers, which
+keeps the indexes small in memory and in a pickled registry manifest.
+
+Zero external dependencies - pure Python stdlib only.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections import defaultdict, deque
+from collections.abc import Sequence
+
+# Longest gram indexed; queries of this length or more use gram intersection
+MAX_GRAM = 3
+
+
+def _grams(text: str, size: int) -> set[str]:
+    return {text[i : i + size] for i in range(len(text) - size + 1)}
+
+
+class SubstringIndex:
+    """
+    N-gram index over a fixed list of strings.
+
+    Every 1..MAX_GRAM character gram maps to the ascending ids of the strings
+    that contain it. Short queries are answered directly from the postings;
+    longer ones intersect the postings of their grams (shortest first) and
+    verify the survivors with a real substring test.
+    """
+
+    def __init__(self, strings: Sequence[str]) -> None:
+        self._strings = list(strings)
+        grams: defaultdict[str, array[int]] = defaultdict(lambda: array("I"))
+        for string_id, text in enumerate(self._strings):
+            for size in range(1, MAX_GRAM + 1):
+                for gram in _grams(text, size):
+                    grams[gram].append(string_id)
+        self._grams = dict(grams)
+
+    def __len__(self) -> int:
+        return len(self._strings)
+
+    @property
+    def gram_count(self) -> int:
+        """Number of distinct grams indexed."""
+        return len(self._grams)
+
+    def find(self, query: str) -> Sequence[int]:
+        """Return ids of the strings that contain ``query``."""
+        if not query:
+            return range(len(self._strings))
+
+        if len(query) <= MAX_GRAM:
+            return self._grams.get(query, ())
+
+        postings = []
+        for gram in _grams(query, MAX_GRAM):
+            ids = self._grams.get(gram)
+            if ids is None:
+                return ()
+            postings.append(ids)
+        postings.sort(key=len)
+
+        candidates = set(postings[0])
+        for ids in postings[1:]:
+            candidates.intersection_update(ids)
+            if not candidates:
+                return ()
+        return sorted(string_id for string_id in candidates if query in self._strings[string_id])
+
+
+class AhoCorasickAutomaton:
+    """
+    Aho-Corasick automaton over a fixed list of patterns.
+
+    ``find(text)`` reports every pattern that occurs as a substring of
+    ``text`` in a single pass over the text.
+    """
+
+    def __init__(self, patterns: Sequence[str]) -> None:
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: array[int] = array("I", [0])
+        self._output: list[tuple[int, ...]] = [()]
+
+        for pattern_id, pattern in enumerate(patterns):
+            node = 0
+            for char in pattern:
+                next_node = self._goto[node].get(char)
+                if next_node is None:
+                    next_node = len(self._goto)
+                    self._goto[node][char] = next_node
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append(())
+                node = next_node
+            self._output[node] += (pattern_id,)
+
+        # Breadth-first pass to set failure links and inherit outputs
+        queue: deque[int] = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                self._output[child] = self._output[child] + self._output[self._fail[child]]
+
+    def find(self, text: str) -> set[int]:
+        """Return ids of the patterns that occur in ``text``."""
+        found: set[int] = set(self._output[0])  # empty patterns match everything
+        node = 0
+        for char in text:
+            while node and char not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(char, 0)
+            found.update(self._output[node])
+        return found
+
+
+class ContainmentIndex:
+    """
+    Bidirectional containment lookup over an ordered list of keys.
+
+    ``matches(word)`` returns the positions of every key for which
+    ``word in key or key in word`` holds, in key order, which is exactly the
+    set (and iteration order) a linear scan over the keys would produce.
+    """
+
+    def __init__(self, keys: Sequence[str]) -> None:
+        self._keys = list(keys)
+        self._containing = SubstringIndex(self._keys)
+        self._contained = AhoCorasickAutomaton(self._keys)
+
+    @property
+    def keys(self) -> list[str]:
+        """Indexed keys, in original order."""
+        return self._keys
+
+    def matches(self, word: str) -> list[int]:
+        """Positions of keys that contain, or are contained in, ``word``."""
+        hits = self._contained.find(word)
+        hits.update(self._containing.find(word))
+        return sorted(hits)
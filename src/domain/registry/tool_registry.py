@@ -6,19 +6,36 @@ Provides registration, lookup, and search capabilities.
 
 Enhanced with AutoDiscoveryEngine and ToolRelationGraph for
 intelligent tool discovery without ML dependencies.
+
+The registry can also be restored from a prebuilt RegistryManifest (see
+manifest.py): metadata, plans and discovery indexes are loaded as data and
+each calculator module is imported only when that tool is first used.
+Eagerly built registries load their discovery indexes from a prebuilt
+DiscoverySnapshot (see discovery_snapshot.py) when one matches.
 """
 
+import logging
+import threading
 from collections import defaultdict
+from collections.abc import Iterable
+from importlib import import_module
 from typing import TYPE_CHECKING, Any, Optional
 
-from ..entities.tool_metadata import ToolMetadata
+from ...shared.smart_input import IdentifierResolver
+from ..entities.tool_metadata import ToolMetadata, ensure_frozen_metadata
 from ..services.base import BaseCalculator
+from ..services.param_matcher import CalculatePlan, get_calculate_plan, seed_calculate_plan
 from ..value_objects.tool_keys import ClinicalContext, Specialty
+from .search_index import KeywordSearchIndex
 
 if TYPE_CHECKING:
     from .auto_discovery import AutoDiscoveryEngine
+    from .discovery_snapshot import DiscoverySnapshot
+    from .manifest import RegistryManifest
     from .tool_graph import ToolRelationGraph
 
+logger = logging.getLogger(__name__)
+
 
 class ToolRegistry:
     """
@@ -31,6 +48,11 @@ class ToolRegistry:
     - List all tools or by category
     - Auto-discovery engine (no ML required)
     - Tool relation graph for related tools
+    - Metadata cache: each calculator's ToolMetadata is built once at
+      registration and the same frozen instance is shared by all lookups
+    - Compiled calculate plans (signature, aliases, template) per tool
+    - Lazy calculators: when restored from a manifest, a calculator is
+      imported and instantiated on its first get_calculator() call
 
     This is a singleton - use ToolRegistry.instance() to get the registry.
     """
@@ -40,6 +62,12 @@ class ToolRegistry:
     def __init__(self) -> None:
         # Main storage
         self._calculators: dict[str, BaseCalculator] = {}
+        self._metadata: dict[str, ToolMetadata] = {}
+        self._plans: dict[str, CalculatePlan] = {}
+
+        # Manifest-restored tools not yet imported: tool_id → (module, class name)
+        self._class_paths: dict[str, tuple[str, str]] = {}
+        self._load_lock = threading.Lock()
 
         # Indexes for fast lookup
         self._by_specialty: dict[Specialty, set[str]] = defaultdict(set)
@@ -48,6 +76,12 @@ class ToolRegistry:
         self._by_keyword: dict[str, set[str]] = defaultdict(set)
         self._by_icd10: dict[str, set[str]] = defaultdict(set)
 
+        # Free-text search index (rebuilt lazily after registration changes)
+        self._search_index: Optional[KeywordSearchIndex] = None
+
+        # Identifier resolvers by kind ("tool", "specialty", "context"), rebuilt lazily after registration changes
+        self._resolvers: dict[str, IdentifierResolver] = {}
+
         # Auto-discovery components (lazy init)
         self._discovery_engine: Optional[AutoDiscoveryEngine] = None
         self._relation_graph: Optional[ToolRelationGraph] = None
@@ -72,16 +106,26 @@ class ToolRegistry:
         Args:
             calculator: The calculator instance to register
         """
-        tool_id = calculator.tool_id
+        metadata = calculator.metadata
+        tool_id = metadata.tool_id
 
-        if tool_id in self._calculators:
+        if tool_id in self._metadata:
             raise ValueError(f"Calculator with tool_id '{tool_id}' already registered")
 
-        # Store calculator
+        if __debug__:
+            ensure_frozen_metadata(metadata)
+
+        # Store calculator and its shared metadata
         self._calculators[tool_id] = calculator
+        self._metadata[tool_id] = metadata
+        self._plans[tool_id] = get_calculate_plan(calculator)
+        self._search_index = None
+        self._resolvers.clear()
+        self._index_metadata(tool_id, metadata)
 
-        # Build indexes from high level key
-        high_level = calculator.high_level_key
+    def _index_metadata(self, tool_id: str, metadata: ToolMetadata) -> None:
+        """Add a tool to the specialty/condition/context/keyword/ICD-10 indexes."""
+        high_level = metadata.high_level
 
         for specialty in high_level.specialties:
             self._by_specialty[specialty].add(tool_id)
@@ -100,24 +144,60 @@ class ToolRegistry:
 
     def get(self, tool_id: str) -> Optional[ToolMetadata]:
         """Get metadata for a tool by tool_id"""
-        calc = self._calculators.get(tool_id)
-        return calc.metadata if calc else None
+        return self._metadata.get(tool_id)
 
     def get_calculator(self, tool_id: str) -> Optional[BaseCalculator]:
-        """Get a calculator instance by tool_id"""
-        return self._calculators.get(tool_id)
+        """Get a calculator instance by tool_id (importing it on first use if lazily registered)"""
+        calculator = self._calculators.get(tool_id)
+        if calculator is None and tool_id in self._class_paths:
+            calculator = self._load_calculator(tool_id)
+        return calculator
+
+    def _load_calculator(self, tool_id: str) -> BaseCalculator:
+        """Import and instantiate a manifest-restored calculator, sharing its prebuilt plan."""
+        with self._load_lock:
+            calculator = self._calculators.get(tool_id)
+            if calculator is None:
+                module_name, class_name = self._class_paths[tool_id]
+                calculator = getattr(import_module(module_name), class_name)()
+                seed_calculate_plan(calculator, self._plans[tool_id])
+                self._calculators[tool_id] = calculator
+                del self._class_paths[tool_id]
+            return calculator
+
+    def warm_up(self) -> None:
+        """
+        Build everything that is otherwise built on first use: import every
+        lazily registered calculator, build the discovery indexes and the
+        tool/specialty/context resolvers. Call before forking workers so they
+        share these structures instead of each building its own copy.
+        """
+        for tool_id in list(self._class_paths):
+            self._load_calculator(tool_id)
+        self.build_discovery_indexes()
+        self.get_tool_resolver()
+        self.get_specialty_resolver()
+        self.get_context_resolver()
+
+    def is_loaded(self, tool_id: str) -> bool:
+        """Whether a registered tool's calculator has been imported and instantiated"""
+        return tool_id in self._calculators
+
+    def get_calculate_plan(self, tool_id: str) -> Optional[CalculatePlan]:
+        """Get the compiled calculate plan for a tool by tool_id"""
+        return self._plans.get(tool_id)
 
     def list_all(self) -> list[ToolMetadata]:
         """List metadata for all registered tools"""
-        return [calc.metadata for calc in self._calculators.values()]
+        return list(self._metadata.values())
 
     def list_all_ids(self) -> list[str]:
         """List all registered tool IDs"""
-        return list(self._calculators.keys())
+        return list(self._metadata.keys())
 
     def count(self) -> int:
         """Get total number of registered calculators"""
-        return len(self._calculators)
+        return len(self._metadata)
 
     # Search methods
 
@@ -126,7 +206,8 @@ class ToolRegistry:
         Search for tools by free text query.
 
         Searches across tool names, purposes, conditions, keywords,
-        clinical questions, and specialties.
+        clinical questions, and specialties using a precomputed n-gram
+        substring index (see KeywordSearchIndex for field weights).
 
         Args:
             query: Free text search query
@@ -135,49 +216,16 @@ class ToolRegistry:
         Returns:
             List of matching ToolMetadata, sorted by relevance
         """
-        query_lower = query.lower()
-        results: list[tuple[int, ToolMetadata]] = []
-
-        for calc in self._calculators.values():
-            score = 0
-            meta = calc.metadata
-            low = meta.low_level
-            high = meta.high_level
-
-            # Exact matches score higher
-            if query_lower in low.tool_id.lower():
-                score += 10
-            if query_lower in low.name.lower():
-                score += 8
-            if query_lower in low.purpose.lower():
-                score += 5
-
-            # Check specialties
-            for specialty in high.specialties:
-                if query_lower in specialty.value.lower():
-                    score += 7
-
-            # Check conditions
-            for condition in high.conditions:
-                if query_lower in condition.lower():
-                    score += 6
-
-            # Check keywords
-            for keyword in high.keywords:
-                if query_lower in keyword.lower():
-                    score += 4
-
-            # Check clinical questions
-            for question in high.clinical_questions:
-                if query_lower in question.lower():
-                    score += 3
-
-            if score > 0:
-                results.append((score, meta))
-
-        # Sort by score descending
-        results.sort(key=lambda x: x[0], reverse=True)
-        return [meta for _, meta in results[:limit]]
+        tool_ids = self._get_search_index().search(query, limit)
+        return [self._metadata[tid] for tid in tool_ids]
+
+    def _get_search_index(self) -> KeywordSearchIndex:
+        """Get the keyword search index, building it on first use."""
+        if self._search_index is None:
+            index = KeywordSearchIndex()
+            index.build(self._metadata.values())
+            self._search_index = index
+        return self._search_index
 
     def search_by_filters(
         self,
@@ -227,19 +275,19 @@ class ToolRegistry:
 
         # If no filters, return all
         if matching_ids is None:
-            matching_ids = set(self._calculators.keys())
+            matching_ids = set(self._metadata.keys())
 
-        return [self._calculators[tid].metadata for tid in matching_ids]
+        return [self._metadata[tid] for tid in matching_ids]
 
     def list_by_specialty(self, specialty: Specialty) -> list[ToolMetadata]:
         """List all tools for a given specialty"""
         tool_ids = self._by_specialty.get(specialty, set())
-        return [self._calculators[tid].metadata for tid in tool_ids]
+        return [self._metadata[tid] for tid in tool_ids]
 
     def list_by_context(self, context: ClinicalContext) -> list[ToolMetadata]:
         """List all tools for a given clinical context"""
         tool_ids = self._by_context.get(context, set())
-        return [self._calculators[tid].metadata for tid in tool_ids]
+        return [self._metadata[tid] for tid in tool_ids]
 
     def list_specialties(self) -> list[Specialty]:
         """List all specialties that have registered tools"""
@@ -249,6 +297,79 @@ class ToolRegistry:
         """List all clinical contexts that have registered tools"""
         return [c for c in self._by_context.keys() if self._by_context[c]]
 
+    # ========================================
+    # Identifier Resolution
+    # ========================================
+
+    def get_tool_resolver(self) -> IdentifierResolver:
+        """Get the IdentifierResolver for registered tool_ids (rebuilt after registration changes)"""
+        return self._get_resolver("tool", self._metadata)
+
+    def get_specialty_resolver(self) -> IdentifierResolver:
+        """Get the IdentifierResolver for specialties that have registered tools"""
+        return self._get_resolver("specialty", [specialty.value for specialty in self.list_specialties()])
+
+    def get_context_resolver(self) -> IdentifierResolver:
+        """Get the IdentifierResolver for clinical contexts that have registered tools"""
+        return self._get_resolver("context", [context.value for context in self.list_contexts()])
+
+    def _get_resolver(self, kind: str, candidates: Iterable[str]) -> IdentifierResolver:
+        resolver = self._resolvers.get(kind)
+        if resolver is None:
+            resolver = self._resolvers[kind] = IdentifierResolver(candidates)
+        return resolver
+
+    # ========================================
+    # Registry Manifest (fast cold start)
+    # ========================================
+
+    def export_manifest(self, fingerprint: str) -> "RegistryManifest":
+        """
+        Snapshot metadata, plans and discovery indexes into a RegistryManifest.
+
+        All calculators must be loaded (i.e. registered eagerly) so their
+        import paths are known; discovery indexes are built if needed.
+        """
+        from .manifest import MANIFEST_FORMAT_VERSION, RegistryManifest
+
+        if self._class_paths:
+            raise ValueError("Cannot export a manifest from a registry with unloaded calculators")
+        self.build_discovery_indexes()
+        assert self._discovery_engine is not None and self._relation_graph is not None  # nosec B101 - built above
+
+        return RegistryManifest(
+            format_version=MANIFEST_FORMAT_VERSION,
+            fingerprint=fingerprint,
+            class_paths={tool_id: (type(calc).__module__, type(calc).__qualname__) for tool_id, calc in self._calculators.items()},
+            metadata=dict(self._metadata),
+            plans=dict(self._plans),
+            search_index=self._get_search_index(),
+            discovery_engine=self._discovery_engine,
+            relation_graph=self._relation_graph,
+        )
+
+    def load_manifest(self, manifest: "RegistryManifest") -> None:
+        """
+        Restore an empty registry from a manifest without importing calculators.
+
+        Lookups, search and discovery are served from the manifest; each
+        calculator module is imported on its first get_calculator() call.
+        """
+        if self._metadata:
+            raise ValueError("load_manifest() requires an empty registry")
+
+        self._metadata = dict(manifest.metadata)
+        self._plans = dict(manifest.plans)
+        self._class_paths = dict(manifest.class_paths)
+        for tool_id, metadata in self._metadata.items():
+            self._index_metadata(tool_id, metadata)
+
+        self._search_index = manifest.search_index
+        self._resolvers.clear()
+        self._discovery_engine = manifest.discovery_engine
+        self._relation_graph = manifest.relation_graph
+        self._discovery_built = True
+
     # ========================================
     # Auto-Discovery Features (No ML Required)
     # ========================================
@@ -258,8 +379,14 @@ class ToolRegistry:
         Build auto-discovery indexes from registered tools.
 
         This builds:
-        1. AutoDiscoveryEngine - parameter/keyword based discovery
-        2. ToolRelationGraph - graph-based related tool discovery
+        1. KeywordSearchIndex - n-gram substring index for search()
+        2. AutoDiscoveryEngine - parameter/keyword based discovery
+        3. ToolRelationGraph - graph-based related tool discovery
+
+        The indexes are restored from the discovery snapshot when its key
+        matches the registered calculators; otherwise they are built in
+        memory. Snapshots are only written by the build script (see
+        discovery_snapshot.py).
 
         Call this AFTER all tools are registered.
         No ML dependencies - pure Python algorithms.
@@ -267,10 +394,29 @@ class ToolRegistry:
         if self._discovery_built:
             return
 
+        from .discovery_snapshot import compute_snapshot_key, default_snapshot_path, load_discovery_snapshot
+
+        path = default_snapshot_path()
+        if path is not None and path.exists():
+            snapshot = load_discovery_snapshot(path, compute_snapshot_key(self))
+            if snapshot is not None:
+                self._search_index = snapshot.search_index
+                self._discovery_engine = snapshot.discovery_engine
+                self._relation_graph = snapshot.relation_graph
+                self._discovery_built = True
+                return
+
+        self._build_discovery_indexes()
+
+    def _build_discovery_indexes(self) -> None:
+        """Build the search index, discovery engine and relation graph from scratch."""
         # Lazy import to avoid circular deps
         from .auto_discovery import AutoDiscoveryEngine
         from .tool_graph import ToolRelationGraph
 
+        # Build keyword search index
+        self._get_search_index()
+
         # Build discovery engine
         self._discovery_engine = AutoDiscoveryEngine()
         self._discovery_engine.build_from_registry(self)
@@ -281,6 +427,24 @@ class ToolRegistry:
 
         self._discovery_built = True
 
+    def export_discovery_snapshot(self) -> "DiscoverySnapshot":
+        """Build discovery indexes if needed and return them as a keyed DiscoverySnapshot."""
+        from .discovery_snapshot import compute_snapshot_key
+
+        self.build_discovery_indexes()
+        return self._discovery_snapshot(compute_snapshot_key(self))
+
+    def _discovery_snapshot(self, key: str) -> "DiscoverySnapshot":
+        from .discovery_snapshot import DiscoverySnapshot
+
+        assert self._discovery_engine is not None and self._relation_graph is not None  # nosec B101 - built by the caller
+        return DiscoverySnapshot(
+            key=key,
+            search_index=self._get_search_index(),
+            discovery_engine=self._discovery_engine,
+            relation_graph=self._relation_graph,
+        )
+
     def get_related_tools(self, tool_id: str, limit: int = 5) -> list[tuple[str, float]]:
         """
         Get tools related to the given tool.
@@ -338,7 +502,7 @@ class ToolRegistry:
                         if rel_id not in tool_ids:
                             tool_ids.append(rel_id)
 
-            return [self._calculators[tid].metadata for tid in tool_ids[:limit] if tid in self._calculators]
+            return [self._metadata[tid] for tid in tool_ids[:limit] if tid in self._metadata]
 
         # Fallback to basic search
         return self.search(query, limit)
@@ -360,7 +524,7 @@ class ToolRegistry:
 
         if self._discovery_engine:
             tool_ids = self._discovery_engine.find_tools_by_params(params)
-            return [self._calculators[tid].metadata for tid in tool_ids if tid in self._calculators]
+            return [self._metadata[tid] for tid in tool_ids if tid in self._metadata]
         return []
 
     def get_discovery_statistics(self) -> dict[str, Any]:
@@ -381,6 +545,7 @@ class ToolRegistry:
         """Get registry statistics"""
         return {
             "total_tools": self.count(),
+            "loaded_tools": len(self._calculators),
             "specialties": {s.value: len(ids) for s, ids in self._by_specialty.items() if ids},
             "clinical_contexts": {c.value: len(ids) for c, ids in self._by_context.items() if ids},
         }
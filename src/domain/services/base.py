@@ -6,6 +6,7 @@ Defines the interface that all calculators must implement.
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from typing import Any
 
 from ..entities.score_result import ScoreResult
@@ -18,6 +19,31 @@ from ..value_objects.reference import Reference
 from ..value_objects.tool_keys import HighLevelKey, LowLevelKey
 
 
+class _SharedMetadata:
+    """
+    Descriptor that builds a calculator's metadata once per instance.
+
+    Subclasses declare ``metadata`` as a plain property that constructs a new
+    ToolMetadata graph; BaseCalculator swaps that property for this descriptor
+    so the graph is built on first access (normally at registry registration)
+    and the same frozen instance is shared by every later consumer.
+    """
+
+    def __init__(self, build: Callable[[Any], ToolMetadata], owner: type) -> None:
+        self._build = build
+        self._slot = f"_{owner.__name__}__shared_metadata"
+        self.__doc__ = build.__doc__
+
+    def __get__(self, instance: Any, owner: type | None = None) -> Any:
+        if instance is None:
+            return self
+        cached = instance.__dict__.get(self._slot)
+        if cached is None:
+            cached = self._build(instance)
+            instance.__dict__[self._slot] = cached
+        return cached
+
+
 class BaseCalculator(ABC):
     """
     Abstract base class for all medical calculators.
@@ -41,8 +67,24 @@ class BaseCalculator(ABC):
             def calculate(self, age: int, sex: str, serum_creatinine: float) -> ScoreResult:
                 # Implementation
                 pass
+
+    The ``metadata`` property is evaluated once per instance and the resulting
+    (immutable) ToolMetadata is reused by the registry and discovery layers.
+
+    ``cacheable`` declares calculate() a pure function of its parameters, so
+    the application layer may memoize its results. Calculators whose output
+    depends on anything else (current time, randomness, external state) must
+    set it to False.
     """
 
+    cacheable: bool = True
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        declared = cls.__dict__.get("metadata")
+        if isinstance(declared, property) and declared.fget is not None and not declared.__isabstractmethod__:
+            setattr(cls, "metadata", _SharedMetadata(declared.fget, cls))
+
     @property
     @abstractmethod
     def metadata(self) -> ToolMetadata:
@@ -21,6 +21,47 @@ from ...value_objects.tool_keys import ClinicalContext, HighLevelKey, LowLevelKe
 from ...value_objects.units import Unit
 from ..base import BaseCalculator
 
+# (kappa, alpha, sex_coefficient) by sex - shared by calculate() and the renal batch engine
+CKD_EPI_2021_COEFFICIENTS: dict[str, tuple[float, float, float]] = {
+    "female": (0.7, -0.241, 1.012),
+    "male": (0.9, -0.302, 1.0),
+}
+
+# Lower eGFR bound of each CKD G stage, highest first (below the last bound is G5)
+CKD_EPI_2021_STAGE_THRESHOLDS: tuple[tuple[float, str], ...] = (
+    (90, "G1"),
+    (60, "G2"),
+    (45, "G3a"),
+    (30, "G3b"),
+    (15, "G4"),
+)
+
+
+def validate_ckd_epi_2021_inputs(age: float, sex: str, serum_creatinine: float) -> None:
+    """Raise ValueError if CKD-EPI 2021 inputs are out of range."""
+    if not 18 <= age <= 120:
+        raise ValueError("Age must be between 18 and 120 years")
+    if sex not in ("male", "female"):
+        raise ValueError("Sex must be 'male' or 'female'")
+    if not 0.1 <= serum_creatinine <= 30:
+        raise ValueError("Serum creatinine must be between 0.1 and 30 mg/dL")
+
+
+def ckd_epi_2021_egfr(age: float, sex: str, serum_creatinine: float) -> float:
+    """CKD-EPI 2021 eGFR (mL/min/1.73m²) rounded to 1 decimal place; inputs must be validated."""
+    kappa, alpha, sex_coefficient = CKD_EPI_2021_COEFFICIENTS[sex]
+    scr_kappa = serum_creatinine / kappa
+    egfr: float = 142 * (min(scr_kappa, 1) ** alpha) * (max(scr_kappa, 1) ** -1.200) * (0.9938**age) * sex_coefficient
+    return round(egfr, 1)
+
+
+def ckd_epi_2021_stage(egfr: float) -> str:
+    """CKD G stage code (G1-G5) for an eGFR value."""
+    for lower_bound, stage in CKD_EPI_2021_STAGE_THRESHOLDS:
+        if egfr >= lower_bound:
+            return stage
+    return "G5"
+
 
 class CkdEpi2021Calculator(BaseCalculator):
     """
@@ -115,31 +156,10 @@ class CkdEpi2021Calculator(BaseCalculator):
         Returns:
             ScoreResult with eGFR value and CKD staging
         """
-        # Validate inputs
-        if not 18 <= age <= 120:
-            raise ValueError("Age must be between 18 and 120 years")
-        if sex not in ("male", "female"):
-            raise ValueError("Sex must be 'male' or 'female'")
-        if not 0.1 <= serum_creatinine <= 30:
-            raise ValueError("Serum creatinine must be between 0.1 and 30 mg/dL")
-
-        # CKD-EPI 2021 parameters
-        if sex == "female":
-            kappa = 0.7
-            alpha = -0.241
-            sex_coefficient = 1.012
-        else:
-            kappa = 0.9
-            alpha = -0.302
-            sex_coefficient = 1.0
-
-        # Calculate eGFR
-        scr_kappa = serum_creatinine / kappa
-
-        egfr = 142 * (min(scr_kappa, 1) ** alpha) * (max(scr_kappa, 1) ** -1.200) * (0.9938**age) * sex_coefficient
+        validate_ckd_epi_2021_inputs(age, sex, serum_creatinine)
 
-        # Round to 1 decimal place
-        egfr = round(egfr, 1)
+        kappa, alpha, sex_coefficient = CKD_EPI_2021_COEFFICIENTS[sex]
+        egfr = ckd_epi_2021_egfr(age, sex, serum_creatinine)
 
         # Determine CKD stage and interpretation
         interpretation = self._get_interpretation(egfr)
@@ -158,13 +178,14 @@ class CkdEpi2021Calculator(BaseCalculator):
 
     def _get_interpretation(self, egfr: float) -> Interpretation:
         """Get CKD staging and clinical interpretation"""
+        stage = ckd_epi_2021_stage(egfr)
 
-        if egfr >= 90:
+        if stage == "G1":
             return Interpretation(
                 summary="Normal or high kidney function (G1)",
                 detail="eGFR ≥90 indicates normal kidney function. If no other markers of kidney damage, CKD is not present.",
                 severity=Severity.NORMAL,
-                stage="G1",
+                stage=stage,
                 stage_description="Normal or high GFR",
                 recommendations=(
                     "No specific renal intervention needed",
@@ -176,12 +197,12 @@ class CkdEpi2021Calculator(BaseCalculator):
                     "Address cardiovascular risk factors",
                 ),
             )
-        elif egfr >= 60:
+        elif stage == "G2":
             return Interpretation(
                 summary="Mildly decreased kidney function (G2)",
                 detail="eGFR 60-89 indicates mildly decreased kidney function. CKD diagnosis requires additional markers of kidney damage.",
                 severity=Severity.MILD,
-                stage="G2",
+                stage=stage,
                 stage_description="Mildly decreased GFR",
                 recommendations=(
                     "Monitor kidney function annually",
@@ -193,12 +214,12 @@ class CkdEpi2021Calculator(BaseCalculator):
                     "Review medication list for nephrotoxins",
                 ),
             )
-        elif egfr >= 45:
+        elif stage == "G3a":
             return Interpretation(
                 summary="Mildly to moderately decreased kidney function (G3a)",
                 detail="eGFR 45-59 indicates CKD Stage G3a. Referral to nephrology may be considered.",
                 severity=Severity.MILD,
-                stage="G3a",
+                stage=stage,
                 stage_description="Mildly to moderately decreased GFR",
                 recommendations=(
                     "Monitor kidney function every 6 months",
@@ -212,12 +233,12 @@ class CkdEpi2021Calculator(BaseCalculator):
                     "Check for anemia and mineral bone disease",
                 ),
             )
-        elif egfr >= 30:
+        elif stage == "G3b":
             return Interpretation(
                 summary="Moderately to severely decreased kidney function (G3b)",
                 detail="eGFR 30-44 indicates CKD Stage G3b. Nephrology referral is recommended.",
                 severity=Severity.MODERATE,
-                stage="G3b",
+                stage=stage,
                 stage_description="Moderately to severely decreased GFR",
                 recommendations=(
                     "Nephrology referral recommended",
@@ -235,12 +256,12 @@ class CkdEpi2021Calculator(BaseCalculator):
                     "Check hemoglobin for anemia",
                 ),
             )
-        elif egfr >= 15:
+        elif stage == "G4":
             return Interpretation(
                 summary="Severely decreased kidney function (G4)",
                 detail="eGFR 15-29 indicates CKD Stage G4. Prepare for possible renal replacement therapy.",
                 severity=Severity.SEVERE,
-                stage="G4",
+                stage=stage,
                 stage_description="Severely decreased GFR",
                 recommendations=(
                     "Nephrology co-management essential",
@@ -264,7 +285,7 @@ class CkdEpi2021Calculator(BaseCalculator):
                 summary="Kidney failure (G5)",
                 detail="eGFR <15 indicates kidney failure. Renal replacement therapy may be needed.",
                 severity=Severity.CRITICAL,
-                stage="G5",
+                stage=stage,
                 stage_description="Kidney failure",
                 recommendations=(
                     "Urgent nephrology consultation",
@@ -36,6 +36,58 @@ from ...value_objects.tool_keys import (
 from ...value_objects.units import Unit
 from ..base import BaseCalculator
 
+# Lower CrCl bound of each renal function stage, highest first (below the last bound is kidney failure)
+COCKCROFT_GAULT_STAGE_THRESHOLDS: tuple[tuple[float, str], ...] = (
+    (90, "Normal renal function"),
+    (60, "Mild renal impairment"),
+    (30, "Moderate renal impairment"),
+    (15, "Severe renal impairment"),
+)
+
+
+def validate_cockcroft_gault_inputs(age: float, weight_kg: float, creatinine_mg_dl: float, height_cm: Optional[float] = None) -> None:
+    """Raise ValueError if Cockcroft-Gault inputs are out of range."""
+    if not 18 <= age <= 120:
+        raise ValueError(f"Age must be 18-120 years, got {age}")
+    if not 30 <= weight_kg <= 300:
+        raise ValueError(f"Weight must be 30-300 kg, got {weight_kg}")
+    if not 0.2 <= creatinine_mg_dl <= 20.0:
+        raise ValueError(f"Creatinine must be 0.2-20.0 mg/dL, got {creatinine_mg_dl}")
+    if height_cm is not None and not (100 <= height_cm <= 250):
+        raise ValueError(f"Height must be 100-250 cm, got {height_cm}")
+
+
+def cockcroft_gault_crcl(age: float, weight: float, creatinine: float, sex: str) -> float:
+    """Unrounded Cockcroft-Gault CrCl (mL/min) for the given dosing weight."""
+    crcl = ((140 - age) * weight) / (72 * creatinine)
+    if sex == "female":
+        crcl *= 0.85
+    return crcl
+
+
+def cockcroft_gault_body_weights(weight_kg: float, height_cm: float, sex: str) -> tuple[float, Optional[float]]:
+    """Return (Devine IBW, adjusted body weight if ABW > 130% IBW else None)."""
+    height_inches = height_cm / 2.54
+    if sex == "male":
+        ibw = 50 + 2.3 * (height_inches - 60)
+    else:
+        ibw = 45.5 + 2.3 * (height_inches - 60)
+
+    ibw = max(ibw, 30)  # Minimum IBW
+
+    # Obese (ABW > 130% IBW): dose on adjusted body weight
+    if weight_kg > 1.3 * ibw:
+        return ibw, ibw + 0.4 * (weight_kg - ibw)
+    return ibw, None
+
+
+def cockcroft_gault_stage(crcl: float) -> str:
+    """Renal function stage label for a CrCl value."""
+    for lower_bound, stage in COCKCROFT_GAULT_STAGE_THRESHOLDS:
+        if crcl >= lower_bound:
+            return stage
+    return "Kidney failure"
+
 
 class CockcroftGaultCalculator(BaseCalculator):
     """
@@ -162,15 +214,7 @@ class CockcroftGaultCalculator(BaseCalculator):
         Raises:
             ValueError: If parameters are out of valid range
         """
-        # Validate inputs
-        if not 18 <= age <= 120:
-            raise ValueError(f"Age must be 18-120 years, got {age}")
-        if not 30 <= weight_kg <= 300:
-            raise ValueError(f"Weight must be 30-300 kg, got {weight_kg}")
-        if not 0.2 <= creatinine_mg_dl <= 20.0:
-            raise ValueError(f"Creatinine must be 0.2-20.0 mg/dL, got {creatinine_mg_dl}")
-        if height_cm is not None and not (100 <= height_cm <= 250):
-            raise ValueError(f"Height must be 100-250 cm, got {height_cm}")
+        validate_cockcroft_gault_inputs(age, weight_kg, creatinine_mg_dl, height_cm)
 
         # Calculate with actual body weight (ABW)
         crcl_abw = self._calculate_crcl(age, weight_kg, creatinine_mg_dl, sex)
@@ -183,24 +227,10 @@ class CockcroftGaultCalculator(BaseCalculator):
         weight_recommendation = "actual"
 
         if height_cm is not None:
-            # Devine formula for IBW
-            height_inches = height_cm / 2.54
-            if sex == "male":
-                ibw = 50 + 2.3 * (height_inches - 60)
-            else:
-                ibw = 45.5 + 2.3 * (height_inches - 60)
-
-            ibw = max(ibw, 30)  # Minimum IBW
-
-            # Check if obese (ABW > 130% IBW)
-            if weight_kg > 1.3 * ibw:
-                # Calculate adjusted body weight
-                adjbw = ibw + 0.4 * (weight_kg - ibw)
+            ibw, adjbw = cockcroft_gault_body_weights(weight_kg, height_cm, sex)
+            if adjbw is not None:
                 crcl_adjbw = self._calculate_crcl(age, adjbw, creatinine_mg_dl, sex)
                 weight_recommendation = "adjusted"
-            elif weight_kg < ibw:
-                # Underweight - use actual weight
-                weight_recommendation = "actual"
 
             crcl_ibw = self._calculate_crcl(age, ibw, creatinine_mg_dl, sex)
 
@@ -248,20 +278,18 @@ class CockcroftGaultCalculator(BaseCalculator):
 
     def _calculate_crcl(self, age: int, weight: float, creatinine: float, sex: str) -> float:
         """Calculate CrCl using Cockcroft-Gault formula"""
-        crcl = ((140 - age) * weight) / (72 * creatinine)
-        if sex == "female":
-            crcl *= 0.85
-        return crcl
+        return cockcroft_gault_crcl(age, weight, creatinine, sex)
 
     def _get_dosing_category(self, crcl: float) -> dict[str, str]:
         """Get dosing category based on CrCl"""
-        if crcl >= 90:
+        stage = cockcroft_gault_stage(crcl)
+        if stage == "Normal renal function":
             return {"category": "Normal", "adjustment": "No adjustment needed"}
-        elif crcl >= 60:
+        elif stage == "Mild renal impairment":
             return {"category": "Mild impairment", "adjustment": "Usually no adjustment"}
-        elif crcl >= 30:
+        elif stage == "Moderate renal impairment":
             return {"category": "Moderate impairment", "adjustment": "Often requires 50% reduction"}
-        elif crcl >= 15:
+        elif stage == "Severe renal impairment":
             return {"category": "Severe impairment", "adjustment": "Often requires 50-75% reduction"}
         else:
             return {"category": "Kidney failure", "adjustment": "Often contraindicated or dialysis dosing"}
@@ -269,17 +297,16 @@ class CockcroftGaultCalculator(BaseCalculator):
     def _get_interpretation(self, crcl: float, weight_used: str) -> Interpretation:
         """Generate interpretation based on CrCl value"""
         recommendations: tuple[str, ...]
+        stage = cockcroft_gault_stage(crcl)
 
-        if crcl >= 90:
-            stage = "Normal renal function"
+        if stage == "Normal renal function":
             severity = Severity.NORMAL
             recommendations = (
                 "No dose adjustment typically required for renal function",
                 "Standard dosing for renally eliminated drugs",
                 "Monitor renal function periodically",
             )
-        elif crcl >= 60:
-            stage = "Mild renal impairment"
+        elif stage == "Mild renal impairment":
             severity = Severity.MILD
             recommendations = (
                 "Most drugs: no adjustment needed",
@@ -287,8 +314,7 @@ class CockcroftGaultCalculator(BaseCalculator):
                 "Consider dose reduction for drugs with narrow therapeutic index",
                 "Monitor for drug accumulation",
             )
-        elif crcl >= 30:
-            stage = "Moderate renal impairment"
+        elif stage == "Moderate renal impairment":
             severity = Severity.MODERATE
             recommendations = (
                 "Many drugs require dose reduction (typically 50%)",
@@ -297,8 +323,7 @@ class CockcroftGaultCalculator(BaseCalculator):
                 "Monitor drug levels where available (vancomycin, aminoglycosides)",
                 "DOACs: reduced doses (check specific thresholds)",
             )
-        elif crcl >= 15:
-            stage = "Severe renal impairment"
+        elif stage == "Severe renal impairment":
             severity = Severity.SEVERE
             recommendations = (
                 "Significant dose reductions required for most renally cleared drugs",
@@ -308,7 +333,6 @@ class CockcroftGaultCalculator(BaseCalculator):
                 "Consider nephrology/pharmacy consultation",
             )
         else:
-            stage = "Kidney failure"
             severity = Severity.CRITICAL
             recommendations = (
                 "Most renally cleared drugs contraindicated or require dialysis dosing",
@@ -339,7 +363,7 @@ class CockcroftGaultCalculator(BaseCalculator):
                 "Not validated for acute kidney injury",
                 "Different drugs use different CrCl thresholds - check labeling",
             )
-            if crcl < 60
+            if severity not in (Severity.NORMAL, Severity.MILD)
             else (
                 "This is NOT the same as CKD-EPI eGFR",
                 "Many drug labels specifically require CG-CrCl",
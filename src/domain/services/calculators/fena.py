@@ -29,6 +29,35 @@ from ...value_objects.units import Unit
 from ..base import BaseCalculator
 
 
+def validate_fena_inputs(urine_sodium: float, plasma_sodium: float, urine_creatinine: float, plasma_creatinine: float) -> None:
+    """Raise ValueError if FENa inputs are out of physiological range."""
+    if urine_sodium < 0 or urine_sodium > 300:
+        raise ValueError("Urine sodium must be between 0 and 300 mEq/L")
+    if plasma_sodium < 100 or plasma_sodium > 180:
+        raise ValueError("Plasma sodium must be between 100 and 180 mEq/L")
+    if urine_creatinine <= 0 or urine_creatinine > 500:
+        raise ValueError("Urine creatinine must be between 0 and 500 mg/dL")
+    if plasma_creatinine <= 0 or plasma_creatinine > 30:
+        raise ValueError("Plasma creatinine must be between 0 and 30 mg/dL")
+
+
+def fena_percent(urine_sodium: float, plasma_sodium: float, urine_creatinine: float, plasma_creatinine: float) -> float:
+    """FENa (%) rounded to 2 decimal places; inputs must be validated."""
+    fena = (urine_sodium * plasma_creatinine) / (plasma_sodium * urine_creatinine) * 100
+    return round(fena, 2)
+
+
+def fena_stage(fena: float, on_diuretics: bool = False) -> str:
+    """FENa category label (prerenal / indeterminate / intrinsic)."""
+    if on_diuretics:
+        return "Indeterminate (diuretics)"
+    if fena < 1:
+        return "Prerenal (<1%)"
+    if fena <= 2:
+        return "Indeterminate (1-2%)"
+    return "Intrinsic (>2%)"
+
+
 class FENaCalculator(BaseCalculator):
     """
     Fractional Excretion of Sodium (FENa) Calculator
@@ -172,22 +201,10 @@ class FENaCalculator(BaseCalculator):
             FENa = (urine_sodium × plasma_creatinine) /
                    (plasma_sodium × urine_creatinine) × 100
         """
-        # Validate inputs
-        if urine_sodium < 0 or urine_sodium > 300:
-            raise ValueError("Urine sodium must be between 0 and 300 mEq/L")
-        if plasma_sodium < 100 or plasma_sodium > 180:
-            raise ValueError("Plasma sodium must be between 100 and 180 mEq/L")
-        if urine_creatinine <= 0 or urine_creatinine > 500:
-            raise ValueError("Urine creatinine must be between 0 and 500 mg/dL")
-        if plasma_creatinine <= 0 or plasma_creatinine > 30:
-            raise ValueError("Plasma creatinine must be between 0 and 30 mg/dL")
+        validate_fena_inputs(urine_sodium, plasma_sodium, urine_creatinine, plasma_creatinine)
 
-        # Calculate FENa
-        # FENa (%) = (Urine Na × Plasma Cr) / (Plasma Na × Urine Cr) × 100
-        fena = (urine_sodium * plasma_creatinine) / (plasma_sodium * urine_creatinine) * 100
-
-        # Round to 2 decimal places
-        fena = round(fena, 2)
+        # FENa (%) = (Urine Na × Plasma Cr) / (Plasma Na × Urine Cr) × 100, rounded to 2 decimals
+        fena = fena_percent(urine_sodium, plasma_sodium, urine_creatinine, plasma_creatinine)
 
         # Get interpretation
         interpretation = self._interpret_fena(fena, on_diuretics)
@@ -223,8 +240,9 @@ class FENaCalculator(BaseCalculator):
 
     def _interpret_fena(self, fena: float, on_diuretics: bool) -> Interpretation:
         """Generate clinical interpretation based on FENa value."""
+        stage = fena_stage(fena, on_diuretics)
 
-        if on_diuretics:
+        if stage == "Indeterminate (diuretics)":
             # When on diuretics, FENa is less reliable
             return Interpretation(
                 summary=f"FENa = {fena:.2f}% (UNRELIABLE - patient on diuretics)",
@@ -234,7 +252,7 @@ class FENaCalculator(BaseCalculator):
                 "affected by diuretics.",
                 severity=Severity.MILD if fena < 1 else Severity.MODERATE,
                 risk_level=RiskLevel.INTERMEDIATE,
-                stage="Indeterminate (diuretics)",
+                stage=stage,
                 stage_description="FENa unreliable due to diuretic use",
                 recommendations=(
                     "Consider FEUrea for more accurate assessment",
@@ -254,7 +272,7 @@ class FENaCalculator(BaseCalculator):
             )
 
         # Standard interpretation without diuretics
-        if fena < 1:
+        if stage == "Prerenal (<1%)":
             return Interpretation(
                 summary=f"FENa = {fena:.2f}%: Suggests prerenal azotemia",
                 detail=f"FENa of {fena:.2f}% (<1%) indicates the kidney is appropriately "
@@ -262,7 +280,7 @@ class FENaCalculator(BaseCalculator):
                 "effective circulating volume). The tubular function is intact.",
                 severity=Severity.MODERATE,
                 risk_level=RiskLevel.INTERMEDIATE,
-                stage="Prerenal (<1%)",
+                stage=stage,
                 stage_description="Prerenal azotemia - kidney conserving sodium",
                 recommendations=(
                     "Identify and treat underlying cause of prerenal state",
@@ -282,7 +300,7 @@ class FENaCalculator(BaseCalculator):
                     "Renal ultrasound if obstruction suspected",
                 ),
             )
-        elif fena <= 2:
+        elif stage == "Indeterminate (1-2%)":
             return Interpretation(
                 summary=f"FENa = {fena:.2f}%: Indeterminate zone",
                 detail=f"FENa of {fena:.2f}% (1-2%) is in the indeterminate zone. This may "
@@ -290,7 +308,7 @@ class FENaCalculator(BaseCalculator):
                 "mixed etiology. Clinical context is crucial for interpretation.",
                 severity=Severity.MODERATE,
                 risk_level=RiskLevel.INTERMEDIATE,
-                stage="Indeterminate (1-2%)",
+                stage=stage,
                 stage_description="Indeterminate - may be prerenal, ATN, or transition",
                 recommendations=(
                     "Use clinical context to guide management",
@@ -318,7 +336,7 @@ class FENaCalculator(BaseCalculator):
                 "tubular necrosis (ATN). The kidney is unable to conserve sodium normally.",
                 severity=Severity.SEVERE,
                 risk_level=RiskLevel.HIGH,
-                stage="Intrinsic (>2%)",
+                stage=stage,
                 stage_description="Intrinsic renal disease - likely ATN",
                 recommendations=(
                     "Identify and remove inciting cause (nephrotoxins, ischemia)",
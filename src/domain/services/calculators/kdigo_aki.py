@@ -37,6 +37,85 @@ from ...value_objects.units import Unit
 from ..base import BaseCalculator
 
 
+def kdigo_creatinine_stage(
+    current: float,
+    baseline: Optional[float],
+    increase_48h: Optional[float],
+) -> int:
+    """Determine AKI stage by creatinine criteria"""
+    stage = 0
+
+    # Check 48h absolute increase (≥0.3 mg/dL = Stage 1)
+    if increase_48h is not None and increase_48h >= 0.3:
+        stage = max(stage, 1)
+
+    # Check ratio to baseline
+    if baseline is not None and baseline > 0:
+        ratio = current / baseline
+
+        if ratio >= 3.0:
+            stage = 3
+        elif ratio >= 2.0:
+            stage = max(stage, 2)
+        elif ratio >= 1.5:
+            stage = max(stage, 1)
+
+    # Absolute creatinine ≥4.0 mg/dL = Stage 3
+    if current >= 4.0:
+        stage = 3
+
+    return stage
+
+
+def kdigo_urine_output_stage(
+    uo_ml_kg_h: Optional[float],
+    duration_hours: Optional[float],
+) -> int:
+    """Determine AKI stage by urine output criteria"""
+    if uo_ml_kg_h is None or duration_hours is None:
+        return 0
+
+    # Anuria (essentially 0) for ≥12 hours = Stage 3
+    if uo_ml_kg_h < 0.1 and duration_hours >= 12:
+        return 3
+
+    # <0.3 mL/kg/h for ≥24 hours = Stage 3
+    if uo_ml_kg_h < 0.3 and duration_hours >= 24:
+        return 3
+
+    # <0.5 mL/kg/h for ≥12 hours = Stage 2
+    if uo_ml_kg_h < 0.5 and duration_hours >= 12:
+        return 2
+
+    # <0.5 mL/kg/h for 6-12 hours = Stage 1
+    if uo_ml_kg_h < 0.5 and duration_hours >= 6:
+        return 1
+
+    return 0
+
+
+def kdigo_aki_stage(
+    current_creatinine: float,
+    baseline_creatinine: Optional[float] = None,
+    creatinine_increase_48h: Optional[float] = None,
+    urine_output_ml_kg_h: Optional[float] = None,
+    urine_output_duration_hours: Optional[float] = None,
+    on_rrt: bool = False,
+) -> int:
+    """Final KDIGO AKI stage (0-3): RRT is Stage 3, otherwise the worse of creatinine and urine output."""
+    if on_rrt:
+        return 3
+    return max(
+        kdigo_creatinine_stage(current_creatinine, baseline_creatinine, creatinine_increase_48h),
+        kdigo_urine_output_stage(urine_output_ml_kg_h, urine_output_duration_hours),
+    )
+
+
+def kdigo_stage_label(stage: int) -> str:
+    """Stage label as reported in the interpretation ("KDIGO AKI Stage N" or "No AKI")."""
+    return f"KDIGO AKI Stage {stage}" if stage > 0 else "No AKI"
+
+
 class KdigoAkiCalculator(BaseCalculator):
     """
     KDIGO AKI Staging Calculator
@@ -193,12 +272,10 @@ class KdigoAkiCalculator(BaseCalculator):
         # Determine AKI stage based on urine output criteria
         uo_stage = self._stage_by_urine_output(urine_output_ml_kg_h, urine_output_duration_hours)
 
-        # RRT automatically means Stage 3
-        if on_rrt:
-            final_stage = 3
-        else:
-            # Take the higher (worse) stage
-            final_stage = max(cr_stage, uo_stage)
+        # RRT automatically means Stage 3, otherwise the higher (worse) stage
+        final_stage = kdigo_aki_stage(
+            current_creatinine, baseline_creatinine, creatinine_increase_48h, urine_output_ml_kg_h, urine_output_duration_hours, on_rrt
+        )
 
         # Check if AKI criteria met
         has_aki = final_stage > 0
@@ -237,28 +314,7 @@ class KdigoAkiCalculator(BaseCalculator):
         increase_48h: Optional[float],
     ) -> int:
         """Determine AKI stage by creatinine criteria"""
-        stage = 0
-
-        # Check 48h absolute increase (≥0.3 mg/dL = Stage 1)
-        if increase_48h is not None and increase_48h >= 0.3:
-            stage = max(stage, 1)
-
-        # Check ratio to baseline
-        if baseline is not None and baseline > 0:
-            ratio = current / baseline
-
-            if ratio >= 3.0:
-                stage = 3
-            elif ratio >= 2.0:
-                stage = max(stage, 2)
-            elif ratio >= 1.5:
-                stage = max(stage, 1)
-
-        # Absolute creatinine ≥4.0 mg/dL = Stage 3
-        if current >= 4.0:
-            stage = 3
-
-        return stage
+        return kdigo_creatinine_stage(current, baseline, increase_48h)
 
     def _stage_by_urine_output(
         self,
@@ -266,26 +322,7 @@ class KdigoAkiCalculator(BaseCalculator):
         duration_hours: Optional[float],
     ) -> int:
         """Determine AKI stage by urine output criteria"""
-        if uo_ml_kg_h is None or duration_hours is None:
-            return 0
-
-        # Anuria (essentially 0) for ≥12 hours = Stage 3
-        if uo_ml_kg_h < 0.1 and duration_hours >= 12:
-            return 3
-
-        # <0.3 mL/kg/h for ≥24 hours = Stage 3
-        if uo_ml_kg_h < 0.3 and duration_hours >= 24:
-            return 3
-
-        # <0.5 mL/kg/h for ≥12 hours = Stage 2
-        if uo_ml_kg_h < 0.5 and duration_hours >= 12:
-            return 2
-
-        # <0.5 mL/kg/h for 6-12 hours = Stage 1
-        if uo_ml_kg_h < 0.5 and duration_hours >= 6:
-            return 1
-
-        return 0
+        return kdigo_urine_output_stage(uo_ml_kg_h, duration_hours)
 
     def _interpret_stage(
         self,
@@ -297,12 +334,13 @@ class KdigoAkiCalculator(BaseCalculator):
         on_rrt: bool,
     ) -> Interpretation:
         """Generate interpretation based on KDIGO AKI stage"""
+        label = kdigo_stage_label(stage)
 
         if stage == 0:
             # No AKI
             severity = Severity.NORMAL
             risk_level = RiskLevel.LOW
-            summary = "No AKI: Does not meet KDIGO AKI criteria"
+            summary = f"{label}: Does not meet KDIGO AKI criteria"
             detail = "Current creatinine and urine output do not meet KDIGO criteria for acute kidney injury. Continue monitoring if risk factors present."
             recommendations = [
                 "No AKI by current criteria",
@@ -320,7 +358,7 @@ class KdigoAkiCalculator(BaseCalculator):
         elif stage == 1:
             severity = Severity.MILD
             risk_level = RiskLevel.LOW
-            summary = "KDIGO AKI Stage 1: Mild acute kidney injury"
+            summary = f"{label}: Mild acute kidney injury"
             detail = (
                 "Stage 1 AKI: Creatinine 1.5-1.9x baseline OR ≥0.3 mg/dL increase "
                 "OR urine output <0.5 mL/kg/h for 6-12 hours. "
@@ -345,7 +383,7 @@ class KdigoAkiCalculator(BaseCalculator):
         elif stage == 2:
             severity = Severity.MODERATE
             risk_level = RiskLevel.INTERMEDIATE
-            summary = "KDIGO AKI Stage 2: Moderate acute kidney injury"
+            summary = f"{label}: Moderate acute kidney injury"
             detail = (
                 "Stage 2 AKI: Creatinine 2.0-2.9x baseline OR urine output "
                 "<0.5 mL/kg/h for ≥12 hours. Significant injury requiring "
@@ -379,14 +417,14 @@ class KdigoAkiCalculator(BaseCalculator):
             risk_level = RiskLevel.HIGH
 
             if on_rrt:
-                summary = "KDIGO AKI Stage 3: Severe AKI on renal replacement therapy"
+                summary = f"{label}: Severe AKI on renal replacement therapy"
                 detail = (
                     "Stage 3 AKI by RRT criterion. Patient already receiving dialysis "
                     "or CRRT. Continue RRT and supportive care while addressing "
                     "underlying cause. Monitor for renal recovery."
                 )
             else:
-                summary = "KDIGO AKI Stage 3: Severe acute kidney injury"
+                summary = f"{label}: Severe acute kidney injury"
                 detail = (
                     "Stage 3 AKI: Creatinine ≥3.0x baseline OR ≥4.0 mg/dL OR "
                     "urine output <0.3 mL/kg/h for ≥24h OR anuria for ≥12h. "
@@ -431,7 +469,7 @@ class KdigoAkiCalculator(BaseCalculator):
             summary=summary,
             severity=severity,
             detail=detail,
-            stage=f"KDIGO AKI Stage {stage}" if stage > 0 else "No AKI",
+            stage=label,
             stage_description=stage_criteria[stage],
             risk_level=risk_level,
             recommendations=tuple(recommendations),
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left
 from dataclasses import dataclass
+from functools import cached_property
+from itertools import accumulate
 from typing import Any
 
 from ...entities.score_result import ScoreResult
@@ -51,8 +54,42 @@ class QuestionnaireDefinition:
     formula_used: str | None = None
     abnormal_threshold: int | None = None
 
+    @cached_property
+    def max_score(self) -> int:
+        """Highest attainable total (sum of the item maxima)."""
+        return sum(spec.max_value for spec in self.item_specs)
+
+    @cached_property
+    def band_bounds(self) -> tuple[int, ...]:
+        """
+        Running maximum of the band upper bounds.
+
+        Non-decreasing even if the bands are not, so ``bisect_left`` finds the
+        first band with ``total <= upper_bound`` - the band a linear walk over
+        ``bands`` would pick.
+        """
+        return tuple(accumulate((band.upper_bound for band in self.bands), max))
+
+    def band_index(self, total_score: int) -> int:
+        """Index of the band for ``total_score`` (the last band when the total exceeds every bound)."""
+        return min(bisect_left(self.band_bounds, total_score), len(self.bands) - 1)
+
+    def interpretation(self, total_score: int, band_index: int | None = None) -> Interpretation:
+        """Interpretation for ``total_score``; ``band_index`` skips the band lookup when already known."""
+        band = self.bands[self.band_index(total_score) if band_index is None else band_index]
+        return Interpretation(
+            summary=f"{self.name} {total_score}/{self.max_score}: {band.stage}",
+            detail=band.detail,
+            severity=band.severity,
+            stage=band.stage,
+            stage_description=band.detail,
+            recommendations=band.recommendations,
+            warnings=band.warnings,
+            next_steps=band.next_steps,
+        )
+
 
-def _coerce_int(value: Any, *, item_name: str) -> int:
+def coerce_item_score(value: Any, *, item_name: str) -> int:
     if isinstance(value, bool):
         return int(value)
     if isinstance(value, int):
@@ -67,7 +104,7 @@ def _validate_items(params: dict[str, Any], item_specs: tuple[ItemSpec, ...]) ->
     for spec in item_specs:
         if spec.name not in params:
             raise ValueError(f"Missing required parameter: {spec.name}")
-        value = _coerce_int(params[spec.name], item_name=spec.name)
+        value = coerce_item_score(params[spec.name], item_name=spec.name)
         if spec.allowed_values is not None:
             if value not in spec.allowed_values:
                 raise ValueError(f"{spec.name} must be one of {spec.allowed_values}")
@@ -91,7 +128,7 @@ class QuestionnaireScaleCalculator(BaseCalculator):
                 name=definition.name,
                 purpose=definition.purpose,
                 input_params=[spec.name for spec in definition.item_specs],
-                output_type=f"Score 0-{sum(spec.max_value for spec in definition.item_specs)} with clinical interpretation",
+                output_type=f"Score 0-{definition.max_score} with clinical interpretation",
             ),
             high_level=HighLevelKey(
                 specialties=definition.specialties,
@@ -109,11 +146,9 @@ class QuestionnaireScaleCalculator(BaseCalculator):
         definition = self.DEFINITION
         validated = _validate_items(params, definition.item_specs)
         total_score = sum(validated.values())
-        interpretation = self._interpret(total_score)
-        max_score = sum(spec.max_value for spec in definition.item_specs)
         details: dict[str, Any] = {
             "total_score": total_score,
-            "max_score": max_score,
+            "max_score": definition.max_score,
             "item_scores": validated,
         }
         if definition.abnormal_threshold is not None:
@@ -121,10 +156,10 @@ class QuestionnaireScaleCalculator(BaseCalculator):
         return ScoreResult(
             value=total_score,
             unit=definition.unit,
-            interpretation=interpretation,
-            references=list(self.references),
-            tool_id=self.tool_id,
-            tool_name=self.name,
+            interpretation=self._interpret(total_score),
+            references=list(definition.references),
+            tool_id=definition.tool_id,
+            tool_name=definition.name,
             raw_inputs=validated,
             calculation_details=details,
             formula_used=definition.formula_used,
@@ -132,31 +167,7 @@ class QuestionnaireScaleCalculator(BaseCalculator):
         )
 
     def _interpret(self, total_score: int) -> Interpretation:
-        definition = self.DEFINITION
-        max_score = sum(spec.max_value for spec in definition.item_specs)
-        for band in definition.bands:
-            if total_score <= band.upper_bound:
-                return Interpretation(
-                    summary=f"{definition.name} {total_score}/{max_score}: {band.stage}",
-                    detail=band.detail,
-                    severity=band.severity,
-                    stage=band.stage,
-                    stage_description=band.detail,
-                    recommendations=band.recommendations,
-                    warnings=band.warnings,
-                    next_steps=band.next_steps,
-                )
-        last_band = definition.bands[-1]
-        return Interpretation(
-            summary=f"{definition.name} {total_score}/{max_score}: {last_band.stage}",
-            detail=last_band.detail,
-            severity=last_band.severity,
-            stage=last_band.stage,
-            stage_description=last_band.detail,
-            recommendations=last_band.recommendations,
-            warnings=last_band.warnings,
-            next_steps=last_band.next_steps,
-        )
+        return self.DEFINITION.interpretation(total_score)
 
 
 class PHQ2Calculator(QuestionnaireScaleCalculator):
@@ -0,0 +1,121 @@
+"""
+Derived Parameters
+
+Intermediate quantities several calculators take as input but a patient
+record usually carries only as raw measurements:
+
+    map_value        (SBP + 2 × DBP) / 3          sofa_score, sofa2_score, apache_ii, ...
+    pao2_fio2_ratio  PaO2 / FiO2                  sofa_score, murray_lung_injury_score, ...
+    gcs_score        eye + verbal + motor         sofa_score, qsofa_score, apache_ii, ich_score, ...
+    bmi              weight / (height / 100)²     nrs_2002, no_sas_score
+
+Names are canonical parameter names (see param_matcher.canonical_param_name),
+so a derivation feeds every calculator parameter that is an alias of its
+output (``mean_arterial_pressure`` in apache_ii takes ``map_value``).
+Inputs and outputs are in the calculators' units for those names
+(param_matcher.PARAM_UNITS: mmHg, kg, cm); callers convert first.
+
+plan_derivations() orders the derivations reachable from a set of
+available names so that each runs after the ones it depends on; a name
+already available (measured) is never derived.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class Derivation:
+    """One derived quantity: canonical output name, canonical input names and formula."""
+
+    name: str
+    inputs: tuple[str, ...]
+    formula: str
+    compute: Callable[..., float]
+
+    def __call__(self, *values: object) -> float:
+        """
+        Compute the quantity from input values (in ``inputs`` order).
+
+        Raises:
+            ValueError: A value is not a finite number or is out of range
+        """
+        numbers = [_number(name, value) for name, value in zip(self.inputs, values, strict=True)]
+        return self.compute(*numbers)
+
+
+def _number(name: str, value: object) -> float:
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or not math.isfinite(value):
+        raise ValueError(f"{name} must be a finite number, got {value!r}")
+    return float(value)
+
+
+def _positive(name: str, value: float) -> float:
+    if value <= 0:
+        raise ValueError(f"{name} must be positive, got {value:g}")
+    return value
+
+
+def mean_arterial_pressure(systolic_bp: float, diastolic_bp: float) -> float:
+    """MAP (mmHg) from systolic and diastolic pressure."""
+    _positive("diastolic_bp", diastolic_bp)
+    if diastolic_bp > systolic_bp:
+        raise ValueError(f"diastolic_bp ({diastolic_bp:g}) exceeds systolic_bp ({systolic_bp:g})")
+    return round((systolic_bp + 2 * diastolic_bp) / 3, 1)
+
+
+def pao2_fio2_ratio(pao2: float, fio2: float) -> float:
+    """P/F ratio (mmHg); FiO2 above 1 is read as a percentage."""
+    _positive("pao2", pao2)
+    fraction = fio2 / 100 if fio2 > 1 else fio2
+    if not 0.21 <= fraction <= 1.0:
+        raise ValueError(f"fio2 {fio2:g} is outside 0.21-1.0 (or 21-100%)")
+    return round(pao2 / fraction, 1)
+
+
+def glasgow_coma_score(eye: float, verbal: float, motor: float) -> float:
+    """GCS total from its eye (1-4), verbal (1-5) and motor (1-6) components."""
+    for name, value, top in (("eye", eye, 4), ("verbal", verbal, 5), ("motor", motor, 6)):
+        if value != int(value) or not 1 <= value <= top:
+            raise ValueError(f"{name} must be an integer 1-{top}, got {value:g}")
+    return int(eye + verbal + motor)
+
+
+def body_mass_index(weight: float, height: float) -> float:
+    """BMI (kg/m²) from weight (kg) and height (cm)."""
+    _positive("weight", weight)
+    meters = _positive("height", height) / 100
+    return round(weight / (meters * meters), 1)
+
+
+DERIVATIONS: tuple[Derivation, ...] = (
+    Derivation("map_value", ("systolic_bp", "diastolic_bp"), "(SBP + 2 × DBP) / 3", mean_arterial_pressure),
+    Derivation("pao2_fio2_ratio", ("pao2", "fio2"), "PaO2 / FiO2", pao2_fio2_ratio),
+    Derivation("gcs_score", ("eye", "verbal", "motor"), "E + V + M", glasgow_coma_score),
+    Derivation("bmi", ("weight", "height"), "weight / (height / 100)²", body_mass_index),
+)
+
+
+def plan_derivations(available: Iterable[str], derivations: Iterable[Derivation] = DERIVATIONS) -> list[Derivation]:
+    """
+    Derivations computable from ``available`` canonical names, in dependency order.
+
+    A derivation whose output is already available is left out; one whose
+    inputs are only reachable through other derivations follows them.
+    """
+    known = set(available)
+    pending = [derivation for derivation in derivations if derivation.name not in known]
+    ordered: list[Derivation] = []
+    progress = True
+    while pending and progress:
+        progress = False
+        for derivation in list(pending):
+            if all(name in known for name in derivation.inputs):
+                ordered.append(derivation)
+                known.add(derivation.name)
+                pending.remove(derivation)
+                progress = True
+    return ordered
@@ -12,13 +12,19 @@ Features:
 - Fuzzy matching for typos
 
 This enables a more forgiving API where users don't need to know exact param names.
+
+Each calculator's calculate() signature is compiled once into a CalculatePlan
+(expected/required params, alias lookup table, param template) so matching a
+request is a handful of dict lookups instead of re-inspecting the signature.
 """
 
 from __future__ import annotations
 
 import inspect
 import re
+import weakref
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any, Optional
 
 from ...shared.fuzzy_matching import similarity_ratio
@@ -129,6 +135,319 @@ UNIT_SUFFIXES = [
     "_24hr",
 ]
 
+# Unit each unit suffix states ("_score", "_value", "_count", ... state none)
+SUFFIX_UNITS: dict[str, str] = {
+    "_mg_dl": "mg/dL",
+    "_mg/dl": "mg/dL",
+    "_mgdl": "mg/dL",
+    "_mmol_l": "mmol/L",
+    "_mmol/l": "mmol/L",
+    "_mmoll": "mmol/L",
+    "_g_dl": "g/dL",
+    "_g/dl": "g/dL",
+    "_gdl": "g/dL",
+    "_mmhg": "mmHg",
+    "_mm_hg": "mmHg",
+    "_bpm": "/min",
+    "_beats_per_min": "/min",
+    "_ml": "mL",
+    "_ml_min": "mL/min",
+    "_ml/min": "mL/min",
+    "_kg": "kg",
+    "_cm": "cm",
+    "_m": "m",
+    "_inches": "in",
+    "_mg_kg": "mg/kg",
+    "_mg/kg": "mg/kg",
+    "_percent": "%",
+    "_pct": "%",
+    "_%": "%",
+}
+
+# Unit the calculators take for a canonical parameter that states none in its name
+PARAM_UNITS: dict[str, str] = {
+    "serum_creatinine": "mg/dL",
+    "bilirubin": "mg/dL",
+    "bun": "mg/dL",
+    "glucose": "mg/dL",
+    "hemoglobin": "g/dL",
+    "albumin": "g/dL",
+    "sodium": "mmol/L",
+    "potassium": "mmol/L",
+    "chloride": "mmol/L",
+    "bicarbonate": "mmol/L",
+    "lactate": "mmol/L",
+    "systolic_bp": "mmHg",
+    "diastolic_bp": "mmHg",
+    "map_value": "mmHg",
+    "pao2": "mmHg",
+    "heart_rate": "/min",
+    "respiratory_rate": "/min",
+    "urine_output_24h": "mL",
+    "weight": "kg",
+    "height": "cm",
+}
+
+# Analyte-independent conversions: (from, to) -> factor
+UNIT_CONVERSIONS: dict[tuple[str, str], float] = {
+    ("m", "cm"): 100.0,
+    ("cm", "m"): 0.01,
+    ("in", "cm"): 2.54,
+    ("in", "m"): 0.0254,
+}
+
+
+# =============================================================================
+# Name Normalization
+# =============================================================================
+
+
+@lru_cache(maxsize=4096)
+def normalize_param_name(name: str) -> str:
+    """Normalize parameter name for matching (lowercase, unified separators)."""
+    # Lowercase
+    name = name.lower()
+    # Replace common separators
+    name = name.replace("-", "_").replace(" ", "_")
+    # Remove multiple underscores
+    name = re.sub(r"_+", "_", name)
+    # Strip leading/trailing underscores
+    name = name.strip("_")
+    return name
+
+
+def strip_unit_suffix(name: str) -> str:
+    """Strip the first matching unit suffix from a normalized parameter name."""
+    for suffix in UNIT_SUFFIXES:
+        if name.endswith(suffix):
+            return name[: -len(suffix)]
+    return name
+
+
+@lru_cache(maxsize=4096)
+def canonical_param_name(name: str) -> str:
+    """
+    Canonical name of a parameter: exact, alias and unit-suffix matching only.
+
+    Two names share a canonical name when ParamMatcher's first three
+    strategies would match them ("creatinine" and "serum_creatinine_mg_dl"
+    both give "serum_creatinine"); prefix/suffix and fuzzy matches do not.
+    """
+    normalized = normalize_param_name(name)
+    canonical = _ALIAS_TO_CANONICAL.get(normalized)
+    if canonical is not None:
+        return canonical
+    stripped = strip_unit_suffix(normalized)
+    return _ALIAS_TO_CANONICAL.get(stripped, stripped)
+
+
+@lru_cache(maxsize=4096)
+def param_unit(name: str) -> Optional[str]:
+    """Unit a parameter name states with its suffix ("height_m" -> "m"), if any."""
+    normalized = normalize_param_name(name)
+    stated = [suffix for suffix in SUFFIX_UNITS if normalized.endswith(suffix) and len(normalized) > len(suffix)]
+    return SUFFIX_UNITS[max(stated, key=len)] if stated else None
+
+
+def expected_unit(name: str) -> Optional[str]:
+    """Unit a parameter takes: the one its name states, else the calculators' unit for its canonical name."""
+    return param_unit(name) or PARAM_UNITS.get(canonical_param_name(name))
+
+
+def convert_unit(value: Any, from_unit: Optional[str], to_unit: Optional[str]) -> Any:
+    """
+    Express ``value`` (in ``from_unit``) in ``to_unit``.
+
+    A value without a stated unit is taken as already in ``to_unit``;
+    otherwise the units must be equal or have an analyte-independent
+    conversion (m/cm/in).
+
+    Raises:
+        ValueError: The units differ and cannot be converted
+    """
+    if from_unit is None or from_unit == to_unit:
+        return value
+    factor = UNIT_CONVERSIONS.get((from_unit, to_unit)) if to_unit is not None else None
+    if factor is None or isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise ValueError(f"cannot convert {value!r} from {from_unit} to {to_unit or 'an unspecified unit'}")
+    return round(value * factor, 6)
+
+
+# =============================================================================
+# Compiled Calculate Plan
+# =============================================================================
+
+# Upper bound for lazily memoized lookups of names not known at compile time
+# (shared by every plan; see _learned_candidates())
+_MAX_LEARNED_LOOKUPS = 4096
+
+
+@dataclass(frozen=True)
+class CalculatePlan:
+    """
+    Precompiled parameter plan for one calculator's calculate() method.
+
+    Built once per calculator (normally at registry registration) and shared
+    by ParamMatcher, CalculateUseCase and the template/guidance helpers.
+
+    Attributes:
+        expected_params: All parameter names accepted by calculate()
+        required_params: Parameters without a default value
+        normalized_expected: normalize_param_name() of each expected param
+        param_template: Agent-facing template (see generate_param_template)
+        alias_table: normalized provided name → candidate expected params,
+            ordered by matching strategy (exact, alias, unit-stripped,
+            prefix/suffix), for the expected names and known aliases. Never
+            mutated after compilation: other names (unit-suffixed variants
+            and the like) are ranked on first sight and memoized in a
+            bounded, thread-safe cache outside the plan.
+    """
+
+    expected_params: tuple[str, ...]
+    required_params: tuple[str, ...]
+    normalized_expected: tuple[str, ...]
+    param_template: dict[str, str] = field(repr=False)
+    alias_table: dict[str, tuple[str, ...]] = field(repr=False)
+
+    def candidates_for(self, normalized: str) -> tuple[str, ...]:
+        """Return expected params a normalized name can map to, best first."""
+        candidates = self.alias_table.get(normalized)
+        if candidates is None:
+            candidates = _learned_candidates(normalized, self.expected_params, self.normalized_expected)
+        return candidates
+
+
+@lru_cache(maxsize=_MAX_LEARNED_LOOKUPS)
+def _learned_candidates(normalized: str, expected_params: tuple[str, ...], normalized_expected: tuple[str, ...]) -> tuple[str, ...]:
+    """_rank_candidates() for names missing from a plan's alias table, memoized across request threads."""
+    return _rank_candidates(normalized, expected_params, normalized_expected)
+
+
+def _rank_candidates(
+    normalized: str,
+    expected_params: tuple[str, ...],
+    normalized_expected: tuple[str, ...],
+) -> tuple[str, ...]:
+    """
+    Rank expected params for a provided name using the non-fuzzy strategies.
+
+    The order mirrors ParamMatcher's cascade; matching picks the first
+    candidate that has not been claimed by an earlier provided param.
+    """
+    ranked: list[str] = []
+    expected_set = set(expected_params)
+
+    def add(name: Optional[str]) -> None:
+        if name is not None and name in expected_set and name not in ranked:
+            ranked.append(name)
+
+    # Strategy 1: Exact match
+    add(normalized)
+
+    # Strategy 2: Alias lookup (both directions)
+    add(_ALIAS_TO_CANONICAL.get(normalized))
+    for expected in expected_params:
+        if _ALIAS_TO_CANONICAL.get(expected) == normalized or normalized in PARAM_ALIASES.get(expected, ()):
+            add(expected)
+
+    # Strategy 3: Strip unit suffixes
+    stripped = strip_unit_suffix(normalized)
+    if stripped != normalized:
+        add(stripped)
+        add(_ALIAS_TO_CANONICAL.get(stripped))
+
+    # Strategy 4: Prefix/suffix partial match
+    for expected, exp_normalized in zip(expected_params, normalized_expected):
+        if exp_normalized.endswith(normalized) or exp_normalized.startswith(normalized) or normalized.endswith(exp_normalized):
+            add(expected)
+
+    return tuple(ranked)
+
+
+def _known_lookup_keys(expected_params: tuple[str, ...], normalized_expected: tuple[str, ...]) -> set[str]:
+    """Names worth pre-ranking at compile time: expected params and their known aliases."""
+    keys: set[str] = set(normalized_expected)
+    for expected in expected_params:
+        keys.update(PARAM_ALIASES.get(expected, ()))
+        canonical = _ALIAS_TO_CANONICAL.get(expected)
+        if canonical is not None:
+            keys.add(canonical)
+            keys.update(PARAM_ALIASES.get(canonical, ()))
+    return keys
+
+
+def compile_calculate_plan(calculator: BaseCalculator) -> CalculatePlan:
+    """
+    Compile a calculator's calculate() signature into a CalculatePlan.
+
+    Calculators declared as ``calculate(self, **params)`` expose their
+    accepted names through ``metadata.low_level.input_params``; those names
+    are treated as optional here and validated by the calculator itself.
+    """
+    sig = inspect.signature(calculator.calculate)
+    hints = getattr(calculator.calculate, "__annotations__", {})
+
+    expected: list[str] = []
+    required: list[str] = []
+    template: dict[str, str] = {}
+    accepts_var_keyword = False
+
+    for name, param in sig.parameters.items():
+        if name == "self":
+            continue
+        if param.kind is inspect.Parameter.VAR_KEYWORD:
+            accepts_var_keyword = True
+            continue
+        if param.kind is inspect.Parameter.VAR_POSITIONAL:
+            continue
+
+        expected.append(name)
+        type_str = _get_type_string(hints.get(name), param.default)
+        if param.default is inspect.Parameter.empty:
+            required.append(name)
+            template[name] = f"<{type_str}> (required)"
+        elif param.default is None:
+            template[name] = f"<{type_str}> (optional)"
+        else:
+            template[name] = f"<{type_str}> (default: {param.default})"
+
+    if accepts_var_keyword:
+        metadata = getattr(calculator, "metadata", None)
+        declared = metadata.low_level.input_params if metadata is not None else ()
+        for name in declared:
+            if name not in template:
+                expected.append(name)
+                template[name] = "<any> (optional)"
+
+    expected_params = tuple(expected)
+    normalized_expected = tuple(normalize_param_name(name) for name in expected_params)
+    alias_table = {key: _rank_candidates(key, expected_params, normalized_expected) for key in _known_lookup_keys(expected_params, normalized_expected)}
+
+    return CalculatePlan(
+        expected_params=expected_params,
+        required_params=tuple(required),
+        normalized_expected=normalized_expected,
+        param_template=template,
+        alias_table=alias_table,
+    )
+
+
+_plan_cache: weakref.WeakKeyDictionary[BaseCalculator, CalculatePlan] = weakref.WeakKeyDictionary()
+
+
+def get_calculate_plan(calculator: BaseCalculator) -> CalculatePlan:
+    """Get (compiling on first use) the shared CalculatePlan for a calculator instance."""
+    plan = _plan_cache.get(calculator)
+    if plan is None:
+        plan = compile_calculate_plan(calculator)
+        _plan_cache[calculator] = plan
+    return plan
+
+
+def seed_calculate_plan(calculator: BaseCalculator, plan: CalculatePlan) -> None:
+    """Share a prebuilt plan (e.g. from a registry manifest) with a calculator instance."""
+    _plan_cache[calculator] = plan
+
 
 # =============================================================================
 # Match Result
@@ -205,6 +524,7 @@ class ParamMatcher:
         self,
         provided_params: dict[str, Any],
         calculator: BaseCalculator,
+        plan: Optional[CalculatePlan] = None,
     ) -> ParamMatchResult:
         """
         Match provided params to calculator's expected params.
@@ -212,13 +532,13 @@ class ParamMatcher:
         Args:
             provided_params: User-provided parameter dict
             calculator: Target calculator instance
+            plan: Precompiled plan for the calculator (looked up if omitted)
 
         Returns:
             ParamMatchResult with matched params or error details
         """
-        # Get expected params from calculator's calculate method signature
-        expected_params = self._get_expected_params(calculator)
-        required_params = self._get_required_params(calculator)
+        if plan is None:
+            plan = get_calculate_plan(calculator)
 
         matched: dict[str, Any] = {}
         match_details: dict[str, str] = {}
@@ -229,11 +549,7 @@ class ParamMatcher:
         matched_expected: set[str] = set()
 
         for provided_name, value in provided_params.items():
-            matched_name = self._find_match(
-                provided_name,
-                expected_params,
-                matched_expected,
-            )
+            matched_name = self._find_match(provided_name, plan, matched_expected)
 
             if matched_name:
                 matched[matched_name] = value
@@ -242,12 +558,12 @@ class ParamMatcher:
             else:
                 unmatched.append(provided_name)
                 # Find suggestions
-                sugg = self._find_suggestions(provided_name, expected_params)
+                sugg = self._find_suggestions(provided_name, plan)
                 if sugg:
                     suggestions[provided_name] = sugg
 
         # Check for missing required params
-        missing = [p for p in required_params if p not in matched_expected]
+        missing = [p for p in plan.required_params if p not in matched_expected]
 
         # Determine success
         success = len(missing) == 0
@@ -265,79 +581,40 @@ class ParamMatcher:
 
     def _get_expected_params(self, calculator: BaseCalculator) -> list[str]:
         """Get all parameter names from calculator's calculate method."""
-        sig = inspect.signature(calculator.calculate)
-        return [name for name, param in sig.parameters.items() if name != "self"]
+        return list(get_calculate_plan(calculator).expected_params)
 
     def _get_required_params(self, calculator: BaseCalculator) -> list[str]:
         """Get required (non-default) parameters."""
-        sig = inspect.signature(calculator.calculate)
-        return [name for name, param in sig.parameters.items() if name != "self" and param.default is inspect.Parameter.empty]
+        return list(get_calculate_plan(calculator).required_params)
 
     def _find_match(
         self,
         provided_name: str,
-        expected_params: list[str],
+        plan: CalculatePlan,
         already_matched: set[str],
     ) -> Optional[str]:
         """
-        Find a match for provided_name in expected_params.
+        Find a match for provided_name in the plan's expected params.
 
-        Tries matching strategies in order of preference.
+        Exact, alias, unit-stripped and prefix/suffix candidates come from the
+        plan's precompiled lookup table (best first); fuzzy matching is only
+        attempted when none of them is still available.
         """
-        available = [p for p in expected_params if p not in already_matched]
-        if not available:
-            return None
-
         normalized = self._normalize(provided_name)
 
-        # Strategy 1: Exact match
-        if normalized in available:
-            return normalized
-
-        # Strategy 2: Alias lookup
-        canonical = _ALIAS_TO_CANONICAL.get(normalized)
-        if canonical and canonical in available:
-            return canonical
-
-        # Also check if any expected param is an alias of provided
-        for expected in available:
-            if expected in _ALIAS_TO_CANONICAL:
-                if _ALIAS_TO_CANONICAL[expected] == normalized:
-                    return expected
-            # Check if provided is in expected's aliases
-            if expected in PARAM_ALIASES:
-                if normalized in PARAM_ALIASES[expected]:
-                    return expected
-
-        # Strategy 3: Strip unit suffixes
-        stripped = self._strip_units(normalized)
-        if stripped != normalized:
-            if stripped in available:
-                return stripped
-            # Check aliases of stripped
-            canonical = _ALIAS_TO_CANONICAL.get(stripped)
-            if canonical and canonical in available:
-                return canonical
-
-        # Strategy 4: Prefix/suffix partial match
-        for expected in available:
-            exp_normalized = self._normalize(expected)
-            # provided is suffix of expected (e.g., "creatinine" in "serum_creatinine")
-            if exp_normalized.endswith(f"_{normalized}") or exp_normalized.endswith(normalized):
-                return expected
-            # provided is prefix of expected
-            if exp_normalized.startswith(f"{normalized}_") or exp_normalized.startswith(normalized):
-                return expected
-            # expected is suffix of provided
-            if normalized.endswith(f"_{exp_normalized}") or normalized.endswith(exp_normalized):
-                return expected
+        # Strategies 1-4: Exact, alias, unit-stripped, prefix/suffix
+        for candidate in plan.candidates_for(normalized):
+            if candidate not in already_matched:
+                return candidate
 
         # Strategy 5: Fuzzy match
         if self.allow_fuzzy:
             best_match = None
             best_score = 0.0
-            for expected in available:
-                score = similarity_ratio(normalized, self._normalize(expected))
+            for expected, exp_normalized in zip(plan.expected_params, plan.normalized_expected):
+                if expected in already_matched:
+                    continue
+                score = similarity_ratio(normalized, exp_normalized)
                 if score > best_score and score >= self.fuzzy_threshold:
                     best_score = score
                     best_match = expected
@@ -349,15 +626,15 @@ class ParamMatcher:
     def _find_suggestions(
         self,
         provided_name: str,
-        expected_params: list[str],
+        plan: CalculatePlan,
         limit: int = 3,
     ) -> list[str]:
         """Find similar parameter names as suggestions."""
         normalized = self._normalize(provided_name)
         scored = []
 
-        for expected in expected_params:
-            score = similarity_ratio(normalized, self._normalize(expected))
+        for expected, exp_normalized in zip(plan.expected_params, plan.normalized_expected):
+            score = similarity_ratio(normalized, exp_normalized)
             if score > 0.4:  # Minimum threshold for suggestions
                 scored.append((expected, score))
 
@@ -366,22 +643,11 @@ class ParamMatcher:
 
     def _normalize(self, name: str) -> str:
         """Normalize parameter name for matching."""
-        # Lowercase
-        name = name.lower()
-        # Replace common separators
-        name = name.replace("-", "_").replace(" ", "_")
-        # Remove multiple underscores
-        name = re.sub(r"_+", "_", name)
-        # Strip leading/trailing underscores
-        name = name.strip("_")
-        return name
+        return normalize_param_name(name)
 
     def _strip_units(self, name: str) -> str:
         """Strip unit suffixes from parameter name."""
-        for suffix in UNIT_SUFFIXES:
-            if name.endswith(suffix):
-                return name[: -len(suffix)]
-        return name
+        return strip_unit_suffix(name)
 
 
 # =============================================================================
@@ -417,38 +683,7 @@ def generate_param_template(calculator: BaseCalculator) -> dict[str, str]:
             "sex": "<'male' | 'female'>"
         }
     """
-    template: dict[str, str] = {}
-    sig = inspect.signature(calculator.calculate)
-
-    # Get type hints if available
-    hints = {}
-    try:
-        hints = calculator.calculate.__annotations__
-    except AttributeError:
-        pass
-
-    for name, param in sig.parameters.items():
-        if name == "self":
-            continue
-
-        # Determine type string
-        type_hint = hints.get(name)
-        type_str = _get_type_string(type_hint, param.default)
-
-        # Check if required
-        is_required = param.default is inspect.Parameter.empty
-
-        # Build template string
-        if is_required:
-            template[name] = f"<{type_str}> (required)"
-        else:
-            default_val = param.default
-            if default_val is None:
-                template[name] = f"<{type_str}> (optional)"
-            else:
-                template[name] = f"<{type_str}> (default: {default_val})"
-
-    return template
+    return dict(get_calculate_plan(calculator).param_template)
 
 
 def _get_type_string(type_hint: Any, default: Any) -> str:
@@ -0,0 +1,284 @@
+"""
+Questionnaire Batch Engine
+
+Columnar batch scoring for the additive questionnaire scales built on
+QuestionnaireDefinition (PHQ-2, AUDIT, CAGE, GDS-15, ISI, Lawton IADL, ...).
+
+Built for population screening: one call scores hundreds of thousands of
+survey responses without per-row parameter matching, ScoreResult
+construction or interpretation building. The definition drives everything:
+
+1. Validation: the item matrix is checked column by column in item order,
+   and each row keeps the first failing item's message, so row errors are
+   the ValueError the scalar ``calculate()`` would raise.
+2. Totals: a vectorized row sum over the validated matrix (NumPy int64 when
+   available, ``map(sum, zip(...))`` otherwise - integer sums are exact in
+   both).
+3. Bands: a binary search of every total over the definition's precomputed
+   ``band_bounds`` (``searchsorted`` / ``bisect_left``).
+
+Inputs are either a list of dicts (one per response) or a mapping of item
+name to sequence (lists, tuples or NumPy arrays). Integer NumPy columns are
+validated without leaving NumPy. Missing answers may be absent, None or NaN.
+
+Example:
+    >>> result = calculate_questionnaire_batch("phq2", {"interest_pleasure": [2, 0], "feeling_down": [1, 1]})
+    >>> result.totals, result.band_indices, result.stages
+    ([3, 1], [1, 0], ['Positive Screen', 'Negative Screen'])
+"""
+
+from __future__ import annotations
+
+import math
+from bisect import bisect_left
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+from importlib import import_module
+from typing import Any, Optional
+
+from ..value_objects.interpretation import Interpretation
+from .calculators.scale_expansion_batch import ItemSpec, QuestionnaireDefinition, QuestionnaireScaleCalculator, ScaleBand, coerce_item_score
+
+try:  # pragma: no branch - import depends on optional dependency presence
+    _numpy: Any = import_module("numpy")
+except ImportError:  # pragma: no cover - fallback path depends on installed extras
+    _numpy = None
+
+
+# Rows (list of dicts) or columns (item name -> list, tuple or NumPy array)
+BatchRecords = Sequence[Mapping[str, Any]] | Mapping[str, Any]
+
+
+def _questionnaire_definitions() -> dict[str, QuestionnaireDefinition]:
+    """Definitions of every concrete QuestionnaireScaleCalculator subclass, by tool_id."""
+    definitions: dict[str, QuestionnaireDefinition] = {}
+    pending = list(QuestionnaireScaleCalculator.__subclasses__())
+    while pending:
+        calculator_type = pending.pop()
+        pending.extend(calculator_type.__subclasses__())
+        definition = calculator_type.__dict__.get("DEFINITION")
+        if isinstance(definition, QuestionnaireDefinition):
+            definitions[definition.tool_id] = definition
+    return dict(sorted(definitions.items()))
+
+
+_DEFINITIONS = _questionnaire_definitions()
+
+QUESTIONNAIRE_BATCH_TOOL_IDS: tuple[str, ...] = tuple(_DEFINITIONS)
+
+
+def questionnaire_definition(tool_id: str) -> QuestionnaireDefinition:
+    """
+    Definition of a questionnaire scale.
+
+    Raises:
+        ValueError: If the tool is not a questionnaire scale
+    """
+    definition = _DEFINITIONS.get(tool_id)
+    if definition is None:
+        raise ValueError(f"Tool '{tool_id}' is not a questionnaire scale; supported: {', '.join(QUESTIONNAIRE_BATCH_TOOL_IDS)}")
+    return definition
+
+
+def numpy_available() -> bool:
+    """Return whether NumPy is available for vectorized validation and sums."""
+    return _numpy is not None
+
+
+# =============================================================================
+# Result
+# =============================================================================
+
+
+@dataclass
+class QuestionnaireBatchResult:
+    """
+    Columnar result of a questionnaire batch run.
+
+    ``totals[i]`` is the scalar ``ScoreResult.value`` for response i,
+    ``band_indices[i]`` the index of its band in ``definition.bands`` and
+    ``errors[i]`` the validation message; failed rows have None for total
+    and band. Interpretation objects are built only on request via
+    ``interpretation(i)``.
+    """
+
+    definition: QuestionnaireDefinition
+    totals: list[Optional[int]]
+    band_indices: list[Optional[int]]
+    errors: list[Optional[str]]
+    _interpretations: dict[int, Interpretation] = field(default_factory=dict, repr=False)
+
+    def __len__(self) -> int:
+        return len(self.totals)
+
+    @property
+    def tool_id(self) -> str:
+        return self.definition.tool_id
+
+    @property
+    def error_count(self) -> int:
+        """Number of rows that failed validation."""
+        return sum(1 for error in self.errors if error is not None)
+
+    @property
+    def stages(self) -> list[Optional[str]]:
+        """Band stage label per row (None for failed rows)."""
+        bands = self.definition.bands
+        return [None if index is None else bands[index].stage for index in self.band_indices]
+
+    def band(self, index: int) -> Optional[ScaleBand]:
+        """The ScaleBand of one row; None for failed rows."""
+        band_index = self.band_indices[index]
+        return None if band_index is None else self.definition.bands[band_index]
+
+    def interpretation(self, index: int) -> Optional[Interpretation]:
+        """Build (and cache) the full Interpretation for one row; None for failed rows."""
+        total, band_index = self.totals[index], self.band_indices[index]
+        if total is None or band_index is None:
+            return None
+        cached = self._interpretations.get(index)
+        if cached is None:
+            cached = self._interpretations[index] = self.definition.interpretation(total, band_index)
+        return cached
+
+    def to_numpy(self) -> tuple[Any, Any]:
+        """Return (totals, band indices) as int64 NumPy arrays, -1 for failed rows (requires numpy)."""
+        if _numpy is None:
+            raise ImportError("numpy is required for QuestionnaireBatchResult.to_numpy()")
+        totals = _numpy.asarray([-1 if total is None else total for total in self.totals], dtype=_numpy.int64)
+        band_indices = _numpy.asarray([-1 if index is None else index for index in self.band_indices], dtype=_numpy.int64)
+        return totals, band_indices
+
+
+# =============================================================================
+# Validation
+# =============================================================================
+
+
+def _is_integer_array(column: Any) -> bool:
+    return _numpy is not None and isinstance(column, _numpy.ndarray) and column.ndim == 1 and column.dtype.kind in "biu"
+
+
+def _raw_columns(item_specs: tuple[ItemSpec, ...], records: BatchRecords) -> tuple[int, list[Any]]:
+    """Return (row count, one raw column per item in definition order); absent columns are None."""
+    if isinstance(records, Mapping):
+        columns = [records.get(spec.name) for spec in item_specs]
+        lengths = {len(column) for column in columns if column is not None}
+        if len(lengths) > 1:
+            raise ValueError(f"Column lengths differ: {sorted(lengths)}")
+        return (lengths.pop() if lengths else 0), columns
+
+    return len(records), [[row.get(spec.name) for row in records] for spec in item_specs]
+
+
+def _validate_array(spec: ItemSpec, column: Any, errors: list[Optional[str]]) -> Any:
+    """Range-check an integer NumPy column in place of per-value coercion."""
+    values = column.astype(_numpy.int64)
+    if spec.allowed_values is not None:
+        invalid = ~_numpy.isin(values, spec.allowed_values)
+        message = f"{spec.name} must be one of {spec.allowed_values}"
+    else:
+        invalid = (values < spec.min_value) | (values > spec.max_value)
+        message = f"{spec.name} must be between {spec.min_value} and {spec.max_value}"
+    for row in _numpy.flatnonzero(invalid).tolist():
+        if errors[row] is None:
+            errors[row] = message
+    return values
+
+
+# Item ranges up to this size get a set-membership fast path
+_MAX_FAST_RANGE = 1024
+
+
+def _all_valid(spec: ItemSpec, values: list[Any]) -> bool:
+    """Whether every value is an in-range int (or bool), checked with C-level set operations."""
+    if not set(map(type, values)) <= {int, bool}:
+        return False
+    if spec.allowed_values is not None:
+        return set(values) <= set(spec.allowed_values)
+    if spec.max_value - spec.min_value > _MAX_FAST_RANGE:
+        return False
+    return set(values) <= set(range(spec.min_value, spec.max_value + 1))
+
+
+def _validate_list(spec: ItemSpec, column: Any, errors: list[Optional[str]]) -> list[int]:
+    """Coerce and range-check one column of Python values; invalid cells become 0."""
+    values = column.tolist() if callable(getattr(column, "tolist", None)) else list(column)
+    if _all_valid(spec, values):
+        return values
+
+    allowed = spec.allowed_values
+    low, high = spec.min_value, spec.max_value
+    range_message = f"{spec.name} must be one of {allowed}" if allowed is not None else f"{spec.name} must be between {low} and {high}"
+
+    validated = [0] * len(values)
+    for row, value in enumerate(values):
+        if type(value) is not int:
+            if value is None or (isinstance(value, float) and math.isnan(value)):
+                if errors[row] is None:
+                    errors[row] = f"Missing required parameter: {spec.name}"
+                continue
+            try:
+                value = coerce_item_score(value, item_name=spec.name)
+            except ValueError as e:
+                if errors[row] is None:
+                    errors[row] = str(e)
+                continue
+        if (value not in allowed) if allowed is not None else (value < low or value > high):
+            if errors[row] is None:
+                errors[row] = range_message
+            continue
+        validated[row] = value
+    return validated
+
+
+# =============================================================================
+# Public API
+# =============================================================================
+
+
+def calculate_questionnaire_batch(questionnaire: str | QuestionnaireDefinition, records: BatchRecords) -> QuestionnaireBatchResult:
+    """
+    Score many responses to one questionnaire in a single call.
+
+    Args:
+        questionnaire: One of QUESTIONNAIRE_BATCH_TOOL_IDS, or a QuestionnaireDefinition
+        records: List of response dicts, or mapping of item name -> sequence/array,
+            keyed by the definition's item names
+
+    Returns:
+        QuestionnaireBatchResult with per-row totals, band indices and errors
+
+    Raises:
+        ValueError: If the tool is not a questionnaire scale or columns are misaligned
+    """
+    definition = questionnaire if isinstance(questionnaire, QuestionnaireDefinition) else questionnaire_definition(questionnaire)
+
+    row_count, raw_columns = _raw_columns(definition.item_specs, records)
+    errors: list[Optional[str]] = [None] * row_count
+    columns: list[Any] = []
+    for spec, raw in zip(definition.item_specs, raw_columns, strict=True):
+        if raw is None:
+            errors = [error or f"Missing required parameter: {spec.name}" for error in errors]
+            columns.append([0] * row_count)
+        elif _is_integer_array(raw):
+            columns.append(_validate_array(spec, raw, errors))
+        else:
+            columns.append(_validate_list(spec, raw, errors))
+
+    if _numpy is not None and row_count:
+        totals_array = _numpy.stack([_numpy.asarray(column, dtype=_numpy.int64) for column in columns], axis=1).sum(axis=1)
+        band_array = _numpy.minimum(_numpy.searchsorted(definition.band_bounds, totals_array, side="left"), len(definition.bands) - 1)
+        totals: list[Optional[int]] = totals_array.tolist()
+        band_indices: list[Optional[int]] = band_array.tolist()
+    else:
+        sums: list[int] = list(map(sum, zip(*columns, strict=True))) if columns else [0] * row_count
+        bounds, last_band = definition.band_bounds, len(definition.bands) - 1
+        band_indices = [min(bisect_left(bounds, total), last_band) for total in sums]
+        totals = list(sums)
+
+    for row, error in enumerate(errors):
+        if error is not None:
+            totals[row] = band_indices[row] = None
+
+    return QuestionnaireBatchResult(definition=definition, totals=totals, band_indices=band_indices, errors=errors)
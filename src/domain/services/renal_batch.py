@@ -0,0 +1,307 @@
+"""
+Renal Batch Engine
+
+Columnar batch scoring for the closed-form renal calculators
+(ckd_epi_2021, cockcroft_gault, fena, kdigo_aki).
+
+Built for lab feeds: one call scores thousands of rows without per-row
+parameter matching, ScoreResult construction or interpretation building.
+Every row goes through the same kernel functions the calculators use, so
+values are bit-for-bit identical to the scalar ``calculate()`` path.
+
+Inputs are either a list of dicts (one per row) or a mapping of column name
+to sequence (lists, tuples or NumPy arrays). NumPy is optional: it is only
+used to read array columns and, on request, to return results as arrays.
+The arithmetic stays on Python floats because NumPy's vectorized pow/round
+are not guaranteed to match CPython's libm pow and correctly rounded round().
+Columns are type-checked before scoring: a non-numeric cell in a numeric
+column becomes that row's error, with the scalar path's message.
+
+Example:
+    >>> result = calculate_renal_batch(
+    ...     "ckd_epi_2021",
+    ...     {"age": [65, 40], "sex": ["female", "male"], "serum_creatinine": [1.2, 0.9]},
+    ... )
+    >>> result.values, result.stages
+    ([50.2, 110.7], ['G3a', 'G1'])
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass, field
+from importlib import import_module
+from typing import Any, Optional
+
+from ..value_objects.interpretation import Interpretation
+from .base import BaseCalculator
+from .calculators.ckd_epi_2021 import CkdEpi2021Calculator, ckd_epi_2021_egfr, ckd_epi_2021_stage, validate_ckd_epi_2021_inputs
+from .calculators.cockcroft_gault import (
+    CockcroftGaultCalculator,
+    cockcroft_gault_body_weights,
+    cockcroft_gault_crcl,
+    cockcroft_gault_stage,
+    validate_cockcroft_gault_inputs,
+)
+from .calculators.fena import FENaCalculator, fena_percent, fena_stage, validate_fena_inputs
+from .calculators.kdigo_aki import KdigoAkiCalculator, kdigo_aki_stage, kdigo_stage_label
+
+try:  # pragma: no branch - import depends on optional dependency presence
+    _numpy: Any = import_module("numpy")
+except ImportError:  # pragma: no cover - fallback path depends on installed extras
+    _numpy = None
+
+
+# Rows (list of dicts) or columns (name -> list, tuple or NumPy array)
+BatchRecords = Sequence[Mapping[str, Any]] | Mapping[str, Any]
+
+
+# =============================================================================
+# Row kernels: (validated inputs) -> (value, stage code)
+# =============================================================================
+
+
+def _ckd_epi_2021_row(age: float, sex: str, serum_creatinine: float) -> tuple[float, str]:
+    validate_ckd_epi_2021_inputs(age, sex, serum_creatinine)
+    egfr = ckd_epi_2021_egfr(age, sex, serum_creatinine)
+    return egfr, ckd_epi_2021_stage(egfr)
+
+
+def _cockcroft_gault_row(age: float, weight_kg: float, creatinine_mg_dl: float, sex: str, height_cm: Optional[float] = None) -> tuple[float, str]:
+    validate_cockcroft_gault_inputs(age, weight_kg, creatinine_mg_dl, height_cm)
+    dosing_weight = weight_kg
+    if height_cm is not None:
+        _ibw, adjbw = cockcroft_gault_body_weights(weight_kg, height_cm, sex)
+        if adjbw is not None:
+            dosing_weight = adjbw
+    crcl = cockcroft_gault_crcl(age, dosing_weight, creatinine_mg_dl, sex)
+    return float(round(crcl, 1)), cockcroft_gault_stage(crcl)
+
+
+def _fena_row(urine_sodium: float, plasma_sodium: float, urine_creatinine: float, plasma_creatinine: float, on_diuretics: bool = False) -> tuple[float, str]:
+    validate_fena_inputs(urine_sodium, plasma_sodium, urine_creatinine, plasma_creatinine)
+    fena = fena_percent(urine_sodium, plasma_sodium, urine_creatinine, plasma_creatinine)
+    return fena, fena_stage(fena, bool(on_diuretics))
+
+
+def _kdigo_aki_row(
+    current_creatinine: float,
+    baseline_creatinine: Optional[float] = None,
+    creatinine_increase_48h: Optional[float] = None,
+    urine_output_ml_kg_h: Optional[float] = None,
+    urine_output_duration_hours: Optional[float] = None,
+    on_rrt: bool = False,
+) -> tuple[float, str]:
+    stage = kdigo_aki_stage(
+        current_creatinine,
+        baseline_creatinine,
+        creatinine_increase_48h,
+        urine_output_ml_kg_h,
+        urine_output_duration_hours,
+        bool(on_rrt),
+    )
+    return float(stage), kdigo_stage_label(stage)
+
+
+@dataclass(frozen=True)
+class _BatchSpec:
+    """Column layout and kernel for one batch-capable calculator."""
+
+    required: tuple[str, ...]
+    optional: tuple[str, ...]
+    numeric: tuple[str, ...]
+    kernel: Callable[..., tuple[float, str]]
+    calculator_type: type[BaseCalculator]
+
+
+_BATCH_SPECS: dict[str, _BatchSpec] = {
+    "ckd_epi_2021": _BatchSpec(
+        required=("age", "sex", "serum_creatinine"),
+        optional=(),
+        numeric=("age", "serum_creatinine"),
+        kernel=_ckd_epi_2021_row,
+        calculator_type=CkdEpi2021Calculator,
+    ),
+    "cockcroft_gault": _BatchSpec(
+        required=("age", "weight_kg", "creatinine_mg_dl", "sex"),
+        optional=("height_cm",),
+        numeric=("age", "weight_kg", "creatinine_mg_dl", "height_cm"),
+        kernel=_cockcroft_gault_row,
+        calculator_type=CockcroftGaultCalculator,
+    ),
+    "fena": _BatchSpec(
+        required=("urine_sodium", "plasma_sodium", "urine_creatinine", "plasma_creatinine"),
+        optional=("on_diuretics",),
+        numeric=("urine_sodium", "plasma_sodium", "urine_creatinine", "plasma_creatinine"),
+        kernel=_fena_row,
+        calculator_type=FENaCalculator,
+    ),
+    "kdigo_aki": _BatchSpec(
+        required=("current_creatinine",),
+        optional=("baseline_creatinine", "creatinine_increase_48h", "urine_output_ml_kg_h", "urine_output_duration_hours", "on_rrt"),
+        numeric=("current_creatinine", "baseline_creatinine", "creatinine_increase_48h", "urine_output_ml_kg_h", "urine_output_duration_hours"),
+        kernel=_kdigo_aki_row,
+        calculator_type=KdigoAkiCalculator,
+    ),
+}
+
+RENAL_BATCH_TOOL_IDS: tuple[str, ...] = tuple(_BATCH_SPECS)
+
+
+def numpy_available() -> bool:
+    """Return whether NumPy is available for array input/output."""
+    return _numpy is not None
+
+
+# =============================================================================
+# Result
+# =============================================================================
+
+
+@dataclass
+class RenalBatchResult:
+    """
+    Columnar result of a renal batch run.
+
+    ``values[i]`` is the scalar ``ScoreResult.value`` for row i (NaN when the
+    row failed validation), ``stages[i]`` the interpretation stage code and
+    ``errors[i]`` the validation message, if any. Full Interpretation objects
+    are built only on request via ``interpretation(i)``.
+    """
+
+    tool_id: str
+    values: list[float]
+    stages: list[Optional[str]]
+    errors: list[Optional[str]]
+    _columns: dict[str, list[Any]] = field(repr=False)
+    _interpretations: dict[int, Interpretation] = field(default_factory=dict, repr=False)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    @property
+    def error_count(self) -> int:
+        """Number of rows that failed validation."""
+        return sum(1 for error in self.errors if error is not None)
+
+    def interpretation(self, index: int) -> Optional[Interpretation]:
+        """Build (and cache) the full Interpretation for one row; None for failed rows."""
+        if self.errors[index] is not None:
+            return None
+        cached = self._interpretations.get(index)
+        if cached is None:
+            calculator = _calculator_for(self.tool_id)
+            kwargs = {name: column[index] for name, column in self._columns.items() if column[index] is not None}
+            cached = calculator.calculate(**kwargs).interpretation
+            self._interpretations[index] = cached
+        return cached
+
+    def to_numpy(self) -> tuple[Any, Any]:
+        """Return (float64 values, object stage codes) as NumPy arrays (requires numpy)."""
+        if _numpy is None:
+            raise ImportError("numpy is required for RenalBatchResult.to_numpy()")
+        return _numpy.asarray(self.values, dtype=_numpy.float64), _numpy.asarray(self.stages, dtype=object)
+
+
+_calculators: dict[str, BaseCalculator] = {}
+
+
+def _calculator_for(tool_id: str) -> BaseCalculator:
+    calculator = _calculators.get(tool_id)
+    if calculator is None:
+        calculator = _calculators[tool_id] = _BATCH_SPECS[tool_id].calculator_type()
+    return calculator
+
+
+# =============================================================================
+# Input handling
+# =============================================================================
+
+
+def _as_list(column: Any) -> list[Any]:
+    """Materialize a column as a list of Python scalars (NumPy arrays via tolist())."""
+    tolist = getattr(column, "tolist", None)
+    if callable(tolist):
+        values = tolist()
+        return values if isinstance(values, list) else [values]
+    return list(column)
+
+
+def _normalize_missing(values: list[Any]) -> list[Any]:
+    """Replace NaN placeholders (e.g. from NumPy float columns) with None."""
+    return [None if isinstance(value, float) and math.isnan(value) else value for value in values]
+
+
+def _columns(spec: _BatchSpec, records: BatchRecords) -> tuple[int, list[list[Any]]]:
+    """Return (row count, one list per kernel parameter in signature order)."""
+    names = spec.required + spec.optional
+
+    if isinstance(records, Mapping):
+        present = {name: _as_list(records[name]) for name in names if name in records}
+        lengths = {len(column) for column in present.values()}
+        if len(lengths) > 1:
+            raise ValueError(f"Column lengths differ: {sorted(lengths)}")
+        row_count = lengths.pop() if lengths else 0
+        columns = [present.get(name) or [None] * row_count for name in names]
+    else:
+        row_count = len(records)
+        columns = [[row.get(name) for row in records] for name in names]
+
+    return row_count, [_normalize_missing(column) for column in columns]
+
+
+# =============================================================================
+# Public API
+# =============================================================================
+
+
+def calculate_renal_batch(tool_id: str, records: BatchRecords) -> RenalBatchResult:
+    """
+    Score many rows of one renal calculator in a single call.
+
+    Args:
+        tool_id: One of RENAL_BATCH_TOOL_IDS
+        records: List of row dicts, or mapping of column name -> sequence/array,
+            keyed by the calculator's parameter names. Missing optional values
+            may be None or NaN.
+
+    Returns:
+        RenalBatchResult with per-row values, stage codes and errors
+
+    Raises:
+        ValueError: If the tool is not batch-capable or columns are misaligned
+    """
+    spec = _BATCH_SPECS.get(tool_id)
+    if spec is None:
+        raise ValueError(f"Tool '{tool_id}' has no batch kernel; supported: {', '.join(RENAL_BATCH_TOOL_IDS)}")
+
+    row_count, columns = _columns(spec, records)
+    values: list[float] = [math.nan] * row_count
+    stages: list[Optional[str]] = [None] * row_count
+    errors: list[Optional[str]] = [None] * row_count
+    kernel = spec.kernel
+    required_count = len(spec.required)
+
+    names = spec.required + spec.optional
+
+    # Same message as the scalar path's BoundarySpec type check
+    for name, column in zip(names, columns, strict=True):
+        if name in spec.numeric:
+            for index, value in enumerate(column):
+                if value is not None and not isinstance(value, (int, float)) and errors[index] is None:
+                    errors[index] = f"Expected numeric type, got {type(value).__name__}"
+
+    for index, args in enumerate(zip(*columns, strict=True)):
+        if None in args[:required_count]:
+            missing = [name for name, value in zip(spec.required, args, strict=False) if value is None]
+            errors[index] = f"Missing required parameters: {', '.join(missing)}"
+            continue
+        if errors[index] is not None:
+            continue
+        try:
+            values[index], stages[index] = kernel(*args)
+        except (TypeError, ValueError) as e:
+            errors[index] = str(e)
+
+    return RenalBatchResult(tool_id=tool_id, values=values, stages=stages, errors=errors, _columns=dict(zip(names, columns, strict=True)))
@@ -7,6 +7,7 @@ Defines Low Level and High Level Keys for Tool Discovery.
 - HighLevelKey: For exploration and discovery based on clinical context
 """
 
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
@@ -341,14 +342,14 @@ class LowLevelKey:
         tool_id: Unique identifier (e.g., "ckd_epi_2021")
         name: Human-readable name (e.g., "CKD-EPI 2021")
         purpose: What it calculates (e.g., "Calculate estimated GFR")
-        input_params: List of required parameters
+        input_params: Required parameters (stored as a tuple so shared keys stay immutable)
         output_type: Description of the result
     """
 
     tool_id: str
     name: str
     purpose: str
-    input_params: list[str]
+    input_params: Sequence[str]
     output_type: str
 
     def __post_init__(self) -> None:
@@ -356,9 +357,11 @@ class LowLevelKey:
             raise ValueError("tool_id is required")
         if not self.name:
             raise ValueError("name is required")
+        if not isinstance(self.input_params, tuple):
+            object.__setattr__(self, "input_params", tuple(self.input_params))
 
     def to_dict(self) -> dict[str, Any]:
-        return {"tool_id": self.tool_id, "name": self.name, "purpose": self.purpose, "input_params": self.input_params, "output_type": self.output_type}
+        return {"tool_id": self.tool_id, "name": self.name, "purpose": self.purpose, "input_params": list(self.input_params), "output_type": self.output_type}
 
 
 @dataclass(frozen=True)
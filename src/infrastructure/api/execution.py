@@ -0,0 +1,179 @@
+"""
+REST API Execution Backends
+
+Decides where the REST API runs calculations (API_EXECUTION_BACKEND):
+
+    inline   on the event loop (lowest overhead; a slow calculation delays
+             every other request on the worker, health checks included)
+    thread   on a thread pool (the event loop stays responsive; the GIL still
+             limits calculations to about one core)
+    process  on a pool of worker processes started with the app; each worker
+             builds the registry once (pool initializer), so a single API
+             process can use several cores
+
+Routing by request size: requests of at most API_EXECUTION_INLINE_MAX_ROWS
+rows (default 1, i.e. single calculations) run inline, where a pool
+round-trip would cost more than the calculation; larger batches and streamed
+NDJSON batches (size unknown) go to the pool, several rows per pool job.
+
+Shedding: at most API_EXECUTION_MAX_QUEUE_DEPTH pool jobs may be queued or
+running. A new request that would go to a full pool is rejected with
+ExecutionOverloaded (503 + Retry-After) instead of waiting; rows of a batch
+that was already admitted are never shed.
+
+The pool is a serving.CalculationPool (shared with the MCP calculate_batch
+executor): usage events of process workers are captured with each job and
+replayed into the API process's usage logger, so the usage log and
+/api/v1/stats/latency cover every calculation whichever backend ran it, and
+a pool broken by a dying worker is replaced on the next pooled request.
+"""
+
+import os
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Optional
+
+from ...application.dto import CalculateRequest, CalculateResponse
+from ...application.use_cases.calculate_use_case import CalculateUseCase, ToolCallRecorder
+from ..serving.calculation_pool import MAX_JOB_SIZE, CalculationPool
+
+EXECUTION_BACKENDS = ("inline", "thread", "process")
+
+# Most rows in one pool job (see ExecutionBackend.job_rows())
+MAX_JOB_ROWS = MAX_JOB_SIZE
+
+
+def _default_execution_workers() -> int:
+    return min(8, os.cpu_count() or 1)
+
+
+@dataclass
+class ExecutionConfig:
+    """Execution settings for the REST calculate endpoints"""
+
+    backend: str = "thread"
+    max_workers: int = field(default_factory=_default_execution_workers)
+    inline_max_rows: int = 1
+    max_queue_depth: int = 256
+    retry_after: int = 1
+
+    def __post_init__(self) -> None:
+        if self.backend not in EXECUTION_BACKENDS:
+            raise ValueError(f"API_EXECUTION_BACKEND must be one of {', '.join(EXECUTION_BACKENDS)}, got {self.backend!r}")
+        if self.max_workers < 1:
+            raise ValueError(f"API_EXECUTION_WORKERS must be at least 1, got {self.max_workers}")
+        if self.inline_max_rows < 0 or self.max_queue_depth < 0 or self.retry_after < 0:
+            raise ValueError("API_EXECUTION_INLINE_MAX_ROWS, API_EXECUTION_MAX_QUEUE_DEPTH and API_EXECUTION_RETRY_AFTER must not be negative")
+
+    @classmethod
+    def from_env(cls) -> "ExecutionConfig":
+        """
+        Create execution configuration from environment variables.
+
+        Environment Variables:
+            API_EXECUTION_BACKEND: "thread" (default), "process", or "inline"
+            API_EXECUTION_WORKERS: Pool size (default: min(8, CPU count))
+            API_EXECUTION_INLINE_MAX_ROWS: Requests up to this many rows run inline (default: 1, 0 sends everything to the pool)
+            API_EXECUTION_MAX_QUEUE_DEPTH: Pool jobs queued or running before new requests get 503 (default: 256, 0 disables shedding)
+            API_EXECUTION_RETRY_AFTER: Retry-After seconds on a 503 (default: 1)
+
+        Returns:
+            ExecutionConfig instance
+        """
+        return cls(
+            backend=os.environ.get("API_EXECUTION_BACKEND", "thread").lower(),
+            max_workers=int(os.environ.get("API_EXECUTION_WORKERS", str(_default_execution_workers()))),
+            inline_max_rows=int(os.environ.get("API_EXECUTION_INLINE_MAX_ROWS", "1")),
+            max_queue_depth=int(os.environ.get("API_EXECUTION_MAX_QUEUE_DEPTH", "256")),
+            retry_after=int(os.environ.get("API_EXECUTION_RETRY_AFTER", "1")),
+        )
+
+
+class ExecutionOverloaded(Exception):
+    """The execution pool is at API_EXECUTION_MAX_QUEUE_DEPTH; the request should be retried later."""
+
+    def __init__(self, depth: int, retry_after: int) -> None:
+        super().__init__(f"Calculation queue is full ({depth} jobs pending); retry later")
+        self.depth = depth
+        self.retry_after = retry_after
+
+
+# =============================================================================
+# Backend
+# =============================================================================
+
+
+class ExecutionBackend:
+    """Size-routed, load-shedding runner for REST calculations."""
+
+    def __init__(self, use_case: CalculateUseCase, config: Optional[ExecutionConfig] = None, usage_logger: Optional[ToolCallRecorder] = None) -> None:
+        self._use_case = use_case
+        self._config = config or ExecutionConfig.from_env()
+        self._pool = CalculationPool(
+            use_case,
+            kind="thread" if self._config.backend == "inline" else self._config.backend,
+            max_workers=self._config.max_workers,
+            usage_logger=usage_logger,
+            thread_name_prefix="api-calculate",
+        )
+        self._depth = 0
+
+    @property
+    def config(self) -> ExecutionConfig:
+        return self._config
+
+    @property
+    def depth(self) -> int:
+        """Pool jobs queued or running."""
+        return self._depth
+
+    def routes_to_pool(self, rows: Optional[int]) -> bool:
+        """
+        Whether a request of ``rows`` rows (None: unknown, e.g. a streamed batch) runs on the pool.
+
+        Raises:
+            ExecutionOverloaded: It would run on the pool and the pool is at max_queue_depth
+        """
+        config = self._config
+        if config.backend == "inline" or (rows is not None and rows <= config.inline_max_rows):
+            return False
+        if config.max_queue_depth and self._depth >= config.max_queue_depth:
+            raise ExecutionOverloaded(self._depth, config.retry_after)
+        return True
+
+    def start(self) -> None:
+        """
+        Create the pool now instead of on first use.
+
+        Process workers are started and initialized before this returns, so
+        the first requests do not pay for forking and registry setup.
+        """
+        if self._config.backend != "inline":
+            self._pool.start()
+
+    def shutdown(self) -> None:
+        """Shut down the pool (if one was started)."""
+        self._pool.shutdown()
+
+    def job_rows(self, rows: Optional[int]) -> int:
+        """Rows per pool job for a batch of ``rows`` rows (None: unknown); see serving.job_size()."""
+        return self._pool.job_size(rows)
+
+    async def execute(self, request: CalculateRequest, pooled: bool) -> CalculateResponse:
+        """Run one calculation inline or, when ``pooled`` (see routes_to_pool()), on the pool."""
+        return (await self.execute_many([request], pooled))[0]
+
+    async def execute_many(self, requests: Sequence[CalculateRequest], pooled: bool = True) -> list[CalculateResponse]:
+        """
+        Run several calculations inline or as one pool job (responses in request order).
+
+        Raises:
+            BrokenExecutor: A process worker died; the next pooled request starts a new pool
+        """
+        if not pooled:
+            return [self._use_case.execute(request) for request in requests]
+        self._depth += 1
+        try:
+            return await self._pool.run(requests)
+        finally:
+            self._depth -= 1
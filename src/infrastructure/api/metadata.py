@@ -69,6 +69,8 @@ def build_api_description() -> str:
         "1. `GET /api/v1/calculators` - 列出所有計算器",
         "2. `GET /api/v1/calculators/{tool_id}` - 取得計算器詳情",
         "3. `POST /api/v1/calculate/{tool_id}` - 執行計算",
+        "4. `POST /api/v1/calculate:batch` - 批次計算 (JSON 陣列或 NDJSON，串流回傳 NDJSON)",
+        "5. `POST /api/v1/score-patient` - 單一病人資料一次計算多個評分 (衍生量共用)",
         "",
         "### 代表性專科覆蓋",
         "",
@@ -13,11 +13,32 @@ Usage:
 
     # With uvicorn (production)
     uvicorn src.infrastructure.api.server:app --host 0.0.0.0 --port 8080
+
+    # Pre-forked workers sharing one warmed-up registry (POSIX)
+    python -m src.infrastructure.api.server --workers 4
+
+Metrics:
+    GET /metrics serves Prometheus text: HTTP requests per route and status,
+    rate-limiter rejections, event-loop lag and per-tool_id metrics.
+    Disable with METRICS_ENABLED=false.
+
+Execution:
+    API_EXECUTION_BACKEND selects where calculations run (inline, thread or a
+    pre-started process pool); large batches go to the pool and new requests
+    get 503 + Retry-After when API_EXECUTION_MAX_QUEUE_DEPTH jobs are pending
+    (see execution.py).
+
+Security:
+    SECURITY_RATE_LIMIT_ENABLED / SECURITY_AUTH_ENABLED are enforced by a pure
+    ASGI middleware (401/429 before the request body is read); /health and
+    /ready stay open (SECURITY_EXEMPT_PATHS).
 """
 
+import asyncio
+import json
 import os
 import sys
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, AsyncIterator
 from contextlib import asynccontextmanager
 from dataclasses import asdict
 from pathlib import Path
@@ -30,19 +51,31 @@ if str(project_root) not in sys.path:
 
 from fastapi import Depends, FastAPI, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from pydantic import BaseModel, ConfigDict, Field
+from starlette.concurrency import run_in_threadpool
+from starlette.requests import ClientDisconnect
+from starlette.types import Receive, Scope, Send
 
-from src.application.dto import CalculateRequest, DiscoveryMode, DiscoveryRequest
+from src.application.dto import CalculateRequest, CalculateResponse, DiscoveryMode, DiscoveryRequest
 from src.application.use_cases.calculate_use_case import CalculateUseCase
 from src.application.use_cases.discovery_use_case import DiscoveryUseCase
+from src.application.use_cases.patient_scoring_use_case import ALL_APPLICABLE, PatientScoringUseCase
+from src.application.use_cases.tool_schema_use_case import ToolSchemaUseCase
 from src.domain.registry.tool_registry import get_registry
 from src.domain.services.calculators import CALCULATORS
+from src.domain.validation.boundaries import get_boundary_registry
+from src.infrastructure.api.execution import ExecutionBackend, ExecutionOverloaded
 from src.infrastructure.api.metadata import build_api_description
+from src.infrastructure.logging import get_logger as get_usage_logger
+from src.infrastructure.metrics import MetricsMiddleware, get_metrics, metrics_enabled, render_metrics
+from src.infrastructure.security import ASGISecurityMiddleware, SecurityMiddleware
 from src.infrastructure.security.config import SecurityConfig
 from src.shared.formula_provenance import validate_formula_provenance_manifest
+from src.shared.latency_histogram import ALL_TIME_WINDOW, LATENCY_WINDOWS
 from src.shared.production_readiness import ReadinessReport, build_readiness_report
 from src.shared.project_metadata import get_project_version
+from src.shared.prometheus_format import PROMETHEUS_CONTENT_TYPE
 
 # =============================================================================
 # Pydantic Models for API
@@ -66,6 +99,22 @@ class CalculatorResponse(BaseModel):
     error: Optional[str] = None
 
 
+class PatientScoringInput(BaseModel):
+    """Patient scoring input model"""
+
+    record: dict[str, Any] = Field(..., description="Patient fields (parameter names or aliases; null counts as missing)")
+    tools: list[str] | str = Field(ALL_APPLICABLE, description='Tool ids, or "all_applicable" for every tool the record can feed')
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "record": {"age": 67, "sex": "male", "systolic_bp": 92, "diastolic_bp": 54, "respiratory_rate": 26, "creatinine": 2.1},
+                "tools": ["qsofa_score", "ckd_epi_2021"],
+            }
+        }
+    )
+
+
 class DiscoveryResponse(BaseModel):
     """Discovery response model"""
 
@@ -113,7 +162,7 @@ def build_api_readiness_report(registry: Any) -> ReadinessReport:
         discovery_built=bool(discovery_stats.get("discovery_built")),
         formula_provenance_issues=provenance_issues,
         auth_enabled=security_config.auth_enabled,
-        api_keys_configured=bool(security_config.auth_api_keys),
+        api_keys_configured=security_config.has_api_key_source(),
         rate_limit_enabled=security_config.rate_limit_enabled,
         cors_origins=_cors_origins,
         ssl_enabled=_is_ssl_enabled(),
@@ -129,18 +178,27 @@ def _initialize_registry() -> tuple[Any, CalculateUseCase, DiscoveryUseCase]:
             registry.register(instance)
 
     registry.build_discovery_indexes()
-    return registry, CalculateUseCase(registry), DiscoveryUseCase(registry)
+    return registry, CalculateUseCase(registry, usage_logger=get_usage_logger()), DiscoveryUseCase(registry)
 
 
 def _ensure_app_state(app: FastAPI) -> None:
     """Populate FastAPI app state on demand for tests and direct imports."""
-    if hasattr(app.state, "registry") and hasattr(app.state, "calculate_use_case") and hasattr(app.state, "discovery_use_case"):
-        return
+    if not (hasattr(app.state, "registry") and hasattr(app.state, "calculate_use_case") and hasattr(app.state, "discovery_use_case")):
+        registry, calculate_use_case, discovery_use_case = _initialize_registry()
+        app.state.registry = registry
+        app.state.calculate_use_case = calculate_use_case
+        app.state.discovery_use_case = discovery_use_case
 
-    registry, calculate_use_case, discovery_use_case = _initialize_registry()
-    app.state.registry = registry
-    app.state.calculate_use_case = calculate_use_case
-    app.state.discovery_use_case = discovery_use_case
+    if not hasattr(app.state, "execution_backend"):
+        app.state.execution_backend = ExecutionBackend(app.state.calculate_use_case, usage_logger=get_usage_logger())
+
+    if not hasattr(app.state, "patient_scoring_use_case"):
+        app.state.patient_scoring_use_case = PatientScoringUseCase(app.state.registry, app.state.calculate_use_case)
+
+    if not hasattr(app.state, "schema_use_case"):
+        schema_use_case = ToolSchemaUseCase(app.state.registry)
+        schema_use_case.precompute()
+        app.state.schema_use_case = schema_use_case
 
 
 def get_registry_from_app(request: Request) -> Any:
@@ -155,12 +213,30 @@ def get_calculate_use_case(request: Request) -> CalculateUseCase:
     return cast(CalculateUseCase, request.app.state.calculate_use_case)
 
 
+def get_execution_backend(request: Request) -> ExecutionBackend:
+    """Resolve the shared calculation execution backend from FastAPI application state."""
+    _ensure_app_state(request.app)
+    return cast(ExecutionBackend, request.app.state.execution_backend)
+
+
 def get_discovery_use_case(request: Request) -> DiscoveryUseCase:
     """Resolve the shared discovery use case from FastAPI application state."""
     _ensure_app_state(request.app)
     return cast(DiscoveryUseCase, request.app.state.discovery_use_case)
 
 
+def get_patient_scoring_use_case(request: Request) -> PatientScoringUseCase:
+    """Resolve the shared patient scoring use case from FastAPI application state."""
+    _ensure_app_state(request.app)
+    return cast(PatientScoringUseCase, request.app.state.patient_scoring_use_case)
+
+
+def get_schema_use_case(request: Request) -> ToolSchemaUseCase:
+    """Resolve the shared (precomputed) tool schema use case from FastAPI application state."""
+    _ensure_app_state(request.app)
+    return cast(ToolSchemaUseCase, request.app.state.schema_use_case)
+
+
 # =============================================================================
 # Application Lifespan
 # =============================================================================
@@ -170,11 +246,16 @@ def get_discovery_use_case(request: Request) -> DiscoveryUseCase:
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Application lifespan handler"""
     _ensure_app_state(app)
+    if _metrics_enabled:
+        get_metrics().ensure_lag_monitor()
+    # Start pool workers (and their registries) before the first request
+    app.state.execution_backend.start()
 
     yield
 
-    # Shutdown: Cleanup if needed
-    pass
+    # Shutdown: stop pool workers, then write out queued tool usage events
+    app.state.execution_backend.shutdown()
+    get_usage_logger().flush()
 
 
 # =============================================================================
@@ -191,6 +272,13 @@ app = FastAPI(
     openapi_url="/openapi.json",
 )
 
+# Security (rate limiting / API keys; disabled by default). Added first so it
+# runs inside CORS: preflights are answered without credentials and 401/429
+# responses still carry CORS headers.
+_security = SecurityMiddleware()
+if _security.is_enabled():
+    app.add_middleware(ASGISecurityMiddleware, security=_security)
+
 # CORS middleware - Configure via environment variables for production
 # Default: Allow all origins (development mode)
 # Production: Set CORS_ORIGINS="https://example.com,https://api.example.com"
@@ -202,9 +290,15 @@ app.add_middleware(
     allow_origins=_allowed_origins,
     allow_credentials=True if _cors_origins != "*" else False,  # Credentials only with specific origins
     allow_methods=["GET", "POST", "OPTIONS"],  # Only necessary methods
-    allow_headers=["Content-Type", "Authorization", "X-Request-ID"],
+    allow_headers=["Content-Type", "Authorization", "X-Request-ID", "If-None-Match", _security.config.auth_header_name],
+    expose_headers=["ETag", "Retry-After", "X-RateLimit-Limit", "X-RateLimit-Remaining", "X-RateLimit-Reset"],
 )
 
+# Request metrics (outermost, so CORS preflights and errors are counted too)
+_metrics_enabled = metrics_enabled()
+if _metrics_enabled:
+    app.add_middleware(MetricsMiddleware)
+
 
 # =============================================================================
 # Health & Info Endpoints
@@ -246,6 +340,43 @@ async def readiness_check(registry: Any = Depends(get_registry_from_app)) -> Any
     return payload
 
 
+# =============================================================================
+# Monitoring Endpoints
+# =============================================================================
+
+
+@app.get("/metrics", tags=["Monitoring"], response_class=Response, include_in_schema=_metrics_enabled)
+async def metrics() -> Response:
+    """
+    Prometheus 指標
+
+    Prometheus text exposition: HTTP requests per route and status, latency
+    histograms, in-flight requests, rate-limiter rejections, event-loop lag,
+    and per-tool_id call counters and latency histograms.
+    """
+    if not _metrics_enabled:
+        raise HTTPException(status_code=404, detail="Metrics are disabled (METRICS_ENABLED=false)")
+    return Response(content=await run_in_threadpool(render_metrics), media_type=PROMETHEUS_CONTENT_TYPE)
+
+
+@app.get("/api/v1/stats/latency", tags=["Monitoring"])
+async def latency_stats(
+    window: Optional[str] = Query(None, description="Window: 1m, 5m, 1h or all (default: every window)"),
+    tool_id: Optional[str] = Query(None, description="Only report this tool"),
+) -> dict[str, Any]:
+    """
+    延遲統計
+
+    Latency percentiles (p50/p90/p99/p999, in ms) per tool, per pipeline stage
+    and overall, from this API process's fixed-memory histograms.
+    """
+    windows = (window,) if window else (*LATENCY_WINDOWS, ALL_TIME_WINDOW)
+    try:
+        return await run_in_threadpool(get_usage_logger().get_latency_snapshot, windows, tool_id)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+
 # =============================================================================
 # Discovery Endpoints
 # =============================================================================
@@ -284,6 +415,52 @@ async def get_calculator_info(tool_id: str, use_case: DiscoveryUseCase = Depends
     return asdict(result.tool_detail)
 
 
+# Schemas only change with a deploy: let clients and proxies keep them briefly,
+# then revalidate with If-None-Match. Behind API keys, shared caches must not serve them.
+SCHEMA_CACHE_CONTROL = ("private" if _security.config.auth_enabled else "public") + ", max-age=300, must-revalidate"
+
+
+@app.get(
+    "/api/v1/calculators/{tool_id}/schema",
+    tags=["Discovery"],
+    response_class=Response,
+    responses={200: {"content": {"application/json": {}}}, 304: {"description": "Not Modified"}},
+)
+async def get_calculator_schema(
+    tool_id: str,
+    request: Request,
+    include_references: bool = Query(True, description="Include references (citation, PMID, DOI)"),
+    include_param_sources: bool = Query(True, description="Include clinical hints, common sources and normal ranges"),
+    use_case: ToolSchemaUseCase = Depends(get_schema_use_case),
+) -> Response:
+    """
+    取得計算器的參數 Schema（與 MCP get_tool_schema 相同）
+
+    Get the parameter schema of a calculator, the same payload as the MCP
+    get_tool_schema tool. Served from a precomputed cache with a strong ETag;
+    send If-None-Match to get 304 Not Modified while it is unchanged.
+    """
+    schema = use_case.get(tool_id, include_references=include_references, include_param_sources=include_param_sources)
+    if schema is None:
+        raise HTTPException(status_code=404, detail=f"Calculator '{tool_id}' not found")
+
+    headers = {"ETag": schema.etag, "Cache-Control": SCHEMA_CACHE_CONTROL}
+    if _etag_matches(request.headers.get("if-none-match"), schema.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=schema.json_bytes, media_type="application/json", headers=headers)
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match uses weak comparison (RFC 9110 13.1.2): W/ prefixes are ignored."""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
 @app.get("/api/v1/search", response_model=DiscoveryResponse, tags=["Discovery"])
 async def search_calculators(
     q: str = Query(..., min_length=1, description="Search keyword"),
@@ -349,16 +526,37 @@ async def list_contexts(use_case: DiscoveryUseCase = Depends(get_discovery_use_c
 # =============================================================================
 
 
-@app.post("/api/v1/calculate/{tool_id}", response_model=CalculatorResponse, tags=["Calculate"])
+# Documented on every endpoint that runs calculations through the execution backend
+_OVERLOADED_RESPONSES: dict[int | str, dict[str, Any]] = {
+    503: {"description": "Calculation queue is full (API_EXECUTION_MAX_QUEUE_DEPTH); retry after the Retry-After seconds"}
+}
+
+
+def _overloaded(e: ExecutionOverloaded) -> HTTPException:
+    return HTTPException(status_code=503, detail=str(e), headers={"Retry-After": str(e.retry_after)})
+
+
+async def _execute(backend: ExecutionBackend, request: CalculateRequest) -> CalculateResponse:
+    """Run one calculation inline or on the pool (API_EXECUTION_INLINE_MAX_ROWS), shedding with 503 when the pool is full."""
+    try:
+        pooled = backend.routes_to_pool(1)
+    except ExecutionOverloaded as e:
+        raise _overloaded(e) from e
+    return await backend.execute(request, pooled)
+
+
+@app.post("/api/v1/calculate/{tool_id}", response_model=CalculatorResponse, tags=["Calculate"], responses=_OVERLOADED_RESPONSES)
 async def calculate(
     tool_id: str,
     input_data: CalculatorInput,
-    use_case: CalculateUseCase = Depends(get_calculate_use_case),
+    debug_timings: bool = Query(False, description="Attach per-stage timings (ms) to component_scores._timings"),
+    backend: ExecutionBackend = Depends(get_execution_backend),
 ) -> CalculatorResponse:
     """
     執行計算
 
     Execute a medical calculation with the given parameters.
+    Set `debug_timings=true` to include per-stage timings in `component_scores._timings`.
 
     Example for CKD-EPI 2021:
     ```json
@@ -371,9 +569,13 @@ async def calculate(
     }
     ```
     """
-    request = CalculateRequest(tool_id=tool_id, params=input_data.params)
-    result = use_case.execute(request)
+    request = CalculateRequest(tool_id=tool_id, params=input_data.params, debug_timings=debug_timings)
+    result = await _execute(backend, request)
+    return _build_calculator_response(tool_id, result)
+
 
+def _build_calculator_response(tool_id: str, result: CalculateResponse) -> CalculatorResponse:
+    """Convert a use-case response into the public CalculatorResponse shape."""
     if not result.success:
         return CalculatorResponse(success=False, calculator=tool_id, error=result.error)
 
@@ -400,17 +602,304 @@ async def calculate(
     return CalculatorResponse(success=True, calculator=tool_id, result=result_dict)
 
 
+# =============================================================================
+# Batch Endpoint (JSON array or NDJSON in, NDJSON out)
+# =============================================================================
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# Configure via environment variables: API_BATCH_MAX_ROWS caps rows per
+# request, API_BATCH_CONCURRENCY caps rows (pool jobs of up to
+# execution.MAX_JOB_ROWS rows, for batches on the execution pool) in flight,
+# which also bounds how far the server reads ahead of a slow client;
+# API_BATCH_MAX_LINE_BYTES caps one NDJSON line; API_BATCH_MAX_BODY_BYTES caps
+# a JSON array body, which is read whole (default: max rows x max line bytes).
+API_BATCH_MAX_ROWS = int(os.environ.get("API_BATCH_MAX_ROWS", "10000"))
+API_BATCH_CONCURRENCY = int(os.environ.get("API_BATCH_CONCURRENCY", "8"))
+API_BATCH_MAX_LINE_BYTES = int(os.environ.get("API_BATCH_MAX_LINE_BYTES", str(1024 * 1024)))
+API_BATCH_MAX_BODY_BYTES = int(os.environ.get("API_BATCH_MAX_BODY_BYTES", str(API_BATCH_MAX_ROWS * API_BATCH_MAX_LINE_BYTES)))
+
+_BATCH_ROW_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "required": ["tool_id", "params"],
+    "properties": {
+        "tool_id": {"type": "string", "description": "Calculator tool_id"},
+        "params": {"type": "object", "description": "Calculator parameters"},
+    },
+}
+
+# Yielded by a row source when no further rows are ready yet (a pending pool job is submitted)
+_ROWS_FLUSH = object()
+
+
+class DuplexStreamingResponse(StreamingResponse):
+    """
+    StreamingResponse whose body iterator may keep reading the request body.
+
+    Starlette's default runs a disconnect listener that drains receive(), which
+    would steal NDJSON chunks the iterator has not consumed yet. Disconnects
+    still surface through request.stream() (ClientDisconnect) or a failed send.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await self.stream_response(send)
+        except OSError as e:
+            raise ClientDisconnect() from e
+        if self.background is not None:
+            await self.background()
+
+
+class BatchRowError(ValueError):
+    """A single batch row could not be parsed; reported in-band for that row."""
+
+
+def _parse_batch_row(raw: Any) -> tuple[str, dict[str, Any]]:
+    if not isinstance(raw, dict):
+        raise BatchRowError("Row must be a JSON object with 'tool_id' and 'params'")
+    tool_id = raw.get("tool_id")
+    params = raw.get("params", {})
+    if not isinstance(tool_id, str) or not tool_id:
+        raise BatchRowError("Row is missing a string 'tool_id'")
+    if not isinstance(params, dict):
+        raise BatchRowError("Row 'params' must be a JSON object")
+    return tool_id, params
+
+
+async def _iter_ndjson_rows(request: Request) -> AsyncIterator[Any]:
+    """Yield decoded NDJSON rows (or a BatchRowError per bad line) while the body streams in."""
+    buffer = b""
+    oversized = False
+    async for chunk in request.stream():
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            if oversized:
+                # Tail of an oversized line that was already reported
+                oversized = False
+            elif line.strip():
+                yield _decode_ndjson_line(line)
+        if lines:
+            yield _ROWS_FLUSH
+        if not oversized and len(buffer) > API_BATCH_MAX_LINE_BYTES:
+            oversized = True
+            yield BatchRowError(f"NDJSON line exceeds {API_BATCH_MAX_LINE_BYTES} bytes")
+        if oversized:
+            buffer = b""
+    if buffer.strip() and not oversized:
+        yield _decode_ndjson_line(buffer)
+
+
+def _decode_ndjson_line(line: bytes) -> Any:
+    if len(line) > API_BATCH_MAX_LINE_BYTES:
+        return BatchRowError(f"NDJSON line exceeds {API_BATCH_MAX_LINE_BYTES} bytes")
+    try:
+        return json.loads(line)
+    except ValueError as e:
+        return BatchRowError(f"Invalid JSON: {e}")
+
+
+async def _read_json_array_rows(request: Request) -> list[Any]:
+    """Read a JSON array body, failing the whole request if it is malformed or too large."""
+    too_large = HTTPException(status_code=413, detail=f"Batch body exceeds {API_BATCH_MAX_BODY_BYTES} bytes")
+    content_length = request.headers.get("content-length", "")
+    if content_length.isdigit() and int(content_length) > API_BATCH_MAX_BODY_BYTES:
+        raise too_large
+    body = bytearray()
+    async for chunk in request.stream():
+        body += chunk
+        if len(body) > API_BATCH_MAX_BODY_BYTES:
+            raise too_large
+    try:
+        rows = json.loads(body)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid JSON body: {e}") from e
+    if not isinstance(rows, list):
+        raise HTTPException(status_code=400, detail="Body must be a JSON array of {tool_id, params} rows")
+    if len(rows) > API_BATCH_MAX_ROWS:
+        raise HTTPException(status_code=413, detail=f"Batch exceeds the maximum of {API_BATCH_MAX_ROWS} rows")
+    return rows
+
+
+async def _iter_rows(rows: list[Any]) -> AsyncIterator[Any]:
+    for row in rows:
+        yield row
+
+
+def _ndjson_line(payload: dict[str, Any]) -> bytes:
+    return (json.dumps(payload, ensure_ascii=False, default=str) + "\n").encode("utf-8")
+
+
+async def _stream_batch_results(rows: AsyncIterator[Any], backend: ExecutionBackend, pooled: bool, job_rows: int = 1) -> AsyncIterator[bytes]:
+    """
+    Execute rows with at most API_BATCH_CONCURRENCY jobs in flight and yield
+    one NDJSON line per row as its job finishes (tagged with its input index).
+
+    ``pooled`` is the routing decision made when the batch was admitted.
+    Inline rows run one per job; pooled rows are grouped into jobs of up to
+    ``job_rows`` rows, and a partial job is submitted as soon as the row
+    source has nothing more ready (_ROWS_FLUSH) or ends.
+
+    Input is only read when a slot frees up and a slot only frees up after its
+    lines have been handed to the client, so a slow reader throttles both
+    execution and request-body consumption.
+    """
+    pending: set[asyncio.Task[bytes]] = set()
+    job: list[tuple[int, str, dict[str, Any]]] = []
+    index = 0
+
+    async def run_job(items: list[tuple[int, str, dict[str, Any]]]) -> bytes:
+        try:
+            results = await backend.execute_many([CalculateRequest(tool_id=tool_id, params=params) for _, tool_id, params in items], pooled)
+            responses = [_build_calculator_response(tool_id, result) for (_, tool_id, _), result in zip(items, results, strict=True)]
+        except Exception as e:  # isolate unexpected failures to the job's rows
+            responses = [CalculatorResponse(success=False, calculator=tool_id, error=f"Internal error: {e}") for _, tool_id, _ in items]
+        return b"".join(_ndjson_line({"index": row_index, **response.model_dump()}) for (row_index, _, _), response in zip(items, responses, strict=True))
+
+    def submit() -> None:
+        nonlocal job
+        if job:
+            pending.add(asyncio.create_task(run_job(job)))
+            job = []
+
+    try:
+        async for raw in rows:
+            if raw is _ROWS_FLUSH:
+                submit()
+                continue
+            if index >= API_BATCH_MAX_ROWS:
+                error = f"Batch exceeds the maximum of {API_BATCH_MAX_ROWS} rows; remaining rows were not processed"
+                yield _ndjson_line({"index": index, "success": False, "calculator": None, "result": None, "error": error})
+                break
+            try:
+                if isinstance(raw, BatchRowError):
+                    raise raw
+                tool_id, params = _parse_batch_row(raw)
+            except BatchRowError as e:
+                yield _ndjson_line({"index": index, "success": False, "calculator": None, "result": None, "error": str(e)})
+            else:
+                job.append((index, tool_id, params))
+                if len(job) >= job_rows:
+                    submit()
+            index += 1
+            if len(pending) >= API_BATCH_CONCURRENCY:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+        submit()
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+@app.post(
+    "/api/v1/calculate:batch",
+    tags=["Calculate"],
+    response_class=StreamingResponse,
+    responses={
+        200: {"description": "One NDJSON result line per input row, in completion order", "content": {NDJSON_MEDIA_TYPE: {}}},
+        400: {"description": "Body is not a JSON array"},
+        413: {"description": "Too many rows, an oversized JSON array body, or an oversized NDJSON line"},
+        **_OVERLOADED_RESPONSES,
+    },
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {"schema": {"type": "array", "items": _BATCH_ROW_SCHEMA}},
+                NDJSON_MEDIA_TYPE: {"schema": _BATCH_ROW_SCHEMA},
+            },
+        }
+    },
+)
+async def calculate_batch(request: Request, backend: ExecutionBackend = Depends(get_execution_backend)) -> StreamingResponse:
+    """
+    批次計算 (串流 NDJSON)
+
+    Execute many calculations in one request. Send either a JSON array or an
+    NDJSON stream (`Content-Type: application/x-ndjson`) of
+    `{"tool_id": ..., "params": {...}}` rows.
+
+    Results stream back as NDJSON as each row finishes; every line carries the
+    row `index` plus the same fields as `POST /api/v1/calculate/{tool_id}`.
+    A malformed or failing row only produces an error line for that row.
+    Batches larger than `API_EXECUTION_INLINE_MAX_ROWS` run on the execution
+    pool; when it is full the whole batch is rejected with 503 up front.
+    """
+    content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    row_count: Optional[int] = None
+    if content_type in (NDJSON_MEDIA_TYPE, "application/jsonl", "application/ndjson"):
+        rows = _iter_ndjson_rows(request)
+    else:
+        # JSON arrays are parsed up front so a malformed body fails with a status code
+        array = await _read_json_array_rows(request)
+        row_count = len(array)
+        rows = _iter_rows(array)
+    try:
+        pooled = backend.routes_to_pool(row_count)
+    except ExecutionOverloaded as e:
+        raise _overloaded(e) from e
+
+    job_rows = backend.job_rows(row_count) if pooled else 1
+    return DuplexStreamingResponse(_stream_batch_results(rows, backend, pooled, job_rows), media_type=NDJSON_MEDIA_TYPE)
+
+
+# =============================================================================
+# Patient Scoring Endpoint (one record, many scores)
+# =============================================================================
+
+
+@app.post("/api/v1/score-patient", tags=["Calculate"], responses={400: {"description": "Invalid tools selection"}, **_OVERLOADED_RESPONSES})
+async def score_patient(
+    input_data: PatientScoringInput,
+    use_case: PatientScoringUseCase = Depends(get_patient_scoring_use_case),
+    backend: ExecutionBackend = Depends(get_execution_backend),
+) -> dict[str, Any]:
+    """
+    單一病人多評分
+
+    Score one patient record with several calculators. Derived inputs (MAP
+    from SBP/DBP, P/F ratio from PaO2/FiO2, GCS total from its components,
+    BMI) are computed once and shared; tools missing a required input are
+    listed under `skipped` with the missing parameters. With
+    `"tools": "all_applicable"` every calculator the record can feed is run.
+
+    Each result lists the record field (or `derived:<name>`) behind every
+    parameter in `inputs`. Tools run on the execution pool, several at once.
+    """
+    try:
+        # Planning matches parameters and, for all_applicable, searches the registry: off the event loop
+        plan = await asyncio.to_thread(use_case.plan, input_data.record, input_data.tools)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    try:
+        pooled = backend.routes_to_pool(len(plan.tools))
+    except ExecutionOverloaded as e:
+        raise _overloaded(e) from e
+
+    requests = [CalculateRequest(tool_id=tool_id, params=params) for tool_id, params in plan.items]
+    if not pooled:
+        return plan.to_dict(await backend.execute_many(requests, pooled=False))
+    size = backend.job_rows(len(requests))
+    jobs = await asyncio.gather(*(backend.execute_many(requests[start : start + size]) for start in range(0, len(requests), size)))
+    return plan.to_dict([response for job in jobs for response in job])
+
+
 # =============================================================================
 # Convenience Endpoints (Direct Calculator Access)
 # =============================================================================
 
 
-@app.post("/api/v1/ckd-epi", tags=["Quick Calculate"])
+@app.post("/api/v1/ckd-epi", tags=["Quick Calculate"], responses=_OVERLOADED_RESPONSES)
 async def calculate_ckd_epi(
     serum_creatinine: float = Query(..., gt=0, description="Serum creatinine (mg/dL)"),
     age: int = Query(..., ge=18, le=120, description="Age in years"),
     sex: str = Query(..., pattern="^(male|female)$", description="Sex (male/female)"),
-    use_case: CalculateUseCase = Depends(get_calculate_use_case),
+    backend: ExecutionBackend = Depends(get_execution_backend),
 ) -> dict[str, Any]:
     """
     快速計算 CKD-EPI 2021 eGFR
@@ -418,7 +907,7 @@ async def calculate_ckd_epi(
     Calculate eGFR using CKD-EPI 2021 equation (race-free).
     """
     request = CalculateRequest(tool_id="ckd_epi_2021", params={"serum_creatinine": serum_creatinine, "age": age, "sex": sex})
-    result = use_case.execute(request)
+    result = await _execute(backend, request)
 
     if not result.success:
         raise HTTPException(status_code=400, detail=result.error)
@@ -437,7 +926,7 @@ async def calculate_ckd_epi(
     return result_dict
 
 
-@app.post("/api/v1/sofa", tags=["Quick Calculate"])
+@app.post("/api/v1/sofa", tags=["Quick Calculate"], responses=_OVERLOADED_RESPONSES)
 async def calculate_sofa(
     pao2_fio2_ratio: float = Query(..., description="PaO2/FiO2 ratio"),
     platelets: float = Query(..., description="Platelets (×10³/µL)"),
@@ -445,7 +934,7 @@ async def calculate_sofa(
     cardiovascular: str = Query(..., description="MAP or vasopressor status"),
     gcs_score: int = Query(..., ge=3, le=15, description="GCS score"),
     creatinine: float = Query(..., description="Creatinine (mg/dL)"),
-    use_case: CalculateUseCase = Depends(get_calculate_use_case),
+    backend: ExecutionBackend = Depends(get_execution_backend),
 ) -> dict[str, Any]:
     """
     快速計算 SOFA Score
@@ -463,7 +952,7 @@ async def calculate_sofa(
             "creatinine": creatinine,
         },
     )
-    result = use_case.execute(request)
+    result = await _execute(backend, request)
 
     if not result.success:
         raise HTTPException(status_code=400, detail=result.error)
@@ -487,17 +976,41 @@ async def calculate_sofa(
 # =============================================================================
 
 
-def main() -> None:
+def warm_up() -> None:
+    """Build every shared read-only structure in this process (before forking workers)."""
+    _ensure_app_state(app)
+    app.state.registry.warm_up()
+    get_boundary_registry()
+
+
+def main(argv: Optional[list[str]] = None) -> None:
     """Run the API server"""
+    import argparse
+
     import uvicorn
 
-    host = os.environ.get("API_HOST", "0.0.0.0")  # nosec B104 - API server may intentionally bind all interfaces in container deployments
-    port = int(os.environ.get("API_PORT", "8080"))
+    parser = argparse.ArgumentParser(description="Medical Calculator REST API")
+    parser.add_argument("--host", default=os.environ.get("API_HOST", "0.0.0.0"), help="Host to bind (default: 0.0.0.0)")  # nosec B104 - API server may intentionally bind all interfaces in container deployments
+    parser.add_argument("--port", type=int, default=int(os.environ.get("API_PORT", "8080")), help="Port to bind (default: 8080)")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=int(os.environ.get("API_WORKERS", "1")),
+        help="Worker processes forked from one warmed-up parent, sharing the registry copy-on-write (default: 1)",
+    )
+    args = parser.parse_args(argv)
+    host, port = args.host, args.port
 
     print(f"🏥 Medical Calculator API starting on http://{host}:{port}")
     print(f"📚 API Docs: http://{host}:{port}/docs")
     print(f"📖 ReDoc: http://{host}:{port}/redoc")
 
+    if args.workers > 1:
+        from src.infrastructure.serving import serve_prefork
+
+        print(f"👥 Workers: {args.workers} (pre-forked)")
+        sys.exit(serve_prefork(app, host=host, port=port, workers=args.workers, warm_up=warm_up))
+
     uvicorn.run("src.infrastructure.api.server:app", host=host, port=port, reload=os.environ.get("DEBUG", "false").lower() == "true")
 
 
@@ -0,0 +1,28 @@
+"""
+Cohort scoring: run calculators over whole dataset files.
+
+- score_file(): stream a CSV/JSONL/Parquet file in chunks through
+  CohortScoringUseCase, optionally on a process pool, and write the scored
+  columns back out
+- open_reader()/open_writer(): the chunked file formats
+- ``medcalc score`` (cli.main): the command-line front end
+
+Usage:
+    from src.infrastructure.cohort import score_file
+
+    summary = score_file("cohort.csv", "scored.parquet", ["ckd_epi_2021", "phq2"], workers=4)
+"""
+
+from .formats import FORMATS, detect_format, open_reader, open_writer, parse_text_value
+from .pipeline import CohortScoringSummary, build_registry, score_file
+
+__all__ = [
+    "FORMATS",
+    "CohortScoringSummary",
+    "build_registry",
+    "detect_format",
+    "open_reader",
+    "open_writer",
+    "parse_text_value",
+    "score_file",
+]
@@ -0,0 +1,95 @@
+"""
+medcalc command-line interface
+
+Usage:
+    medcalc score cohort.csv scored.csv --tool ckd_epi_2021 --tool phq2
+    medcalc score labs.parquet scored.parquet --tool cockcroft_gault --workers 8
+    medcalc score survey.jsonl out.jsonl --tool audit_c --map audit_c.drinking_frequency=q1 --map audit_c.typical_quantity=q2 --map audit_c.six_or_more_frequency=q3 --keep patient_id
+
+Column bindings are printed to stderr before scoring; a summary (rows,
+rows/s, per-tool error counts) follows when the file is done.
+"""
+
+import argparse
+import json
+import sys
+from collections.abc import Sequence
+from typing import Optional
+
+from .formats import FORMATS
+from .pipeline import DEFAULT_CHUNK_SIZE, default_workers, score_file
+
+
+def _parse_map(entries: Sequence[str]) -> dict[str, str]:
+    column_map: dict[str, str] = {}
+    for entry in entries:
+        param, separator, column = entry.partition("=")
+        if not separator or not param or not column:
+            raise argparse.ArgumentTypeError(f"--map expects PARAM=COLUMN or TOOL.PARAM=COLUMN, got '{entry}'")
+        column_map[param] = column
+    return column_map
+
+
+def _print_bindings(bindings: dict[str, dict[str, str]]) -> None:
+    for tool_id, columns in bindings.items():
+        bound = ", ".join(param if param == column else f"{param}<-{column}" for param, column in columns.items())
+        print(f"{tool_id}: {bound}", file=sys.stderr)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="medcalc", description="Medical calculator command-line tools")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    score = commands.add_parser(
+        "score",
+        help="Score every row of a CSV/JSONL/Parquet file with one or more calculators",
+        description="Stream a dataset through calculators in bounded memory and write value, stage, warnings and error columns per tool.",
+    )
+    score.add_argument("input", help="Input file (.csv, .jsonl/.ndjson, .parquet)")
+    score.add_argument("output", help="Output file; the format follows the suffix")
+    score.add_argument("--tool", "-t", dest="tools", action="append", required=True, help="Calculator tool_id (repeatable)")
+    score.add_argument("--map", "-m", dest="mappings", action="append", default=[], metavar="PARAM=COLUMN", help="Bind a column explicitly (repeatable)")
+    score.add_argument("--keep", dest="keep", action="append", metavar="COLUMN", help="Input column to copy to the output (repeatable; default: all)")
+    score.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help=f"Rows per chunk (default: {DEFAULT_CHUNK_SIZE})")
+    score.add_argument("--workers", "-j", type=int, default=1, help=f"Scoring processes; 0 = one per CPU ({default_workers()} here)")
+    score.add_argument("--input-format", choices=FORMATS, help="Override the input format")
+    score.add_argument("--output-format", choices=FORMATS, help="Override the output format")
+    score.add_argument("--json", action="store_true", help="Print the summary as JSON")
+    return parser
+
+
+def run_score(args: argparse.Namespace) -> int:
+    try:
+        summary = score_file(
+            args.input,
+            args.output,
+            args.tools,
+            input_format=args.input_format,
+            output_format=args.output_format,
+            column_map=_parse_map(args.mappings),
+            keep_columns=args.keep,
+            chunk_size=args.chunk_size,
+            workers=args.workers or default_workers(),
+            on_bound=None if args.json else _print_bindings,
+        )
+    except (argparse.ArgumentTypeError, ImportError, OSError, ValueError) as e:
+        print(f"medcalc score: {e}", file=sys.stderr)
+        return 2
+
+    if args.json:
+        print(json.dumps(summary.to_dict(), indent=2))
+        return 0
+    errors = ", ".join(f"{tool_id}={count}" for tool_id, count in summary.errors.items())
+    print(f"Scored {summary.rows} rows in {summary.seconds:.2f}s ({summary.rows_per_second:,.0f} rows/s); row errors: {errors}", file=sys.stderr)
+    return 0
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.command == "score":
+        return run_score(args)
+    return 2  # pragma: no cover - argparse rejects unknown commands
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,307 @@
+"""
+Cohort File Formats
+
+Chunked readers and writers for the cohort scoring pipeline. Readers expose
+the header up front and yield columnar chunks (column name -> list of values)
+of at most ``chunk_size`` rows, so memory is bounded by the chunk size no
+matter how large the file is. Writers take the same columnar chunks.
+
+Formats (chosen from the file suffix unless given explicitly):
+    csv      .csv            cells are text; see parse_text_value()
+    jsonl    .jsonl .ndjson  one JSON object per line; the header is the
+                             keys of the first chunk, in order of appearance
+    parquet  .parquet .pq    record batches via pyarrow (optional dependency)
+"""
+
+import csv
+import json
+import math
+from collections.abc import Iterator, Mapping, Sequence
+from importlib import import_module
+from pathlib import Path
+from typing import IO, Any, Optional
+
+FORMATS = ("csv", "jsonl", "parquet")
+
+_SUFFIX_FORMATS = {".csv": "csv", ".jsonl": "jsonl", ".ndjson": "jsonl", ".parquet": "parquet", ".pq": "parquet"}
+
+_TRUE_TEXT = frozenset({"true", "yes"})
+_FALSE_TEXT = frozenset({"false", "no"})
+
+# Columnar chunk: column name -> one value per row
+Chunk = dict[str, list[Any]]
+
+
+def detect_format(path: str | Path, explicit: Optional[str] = None) -> str:
+    """Format name from ``explicit`` or the file suffix."""
+    if explicit is not None:
+        if explicit not in FORMATS:
+            raise ValueError(f"Unknown format '{explicit}'; supported: {', '.join(FORMATS)}")
+        return explicit
+    fmt = _SUFFIX_FORMATS.get(Path(path).suffix.lower())
+    if fmt is None:
+        raise ValueError(f"Cannot infer the format of '{path}'; pass one of: {', '.join(FORMATS)}")
+    return fmt
+
+
+def parse_text_value(text: Any) -> Any:
+    """
+    Convert one CSV cell to the value a calculator expects.
+
+    Empty -> None, true/yes/false/no -> bool, integer literal -> int, other
+    numbers -> float, anything else stays text (e.g. "female"). NaN becomes None.
+    """
+    if not isinstance(text, str):
+        return text
+    stripped = text.strip()
+    if not stripped:
+        return None
+    try:
+        return int(stripped)
+    except ValueError:
+        pass
+    try:
+        number = float(stripped)
+    except ValueError:
+        lowered = stripped.lower()
+        if lowered in _TRUE_TEXT:
+            return True
+        if lowered in _FALSE_TEXT:
+            return False
+        return stripped
+    return None if math.isnan(number) else number
+
+
+def _pyarrow() -> tuple[Any, Any]:
+    try:
+        return import_module("pyarrow"), import_module("pyarrow.parquet")
+    except ImportError as e:
+        raise ImportError("Parquet support requires pyarrow (pip install pyarrow)") from e
+
+
+# =============================================================================
+# Readers
+# =============================================================================
+
+
+class ChunkReader:
+    """Header plus an iterator of columnar chunks; use as a context manager."""
+
+    text_cells = False  # True when every cell is raw text (CSV)
+
+    def __init__(self, columns: Sequence[str]) -> None:
+        self.columns = tuple(columns)
+
+    def __iter__(self) -> Iterator[Chunk]:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self) -> "ChunkReader":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+class CsvChunkReader(ChunkReader):
+    text_cells = True
+
+    def __init__(self, path: str | Path, chunk_size: int) -> None:
+        self._file = open(path, newline="", encoding="utf-8-sig")
+        self._reader = csv.reader(self._file)
+        super().__init__(next(self._reader, []))
+        self._chunk_size = chunk_size
+
+    def __iter__(self) -> Iterator[Chunk]:
+        width = len(self.columns)
+        rows: list[list[str]] = []
+        for row in self._reader:
+            if not row:
+                continue
+            if len(row) != width:
+                row = (row + [""] * width)[:width]
+            rows.append(row)
+            if len(rows) == self._chunk_size:
+                yield dict(zip(self.columns, map(list, zip(*rows, strict=True)), strict=True))
+                rows = []
+        if rows:
+            yield dict(zip(self.columns, map(list, zip(*rows, strict=True)), strict=True))
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class JsonlChunkReader(ChunkReader):
+    def __init__(self, path: str | Path, chunk_size: int) -> None:
+        self._file = open(path, encoding="utf-8")
+        self._chunk_size = chunk_size
+        self._first = self._read_rows()
+        columns: dict[str, None] = {}
+        for row in self._first:
+            columns.update(dict.fromkeys(row))
+        super().__init__(list(columns))
+
+    def _read_rows(self) -> list[Mapping[str, Any]]:
+        rows: list[Mapping[str, Any]] = []
+        for line in self._file:
+            if line.strip():
+                row = json.loads(line)
+                if not isinstance(row, dict):
+                    raise ValueError("Each JSONL line must be a JSON object")
+                rows.append(row)
+                if len(rows) == self._chunk_size:
+                    break
+        return rows
+
+    def __iter__(self) -> Iterator[Chunk]:
+        rows, self._first = self._first, []
+        while rows:
+            yield {column: [row.get(column) for row in rows] for column in self.columns}
+            rows = self._read_rows()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class ParquetChunkReader(ChunkReader):
+    def __init__(self, path: str | Path, chunk_size: int) -> None:
+        _, parquet = _pyarrow()
+        self._file = parquet.ParquetFile(path)
+        self.schema = self._file.schema_arrow
+        super().__init__(self.schema.names)
+        self._chunk_size = chunk_size
+
+    def __iter__(self) -> Iterator[Chunk]:
+        for batch in self._file.iter_batches(batch_size=self._chunk_size):
+            chunk: Chunk = batch.to_pydict()
+            yield chunk
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def open_reader(path: str | Path, fmt: Optional[str] = None, chunk_size: int = 10_000) -> ChunkReader:
+    """Open a chunked reader for ``path``."""
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be >= 1")
+    fmt = detect_format(path, fmt)
+    if fmt == "csv":
+        return CsvChunkReader(path, chunk_size)
+    if fmt == "jsonl":
+        return JsonlChunkReader(path, chunk_size)
+    return ParquetChunkReader(path, chunk_size)
+
+
+# =============================================================================
+# Writers
+# =============================================================================
+
+
+class ChunkWriter:
+    """Writes columnar chunks with a fixed column order; use as a context manager."""
+
+    def __init__(self, columns: Sequence[str]) -> None:
+        self.columns = tuple(columns)
+
+    def write(self, chunk: Mapping[str, Sequence[Any]]) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self) -> "ChunkWriter":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+class CsvChunkWriter(ChunkWriter):
+    def __init__(self, path: str | Path, columns: Sequence[str]) -> None:
+        super().__init__(columns)
+        self._file: IO[str] = open(path, "w", newline="", encoding="utf-8")
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(self.columns)
+
+    def write(self, chunk: Mapping[str, Sequence[Any]]) -> None:
+        self._writer.writerows(zip(*(chunk[column] for column in self.columns), strict=True))
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class JsonlChunkWriter(ChunkWriter):
+    def __init__(self, path: str | Path, columns: Sequence[str]) -> None:
+        super().__init__(columns)
+        self._file: IO[str] = open(path, "w", encoding="utf-8")
+
+    def write(self, chunk: Mapping[str, Sequence[Any]]) -> None:
+        columns = self.columns
+        dumps = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+        self._file.writelines(dumps(dict(zip(columns, row, strict=True))) + "\n" for row in zip(*(chunk[column] for column in columns), strict=True))
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class ParquetChunkWriter(ChunkWriter):
+    """
+    Parquet writer; the schema is fixed by the first chunk.
+
+    ``types`` pins column types (e.g. the input file's schema, scored
+    columns); other columns are inferred from the first chunk, with all-null
+    columns written as strings.
+    """
+
+    def __init__(self, path: str | Path, columns: Sequence[str], types: Optional[Mapping[str, Any]] = None) -> None:
+        super().__init__(columns)
+        self._pa, self._parquet = _pyarrow()
+        self._path = path
+        self._types = dict(types or {})
+        self._writer: Any = None
+
+    def write(self, chunk: Mapping[str, Sequence[Any]]) -> None:
+        pa = self._pa
+        if self._writer is None:
+            fields = []
+            for column in self.columns:
+                pinned = self._types.get(column)
+                if pinned is None:
+                    pinned = pa.array(chunk[column]).type
+                    if pa.types.is_null(pinned):
+                        pinned = pa.string()
+                fields.append(pa.field(column, pinned))
+            self._writer = self._parquet.ParquetWriter(self._path, pa.schema(fields))
+        schema = self._writer.schema
+        arrays = [pa.array(chunk[column], type=schema.field(column).type) for column in self.columns]
+        self._writer.write_table(pa.Table.from_arrays(arrays, schema=schema))
+
+    def close(self) -> None:
+        if self._writer is None:
+            self.write({column: [] for column in self.columns})
+        self._writer.close()
+
+
+def parquet_types(reader: ChunkReader, scored_columns: Sequence[str]) -> dict[str, Any]:
+    """Column types for a Parquet output: the input schema (Parquet input) plus typed scored columns."""
+    pa, _ = _pyarrow()
+    types: dict[str, Any] = {}
+    if isinstance(reader, ParquetChunkReader):
+        types.update({field.name: field.type for field in reader.schema})
+    elif reader.text_cells:
+        types.update(dict.fromkeys(reader.columns, pa.string()))
+    for column in scored_columns:
+        types[column] = pa.float64() if column.endswith("_value") else pa.string()
+    return types
+
+
+def open_writer(path: str | Path, columns: Sequence[str], fmt: Optional[str] = None, types: Optional[Mapping[str, Any]] = None) -> ChunkWriter:
+    """Open a chunked writer for ``path`` (``types`` only applies to Parquet)."""
+    fmt = detect_format(path, fmt)
+    if fmt == "csv":
+        return CsvChunkWriter(path, columns)
+    if fmt == "jsonl":
+        return JsonlChunkWriter(path, columns)
+    return ParquetChunkWriter(path, columns, types)
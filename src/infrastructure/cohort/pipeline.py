@@ -0,0 +1,216 @@
+"""
+Cohort Scoring Pipeline
+
+Streams an input file through CohortScoringUseCase and writes the input
+columns plus the scored columns back out, chunk by chunk:
+
+    read chunk -> parse text cells of bound columns -> score -> write
+
+With ``workers > 1`` chunks are scored on a process pool. Every worker binds
+the same tools to the same header once (pool initializer) and receives only
+the bound columns of each chunk; at most ``2 * workers`` chunks are in
+flight and results are written in input order, so memory stays bounded by
+the chunk size and the output is identical to a single-process run.
+"""
+
+import os
+import time
+from collections import deque
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional
+
+from ...application.use_cases.cohort_scoring_use_case import CohortScoringUseCase
+from ...domain.registry.tool_registry import ToolRegistry
+from .formats import Chunk, ChunkReader, open_reader, open_writer, parquet_types, parse_text_value
+
+DEFAULT_CHUNK_SIZE = 10_000
+
+
+@dataclass
+class CohortScoringSummary:
+    """Outcome of one scored file."""
+
+    rows: int = 0
+    chunks: int = 0
+    seconds: float = 0.0
+    errors: dict[str, int] = field(default_factory=dict)  # tool_id -> rows with an error
+    bindings: dict[str, dict[str, str]] = field(default_factory=dict)  # tool_id -> parameter -> column
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds > 0 else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "rows": self.rows,
+            "chunks": self.chunks,
+            "seconds": round(self.seconds, 3),
+            "rows_per_second": round(self.rows_per_second, 1),
+            "errors": self.errors,
+            "bindings": self.bindings,
+        }
+
+
+def build_registry() -> ToolRegistry:
+    """A registry with every calculator (restored from the registry manifest when available)."""
+    from ...domain.registry.manifest import load_registry_manifest
+    from ...domain.services.calculators import CALCULATORS
+
+    registry = ToolRegistry()
+    manifest = load_registry_manifest()
+    if manifest is not None:
+        registry.load_manifest(manifest)
+        return registry
+    for calculator_cls in CALCULATORS:
+        registry.register(calculator_cls())
+    return registry
+
+
+def _prepare(use_case: CohortScoringUseCase, chunk: Mapping[str, Sequence[Any]]) -> Chunk:
+    """
+    The bound columns of a chunk, text cells parsed into calculator values.
+
+    Typed formats can carry text too (e.g. Parquet written from a CSV), so
+    every string cell is parsed; other values pass through unchanged. Cohort
+    columns repeat heavily (ages, scores, flags), so each distinct cell is
+    parsed once per chunk.
+    """
+    return {column: _parse_column(chunk[column]) for column in use_case.used_columns}
+
+
+def _parse_column(values: Sequence[Any]) -> list[Any]:
+    # Only text is cached: typed values pass through, and True/1/1.0 must stay distinct
+    parsed = {text: parse_text_value(text) for text in {value for value in values if isinstance(value, str)}}
+    if not parsed:
+        return list(values)
+    return [parsed[value] if isinstance(value, str) else value for value in values]
+
+
+# =============================================================================
+# Process-pool worker state (one bound use case per worker process)
+# =============================================================================
+
+_worker_use_case: Optional[CohortScoringUseCase] = None
+
+
+def _init_worker(tool_ids: Sequence[str], columns: Sequence[str], column_map: Optional[Mapping[str, str]]) -> None:
+    global _worker_use_case
+    _worker_use_case = CohortScoringUseCase(build_registry(), tool_ids, columns, column_map)
+
+
+def _score_in_worker(chunk: Chunk) -> Chunk:
+    assert _worker_use_case is not None  # nosec B101 - set by _init_worker
+    return _worker_use_case.score(_prepare(_worker_use_case, chunk))
+
+
+# =============================================================================
+# Public API
+# =============================================================================
+
+
+def score_file(
+    input_path: str | Path,
+    output_path: str | Path,
+    tool_ids: Sequence[str],
+    *,
+    input_format: Optional[str] = None,
+    output_format: Optional[str] = None,
+    column_map: Optional[Mapping[str, str]] = None,
+    keep_columns: Optional[Sequence[str]] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    workers: int = 1,
+    registry: Optional[ToolRegistry] = None,
+    on_bound: Optional[Callable[[dict[str, dict[str, str]]], None]] = None,
+) -> CohortScoringSummary:
+    """
+    Score every row of ``input_path`` with ``tool_ids`` and write the result to ``output_path``.
+
+    Args:
+        input_path: CSV, JSONL or Parquet file
+        output_path: Output file (format from its suffix unless output_format is given)
+        tool_ids: Calculators to run on every row
+        input_format: Override the input format ("csv", "jsonl", "parquet")
+        output_format: Override the output format
+        column_map: Explicit bindings, ``param`` or ``tool_id.param`` -> column
+        keep_columns: Input columns copied to the output (default: all)
+        chunk_size: Rows per chunk (bounds memory)
+        workers: Processes scoring chunks in parallel (1: score in this process)
+        registry: Registry to use in this process (default: build_registry())
+        on_bound: Called with the bindings (tool_id -> parameter -> column) once
+            they are validated, before any row is scored
+
+    Returns:
+        CohortScoringSummary with row counts, per-tool error counts and bindings
+
+    Raises:
+        ValueError: Unknown tool or format, unbound required parameters, or unknown keep_columns
+    """
+    started = time.perf_counter()
+    with open_reader(input_path, input_format, chunk_size) as reader:
+        use_case = CohortScoringUseCase(registry or build_registry(), tool_ids, reader.columns, column_map)
+        passthrough = reader.columns if keep_columns is None else tuple(keep_columns)
+        unknown = sorted(set(passthrough) - set(reader.columns))
+        if unknown:
+            raise ValueError(f"Columns to keep not in input: {', '.join(unknown)}")
+        clashes = sorted(set(passthrough) & set(use_case.output_columns))
+        if clashes:
+            raise ValueError(f"Input columns clash with scored columns: {', '.join(clashes)} (drop them with keep_columns)")
+
+        summary = CohortScoringSummary(
+            errors={binding.tool_id: 0 for binding in use_case.bindings},
+            bindings={binding.tool_id: dict(binding.columns) for binding in use_case.bindings},
+        )
+        if on_bound is not None:
+            on_bound(summary.bindings)
+        columns = (*passthrough, *use_case.output_columns)
+        types = parquet_types(reader, use_case.output_columns) if _writes_parquet(output_path, output_format) else None
+        with open_writer(output_path, columns, output_format, types) as writer:
+
+            def emit(chunk: Chunk, scored: Chunk) -> None:
+                writer.write({**{column: chunk[column] for column in passthrough}, **scored})
+                summary.rows += len(next(iter(scored.values()), ()))
+                summary.chunks += 1
+                for binding in use_case.bindings:
+                    summary.errors[binding.tool_id] += sum(1 for error in scored[f"{binding.tool_id}_error"] if error is not None)
+
+            if workers <= 1:
+                for chunk in reader:
+                    emit(chunk, use_case.score(_prepare(use_case, chunk)))
+            else:
+                _score_parallel(reader, use_case, tool_ids, column_map, workers, emit)
+
+    summary.seconds = time.perf_counter() - started
+    return summary
+
+
+def _writes_parquet(output_path: str | Path, output_format: Optional[str]) -> bool:
+    return (output_format or "") == "parquet" or (output_format is None and Path(output_path).suffix.lower() in (".parquet", ".pq"))
+
+
+def _score_parallel(
+    reader: ChunkReader,
+    use_case: CohortScoringUseCase,
+    tool_ids: Sequence[str],
+    column_map: Optional[Mapping[str, str]],
+    workers: int,
+    emit: Any,
+) -> None:
+    used = use_case.used_columns
+    pending: deque[tuple[Chunk, Future[Chunk]]] = deque()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(tuple(tool_ids), reader.columns, column_map)) as pool:
+        for chunk in reader:
+            pending.append((chunk, pool.submit(_score_in_worker, {column: chunk[column] for column in used})))
+            if len(pending) >= 2 * workers:
+                done_chunk, future = pending.popleft()
+                emit(done_chunk, future.result())
+        while pending:
+            done_chunk, future = pending.popleft()
+            emit(done_chunk, future.result())
+
+
+def default_workers() -> int:
+    """One worker per available CPU."""
+    return len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count() or 1
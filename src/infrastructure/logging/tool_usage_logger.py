@@ -14,6 +14,24 @@ Design Principles:
 - Privacy-aware: Never log PHI (Protected Health Information)
 - Configurable: Can be enabled/disabled via environment variables
 
+Latency percentiles:
+    Call durations are recorded into fixed-memory log-linear histograms
+    (src/shared/latency_histogram.py) per tool and per (tool, pipeline
+    stage), with rolling 1m/5m/1h windows; get_latency_snapshot() reports
+    mergeable p50/p90/p99/p999 for each, and get_prometheus_metrics()
+    renders the all-time histograms in Prometheus text format. Stage
+    durations come from CalculateUseCase's opt-in stage timing and are also
+    written as the stage_durations_ms event field.
+
+Non-blocking pipeline:
+    The calling thread only appends a small tuple to a bounded deque
+    (append/popleft are atomic, no lock on the hot path). A background
+    writer thread drains the queue in batches, builds ToolUsageEvents,
+    updates the aggregated statistics and writes the JSON lines. When the
+    queue is full, events are dropped (default) or the caller blocks for up
+    to TOOL_USAGE_QUEUE_BLOCK_TIMEOUT seconds; dropped events are counted.
+    Pending events are flushed on flush(), close() and interpreter exit.
+
 Usage:
     from src.infrastructure.logging import ToolUsageLogger
 
@@ -23,22 +41,30 @@ Usage:
     with logger.log_tool_call("sofa_score", params) as ctx:
         result = calculate(...)
         ctx.set_result(result)
+
+    # Or record a finished call (as CalculateUseCase does)
+    logger.record_tool_call("sofa_score", params.keys(), success=True, duration_ms=0.4)
 """
 
 from __future__ import annotations
 
+import atexit
 import json
 import logging
 import os
 import time
-from collections.abc import Generator
+from collections import deque
+from collections.abc import Generator, Iterable, Mapping, Sequence
 from contextlib import contextmanager
 from dataclasses import asdict, dataclass, field
 from datetime import UTC, datetime
 from enum import Enum
-from threading import Lock
+from threading import Condition, Event, Lock, Thread
 from typing import Any, Optional
 
+from ...shared.latency_histogram import ALL_TIME_WINDOW, LATENCY_WINDOWS, LatencyHistogram, RollingLatencyHistogram, window_seconds
+from ...shared.prometheus_format import format_prometheus_histogram, format_prometheus_samples
+
 
 class LogLevel(Enum):
     """Log levels for tool usage events."""
@@ -49,6 +75,13 @@ class LogLevel(Enum):
     ERROR = "ERROR"
 
 
+class QueuePolicy(Enum):
+    """What to do with a new event when the logging queue is full."""
+
+    DROP = "drop"  # Discard the event and count it (never slows the caller)
+    BLOCK = "block"  # Wait for the writer, up to the block timeout, then drop
+
+
 @dataclass
 class ToolUsageEvent:
     """
@@ -78,6 +111,7 @@ class ToolUsageEvent:
 
     # Performance metrics
     duration_ms: float = 0.0
+    stage_durations_ms: Optional[dict[str, float]] = None  # Only when stage timing is enabled
 
     # Session tracking (optional)
     session_id: Optional[str] = None
@@ -86,7 +120,7 @@ class ToolUsageEvent:
 
     def to_json(self) -> str:
         """Serialize to JSON string."""
-        return json.dumps(asdict(self), default=str)
+        return json.dumps(vars(self), default=str)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
@@ -106,6 +140,13 @@ class SessionStats:
     total_duration_ms: float = 0.0
 
 
+# Queued call record: (wall time, tool_id, category, param names, success, has_warnings,
+# warning types, error type, duration ms, session_id, sequence number, previous tool, stage durations ms)
+_CallRecord = tuple[
+    float, str, str, tuple[str, ...], bool, bool, tuple[str, ...], Optional[str], float, Optional[str], int, Optional[str], Optional[Mapping[str, float]]
+]
+
+
 class ToolUsageLogger:
     """
     Singleton structured logger for tool usage analytics.
@@ -116,11 +157,17 @@ class ToolUsageLogger:
     - Session tracking for workflow analysis
     - Aggregated statistics
     - PHI-free by design
+    - Bounded queue + background writer (callers never serialize or do I/O)
 
     Configuration via environment variables:
     - TOOL_USAGE_LOGGING_ENABLED: Enable/disable (default: true)
     - TOOL_USAGE_LOG_FILE: File path for JSON logs (optional)
     - TOOL_USAGE_LOG_LEVEL: Minimum log level (default: INFO)
+    - TOOL_USAGE_QUEUE_SIZE: Maximum pending events (default: 10000)
+    - TOOL_USAGE_QUEUE_POLICY: "drop" or "block" when the queue is full (default: drop)
+    - TOOL_USAGE_QUEUE_BLOCK_TIMEOUT: Seconds a "block" caller waits before dropping (default: 1.0)
+    - TOOL_USAGE_FLUSH_INTERVAL: Seconds between writer wake-ups (default: 0.5)
+    - TOOL_USAGE_BATCH_SIZE: Events written per batch; a full batch wakes the writer early (default: 256)
     """
 
     _instance: Optional[ToolUsageLogger] = None
@@ -143,6 +190,13 @@ class ToolUsageLogger:
         self._log_level = LogLevel[os.environ.get("TOOL_USAGE_LOG_LEVEL", "INFO")]
         self._log_file = os.environ.get("TOOL_USAGE_LOG_FILE")
 
+        # Queue configuration
+        self._queue_size = max(1, int(os.environ.get("TOOL_USAGE_QUEUE_SIZE", "10000")))
+        self._queue_policy = QueuePolicy(os.environ.get("TOOL_USAGE_QUEUE_POLICY", "drop").lower())
+        self._block_timeout = float(os.environ.get("TOOL_USAGE_QUEUE_BLOCK_TIMEOUT", "1.0"))
+        self._flush_interval = float(os.environ.get("TOOL_USAGE_FLUSH_INTERVAL", "0.5"))
+        self._batch_size = max(1, int(os.environ.get("TOOL_USAGE_BATCH_SIZE", "256")))
+
         # Internal state
         self._event_counter = 0
         self._counter_lock = Lock()
@@ -151,12 +205,26 @@ class ToolUsageLogger:
         self._current_session: Optional[SessionStats] = None
         self._session_lock = Lock()
 
-        # Aggregated stats (in-memory)
+        # Aggregated stats (in-memory, updated by the writer thread)
+        self._stats_lock = Lock()
         self._tool_usage_counts: dict[str, int] = {}
         self._tool_error_counts: dict[str, int] = {}
-        self._tool_durations: dict[str, list[float]] = {}
+        self._tool_latency: dict[str, RollingLatencyHistogram] = {}
+        self._stage_latency: dict[tuple[str, str], RollingLatencyHistogram] = {}  # (tool_id, stage)
         self._workflow_patterns: dict[str, int] = {}  # "tool_a->tool_b": count
 
+        # Event queue and background writer (started on first event, restarted after fork)
+        self._queue: deque[_CallRecord | Event] = deque()
+        self._wakeup = Event()
+        self._space = Condition()
+        self._writer: Optional[Thread] = None
+        self._writer_pid: Optional[int] = None
+        self._writer_lock = Lock()
+        self._closing = False
+        self._written_events = 0
+        self._dropped_events = 0
+        self._drop_lock = Lock()
+
         # Python logger for output
         self._logger = logging.getLogger("tool_usage")
         self._logger.setLevel(logging.DEBUG)
@@ -167,11 +235,23 @@ class ToolUsageLogger:
             handler.setFormatter(logging.Formatter("%(message)s"))
             self._logger.addHandler(handler)
 
+        atexit.register(self.close)
+
     @classmethod
     def get_instance(cls) -> ToolUsageLogger:
         """Get the singleton instance."""
         return cls()
 
+    @classmethod
+    def reset_instance(cls) -> None:
+        """Flush and discard the singleton so the next call re-reads configuration (mainly for testing)."""
+        with cls._lock:
+            instance = cls._instance
+            cls._instance = None
+        if instance is not None:
+            instance.close()
+            atexit.unregister(instance.close)
+
     def _generate_event_id(self) -> str:
         """Generate a unique event ID."""
         with self._counter_lock:
@@ -234,82 +314,300 @@ class ToolUsageLogger:
 
         start_time = time.perf_counter()
         ctx = _ToolCallContext()
-
-        # Get previous tool for workflow analysis
-        previous_tool = None
-        sequence_number = 0
-        session_id = None
-
-        with self._session_lock:
-            if self._current_session:
-                session_id = self._current_session.session_id
-                sequence_number = len(self._current_session.tool_calls)
-                if self._current_session.tool_sequence:
-                    previous_tool = self._current_session.tool_sequence[-1]
-                self._current_session.tool_calls.append(tool_id)
-                self._current_session.tool_sequence.append(tool_id)
+        session_id, sequence_number, previous_tool = self._track_session_call(tool_id)
 
         try:
             yield ctx
         finally:
             duration_ms = (time.perf_counter() - start_time) * 1000
+            self._track_session_result(session_id, ctx.success, duration_ms)
+            self._enqueue(
+                (
+                    time.time(),
+                    tool_id,
+                    category,
+                    tuple(params),
+                    ctx.success,
+                    ctx.has_warnings,
+                    tuple(ctx.warning_types),
+                    ctx.error_type,
+                    duration_ms,
+                    session_id,
+                    sequence_number,
+                    previous_tool,
+                    None,
+                )
+            )
+
+    def record_tool_call(
+        self,
+        tool_id: str,
+        param_names: Iterable[str],
+        *,
+        success: bool,
+        duration_ms: float,
+        category: str = "",
+        has_warnings: bool = False,
+        warning_types: Iterable[str] = (),
+        error_type: Optional[str] = None,
+        stage_durations_ms: Optional[Mapping[str, float]] = None,
+    ) -> None:
+        """
+        Record a finished tool call (non-blocking).
+
+        Args:
+            tool_id: The tool that was called
+            param_names: Names of the provided parameters (never values)
+            success: Whether the call succeeded
+            duration_ms: Call duration in milliseconds
+            category: Tool category (e.g., "critical_care")
+            has_warnings: Whether warnings were generated
+            warning_types: Types of warnings (e.g., ["boundary_warning"])
+            error_type: Type of error if failed (e.g., "validation_error")
+            stage_durations_ms: Milliseconds per pipeline stage (not copied; do not mutate)
+        """
+        if not self._enabled:
+            return
 
-            # Create event
-            event = ToolUsageEvent(
-                event_id=self._generate_event_id(),
-                timestamp=datetime.now(UTC).isoformat(),
-                tool_id=tool_id,
-                tool_category=category,
-                param_names=list(params.keys()),
-                param_count=len(params),
-                success=ctx.success,
-                has_warnings=ctx.has_warnings,
-                warning_types=ctx.warning_types,
-                error_type=ctx.error_type,
-                duration_ms=round(duration_ms, 2),
-                session_id=session_id,
-                sequence_number=sequence_number,
-                previous_tool=previous_tool,
+        session_id, sequence_number, previous_tool = self._track_session_call(tool_id)
+        self._track_session_result(session_id, success, duration_ms)
+        self._enqueue(
+            (
+                time.time(),
+                tool_id,
+                category,
+                tuple(param_names),
+                success,
+                has_warnings,
+                tuple(warning_types),
+                error_type,
+                duration_ms,
+                session_id,
+                sequence_number,
+                previous_tool,
+                stage_durations_ms,
             )
+        )
 
-            # Update aggregated stats
-            self._update_stats(event)
+    def _track_session_call(self, tool_id: str) -> tuple[Optional[str], int, Optional[str]]:
+        """Append a call to the current session; return (session_id, sequence number, previous tool)."""
+        if self._current_session is None:
+            return None, 0, None
 
-            # Log the event
-            self._log_event(event)
+        with self._session_lock:
+            session = self._current_session
+            if session is None:
+                return None, 0, None
+            previous_tool = session.tool_sequence[-1] if session.tool_sequence else None
+            sequence_number = len(session.tool_calls)
+            session.tool_calls.append(tool_id)
+            session.tool_sequence.append(tool_id)
+            return session.session_id, sequence_number, previous_tool
+
+    def _track_session_result(self, session_id: Optional[str], success: bool, duration_ms: float) -> None:
+        """Update the session counters if the call's session is still current."""
+        if session_id is None:
+            return
+
+        with self._session_lock:
+            session = self._current_session
+            if session is None or session.session_id != session_id:
+                return
+            session.total_duration_ms += round(duration_ms, 2)
+            if success:
+                session.success_count += 1
+            else:
+                session.error_count += 1
+
+    # ========================================
+    # Queue and background writer
+    # ========================================
+
+    def _enqueue(self, record: _CallRecord) -> None:
+        """Hand a call record to the writer without serializing or doing I/O."""
+        if self._writer_pid != os.getpid():
+            self._start_writer()
+
+        queue = self._queue
+        if len(queue) >= self._queue_size and not (self._queue_policy is QueuePolicy.BLOCK and self._wait_for_space()):
+            with self._drop_lock:
+                self._dropped_events += 1
+            return
+
+        queue.append(record)
+        if len(queue) >= self._batch_size and not self._wakeup.is_set():
+            self._wakeup.set()
+
+    def _wait_for_space(self) -> bool:
+        """Block until the writer makes room (QueuePolicy.BLOCK); False on timeout."""
+        deadline = time.monotonic() + self._block_timeout
+        with self._space:
+            while len(self._queue) >= self._queue_size:
+                self._wakeup.set()
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or self._closing:
+                    return False
+                self._space.wait(remaining)
+        return True
+
+    def _start_writer(self) -> None:
+        """Start the writer thread (again, in a forked child, dropping the parent's pending events)."""
+        with self._writer_lock:
+            pid = os.getpid()
+            if self._writer_pid == pid or self._closing:
+                return
+            if self._writer_pid is not None:
+                # Forked child: the parent's writer thread does not exist here
+                self._queue.clear()
+                self._wakeup = Event()
+                self._space = Condition()
+            self._writer = Thread(target=self._run_writer, name="tool-usage-writer", daemon=True)
+            self._writer_pid = pid
+            self._writer.start()
+
+    def _run_writer(self) -> None:
+        """Writer loop: wake on interval, full batch, flush or close; drain in batches."""
+        while True:
+            self._wakeup.wait(self._flush_interval)
+            self._wakeup.clear()
+            self._drain()
+            if self._closing:
+                self._drain()
+                return
+
+    def _drain(self) -> None:
+        """Write every queued event, batch by batch."""
+        queue = self._queue
+        while queue:
+            batch: list[_CallRecord | Event] = []
+            try:
+                for _ in range(self._batch_size):
+                    batch.append(queue.popleft())
+            except IndexError:
+                pass
+            self._write_batch(batch)
+            if self._queue_policy is QueuePolicy.BLOCK:
+                with self._space:
+                    self._space.notify_all()
+
+    def _write_batch(self, batch: list[_CallRecord | Event]) -> None:
+        """Aggregate and output a batch of call records (writer thread only)."""
+        records: list[_CallRecord] = []
+        for item in batch:
+            if isinstance(item, Event):
+                # flush() marker: everything queued before it has been handled
+                self._output_records(records)
+                records = []
+                item.set()
+                continue
+            records.append(item)
+        self._output_records(records)
+
+    def _output_records(self, records: list[_CallRecord]) -> None:
+        if not records:
+            return
+        with self._stats_lock:
+            for record in records:
+                self._update_stats(record)
+        for record in records:
+            try:
+                self._log_event(self._build_event(record))
+            except Exception:  # a broken handler must not kill the writer
+                logging.getLogger(__name__).exception("Failed to write tool usage event")
+        self._written_events += len(records)
+
+    def _build_event(self, record: _CallRecord) -> ToolUsageEvent:
+        """Turn a queued call record into a ToolUsageEvent."""
+        (
+            wall_time,
+            tool_id,
+            category,
+            param_names,
+            success,
+            has_warnings,
+            warning_types,
+            error_type,
+            duration_ms,
+            session_id,
+            sequence_number,
+            previous_tool,
+            stage_durations_ms,
+        ) = record
+        return ToolUsageEvent(
+            event_id=self._generate_event_id(),
+            timestamp=datetime.fromtimestamp(wall_time, UTC).isoformat(),
+            tool_id=tool_id,
+            tool_category=category,
+            param_names=list(param_names),
+            param_count=len(param_names),
+            success=success,
+            has_warnings=has_warnings,
+            warning_types=list(warning_types),
+            error_type=error_type,
+            duration_ms=round(duration_ms, 2),
+            stage_durations_ms={stage: round(ms, 3) for stage, ms in stage_durations_ms.items()} if stage_durations_ms else None,
+            session_id=session_id,
+            sequence_number=sequence_number,
+            previous_tool=previous_tool,
+        )
+
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        """
+        Wait until every event queued before this call has been written.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
 
-    def _update_stats(self, event: ToolUsageEvent) -> None:
-        """Update aggregated statistics."""
-        tool_id = event.tool_id
+        Returns:
+            True if the queue was flushed, False on timeout
+        """
+        writer = self._writer
+        if writer is None or self._writer_pid != os.getpid() or not writer.is_alive():
+            return not self._queue
+
+        marker = Event()
+        self._queue.append(marker)
+        self._wakeup.set()
+        return marker.wait(timeout)
+
+    def close(self, timeout: Optional[float] = 5.0) -> None:
+        """Flush pending events and stop the writer thread (registered with atexit)."""
+        self._closing = True
+        writer = self._writer
+        if writer is not None and self._writer_pid == os.getpid() and writer.is_alive():
+            self._wakeup.set()
+            with self._space:
+                self._space.notify_all()
+            writer.join(timeout)
+
+    def _update_stats(self, record: _CallRecord) -> None:
+        """Update aggregated statistics and latency histograms (caller holds _stats_lock)."""
+        tool_id, success, duration_ms, previous_tool, stage_durations_ms = record[1], record[4], record[8], record[11], record[12]
 
         # Usage count
         self._tool_usage_counts[tool_id] = self._tool_usage_counts.get(tool_id, 0) + 1
 
         # Error count
-        if not event.success:
+        if not success:
             self._tool_error_counts[tool_id] = self._tool_error_counts.get(tool_id, 0) + 1
 
-        # Duration tracking
-        if tool_id not in self._tool_durations:
-            self._tool_durations[tool_id] = []
-        self._tool_durations[tool_id].append(event.duration_ms)
-        # Keep only last 1000 durations per tool
-        if len(self._tool_durations[tool_id]) > 1000:
-            self._tool_durations[tool_id] = self._tool_durations[tool_id][-1000:]
+        # Latency histograms (per tool and per tool + pipeline stage)
+        self._latency_histogram(self._tool_latency, tool_id).record(int(duration_ms * 1_000_000))
+        if stage_durations_ms:
+            for stage, stage_ms in stage_durations_ms.items():
+                self._latency_histogram(self._stage_latency, (tool_id, stage)).record(int(stage_ms * 1_000_000))
 
         # Workflow pattern
-        if event.previous_tool:
-            pattern = f"{event.previous_tool}->{tool_id}"
+        if previous_tool:
+            pattern = f"{previous_tool}->{tool_id}"
             self._workflow_patterns[pattern] = self._workflow_patterns.get(pattern, 0) + 1
 
-        # Update session stats
-        with self._session_lock:
-            if self._current_session:
-                self._current_session.total_duration_ms += event.duration_ms
-                if event.success:
-                    self._current_session.success_count += 1
-                else:
-                    self._current_session.error_count += 1
+    @staticmethod
+    def _latency_histogram(histograms: dict[Any, RollingLatencyHistogram], key: Any) -> RollingLatencyHistogram:
+        histogram = histograms.get(key)
+        if histogram is None:
+            histogram = histograms[key] = RollingLatencyHistogram()
+        return histogram
 
     def _log_event(self, event: ToolUsageEvent) -> None:
         """Output the event to configured destinations."""
@@ -321,40 +619,136 @@ class ToolUsageLogger:
         else:
             self._logger.warning(json_str)
 
-    def get_statistics(self) -> dict[str, Any]:
+    def get_queue_statistics(self) -> dict[str, Any]:
         """
-        Get aggregated usage statistics.
+        Get counters for the logging queue.
 
         Returns:
-            Dictionary with usage stats, error rates, durations, and patterns
+            Dictionary with pending, written and dropped event counts
         """
-        stats: dict[str, Any] = {
-            "total_calls": sum(self._tool_usage_counts.values()),
-            "unique_tools_used": len(self._tool_usage_counts),
-            "tool_usage_counts": dict(sorted(self._tool_usage_counts.items(), key=lambda x: x[1], reverse=True)[:20]),  # Top 20
-            "tool_error_rates": {},
-            "avg_durations_ms": {},
-            "common_workflows": dict(sorted(self._workflow_patterns.items(), key=lambda x: x[1], reverse=True)[:10]),  # Top 10 patterns
+        return {
+            "policy": self._queue_policy.value,
+            "capacity": self._queue_size,
+            "pending_events": len(self._queue),
+            "written_events": self._written_events,
+            "dropped_events": self._dropped_events,
         }
 
-        # Calculate error rates
-        for tool_id, count in self._tool_usage_counts.items():
-            errors = self._tool_error_counts.get(tool_id, 0)
-            stats["tool_error_rates"][tool_id] = round(errors / count * 100, 1) if count > 0 else 0
+    def get_statistics(self) -> dict[str, Any]:
+        """
+        Get aggregated usage statistics.
 
-        # Calculate average durations
-        for tool_id, durations in self._tool_durations.items():
-            if durations:
-                stats["avg_durations_ms"][tool_id] = round(sum(durations) / len(durations), 2)
+        Pending events are flushed first so the numbers include every call
+        recorded before this one.
 
+        Returns:
+            Dictionary with usage stats, error rates, durations, patterns and queue counters
+        """
+        self.flush()
+        with self._stats_lock:
+            stats: dict[str, Any] = {
+                "total_calls": sum(self._tool_usage_counts.values()),
+                "unique_tools_used": len(self._tool_usage_counts),
+                "tool_usage_counts": dict(sorted(self._tool_usage_counts.items(), key=lambda x: x[1], reverse=True)[:20]),  # Top 20
+                "tool_error_rates": {},
+                "avg_durations_ms": {},
+                "common_workflows": dict(sorted(self._workflow_patterns.items(), key=lambda x: x[1], reverse=True)[:10]),  # Top 10 patterns
+            }
+
+            # Calculate error rates
+            for tool_id, count in self._tool_usage_counts.items():
+                errors = self._tool_error_counts.get(tool_id, 0)
+                stats["tool_error_rates"][tool_id] = round(errors / count * 100, 1) if count > 0 else 0
+
+            # Calculate average durations
+            for tool_id, histogram in self._tool_latency.items():
+                all_time = histogram.all_time
+                if all_time.count:
+                    stats["avg_durations_ms"][tool_id] = round(all_time.total_ns / all_time.count / 1_000_000, 2)
+
+        stats["queue"] = self.get_queue_statistics()
         return stats
 
+    def get_latency_snapshot(self, windows: Sequence[str] = (*LATENCY_WINDOWS, ALL_TIME_WINDOW), tool_id: Optional[str] = None) -> dict[str, Any]:
+        """
+        Get latency percentiles per tool, per pipeline stage and overall.
+
+        Pending events are flushed first. Each summary holds count, min/mean/max
+        and p50/p90/p99/p999 in milliseconds; "overall" merges every tool.
+
+        Args:
+            windows: Window names ("1m", "5m", "1h", "all")
+            tool_id: Only report this tool and its stages (overall is unaffected)
+
+        Returns:
+            {"unit": "ms", "windows": {window: {"overall", "tools", "stages"}}}
+
+        Raises:
+            ValueError: If a window name is unknown
+        """
+        spans = {name: window_seconds(name) for name in windows}
+        self.flush()
+        snapshot: dict[str, Any] = {"unit": "ms", "windows": {}}
+        with self._stats_lock:
+            for name, seconds in spans.items():
+                tools = {key: histogram.window(seconds) for key, histogram in sorted(self._tool_latency.items())}
+                stages: dict[str, LatencyHistogram] = {}
+                for (stage_tool_id, stage), histogram in self._stage_latency.items():
+                    if tool_id is None or stage_tool_id == tool_id:
+                        stages.setdefault(stage, LatencyHistogram()).merge(histogram.window(seconds))
+                snapshot["windows"][name] = {
+                    "overall": LatencyHistogram.merged(tools.values()).summary(),
+                    "tools": {key: histogram.summary() for key, histogram in tools.items() if histogram.count and (tool_id is None or key == tool_id)},
+                    "stages": {key: histogram.summary() for key, histogram in stages.items() if histogram.count},
+                }
+        return snapshot
+
+    def get_prometheus_metrics(self) -> str:
+        """
+        Render per-tool counters and all-time latency histograms in Prometheus text format.
+
+        Pending events are flushed first. Exposes
+        medcalc_tool_calls_total{tool_id,outcome},
+        medcalc_tool_call_duration_seconds{tool_id},
+        medcalc_calculate_stage_duration_seconds{tool_id,stage} (only for
+        calls made with stage timing enabled) and
+        medcalc_tool_usage_dropped_events_total.
+
+        Returns:
+            Exposition text (newline-terminated)
+        """
+        self.flush()
+        with self._stats_lock:
+            calls: list[tuple[dict[str, str], float]] = []
+            for tool_id, count in sorted(self._tool_usage_counts.items()):
+                errors = self._tool_error_counts.get(tool_id, 0)
+                calls.append(({"tool_id": tool_id, "outcome": "success"}, count - errors))
+                calls.append(({"tool_id": tool_id, "outcome": "error"}, errors))
+            lines = format_prometheus_samples("medcalc_tool_calls_total", "counter", "Tool calls by outcome.", calls)
+            lines += format_prometheus_histogram(
+                "medcalc_tool_call_duration_seconds",
+                "Tool call duration in seconds.",
+                (({"tool_id": key}, histogram.all_time) for key, histogram in sorted(self._tool_latency.items())),
+            )
+            lines += format_prometheus_histogram(
+                "medcalc_calculate_stage_duration_seconds",
+                "CalculateUseCase stage duration in seconds.",
+                (({"tool_id": key[0], "stage": key[1]}, histogram.all_time) for key, histogram in sorted(self._stage_latency.items())),
+            )
+        lines += format_prometheus_samples(
+            "medcalc_tool_usage_dropped_events_total", "counter", "Tool usage events dropped because the logging queue was full.", [({}, self._dropped_events)]
+        )
+        return "\n".join(lines) + "\n"
+
     def reset_statistics(self) -> None:
         """Reset all aggregated statistics."""
-        self._tool_usage_counts.clear()
-        self._tool_error_counts.clear()
-        self._tool_durations.clear()
-        self._workflow_patterns.clear()
+        self.flush()
+        with self._stats_lock:
+            self._tool_usage_counts.clear()
+            self._tool_error_counts.clear()
+            self._tool_latency.clear()
+            self._stage_latency.clear()
+            self._workflow_patterns.clear()
 
 
 class _ToolCallContext:
@@ -11,7 +11,7 @@ Architecture:
     - resources/: MCP resource handlers
 """
 
-from .config import McpServerConfig, default_config
+from .config import BatchConfig, McpServerConfig, default_config
 from .server import MedicalCalculatorServer, main, mcp
 
 __all__ = [
@@ -19,5 +19,6 @@ __all__ = [
     "main",
     "MedicalCalculatorServer",
     "McpServerConfig",
+    "BatchConfig",
     "default_config",
 ]
@@ -0,0 +1,134 @@
+"""
+Batch Executor
+
+Runs calculate_batch items off the event loop so one large batch no longer
+stalls every other session served by the same worker.
+
+- Identical (tool_id, params) items are executed once and fanned back out
+- Unique items run concurrently on a thread or process pool (BatchConfig),
+  submitted in chunks so per-future overhead does not dominate small items
+- Progress notifications are throttled to one per progress_interval seconds
+- Results are returned in the original item order
+
+The pool is a serving.CalculationPool (shared with the REST execution
+backend). The "process" executor gives real CPU parallelism for heavy
+batches: each worker process sets up the registry once (pool initializer),
+receives only the requests of its chunk, and its usage events are replayed
+into the server's usage logger. The "inline" executor keeps the legacy
+behaviour of running items sequentially on the event loop.
+"""
+
+import asyncio
+import json
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Any, Optional, cast
+
+from ...application.dto import CalculateRequest, CalculateResponse
+from ...application.use_cases import CalculateUseCase
+from ...application.use_cases.calculate_use_case import ToolCallRecorder
+from ..serving.calculation_pool import CalculationPool
+from .config import BatchConfig
+
+BatchItem = tuple[str, dict[str, Any]]
+ProgressCallback = Callable[[int, int], Awaitable[None]]
+
+
+def batch_item_key(tool_id: str, params: dict[str, Any]) -> str:
+    """Canonical dedupe key for a batch item (parameter order does not matter)."""
+    return json.dumps([tool_id, params], sort_keys=True, default=repr)
+
+
+class BatchExecutor:
+    """Deduplicating, order-preserving parallel runner for batch calculations."""
+
+    def __init__(self, use_case: CalculateUseCase, config: Optional[BatchConfig] = None, usage_logger: Optional[ToolCallRecorder] = None) -> None:
+        """
+        Args:
+            use_case: Runs items inline and on pool threads
+            config: Executor settings (BatchConfig.from_env() if omitted)
+            usage_logger: Receives the usage events of process workers
+        """
+        self._use_case = use_case
+        self._config = config or BatchConfig.from_env()
+        self._pool = CalculationPool(
+            use_case,
+            kind="thread" if self._config.executor == "inline" else self._config.executor,
+            max_workers=self._config.max_workers,
+            usage_logger=usage_logger,
+            thread_name_prefix="calculate-batch",
+        )
+
+    @property
+    def config(self) -> BatchConfig:
+        return self._config
+
+    def shutdown(self) -> None:
+        """Shut down the worker pool (if one was started)."""
+        self._pool.shutdown()
+
+    async def run(self, items: Sequence[BatchItem], on_progress: Optional[ProgressCallback] = None) -> list[CalculateResponse]:
+        """
+        Execute all items and return their responses in input order.
+
+        Args:
+            items: (tool_id, params) pairs
+            on_progress: Awaited with (completed unique items, total unique items),
+                at most once per progress_interval and always at completion
+
+        Returns:
+            One CalculateResponse per input item (duplicates share a response)
+        """
+        slot_by_key: dict[str, int] = {}
+        unique_items: list[BatchItem] = []
+        item_slots: list[int] = []
+        for tool_id, params in items:
+            key = batch_item_key(tool_id, params)
+            slot = slot_by_key.get(key)
+            if slot is None:
+                slot = slot_by_key[key] = len(unique_items)
+                unique_items.append((tool_id, params))
+            item_slots.append(slot)
+
+        responses: list[Optional[CalculateResponse]] = [None] * len(unique_items)
+        total = len(unique_items)
+        completed = 0
+        last_report = time.monotonic()
+
+        async def report(force: bool = False) -> None:
+            nonlocal last_report
+            if on_progress is None:
+                return
+            now = time.monotonic()
+            if force or now - last_report >= self._config.progress_interval:
+                last_report = now
+                await on_progress(completed, total)
+
+        if self._config.executor == "inline":
+            for slot, (tool_id, params) in enumerate(unique_items):
+                responses[slot] = self._use_case.execute(CalculateRequest(tool_id=tool_id, params=params))
+                completed += 1
+                await report()
+        else:
+            size = self._pool.job_size(total)
+
+            async def run_chunk(start: int) -> int:
+                chunk = unique_items[start : start + size]
+                responses[start : start + len(chunk)] = await self._submit(chunk)
+                return len(chunk)
+
+            for finished in asyncio.as_completed([run_chunk(start) for start in range(0, total, size)]):
+                completed += await finished
+                await report()
+
+        await report(force=True)
+        return [cast(CalculateResponse, responses[slot]) for slot in item_slots]
+
+    async def _submit(self, chunk: list[BatchItem]) -> list[CalculateResponse]:
+        """Run one chunk on the pool, converting worker failures into error responses."""
+        try:
+            return await self._pool.run([CalculateRequest(tool_id=tool_id, params=params) for tool_id, params in chunk])
+        except Exception as e:  # worker crash / pickling failure
+            return [
+                CalculateResponse(success=False, tool_id=tool_id, score_name="", result=None, unit="", error=f"Batch worker error: {e}") for tool_id, _ in chunk
+            ]
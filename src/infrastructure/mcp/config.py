@@ -9,6 +9,11 @@ Supports SSL/TLS configuration via environment variables or constructor argument
     - SSL_CERTFILE: Path to SSL certificate file
     - SSL_CA_CERTS: Path to CA certificates file (optional, for client verification)
     - SSL_CERT_REQUIRED: Require client certificate (default: false)
+
+Batch execution (calculate_batch) is configured the same way:
+    - BATCH_EXECUTOR: "thread" (default), "process", or "inline"
+    - BATCH_MAX_WORKERS: Worker pool size (default: min(8, CPU count))
+    - BATCH_PROGRESS_INTERVAL: Minimum seconds between progress notifications (default: 0.25)
 """
 
 import os
@@ -80,6 +85,47 @@ class SslConfig:
                 raise ValueError(f"SSL CA certs file not found: {self.ca_certs}")
 
 
+BATCH_EXECUTORS = ("thread", "process", "inline")
+
+
+def _default_batch_workers() -> int:
+    return min(8, os.cpu_count() or 1)
+
+
+@dataclass
+class BatchConfig:
+    """Execution settings for the calculate_batch tool"""
+
+    executor: str = "thread"
+    max_workers: int = field(default_factory=_default_batch_workers)
+    progress_interval: float = 0.25
+
+    def __post_init__(self) -> None:
+        if self.executor not in BATCH_EXECUTORS:
+            raise ValueError(f"BATCH_EXECUTOR must be one of {', '.join(BATCH_EXECUTORS)}, got {self.executor!r}")
+        if self.max_workers < 1:
+            raise ValueError(f"BATCH_MAX_WORKERS must be at least 1, got {self.max_workers}")
+
+    @classmethod
+    def from_env(cls) -> "BatchConfig":
+        """
+        Create batch configuration from environment variables.
+
+        Environment Variables:
+            BATCH_EXECUTOR: "thread", "process", or "inline" (run on the event loop, legacy behaviour)
+            BATCH_MAX_WORKERS: Worker pool size
+            BATCH_PROGRESS_INTERVAL: Minimum seconds between progress notifications
+
+        Returns:
+            BatchConfig instance
+        """
+        return cls(
+            executor=os.environ.get("BATCH_EXECUTOR", "thread").lower(),
+            max_workers=int(os.environ.get("BATCH_MAX_WORKERS", str(_default_batch_workers()))),
+            progress_interval=float(os.environ.get("BATCH_PROGRESS_INTERVAL", "0.25")),
+        )
+
+
 @dataclass
 class McpServerConfig:
     """Configuration for MCP server"""
@@ -95,6 +141,9 @@ class McpServerConfig:
     # SSL/TLS configuration
     ssl: SslConfig = field(default_factory=SslConfig)
 
+    # calculate_batch execution (worker pool, progress throttling)
+    batch: BatchConfig = field(default_factory=BatchConfig.from_env)
+
     # Instructions shown to AI agents
     instructions: str = """
 Medical Calculator MCP Server - 醫學計算工具 MCP 伺服器
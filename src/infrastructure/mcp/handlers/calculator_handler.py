@@ -6,29 +6,35 @@ MCP tool handlers for calculator operations.
 v3.0 CONSOLIDATED DESIGN (保持 High-Level / Low-Level 分層):
 ============================================================
 
-LOW-LEVEL TOOLS (計算執行層) - 3 個:
+LOW-LEVEL TOOLS (計算執行層) - 4 個:
 ├── get_tool_schema()    - 取得工具詳情 + 參數 Schema + 來源提示
 ├── calculate()          - 單一工具計算
-└── calculate_batch()    - 批次計算多工具
+├── calculate_batch()    - 批次計算多工具
+└── score_patient()      - 單一病人資料一次計算多個評分
 
 這些工具執行實際計算:
 1. get_tool_schema: 提供完整的參數資訊和來源提示 (整併自 get_calculator_info + get_calculation_schema)
 2. calculate: 執行單一計算
 3. calculate_batch: 批次執行多個計算，含跨工具分析
+4. score_patient: 一份病人資料 → 規劃衍生量 (MAP, P/F, GCS, BMI) 與適用工具，各算一次後並行計算
 
 整併說明:
 - get_calculator_info() + get_calculation_schema() → get_tool_schema()
 """
 
-from typing import Any
+import asyncio
+import json
+from typing import Annotated, Any, Optional
 
 from mcp.server.fastmcp import Context, FastMCP
+from mcp.types import CallToolResult, TextContent
 
-from ....application.dto import CalculateRequest, DiscoveryMode, DiscoveryRequest
-from ....application.use_cases import CalculateUseCase, DiscoveryUseCase
+from ....application.dto import CalculateRequest
+from ....application.use_cases import ALL_APPLICABLE, CalculateUseCase, PatientScoringUseCase, ToolSchemaUseCase
 from ....domain.registry.tool_registry import ToolRegistry
 from ....infrastructure.logging import get_logger
-from ....shared.smart_input import resolve_identifier
+from ..batch_executor import BatchExecutor
+from ..config import BatchConfig
 
 McpContext = Context[Any, Any, Any]
 
@@ -71,16 +77,23 @@ class CalculatorHandler:
     - get_calculator_info() + get_calculation_schema() → get_tool_schema()
     """
 
-    def __init__(self, mcp: FastMCP, registry: ToolRegistry):
+    def __init__(self, mcp: FastMCP, registry: ToolRegistry, batch_config: Optional[BatchConfig] = None):
         self._mcp = mcp
         self._registry = registry
-        self._use_case = CalculateUseCase(registry)
-        self._discovery_use_case = DiscoveryUseCase(registry)
         self._logger = get_logger()
+        self._use_case = CalculateUseCase(registry, usage_logger=self._logger)
+        self._batch_executor = BatchExecutor(self._use_case, batch_config, usage_logger=self._logger)
+        self._schema_use_case = ToolSchemaUseCase(registry)
+        self._schema_use_case.precompute()
+        self._patient_scoring = PatientScoringUseCase(registry, self._use_case)
 
         # Register the unified calculate tool
         self._register_tools()
 
+    def shutdown(self) -> None:
+        """Shut down the calculate_batch worker pool (if one was started)."""
+        self._batch_executor.shutdown()
+
     def _register_tools(self) -> None:
         """Register the unified calculate tool with MCP"""
 
@@ -256,26 +269,25 @@ class CalculatorHandler:
             💡 這不是臨床建議，只是根據指引標準的事實陳述
             """
             results: list[dict[str, Any]] = []
-            tool_ids: list[str] = []
+            tool_ids: list[str] = [calc.get("tool_id", "") for calc in calculations]
             scores: dict[str, Any] = {}
 
             await ctx.report_progress(5, 100, f"Preparing {len(calculations)} batch calculations")
 
-            for index, calc in enumerate(calculations, start=1):
-                tool_id = calc.get("tool_id", "")
-                params = calc.get("params", {})
-                tool_ids.append(tool_id)
-
+            async def report_batch_progress(completed: int, total: int) -> None:
                 await ctx.report_progress(
-                    5 + (index - 1) * 80 / max(len(calculations), 1),
+                    5 + completed * 80 / max(total, 1),
                     100,
-                    f"Executing batch item {index}/{len(calculations)}: {tool_id}",
+                    f"Executed {completed}/{total} unique batch items",
                 )
 
-                # Execute calculation
-                request = CalculateRequest(tool_id=tool_id, params=params)
-                response = self._use_case.execute(request)
+            # Deduplicated, order-preserving execution off the event loop
+            responses = await self._batch_executor.run(
+                [(tool_id, calc.get("params", {})) for tool_id, calc in zip(tool_ids, calculations, strict=True)],
+                on_progress=report_batch_progress,
+            )
 
+            for tool_id, response in zip(tool_ids, responses, strict=True):
                 result = {
                     "tool_id": tool_id,
                     "success": response.success,
@@ -314,12 +326,70 @@ class CalculatorHandler:
                 "note": "cross_analysis 是事實陳述，非臨床建議。Agent 應根據臨床情境做判斷。",
             }
 
+        # ====================================================================
+        # Patient Scoring: one record, many scores
+        # ====================================================================
+
+        @self._mcp.tool()
+        async def score_patient(record: dict[str, Any], ctx: McpContext, tools: list[str] | str = ALL_APPLICABLE) -> dict[str, Any]:
+            """
+            🩺 單一病人資料一次計算多個評分 (SOFA, qSOFA, NEWS2, APACHE II, MELD, CKD-EPI ...)
+
+            送一份病人資料即可，不需為每個工具重複組參數。衍生量只算一次並共用:
+            - map_value ← systolic_bp + diastolic_bp
+            - pao2_fio2_ratio ← pao2 + fio2
+            - gcs_score ← eye_response + verbal_response + motor_response
+            - bmi ← weight_kg + height_cm
+            缺少必要參數的工具會被略過並列出缺少的欄位；其餘工具並行計算。
+
+            Args:
+                record: 病人資料 (參數名稱或別名皆可，例如 "creatinine", "sbp", "hr")
+                tools: 工具 ID 列表，或 "all_applicable" (依資料自動挑選可計算的工具，預設)
+
+            Returns:
+                - results: 各工具結果，含 inputs (每個參數來自哪個欄位或衍生量) 與 defaulted (使用預設值的參數)
+                - derived: 計算出的衍生量、公式與使用它的工具
+                - skipped: 略過的工具與缺少的參數
+                - unused_fields: 沒有工具使用的欄位
+                - summary: evaluated / successful / failed / skipped
+
+            **Example - Sepsis + 器官功能:**
+            ```
+            score_patient(
+                {"age": 67, "sex": "male", "temperature": 38.6, "heart_rate": 118,
+                 "respiratory_rate": 26, "systolic_bp": 92, "diastolic_bp": 54,
+                 "spo2": 91, "on_supplemental_o2": True, "pao2": 70, "fio2": 0.5,
+                 "platelets": 95, "bilirubin": 2.4, "creatinine": 2.1, "inr": 1.8,
+                 "sodium": 132, "eye_response": 3, "verbal_response": 4, "motor_response": 6},
+                tools=["sofa_score", "qsofa_score", "news2_score", "apache_ii", "meld_score", "ckd_epi_2021"],
+            )
+            ```
+
+            💡 "all_applicable" 只依參數是否齊全挑選工具，不代表臨床上適用；Agent 應根據臨床情境判讀。
+            """
+            try:
+                # Planning matches parameters and may search the registry: keep it off the event loop
+                plan = await asyncio.to_thread(self._patient_scoring.plan, record, tools)
+            except ValueError as e:
+                return {"all_success": False, "count": 0, "error": str(e)}
+
+            await ctx.report_progress(10, 100, f"Planned {len(plan.tools)} tools, {len(plan.derived)} derived values")
+
+            async def report_progress(completed: int, total: int) -> None:
+                await ctx.report_progress(10 + completed * 85 / max(total, 1), 100, f"Executed {completed}/{total} tools")
+
+            responses = await self._batch_executor.run(plan.items, on_progress=report_progress)
+            await ctx.report_progress(100, 100, "Patient scoring complete")
+            return plan.to_dict(responses)
+
         # ====================================================================
         # LOW-LEVEL TOOL 3: Get Tool Schema (整併自 get_calculator_info + get_calculation_schema)
         # ====================================================================
 
         @self._mcp.tool()
-        async def get_tool_schema(tool_id: str, ctx: McpContext, include_references: bool = True, include_param_sources: bool = True) -> dict[str, Any]:
+        async def get_tool_schema(
+            tool_id: str, ctx: McpContext, include_references: bool = True, include_param_sources: bool = True
+        ) -> Annotated[CallToolResult, dict[str, Any]]:
             """
             📋 取得工具完整資訊 + 參數 Schema + 來源提示 (Low-Level)
 
@@ -361,70 +431,27 @@ class CalculatorHandler:
             """
             await ctx.report_progress(10, 100, f"Loading schema for {tool_id}")
 
-            resolution = resolve_identifier(tool_id, self._registry.list_all_ids())
-            resolved_tool_id = resolution.resolved_value or tool_id
-            calculator = self._registry.get_calculator(resolved_tool_id)
-            if not calculator:
-                return {
-                    "success": False,
-                    "error": f"找不到工具: {tool_id}",
-                    "hint": "使用 discover(by='keyword', value='關鍵字') 搜尋工具",
-                    "suggestions": list(resolution.suggestions),
-                    "guidance": {
-                        "next_actions": [
-                            "discover(by='keyword', value='關鍵字')",
-                            "discover(by='tools')",
-                        ],
-                    },
-                }
-
-            metadata = calculator.metadata
-            low_level = metadata.low_level
-            high_level = metadata.high_level
-
-            # Build parameter schemas with source mapping
-            if include_param_sources:
-                await ctx.report_progress(55, 100, f"Building parameter schema for {tool_id}")
-                param_schemas = _build_param_schemas(calculator)
-            else:
-                # Minimal schema (just type info)
-                param_schemas = {param: {"type": "number", "required": True} for param in low_level.input_params}
-
-            result: dict[str, Any] = {
-                "success": True,
-                "tool_id": resolved_tool_id,
-                "name": low_level.name,
-                "purpose": low_level.purpose,
-                "formula_source_type": metadata.formula_source_type,
-                # High-Level 分類資訊
-                "clinical_context": {
-                    "specialties": [s.value for s in high_level.specialties],
-                    "contexts": [c.value for c in high_level.clinical_contexts],
-                    "conditions": list(high_level.conditions) if high_level.conditions else [],
-                },
-                # Low-Level 參數資訊
-                "required_params": list(low_level.input_params),
-                "param_schemas": param_schemas,
-                "output": {
-                    "type": low_level.output_type,
-                },
-                # 導航
-                "next_step": f"calculate('{resolved_tool_id}', {{...params}})",
-            }
-
-            if resolved_tool_id != tool_id:
-                result["resolved_tool_id"] = resolved_tool_id
-
-            # 參考文獻 (可選)
-            if include_references:
-                await ctx.report_progress(80, 100, f"Resolving references for {tool_id}")
-                request = DiscoveryRequest(mode=DiscoveryMode.GET_INFO, tool_id=resolved_tool_id)
-                discovery_response = self._discovery_use_case.execute(request)
-                if discovery_response.tool_detail and discovery_response.tool_detail.references:
-                    result["references"] = discovery_response.tool_detail.references
+            # Precomputed at registration: no per-call schema building or serialization
+            schema = self._schema_use_case.get(tool_id, include_references=include_references, include_param_sources=include_param_sources)
+            if schema is None:
+                resolution = self._schema_use_case.resolve(tool_id)
+                return _json_tool_result(
+                    {
+                        "success": False,
+                        "error": f"找不到工具: {tool_id}",
+                        "hint": "使用 discover(by='keyword', value='關鍵字') 搜尋工具",
+                        "suggestions": list(resolution.suggestions),
+                        "guidance": {
+                            "next_actions": [
+                                "discover(by='keyword', value='關鍵字')",
+                                "discover(by='tools')",
+                            ],
+                        },
+                    }
+                )
 
             await ctx.report_progress(100, 100, f"Schema ready for {tool_id}")
-            return result
+            return CallToolResult(content=[TextContent(type="text", text=schema.text)], structuredContent=schema.payload)
 
         # ====================================================================
         # OLD DESIGN: 75 個獨立工具 (已註解以節省 token)
@@ -598,224 +625,6 @@ def _generate_cross_analysis(scores: dict[str, Any]) -> list[dict[str, str]]:
     return analysis
 
 
-def _build_param_schemas(calculator: Any) -> dict[str, dict[str, Any]]:
-    """
-    Build detailed parameter schemas with source mapping.
-
-    Args:
-        calculator: Calculator instance
-
-    Returns:
-        Dictionary of param_name -> schema details
-    """
-    # Parameter source mapping (where to find these values clinically)
-    param_sources: dict[str, dict[str, Any]] = {
-        # Lab values
-        "serum_creatinine": {
-            "type": "number",
-            "unit": "mg/dL",
-            "description": "Serum creatinine level",
-            "clinical_hint": "Measured from blood sample",
-            "normal_range": [0.6, 1.2],
-            "common_sources": ["BMP", "CMP", "Renal panel"],
-        },
-        "creatinine": {
-            "type": "number",
-            "unit": "mg/dL",
-            "description": "Serum creatinine",
-            "clinical_hint": "From metabolic panel",
-            "normal_range": [0.6, 1.2],
-            "common_sources": ["BMP", "CMP", "Renal panel"],
-        },
-        "bilirubin": {
-            "type": "number",
-            "unit": "mg/dL",
-            "description": "Total bilirubin",
-            "clinical_hint": "From liver function tests",
-            "normal_range": [0.1, 1.2],
-            "common_sources": ["LFT", "Hepatic panel"],
-        },
-        "platelets": {
-            "type": "number",
-            "unit": "×10³/µL",
-            "description": "Platelet count",
-            "clinical_hint": "From complete blood count",
-            "normal_range": [150, 400],
-            "common_sources": ["CBC"],
-        },
-        "inr": {
-            "type": "number",
-            "unit": "",
-            "description": "International Normalized Ratio",
-            "clinical_hint": "From coagulation panel",
-            "normal_range": [0.9, 1.1],
-            "common_sources": ["PT/INR", "Coag panel"],
-        },
-        "sodium": {
-            "type": "number",
-            "unit": "mEq/L",
-            "description": "Serum sodium",
-            "clinical_hint": "From metabolic panel",
-            "normal_range": [136, 145],
-            "common_sources": ["BMP", "CMP"],
-        },
-        "potassium": {
-            "type": "number",
-            "unit": "mEq/L",
-            "description": "Serum potassium",
-            "clinical_hint": "From metabolic panel",
-            "normal_range": [3.5, 5.0],
-            "common_sources": ["BMP", "CMP"],
-        },
-        "glucose": {
-            "type": "number",
-            "unit": "mg/dL",
-            "description": "Blood glucose",
-            "clinical_hint": "From metabolic panel or point-of-care",
-            "normal_range": [70, 100],
-            "common_sources": ["BMP", "CMP", "POC glucose"],
-        },
-        "albumin": {
-            "type": "number",
-            "unit": "g/dL",
-            "description": "Serum albumin",
-            "clinical_hint": "From liver function tests",
-            "normal_range": [3.5, 5.0],
-            "common_sources": ["LFT", "CMP"],
-        },
-        # Vital signs
-        "heart_rate": {
-            "type": "number",
-            "unit": "bpm",
-            "description": "Heart rate",
-            "clinical_hint": "From vital signs monitor",
-            "normal_range": [60, 100],
-            "common_sources": ["Vital signs", "ECG monitor", "Pulse oximeter"],
-        },
-        "systolic_bp": {
-            "type": "number",
-            "unit": "mmHg",
-            "description": "Systolic blood pressure",
-            "clinical_hint": "From vital signs",
-            "normal_range": [90, 140],
-            "common_sources": ["Vital signs", "Arterial line"],
-        },
-        "respiratory_rate": {
-            "type": "number",
-            "unit": "/min",
-            "description": "Respiratory rate",
-            "clinical_hint": "Count breaths per minute",
-            "normal_range": [12, 20],
-            "common_sources": ["Vital signs", "Bedside observation"],
-        },
-        "temperature": {
-            "type": "number",
-            "unit": "°C",
-            "description": "Body temperature",
-            "clinical_hint": "From vital signs",
-            "normal_range": [36.5, 37.5],
-            "common_sources": ["Vital signs"],
-        },
-        "spo2": {
-            "type": "number",
-            "unit": "%",
-            "description": "Oxygen saturation",
-            "clinical_hint": "From pulse oximeter",
-            "normal_range": [95, 100],
-            "common_sources": ["Pulse oximeter", "Vital signs"],
-        },
-        # Blood gas
-        "pao2_fio2_ratio": {
-            "type": "number",
-            "unit": "mmHg",
-            "description": "PaO2/FiO2 ratio (P/F ratio)",
-            "clinical_hint": "Calculate: PaO2 ÷ FiO2 (as decimal)",
-            "normal_range": [400, 500],
-            "common_sources": ["ABG + Ventilator FiO2"],
-        },
-        "ph": {
-            "type": "number",
-            "unit": "",
-            "description": "Arterial blood pH",
-            "clinical_hint": "From arterial blood gas",
-            "normal_range": [7.35, 7.45],
-            "common_sources": ["ABG"],
-        },
-        "pco2": {
-            "type": "number",
-            "unit": "mmHg",
-            "description": "Partial pressure of CO2",
-            "clinical_hint": "From arterial blood gas",
-            "normal_range": [35, 45],
-            "common_sources": ["ABG"],
-        },
-        "hco3": {
-            "type": "number",
-            "unit": "mEq/L",
-            "description": "Bicarbonate",
-            "clinical_hint": "From ABG or metabolic panel",
-            "normal_range": [22, 26],
-            "common_sources": ["ABG", "BMP"],
-        },
-        # Demographics
-        "age": {
-            "type": "number",
-            "unit": "years",
-            "description": "Patient age",
-            "clinical_hint": "From patient demographics",
-            "normal_range": [0, 120],
-            "common_sources": ["EMR demographics", "Patient interview"],
-        },
-        "sex": {
-            "type": "string",
-            "unit": "",
-            "description": "Biological sex",
-            "clinical_hint": "male or female",
-            "valid_values": ["male", "female"],
-            "common_sources": ["EMR demographics"],
-        },
-        "weight": {
-            "type": "number",
-            "unit": "kg",
-            "description": "Body weight",
-            "clinical_hint": "Measured weight in kilograms",
-            "normal_range": [2, 300],
-            "common_sources": ["Nursing assessment", "Admission weight"],
-        },
-        "height": {
-            "type": "number",
-            "unit": "cm",
-            "description": "Height",
-            "clinical_hint": "Measured height in centimeters",
-            "normal_range": [50, 250],
-            "common_sources": ["Nursing assessment"],
-        },
-        # Scores
-        "gcs_score": {
-            "type": "number",
-            "unit": "",
-            "description": "Glasgow Coma Scale total",
-            "clinical_hint": "Sum of E + V + M components",
-            "normal_range": [3, 15],
-            "common_sources": ["Neurological assessment", "glasgow_coma_scale"],
-        },
-    }
-
-    # Get required params from calculator
-    param_names = list(calculator.metadata.low_level.input_params)
-
-    schemas: dict[str, dict[str, Any]] = {}
-    for param in param_names:
-        if param in param_sources:
-            schemas[param] = param_sources[param]
-        else:
-            # Generate generic schema
-            schemas[param] = {
-                "type": "number",
-                "unit": "",
-                "description": param.replace("_", " ").title(),
-                "clinical_hint": "See calculator documentation",
-                "common_sources": ["Clinical assessment"],
-            }
-
-    return schemas
+def _json_tool_result(payload: dict[str, Any]) -> CallToolResult:
+    """Tool result for a payload built per call (same text form as the precomputed schemas)."""
+    return CallToolResult(content=[TextContent(type="text", text=json.dumps(payload, ensure_ascii=False, indent=2))], structuredContent=payload)
@@ -30,7 +30,7 @@ from mcp.server.fastmcp import FastMCP
 from ....application.dto import DiscoveryMode, DiscoveryRequest
 from ....application.use_cases import DiscoveryUseCase
 from ....domain.registry.tool_registry import ToolRegistry
-from ....shared.smart_input import normalize_identifier, resolve_identifier
+from ....shared.smart_input import normalize_identifier
 
 DISCOVER_MODE_ALIASES = {
     "all": "all",
@@ -262,7 +262,7 @@ class DiscoveryHandler:
 
             💡 相關性基於: 共享參數、相同專科、相同臨床情境
             """
-            resolution = resolve_identifier(tool_id, self._registry.list_all_ids())
+            resolution = self._registry.get_tool_resolver().resolve(tool_id)
             resolved_tool_id = resolution.resolved_value or tool_id
             related = self._registry.get_related_tools(resolved_tool_id, limit)
 
@@ -285,13 +285,13 @@ class DiscoveryHandler:
             # Enrich with metadata
             tools = []
             for rel_id, score in related:
-                calc = self._registry.get_calculator(rel_id)
-                if calc:
+                rel_metadata = self._registry.get(rel_id)
+                if rel_metadata:
                     tools.append(
                         {
                             "tool_id": rel_id,
-                            "name": calc.metadata.low_level.name,
-                            "purpose": calc.metadata.low_level.purpose,
+                            "name": rel_metadata.low_level.name,
+                            "purpose": rel_metadata.low_level.purpose,
                             "similarity": round(score, 3),
                         }
                     )
@@ -0,0 +1,39 @@
+"""
+MCP Tool Metrics
+
+SecuredFastMCP subclass that records every tool call (count, outcome, latency,
+in-flight) into the process-wide MetricsCollector. Overriding call_tool()
+covers every transport (stdio, SSE, streamable HTTP) because the low-level
+server dispatches tools/call through it.
+"""
+
+from collections.abc import Sequence
+from time import perf_counter_ns
+from typing import Any
+
+from mcp.types import ContentBlock
+
+from ..metrics import get_metrics
+from .secured_app import SecuredFastMCP
+
+# Label for calls to tools that are not registered (keeps client input out of label values)
+UNKNOWN_TOOL_LABEL = "unknown"
+
+
+class InstrumentedFastMCP(SecuredFastMCP):
+    """SecuredFastMCP that also reports per-tool call metrics."""
+
+    async def call_tool(self, name: str, arguments: dict[str, Any]) -> Sequence[ContentBlock] | dict[str, Any]:
+        metrics = get_metrics()
+        metrics.ensure_lag_monitor()
+        label = name if self._tool_manager.get_tool(name) is not None else UNKNOWN_TOOL_LABEL
+        success = False
+        started = perf_counter_ns()
+        metrics.in_flight["mcp_tool"] += 1
+        try:
+            result = await super().call_tool(name, arguments)
+            success = True
+            return result
+        finally:
+            metrics.in_flight["mcp_tool"] -= 1
+            metrics.observe_mcp_tool(label, success, perf_counter_ns() - started)
@@ -5,7 +5,9 @@ Resource handlers for MCP server.
 """
 
 from .calculator_resources import CalculatorResourceHandler
+from .monitoring_resources import MonitoringResourceHandler
 
 __all__ = [
     "CalculatorResourceHandler",
+    "MonitoringResourceHandler",
 ]
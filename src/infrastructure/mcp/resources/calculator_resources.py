@@ -10,7 +10,7 @@ from src.infrastructure.mcp.guidance import TOOL_USAGE_SEQUENCE, get_tool_usage_
 
 from ....domain.entities.tool_metadata import ToolMetadata
 from ....domain.registry.tool_registry import ToolRegistry
-from ....shared.smart_input import ResolutionResult, resolve_identifier
+from ....shared.smart_input import ResolutionResult
 
 
 class CalculatorResourceHandler:
@@ -25,9 +25,22 @@ class CalculatorResourceHandler:
         self._mcp = mcp
         self._registry = registry
 
+        # calculator://{tool_id}/info pages, rendered once per tool: (title line, rest)
+        self._info_pages: dict[str, tuple[str, str]] = {}
+        for metadata in registry.list_all():
+            self._info_page(metadata)
+
         # Register resources
         self._register_resources()
 
+    def _info_page(self, metadata: ToolMetadata) -> tuple[str, str]:
+        """Cached info page for a tool, split after the title so a resolved-alias line can be inserted."""
+        page = self._info_pages.get(metadata.low_level.tool_id)
+        if page is None:
+            lines = _build_info_lines(metadata)
+            page = self._info_pages[metadata.low_level.tool_id] = (lines[0], "\n".join(lines[1:]))
+        return page
+
     def _register_resources(self) -> None:
         """Register all resources with MCP"""
 
@@ -73,45 +86,25 @@ class CalculatorResourceHandler:
         @self._mcp.resource("calculator://{tool_id}/info")
         def get_calculator_info_resource(tool_id: str) -> str:
             """Get detailed info for a specific calculator"""
-            resolution = resolve_identifier(tool_id, self._registry.list_all_ids())
+            page = self._info_pages.get(tool_id)
+            if page is not None:
+                return "\n".join(page)
+
+            resolution = self._registry.get_tool_resolver().resolve(tool_id)
             resolved_tool_id = resolution.resolved_value or tool_id
             metadata = self._registry.get(resolved_tool_id)
             if metadata is None:
                 return _build_tool_not_found_resource(tool_id, resolution)
 
-            lines = [f"# {metadata.low_level.name}\n"]
+            title, body = self._info_page(metadata)
             if resolved_tool_id != tool_id:
-                lines.append(f"**Resolved Tool ID:** `{resolved_tool_id}` (from `{tool_id}`)\n")
-            lines.append(f"**Tool ID:** `{metadata.low_level.tool_id}`\n")
-            lines.append(f"**Purpose:** {metadata.low_level.purpose}\n")
-            lines.append(f"**Formula Source Type:** `{metadata.formula_source_type}`\n")
-            lines.append("**Start Here Resource:** `guide://tool-usage-playbook`\n")
-            lines.append("**Recommended Sequence:** `discover(...)` → `get_tool_schema(tool_id)` → `calculate(tool_id, params)`\n")
-
-            lines.append("\n## Input Parameters\n")
-            for param in metadata.low_level.input_params:
-                lines.append(f"- `{param}`")
-
-            lines.append(f"\n**Output:** {metadata.low_level.output_type}\n")
-
-            lines.append("\n## Clinical Use\n")
-            lines.append(f"**Specialties:** {', '.join(s.value for s in metadata.high_level.specialties)}\n")
-            lines.append(f"**Contexts:** {', '.join(c.value for c in metadata.high_level.clinical_contexts)}\n")
-
-            if metadata.high_level.conditions:
-                lines.append(f"**Conditions:** {', '.join(metadata.high_level.conditions)}\n")
-
-            if metadata.high_level.clinical_questions:
-                lines.append("\n### Clinical Questions\n")
-                for q in metadata.high_level.clinical_questions:
-                    lines.append(f"- {q}")
-
-            return "\n".join(lines)
+                return "\n".join((title, f"**Resolved Tool ID:** `{resolved_tool_id}` (from `{tool_id}`)\n", body))
+            return "\n".join((title, body))
 
         @self._mcp.resource("calculator://{tool_id}/references")
         def get_calculator_references(tool_id: str) -> str:
             """Get paper references for a specific calculator"""
-            resolution = resolve_identifier(tool_id, self._registry.list_all_ids())
+            resolution = self._registry.get_tool_resolver().resolve(tool_id)
             resolved_tool_id = resolution.resolved_value or tool_id
             metadata = self._registry.get(resolved_tool_id)
             if metadata is None:
@@ -139,8 +132,7 @@ class CalculatorResourceHandler:
             """Get all tools for a specific specialty"""
             from ....domain.value_objects.tool_keys import Specialty
 
-            specialty_candidates = [s.value for s in self._registry.list_specialties()]
-            resolution = resolve_identifier(specialty, specialty_candidates)
+            resolution = self._registry.get_specialty_resolver().resolve(specialty)
             matched_specialty = None
             if resolution.resolved_value is not None:
                 for s in Specialty:
@@ -173,6 +165,36 @@ class CalculatorResourceHandler:
             return "\n".join(lines)
 
 
+def _build_info_lines(metadata: ToolMetadata) -> list[str]:
+    """Lines of the calculator://{tool_id}/info page (title first)."""
+    lines = [f"# {metadata.low_level.name}\n"]
+    lines.append(f"**Tool ID:** `{metadata.low_level.tool_id}`\n")
+    lines.append(f"**Purpose:** {metadata.low_level.purpose}\n")
+    lines.append(f"**Formula Source Type:** `{metadata.formula_source_type}`\n")
+    lines.append("**Start Here Resource:** `guide://tool-usage-playbook`\n")
+    lines.append("**Recommended Sequence:** `discover(...)` → `get_tool_schema(tool_id)` → `calculate(tool_id, params)`\n")
+
+    lines.append("\n## Input Parameters\n")
+    for param in metadata.low_level.input_params:
+        lines.append(f"- `{param}`")
+
+    lines.append(f"\n**Output:** {metadata.low_level.output_type}\n")
+
+    lines.append("\n## Clinical Use\n")
+    lines.append(f"**Specialties:** {', '.join(s.value for s in metadata.high_level.specialties)}\n")
+    lines.append(f"**Contexts:** {', '.join(c.value for c in metadata.high_level.clinical_contexts)}\n")
+
+    if metadata.high_level.conditions:
+        lines.append(f"**Conditions:** {', '.join(metadata.high_level.conditions)}\n")
+
+    if metadata.high_level.clinical_questions:
+        lines.append("\n### Clinical Questions\n")
+        for q in metadata.high_level.clinical_questions:
+            lines.append(f"- {q}")
+
+    return lines
+
+
 def _build_tool_not_found_resource(tool_id: str, resolution: ResolutionResult) -> str:
     lines = [f"Calculator '{tool_id}' not found"]
     if resolution.suggestions:
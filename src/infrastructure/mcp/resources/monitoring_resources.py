@@ -0,0 +1,46 @@
+"""
+Monitoring Resources Handler
+
+MCP resource handlers for runtime latency statistics recorded by the
+ToolUsageLogger (per-tool and per-stage p50/p90/p99/p999 over rolling windows).
+"""
+
+import json
+from typing import Optional
+
+from mcp.server.fastmcp import FastMCP
+
+from ...logging import ToolUsageLogger, get_logger
+
+
+class MonitoringResourceHandler:
+    """
+    Handler for monitoring MCP resources.
+
+    Resources return JSON snapshots of this server process's latency
+    histograms (see ToolUsageLogger.get_latency_snapshot).
+    """
+
+    def __init__(self, mcp: FastMCP, usage_logger: Optional[ToolUsageLogger] = None):
+        self._mcp = mcp
+        self._usage_logger = usage_logger or get_logger()
+
+        # Register resources
+        self._register_resources()
+
+    def _register_resources(self) -> None:
+        """Register all resources with MCP"""
+
+        @self._mcp.resource("stats://latency")
+        def get_latency_resource() -> str:
+            """Latency percentiles per tool and pipeline stage for the 1m, 5m, 1h and all-time windows"""
+            return json.dumps(self._usage_logger.get_latency_snapshot(), indent=2)
+
+        @self._mcp.resource("stats://latency/{window}")
+        def get_latency_window_resource(window: str) -> str:
+            """Latency percentiles for one window (1m, 5m, 1h or all)"""
+            try:
+                snapshot = self._usage_logger.get_latency_snapshot(windows=(window,))
+            except ValueError as e:
+                return json.dumps({"error": str(e)})
+            return json.dumps(snapshot, indent=2)
@@ -0,0 +1,36 @@
+"""
+Secured FastMCP
+
+FastMCP subclass whose SSE and streamable-HTTP Starlette apps are wrapped in
+ASGISecurityMiddleware, so SecurityMiddleware (rate limiting, API keys) is
+enforced on /sse, /messages/ and /mcp. FastMCP.run() builds its app through
+sse_app() / streamable_http_app(), so the overrides cover normal startup too.
+stdio has no HTTP layer and is unaffected.
+"""
+
+from typing import Any, Optional
+
+from mcp.server.fastmcp import FastMCP
+from starlette.applications import Starlette
+
+from ..security import ASGISecurityMiddleware, SecurityMiddleware
+
+
+class SecuredFastMCP(FastMCP):
+    """FastMCP that enforces SecurityMiddleware on its HTTP transports."""
+
+    def __init__(self, *args: Any, security: Optional[SecurityMiddleware] = None, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.security = security
+
+    def sse_app(self, mount_path: str | None = None) -> Starlette:
+        return self._secure(super().sse_app(mount_path))
+
+    def streamable_http_app(self) -> Starlette:
+        return self._secure(super().streamable_http_app())
+
+    def _secure(self, app: Starlette) -> Starlette:
+        # add_middleware() inserts outermost: checks run before FastMCP's own middleware and routes
+        if self.security is not None and self.security.is_enabled():
+            app.add_middleware(ASGISecurityMiddleware, security=self.security)
+        return app
@@ -10,12 +10,18 @@ Architecture:
     - Application Layer: Use Cases, DTOs
     - Infrastructure Layer: MCP Handlers, Resources, Security
 
+Metrics:
+    GET /metrics (SSE/HTTP modes) serves Prometheus text: MCP tool calls,
+    rate-limiter rejections, event-loop lag and per-tool_id metrics.
+    Disable with METRICS_ENABLED=false.
+
 Security Features (Optional):
     - Rate Limiting: Throttle requests to prevent abuse
     - API Authentication: API Key based authentication
 
-    All security features are DISABLED by default.
-    Enable via environment variables:
+    All security features are DISABLED by default. When enabled they are
+    enforced on the SSE/HTTP transports (401/429 before the request body is
+    read); /health and /ready stay open. Enable via environment variables:
         SECURITY_RATE_LIMIT_ENABLED=true
         SECURITY_AUTH_ENABLED=true
         SECURITY_API_KEYS=your-key
@@ -30,6 +36,9 @@ Usage:
     # HTTP transport
     python -m src.infrastructure.mcp.server --transport http
 
+    # Stateless HTTP transport served by pre-forked workers (POSIX)
+    python -m src.main --mode http --workers 4
+
 Tool Discovery Flow:
     1. Agent calls discover(...) to find the correct tool
     2. Agent calls get_tool_schema(tool_id) for exact parameters
@@ -43,14 +52,20 @@ from typing import Any, Optional, cast
 
 from mcp.server.fastmcp import FastMCP
 
+from ...domain.registry.manifest import load_registry_manifest
 from ...domain.registry.tool_registry import ToolRegistry, get_registry
-from ...domain.services.calculators import CALCULATORS
+from ...domain.services.calculators import CALCULATOR_NAMES
+from ...domain.validation.boundaries import get_boundary_registry
 from ...shared.formula_provenance import validate_formula_provenance_manifest
 from ...shared.production_readiness import ReadinessReport, build_readiness_report
+from ...shared.prometheus_format import PROMETHEUS_CONTENT_TYPE
+from ..metrics import get_metrics, metrics_enabled, render_metrics
 from ..security import SecurityConfig, SecurityMiddleware
 from .config import McpServerConfig, default_config
 from .handlers import CalculatorHandler, DiscoveryHandler, PromptHandler
-from .resources import CalculatorResourceHandler
+from .metrics import InstrumentedFastMCP
+from .resources import CalculatorResourceHandler, MonitoringResourceHandler
+from .secured_app import SecuredFastMCP
 
 logger = logging.getLogger(__name__)
 
@@ -69,6 +84,7 @@ class MedicalCalculatorServer:
     - Handler registration (Discovery, Calculator)
     - Resource registration
     - Security middleware (optional)
+    - Prometheus metrics (/metrics, tool-call instrumentation)
 
     Design Principles:
     - Single Responsibility: Each handler manages its own domain
@@ -100,8 +116,11 @@ class MedicalCalculatorServer:
         else:
             logger.info("Security features: DISABLED (default)")
 
-        # Create FastMCP server with network settings
-        self._mcp = FastMCP(
+        # Create FastMCP server with network settings (instrumented unless METRICS_ENABLED=false)
+        self._metrics_enabled = metrics_enabled()
+        mcp_class = InstrumentedFastMCP if self._metrics_enabled else SecuredFastMCP
+        self._mcp = mcp_class(
+            security=self._security,
             name=self._config.name,
             json_response=self._config.json_response,
             instructions=self._config.instructions,
@@ -120,6 +139,17 @@ class MedicalCalculatorServer:
 
     def _register_calculators(self) -> None:
         """Register all calculators with the registry"""
+        # Fast path: restore metadata and discovery indexes from the prebuilt
+        # manifest; calculator modules are then imported on first use
+        if self._registry.count() == 0:
+            manifest = load_registry_manifest()
+            if manifest is not None:
+                self._registry.load_manifest(manifest)
+                logger.info(f"Registry restored from manifest: {self._registry.count()} calculators (loaded on first use)")
+                return
+
+        from ...domain.services.calculators import CALCULATORS
+
         for calculator_cls in CALCULATORS:
             instance = calculator_cls()
             # Skip if already registered (singleton pattern may have existing entries)
@@ -136,18 +166,25 @@ class MedicalCalculatorServer:
         # Discovery tools (discover, get_related_tools, find_tools_by_params)
         self._discovery_handler = DiscoveryHandler(self._mcp, self._registry)
 
-        # Calculator tools (get_tool_schema, calculate, calculate_batch)
-        self._calculator_handler = CalculatorHandler(self._mcp, self._registry)
+        # Calculator tools (get_tool_schema, calculate, calculate_batch, score_patient)
+        self._calculator_handler = CalculatorHandler(self._mcp, self._registry, self._config.batch)
 
         # Resources (calculator://list, etc.)
         self._resource_handler = CalculatorResourceHandler(self._mcp, self._registry)
 
+        # Monitoring resources (stats://latency)
+        self._monitoring_handler = MonitoringResourceHandler(self._mcp)
+
         # Prompts (clinical workflows)
         self._prompt_handler = PromptHandler(self._mcp, self._registry)
 
         # Health check endpoint for Docker/Kubernetes liveness probes
         self._init_health_endpoint()
 
+        # Prometheus metrics endpoint
+        if self._metrics_enabled:
+            self._init_metrics_endpoint()
+
     def _init_health_endpoint(self) -> None:
         """Initialize health and readiness endpoints for container orchestration."""
         from starlette.requests import Request
@@ -191,6 +228,23 @@ class MedicalCalculatorServer:
             status_code = 200 if report.ready else 503
             return JSONResponse(content=payload, status_code=status_code)
 
+    def _init_metrics_endpoint(self) -> None:
+        """Initialize the Prometheus /metrics endpoint (SSE/HTTP modes)."""
+        from starlette.concurrency import run_in_threadpool
+        from starlette.requests import Request
+        from starlette.responses import Response
+
+        route_decorator = cast(
+            Callable[[Callable[[Request], Awaitable[Response]]], Callable[[Request], Awaitable[Response]]],
+            self._mcp.custom_route("/metrics", methods=["GET"]),
+        )
+
+        @route_decorator
+        async def metrics(request: Request) -> Response:
+            """Prometheus text exposition for scrapers."""
+            get_metrics().ensure_lag_monitor()
+            return Response(content=await run_in_threadpool(render_metrics), media_type=PROMETHEUS_CONTENT_TYPE)
+
     def build_readiness_report(self) -> ReadinessReport:
         """Build an MCP runtime readiness report."""
         discovery_stats = self._registry.get_discovery_statistics()
@@ -201,11 +255,11 @@ class MedicalCalculatorServer:
             service=self._config.name,
             environment=_get_environment_name(),
             calculator_count=len(tool_ids),
-            expected_calculator_count=len(CALCULATORS),
+            expected_calculator_count=len(CALCULATOR_NAMES),
             discovery_built=bool(discovery_stats.get("discovery_built")),
             formula_provenance_issues=provenance_issues,
             auth_enabled=self._security_config.auth_enabled,
-            api_keys_configured=bool(self._security_config.auth_api_keys),
+            api_keys_configured=self._security_config.has_api_key_source(),
             rate_limit_enabled=self._security_config.rate_limit_enabled,
             cors_origins=os.environ.get("CORS_ORIGINS", "*"),
             ssl_enabled=self._config.ssl.enabled or os.environ.get("TRUST_REVERSE_PROXY_SSL", "false").lower() in {"true", "1", "yes", "on"},
@@ -226,11 +280,19 @@ class MedicalCalculatorServer:
         """Get the security middleware"""
         return self._security
 
+    def warm_up(self) -> None:
+        """Build every shared read-only structure in this process (before forking workers)"""
+        # Schemas are precomputed by CalculatorHandler; import the remaining
+        # calculators and build the indexes, resolvers and boundary registry
+        self._registry.warm_up()
+        get_boundary_registry()
+
     def run(
         self,
         transport: str = "stdio",
         ssl_keyfile: str | None = None,
         ssl_certfile: str | None = None,
+        workers: int = 1,
     ) -> None:
         """
         Run the MCP server.
@@ -239,11 +301,17 @@ class MedicalCalculatorServer:
             transport: Transport type ("stdio", "sse", or "http")
             ssl_keyfile: Path to SSL private key file (for HTTPS)
             ssl_certfile: Path to SSL certificate file (for HTTPS)
+            workers: Worker processes forked from this warmed-up process ("http" only)
 
         Note:
             SSL is only effective for "sse" and "http" transport modes.
             For "stdio" mode, SSL parameters are ignored.
 
+            With workers > 1 the HTTP transport runs stateless (no MCP
+            session survives between requests), since consecutive requests
+            of one client may reach different workers. SSE keeps a session
+            per connection in one process and cannot be spread over workers.
+
         Examples:
             # Run with SSL
             server.run(transport="sse", ssl_keyfile="/path/to/key.pem", ssl_certfile="/path/to/cert.pem")
@@ -257,13 +325,42 @@ class MedicalCalculatorServer:
             run_kwargs["ssl_keyfile"] = ssl_keyfile
             run_kwargs["ssl_certfile"] = ssl_certfile
 
-        if transport == "http":
-            self._mcp.run(transport="streamable-http", **run_kwargs)
-        elif transport == "sse":
-            self._mcp.run(transport="sse", **run_kwargs)
-        else:
-            # stdio mode - SSL is not applicable
-            self._mcp.run(transport="stdio")
+        if workers > 1 and transport != "http":
+            raise ValueError(f"Multiple workers need the http transport, got {transport!r}")
+        try:
+            if workers > 1:
+                self._run_prefork(workers, ssl_keyfile=ssl_keyfile, ssl_certfile=ssl_certfile)
+            elif transport == "http":
+                self._mcp.run(transport="streamable-http", **run_kwargs)
+            elif transport == "sse":
+                self._mcp.run(transport="sse", **run_kwargs)
+            else:
+                # stdio mode - SSL is not applicable
+                self._mcp.run(transport="stdio")
+        finally:
+            self.shutdown()
+
+    def shutdown(self) -> None:
+        """Release worker pools (calculate_batch); the usage logger flushes itself at exit."""
+        self._calculator_handler.shutdown()
+
+    def _run_prefork(self, workers: int, ssl_keyfile: str | None, ssl_certfile: str | None) -> None:
+        """Serve the streamable-HTTP app from forked workers sharing this process's warmed-up state."""
+        from ..serving import serve_prefork
+
+        self._mcp.settings.stateless_http = True
+        status = serve_prefork(
+            self._mcp.streamable_http_app(),
+            host=self._config.host,
+            port=self._config.port,
+            workers=workers,
+            warm_up=self.warm_up,
+            log_level=self._mcp.settings.log_level.lower(),
+            ssl_keyfile=ssl_keyfile,
+            ssl_certfile=ssl_certfile,
+        )
+        if status:
+            raise SystemExit(status)
 
 
 # =============================================================================
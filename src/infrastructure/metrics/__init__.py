@@ -0,0 +1,34 @@
+"""
+Metrics infrastructure for the Medical Calculator servers.
+
+Prometheus text exposition (/metrics) without a client library:
+- MetricsCollector: HTTP requests, MCP tool calls, in-flight requests,
+  rate-limiter rejections and event-loop lag (lock-free hot path)
+- MetricsMiddleware: pure ASGI middleware for the REST API
+- render_metrics(): request metrics plus per-tool_id metrics from
+  ToolUsageLogger
+
+Usage:
+    from src.infrastructure.metrics import get_metrics, render_metrics
+
+    get_metrics().observe_mcp_tool("calculate", success=True, duration_ns=250_000)
+    text = render_metrics()
+"""
+
+from .request_metrics import (
+    MetricsCollector,
+    MetricsMiddleware,
+    get_metrics,
+    metrics_enabled,
+    render_metrics,
+    reset_metrics,
+)
+
+__all__ = [
+    "MetricsCollector",
+    "MetricsMiddleware",
+    "get_metrics",
+    "metrics_enabled",
+    "render_metrics",
+    "reset_metrics",
+]
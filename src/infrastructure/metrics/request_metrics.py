@@ -0,0 +1,287 @@
+"""
+Request Metrics - Prometheus-style metrics for the MCP and REST servers.
+
+Tracks, per process:
+- HTTP requests per method, route template and status (REST API)
+- MCP tool calls per tool (calculate, discover, get_tool_schema, calculate_batch, ...)
+- Requests / tool calls in flight
+- Rate-limiter rejections
+- Event-loop lag (a monitor task measures how late a periodic sleep wakes up)
+
+Per-tool_id call counters and latency histograms come from ToolUsageLogger;
+render_metrics() concatenates both into one text exposition for /metrics.
+
+Lock-free hot path:
+    Observations are appended to a deque (append is atomic) and folded into
+    the aggregates later: by the scrape, or by whichever caller finds more
+    than DRAIN_THRESHOLD observations pending and wins a non-blocking
+    try-acquire of the aggregation lock. No caller ever waits on a lock.
+
+Configuration via environment variables:
+- METRICS_ENABLED: Serve /metrics and record request metrics (default: true)
+- METRICS_EVENT_LOOP_LAG_INTERVAL: Seconds between lag probes, 0 disables (default: 0.5)
+
+Zero external dependencies - pure Python stdlib only.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from collections import deque
+from threading import Lock
+from time import perf_counter_ns
+from typing import Any, Optional
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ...shared.latency_histogram import LatencyHistogram
+from ...shared.prometheus_format import format_prometheus_histogram, format_prometheus_samples
+from ..logging import get_logger as get_usage_logger
+
+# Pending observations that trigger an opportunistic drain on the hot path
+DRAIN_THRESHOLD = 1024
+
+# Buckets (seconds) for event-loop lag: lag matters from about a millisecond
+EVENT_LOOP_LAG_BUCKETS_SECONDS: tuple[float, ...] = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+# Observation kinds
+_HTTP = 0
+_MCP_TOOL = 1
+_RATE_LIMIT = 2
+_LOOP_LAG = 3
+
+# Queued observation: (kind, labels, outcome, duration ns)
+_Observation = tuple[int, tuple[str, ...], str, int]
+
+
+def metrics_enabled() -> bool:
+    """Whether METRICS_ENABLED allows /metrics and request instrumentation."""
+    return os.environ.get("METRICS_ENABLED", "true").lower() in {"true", "1", "yes", "on"}
+
+
+class MetricsCollector:
+    """
+    Process-wide request metrics rendered in Prometheus text format.
+
+    Record methods may be called from any thread; the in-flight gauges are
+    only changed from event-loop code (ASGI middleware, MCP tool dispatch).
+    """
+
+    def __init__(self, drain_threshold: int = DRAIN_THRESHOLD, lag_interval: Optional[float] = None) -> None:
+        self._pending: deque[_Observation] = deque()
+        self._drain_threshold = drain_threshold
+        self._aggregate_lock = Lock()
+
+        # Aggregates (only touched while holding _aggregate_lock)
+        self._http_requests: dict[tuple[str, str, str], int] = {}  # (method, route, status)
+        self._http_latency: dict[tuple[str, str], LatencyHistogram] = {}  # (method, route)
+        self._tool_calls: dict[tuple[str, str], int] = {}  # (tool, outcome)
+        self._tool_latency: dict[str, LatencyHistogram] = {}
+        self._rate_limit_rejections = 0
+        self._loop_lag = LatencyHistogram()
+        self._last_loop_lag_ns = 0
+
+        # In-flight gauges (event-loop code only)
+        self.in_flight: dict[str, int] = {"http": 0, "mcp_tool": 0}
+
+        # Event-loop lag monitor
+        if lag_interval is None:
+            lag_interval = float(os.environ.get("METRICS_EVENT_LOOP_LAG_INTERVAL", "0.5"))
+        self._lag_interval = lag_interval
+        self._lag_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lag_task: Optional[asyncio.Task[None]] = None
+
+    # ========================================
+    # Recording (hot path)
+    # ========================================
+
+    def observe_http(self, method: str, route: str, status: int, duration_ns: int) -> None:
+        """Record one finished HTTP request (route is the template, e.g. /api/v1/calculate/{tool_id})."""
+        self._observe((_HTTP, (method, route), str(status), duration_ns))
+
+    def observe_mcp_tool(self, tool: str, success: bool, duration_ns: int) -> None:
+        """Record one finished MCP tool call."""
+        self._observe((_MCP_TOOL, (tool,), "success" if success else "error", duration_ns))
+
+    def count_rate_limit_rejection(self) -> None:
+        """Record one request rejected by the rate limiter."""
+        self._observe((_RATE_LIMIT, (), "", 0))
+
+    def observe_event_loop_lag(self, lag_ns: int) -> None:
+        """Record how late the event loop ran a scheduled wake-up."""
+        self._observe((_LOOP_LAG, (), "", lag_ns))
+
+    def _observe(self, observation: _Observation) -> None:
+        pending = self._pending
+        pending.append(observation)
+        if len(pending) >= self._drain_threshold and self._aggregate_lock.acquire(blocking=False):
+            try:
+                self._drain()
+            finally:
+                self._aggregate_lock.release()
+
+    def _drain(self) -> None:
+        """Fold pending observations into the aggregates (caller holds _aggregate_lock)."""
+        pending = self._pending
+        while True:
+            try:
+                kind, labels, outcome, duration_ns = pending.popleft()
+            except IndexError:
+                return
+            if kind == _HTTP:
+                method, route = labels
+                key = (method, route, outcome)
+                self._http_requests[key] = self._http_requests.get(key, 0) + 1
+                self._histogram(self._http_latency, (method, route)).record(duration_ns)
+            elif kind == _MCP_TOOL:
+                tool = labels[0]
+                self._tool_calls[(tool, outcome)] = self._tool_calls.get((tool, outcome), 0) + 1
+                self._histogram(self._tool_latency, tool).record(duration_ns)
+            elif kind == _RATE_LIMIT:
+                self._rate_limit_rejections += 1
+            else:
+                self._loop_lag.record(duration_ns)
+                self._last_loop_lag_ns = duration_ns
+
+    @staticmethod
+    def _histogram(histograms: dict[Any, LatencyHistogram], key: Any) -> LatencyHistogram:
+        histogram = histograms.get(key)
+        if histogram is None:
+            histogram = histograms[key] = LatencyHistogram()
+        return histogram
+
+    # ========================================
+    # Event-loop lag monitor
+    # ========================================
+
+    def ensure_lag_monitor(self) -> None:
+        """Start the lag monitor on the running event loop (once per loop; no-op if disabled)."""
+        if self._lag_interval <= 0:
+            return
+        loop = asyncio.get_running_loop()
+        if self._lag_loop is loop:
+            return
+        self._lag_loop = loop
+        self._lag_task = loop.create_task(self._monitor_lag(loop, self._lag_interval), name="metrics-event-loop-lag")
+
+    async def _monitor_lag(self, loop: asyncio.AbstractEventLoop, interval: float) -> None:
+        while True:
+            expected = loop.time() + interval
+            await asyncio.sleep(interval)
+            self.observe_event_loop_lag(max(0, int((loop.time() - expected) * 1_000_000_000)))
+
+    # ========================================
+    # Exposition
+    # ========================================
+
+    def render(self) -> str:
+        """Drain pending observations and render every request metric in Prometheus text format."""
+        with self._aggregate_lock:
+            self._drain()
+            lines = format_prometheus_samples(
+                "medcalc_http_requests_total",
+                "counter",
+                "HTTP requests by method, route template and status.",
+                (({"method": method, "route": route, "status": status}, count) for (method, route, status), count in sorted(self._http_requests.items())),
+            )
+            lines += format_prometheus_histogram(
+                "medcalc_http_request_duration_seconds",
+                "HTTP request duration in seconds.",
+                (({"method": method, "route": route}, histogram) for (method, route), histogram in sorted(self._http_latency.items())),
+            )
+            lines += format_prometheus_samples(
+                "medcalc_mcp_tool_calls_total",
+                "counter",
+                "MCP tool calls by tool and outcome.",
+                (({"tool": tool, "outcome": outcome}, count) for (tool, outcome), count in sorted(self._tool_calls.items())),
+            )
+            lines += format_prometheus_histogram(
+                "medcalc_mcp_tool_duration_seconds",
+                "MCP tool call duration in seconds.",
+                (({"tool": tool}, histogram) for tool, histogram in sorted(self._tool_latency.items())),
+            )
+            lines += format_prometheus_samples(
+                "medcalc_rate_limit_rejections_total", "counter", "Requests rejected by the rate limiter.", [({}, self._rate_limit_rejections)]
+            )
+            lines += format_prometheus_histogram(
+                "medcalc_event_loop_lag_seconds",
+                "Delay between a scheduled event-loop wake-up and when it ran.",
+                [({}, self._loop_lag)],
+                buckets_seconds=EVENT_LOOP_LAG_BUCKETS_SECONDS,
+            )
+            lines += format_prometheus_samples(
+                "medcalc_event_loop_lag_last_seconds", "gauge", "Most recently measured event-loop lag.", [({}, self._last_loop_lag_ns / 1_000_000_000)]
+            )
+        lines += format_prometheus_samples(
+            "medcalc_requests_in_flight",
+            "gauge",
+            "Requests currently being handled.",
+            (({"surface": surface}, count) for surface, count in self.in_flight.items()),
+        )
+        return "\n".join(lines) + "\n"
+
+
+class MetricsMiddleware:
+    """
+    Pure ASGI middleware recording HTTP request count, status, latency and in-flight requests.
+
+    Requests are labelled with the matched route template (FastAPI sets
+    scope["route"]), so path parameters do not create new series; requests
+    that match no route are labelled "unmatched".
+    """
+
+    def __init__(self, app: ASGIApp, collector: Optional[MetricsCollector] = None) -> None:
+        self.app = app
+        self._collector = collector
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        collector = self._collector or get_metrics()
+        collector.ensure_lag_monitor()
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        started = perf_counter_ns()
+        collector.in_flight["http"] += 1
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            collector.in_flight["http"] -= 1
+            route = scope.get("route")
+            collector.observe_http(scope["method"], getattr(route, "path", "unmatched"), status, perf_counter_ns() - started)
+
+
+# Module-level collector
+_collector: Optional[MetricsCollector] = None
+_collector_lock = Lock()
+
+
+def get_metrics() -> MetricsCollector:
+    """Get the process-wide metrics collector."""
+    global _collector
+    if _collector is None:
+        with _collector_lock:
+            if _collector is None:
+                _collector = MetricsCollector()
+    return _collector
+
+
+def reset_metrics() -> None:
+    """Discard the process-wide collector (mainly for testing)."""
+    global _collector
+    with _collector_lock:
+        _collector = None
+
+
+def render_metrics() -> str:
+    """Full /metrics exposition: request metrics plus per-tool_id metrics from ToolUsageLogger (may block briefly; run off the event loop)."""
+    return get_metrics().render() + get_usage_logger().get_prometheus_metrics()
@@ -7,6 +7,8 @@ All features are disabled by default and can be enabled via configuration.
 Features:
 - Rate Limiting: Throttle requests to prevent abuse
 - API Authentication: API Key based authentication
+- Rate limit backends: in-memory (per process) or SQLite (shared across workers)
+- ASGISecurityMiddleware: enforces both on the SSE/HTTP and REST transports
 
 Usage:
     from src.infrastructure.security import SecurityConfig, RateLimiter, APIAuthenticator
@@ -23,16 +25,22 @@ Usage:
     )
 """
 
+from .asgi_middleware import ASGISecurityMiddleware
 from .authenticator import APIAuthenticator, AuthenticationError
 from .config import SecurityConfig
 from .middleware import SecurityMiddleware
-from .rate_limiter import RateLimiter, RateLimitExceeded
+from .rate_limiter import InMemoryRateLimiterBackend, RateLimiter, RateLimiterBackend, RateLimitExceeded
+from .sqlite_backend import SQLiteRateLimiterBackend
 
 __all__ = [
     "SecurityConfig",
     "RateLimiter",
     "RateLimitExceeded",
+    "RateLimiterBackend",
+    "InMemoryRateLimiterBackend",
+    "SQLiteRateLimiterBackend",
     "APIAuthenticator",
     "AuthenticationError",
     "SecurityMiddleware",
+    "ASGISecurityMiddleware",
 ]
@@ -0,0 +1,147 @@
+"""
+ASGI Security Middleware
+
+Enforces SecurityMiddleware (rate limiting + API key authentication) in front
+of any ASGI app: the FastMCP SSE / streamable-HTTP apps and the FastAPI REST
+app.
+
+Pure ASGI rather than BaseHTTPMiddleware: checks run on the raw scope
+(client address, header list, query string) before the request body is read,
+and rejected requests are answered with two pre-encoded send() calls - no
+Request object, no body parsing, no task group. A flood of rejected requests
+therefore costs little more than the connection handling itself.
+
+Responses:
+    429 Too Many Requests: Retry-After, X-RateLimit-Limit/Remaining/Reset
+    401 Unauthorized: WWW-Authenticate (plus X-RateLimit-* when rate limiting is enabled)
+
+The rate limit is checked before authentication, so clients guessing API keys
+are throttled as well.
+"""
+
+import json
+import logging
+import math
+from typing import Optional
+from urllib.parse import parse_qsl
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from .authenticator import AuthenticationError
+from .middleware import SecurityMiddleware, create_security_middleware
+from .rate_limiter import RateLimiter
+
+logger = logging.getLogger(__name__)
+
+# WebSocket close code for policy violations (RFC 6455)
+_WS_POLICY_VIOLATION = 1008
+
+
+class ASGISecurityMiddleware:
+    """
+    Pure ASGI middleware that applies SecurityMiddleware to every HTTP request.
+
+    Usage:
+        app.add_middleware(ASGISecurityMiddleware, security=SecurityMiddleware(config))
+    """
+
+    def __init__(self, app: ASGIApp, security: Optional[SecurityMiddleware] = None) -> None:
+        """
+        Args:
+            app: Downstream ASGI app
+            security: Security checks to enforce (from environment if None)
+        """
+        self.app = app
+        self.security = security or create_security_middleware()
+
+        config = self.security.config
+        self._rate_limiter = self.security.rate_limiter
+        self._authenticator = self.security.authenticator
+        self._enabled = self._rate_limiter is not None or self._authenticator is not None
+        self._exempt_paths = frozenset(config.exempt_paths)
+        self._header_name = config.auth_header_name.lower().encode("latin-1")
+        self._query_param = config.auth_query_param
+        self._limit = str(config.rate_limit_requests_per_minute).encode("latin-1")
+        self._log_auth_failures = config.log_auth_failures
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if not self._enabled or scope["type"] not in ("http", "websocket") or scope["path"] in self._exempt_paths:
+            await self.app(scope, receive, send)
+            return
+
+        client = scope.get("client")
+        client_id = client[0] if client else "unknown"
+
+        if self._rate_limiter is not None:
+            allowed, retry_after = self._rate_limiter.try_acquire(client_id)
+            if not allowed:
+                await self._reject_rate_limited(scope, send, self._rate_limiter, client_id, retry_after)
+                return
+
+        if self._authenticator is not None:
+            try:
+                result = self._authenticator.authenticate(self._extract_key(scope))
+            except AuthenticationError as e:
+                if self._log_auth_failures:
+                    logger.warning(f"Auth failed for {client_id}: {e.error_code}")
+                await self._reject_unauthorized(scope, send, client_id, e)
+                return
+            scope.setdefault("state", {})["api_key_id"] = result.api_key_id
+
+        await self.app(scope, receive, send)
+
+    def _extract_key(self, scope: Scope) -> Optional[str]:
+        """API key from the configured header, Authorization (Bearer/ApiKey), or the query string."""
+        authorization: Optional[bytes] = None
+        for name, value in scope["headers"]:
+            if name == self._header_name:
+                return str(value.decode("latin-1"))
+            if name == b"authorization":
+                authorization = value
+
+        if authorization:
+            scheme, _, credential = authorization.decode("latin-1").partition(" ")
+            if credential and scheme.lower() in ("bearer", "apikey"):
+                return credential
+
+        query_string: bytes = scope.get("query_string", b"")
+        if query_string:
+            for key, value in parse_qsl(query_string.decode("latin-1")):
+                if key == self._query_param and value:
+                    return value
+        return None
+
+    def _rate_limit_headers(self, rate_limiter: RateLimiter, client_id: str, remaining: Optional[int] = None) -> list[tuple[bytes, bytes]]:
+        if remaining is None:
+            remaining = rate_limiter.get_remaining(client_id)
+        return [
+            (b"x-ratelimit-limit", self._limit),
+            (b"x-ratelimit-remaining", str(remaining).encode("latin-1")),
+            (b"x-ratelimit-reset", str(math.ceil(rate_limiter.get_reset_time(client_id))).encode("latin-1")),
+        ]
+
+    async def _reject_rate_limited(self, scope: Scope, send: Send, rate_limiter: RateLimiter, client_id: str, retry_after: float) -> None:
+        retry_seconds = max(1, math.ceil(retry_after))
+        body = json.dumps(
+            {"error": "RATE_LIMITED", "message": f"Rate limit exceeded. Try again in {retry_after:.1f} seconds.", "retry_after": round(retry_after, 3)}
+        ).encode()
+        headers = [(b"retry-after", str(retry_seconds).encode("latin-1")), *self._rate_limit_headers(rate_limiter, client_id, remaining=0)]
+        await _send_error(scope, send, 429, body, headers)
+
+    async def _reject_unauthorized(self, scope: Scope, send: Send, client_id: str, error: AuthenticationError) -> None:
+        body = json.dumps({"error": error.error_code, "message": str(error), "details": error.details}).encode()
+        headers = [(b"www-authenticate", b'Bearer realm="medical-calc-mcp"')]
+        if self._rate_limiter is not None:
+            headers += self._rate_limit_headers(self._rate_limiter, client_id)
+        await _send_error(scope, send, 401, body, headers)
+
+
+async def _send_error(scope: Scope, send: Send, status: int, body: bytes, headers: list[tuple[bytes, bytes]]) -> None:
+    """Send a complete JSON error response (HTTP) or refuse the handshake (WebSocket)."""
+    if scope["type"] == "websocket":
+        await send({"type": "websocket.close", "code": _WS_POLICY_VIOLATION})
+        return
+    headers.append((b"content-type", b"application/json"))
+    headers.append((b"content-length", str(len(body)).encode("latin-1")))
+    await send({"type": "http.response.start", "status": status, "headers": headers})
+    await send({"type": "http.response.body", "body": body})
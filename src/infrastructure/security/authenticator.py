@@ -6,10 +6,20 @@ Disabled by default - enable via SecurityConfig.
 """
 
 import hashlib
+import logging
+import os
 import secrets
+import threading
+import time
+from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any, Optional
 
+logger = logging.getLogger(__name__)
+
+# Prefix for pre-hashed entries in a key file
+HASHED_KEY_PREFIX = "sha256:"
+
 
 class AuthenticationError(Exception):
     """Exception raised when authentication fails."""
@@ -35,9 +45,18 @@ class APIAuthenticator:
 
     Features:
     - Multiple API keys support
-    - Constant-time comparison (timing attack resistant)
+    - O(1) verification: the presented key is hashed once (SHA-256) and looked
+      up in a digest-keyed table, so cost does not grow with the number of keys
+      and timing reveals nothing about how close a guess was
+    - Optional key file with hot reload (checked at most every reload_interval
+      seconds; edits take effect without a restart)
+    - Small per-process cache of positive results with a TTL (cleared on any
+      key change, and when it reaches cache_size)
     - Key masking in logs
-    - Optional key rotation support
+
+    Key file format (one entry per line, "#" starts a comment):
+        plain-api-key-value
+        sha256:<64 hex digits>      # pre-hashed key; the plaintext never touches disk
 
     Usage:
         auth = APIAuthenticator(api_keys=["key1", "key2"])
@@ -53,7 +72,17 @@ class APIAuthenticator:
         key = auth.extract_key_from_headers(headers)
     """
 
-    def __init__(self, api_keys: Optional[list[str]] = None, header_name: str = "X-API-Key", query_param: str = "api_key"):
+    def __init__(
+        self,
+        api_keys: Optional[list[str]] = None,
+        header_name: str = "X-API-Key",
+        query_param: str = "api_key",
+        key_file: Optional[str] = None,
+        reload_interval: float = 5.0,
+        cache_ttl: float = 60.0,
+        cache_size: int = 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ):
         """
         Initialize authenticator.
 
@@ -61,18 +90,38 @@ class APIAuthenticator:
             api_keys: List of valid API keys
             header_name: HTTP header name for API key
             query_param: Query parameter name for API key
+            key_file: Optional file of additional keys, reloaded when it changes
+            reload_interval: Minimum seconds between key file change checks
+            cache_ttl: Seconds a verified key is served from the positive cache (0 disables)
+            cache_size: Maximum cached keys
+            clock: Monotonic time source (injectable for tests)
         """
         self.header_name = header_name
         self.query_param = query_param
+        self.key_file = key_file
+        self.reload_interval = reload_interval
+        self.cache_ttl = cache_ttl
+        self.cache_size = cache_size
+        self._clock = clock
+
+        # Digest -> masked id. Replaced wholesale (never mutated in place), so
+        # readers need no lock; writers serialize on _write_lock.
+        self._key_hashes: dict[bytes, str] = {}
+        self._static_hashes: dict[bytes, str] = {}
+        self._write_lock = threading.Lock()
+
+        # Positive cache: presented key -> (masked id, expiry)
+        self._cache: dict[str, tuple[str, float]] = {}
 
-        # Store keys as set for O(1) lookup
-        # Note: We use hashed keys for additional security
-        self._keys: set[str] = set()
-        self._key_hashes: dict[str, str] = {}  # hash -> masked_id
+        # Key file state
+        self._file_signature: Optional[tuple[int, int, int]] = None
+        self._next_reload_check = 0.0
 
         if api_keys:
             for key in api_keys:
                 self.add_key(key)
+        if key_file:
+            self.reload_keys()
 
     def add_key(self, api_key: str) -> str:
         """
@@ -87,12 +136,11 @@ class APIAuthenticator:
         if not api_key or len(api_key) < 8:
             raise ValueError("API key must be at least 8 characters")
 
-        self._keys.add(api_key)
-
-        # Create hash for secure comparison
-        key_hash = self._hash_key(api_key)
+        digest = self._digest(api_key)
         masked_id = self._mask_key(api_key)
-        self._key_hashes[key_hash] = masked_id
+        with self._write_lock:
+            self._static_hashes = {**self._static_hashes, digest: masked_id}
+            self._key_hashes = {**self._key_hashes, digest: masked_id}
 
         return masked_id
 
@@ -106,18 +154,84 @@ class APIAuthenticator:
         Returns:
             True if key was removed, False if not found
         """
-        if api_key in self._keys:
-            self._keys.discard(api_key)
-            key_hash = self._hash_key(api_key)
-            self._key_hashes.pop(key_hash, None)
-            return True
-        return False
+        digest = self._digest(api_key)
+        with self._write_lock:
+            if digest not in self._key_hashes:
+                return False
+            self._static_hashes = {h: masked for h, masked in self._static_hashes.items() if h != digest}
+            self._key_hashes = {h: masked for h, masked in self._key_hashes.items() if h != digest}
+            self._cache = {}
+        return True
+
+    def reload_keys(self) -> bool:
+        """
+        Re-read the key file now and swap in the new key table.
+
+        Keys passed to the constructor or add_key() are kept. If the file
+        cannot be read, the current table stays in place.
+
+        Returns:
+            True if the table was replaced
+        """
+        if not self.key_file:
+            return False
+        try:
+            stat = os.stat(self.key_file)
+            with open(self.key_file, encoding="utf-8") as handle:
+                file_hashes = _parse_key_file(handle.read())
+        except OSError as e:
+            logger.warning(f"Could not read API key file {self.key_file}: {e}")
+            return False
+
+        with self._write_lock:
+            self._file_signature = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+            self._key_hashes = {**file_hashes, **self._static_hashes}
+            self._cache = {}
+        logger.info(f"Loaded {len(file_hashes)} API key(s) from {self.key_file}")
+        return True
+
+    def _maybe_reload(self, key_file: str, now: float) -> None:
+        """Reload the key file if it changed (checked at most every reload_interval seconds)."""
+        if now < self._next_reload_check:
+            return
+        self._next_reload_check = now + self.reload_interval
+        try:
+            stat = os.stat(key_file)
+        except OSError:
+            return
+        if (stat.st_mtime_ns, stat.st_size, stat.st_ino) != self._file_signature:
+            self.reload_keys()
+
+    def _lookup(self, api_key: str) -> Optional[str]:
+        """Masked id of a valid key, or None."""
+        now = self._clock()
+        key_file = self.key_file
+        if key_file:
+            self._maybe_reload(key_file, now)
+
+        cached = self._cache.get(api_key)
+        if cached is not None and cached[1] > now:
+            return cached[0]
+
+        # Lookup timing depends only on the SHA-256 digest, which an attacker
+        # cannot steer towards a valid key, so it leaks nothing about near misses
+        masked_id = self._key_hashes.get(self._digest(api_key))
+        if masked_id is None:
+            return None
+
+        if self.cache_ttl > 0:
+            if len(self._cache) >= self.cache_size:
+                # Start over rather than track recency: the cache only saves a hash
+                self._cache = {}
+            self._cache[api_key] = (masked_id, now + self.cache_ttl)
+        return masked_id
 
     def is_valid(self, api_key: Optional[str]) -> bool:
         """
         Check if API key is valid.
 
-        Uses constant-time comparison to prevent timing attacks.
+        Hashes the key once and looks the digest up in the key table (O(1) in
+        the number of configured keys).
 
         Args:
             api_key: The API key to validate
@@ -127,12 +241,7 @@ class APIAuthenticator:
         """
         if not api_key:
             return False
-
-        # Use constant-time comparison
-        for valid_key in self._keys:
-            if secrets.compare_digest(api_key, valid_key):
-                return True
-        return False
+        return self._lookup(api_key) is not None
 
     def authenticate(self, api_key: Optional[str]) -> AuthResult:
         """
@@ -152,10 +261,11 @@ class APIAuthenticator:
                 message="API key is required", error_code="MISSING_API_KEY", details="Provide API key via X-API-Key header or api_key parameter"
             )
 
-        if not self.is_valid(api_key):
+        masked_id = self._lookup(api_key)
+        if masked_id is None:
             raise AuthenticationError(message="Invalid API key", error_code="INVALID_API_KEY", details="The provided API key is not valid")
 
-        return AuthResult(authenticated=True, api_key_id=self._mask_key(api_key))
+        return AuthResult(authenticated=True, api_key_id=masked_id)
 
     def extract_key_from_headers(self, headers: dict[str, str]) -> Optional[str]:
         """
@@ -248,6 +358,11 @@ class APIAuthenticator:
         """Create SHA-256 hash of API key."""
         return hashlib.sha256(api_key.encode()).hexdigest()
 
+    @staticmethod
+    def _digest(api_key: str) -> bytes:
+        """Raw SHA-256 digest used as the key table index."""
+        return hashlib.sha256(api_key.encode()).digest()
+
     @staticmethod
     def _mask_key(api_key: str) -> str:
         """
@@ -263,7 +378,33 @@ class APIAuthenticator:
     def get_stats(self) -> dict[str, Any]:
         """Get authenticator statistics."""
         return {
-            "keys_configured": len(self._keys),
+            "keys_configured": len(self._key_hashes),
+            "key_file": self.key_file,
+            "cached_keys": len(self._cache),
             "header_name": self.header_name,
             "query_param": self.query_param,
         }
+
+
+def _parse_key_file(text: str) -> dict[bytes, str]:
+    """Digest -> masked id for every valid entry in a key file (invalid lines are skipped with a warning)."""
+    hashes: dict[bytes, str] = {}
+    for line_number, raw_line in enumerate(text.splitlines(), start=1):
+        line = raw_line.split("#", 1)[0].strip()
+        if not line:
+            continue
+        if line.startswith(HASHED_KEY_PREFIX):
+            hex_digest = line[len(HASHED_KEY_PREFIX) :]
+            try:
+                digest = bytes.fromhex(hex_digest)
+            except ValueError:
+                digest = b""
+            if len(digest) != hashlib.sha256().digest_size:
+                logger.warning(f"Skipping malformed sha256 entry on line {line_number} of API key file")
+                continue
+            hashes[digest] = f"{HASHED_KEY_PREFIX}{hex_digest[:8].lower()}"
+        elif len(line) < 8:
+            logger.warning(f"Skipping API key shorter than 8 characters on line {line_number} of API key file")
+        else:
+            hashes[APIAuthenticator._digest(line)] = APIAuthenticator._mask_key(line)
+    return hashes
@@ -6,9 +6,17 @@ All features are disabled by default.
 """
 
 import os
+import tempfile
 from dataclasses import dataclass, field
 from typing import Optional
 
+# Probe endpoints that must answer without credentials
+DEFAULT_EXEMPT_PATHS = ("/health", "/ready")
+
+# Rate-limit bucket storage: per process, or shared by all processes on the host
+RATE_LIMIT_BACKENDS = ("memory", "sqlite")
+DEFAULT_RATE_LIMIT_SQLITE_PATH = os.path.join(tempfile.gettempdir(), "medcalc-ratelimit.sqlite3")
+
 
 @dataclass
 class SecurityConfig:
@@ -22,9 +30,16 @@ class SecurityConfig:
         SECURITY_RATE_LIMIT_ENABLED: "true" or "false" (default: "false")
         SECURITY_RATE_LIMIT_RPM: requests per minute (default: 60)
         SECURITY_RATE_LIMIT_BURST: burst size (default: 10)
+        SECURITY_RATE_LIMIT_BACKEND: "memory" (per process) or "sqlite" (shared by all workers on the host)
+        SECURITY_RATE_LIMIT_SQLITE_PATH: database file of the sqlite backend
+        SECURITY_RATE_LIMIT_LEASE: tokens the sqlite backend takes per transaction (default: 1)
         SECURITY_AUTH_ENABLED: "true" or "false" (default: "false")
         SECURITY_API_KEYS: comma-separated API keys
+        SECURITY_API_KEY_FILE: file of API keys (one per line, or sha256:<hex>), hot-reloaded
+        SECURITY_API_KEY_RELOAD_INTERVAL: seconds between key file change checks (default: 5)
+        SECURITY_API_KEY_CACHE_TTL: seconds verified keys stay cached, 0 disables (default: 60)
         SECURITY_LOG_REQUESTS: "true" or "false" (default: "false")
+        SECURITY_EXEMPT_PATHS: comma-separated paths served without checks (default: "/health,/ready")
 
     Example:
         # Enable rate limiting only
@@ -46,12 +61,21 @@ class SecurityConfig:
     rate_limit_requests_per_minute: int = 60
     rate_limit_burst: int = 10  # Allow burst of requests
     rate_limit_by_ip: bool = True  # Rate limit per IP address
+    rate_limit_backend: str = "memory"  # "memory" or "sqlite" (cross-process)
+    rate_limit_sqlite_path: str = DEFAULT_RATE_LIMIT_SQLITE_PATH
+    rate_limit_lease_size: int = 1  # Tokens leased per sqlite transaction
 
     # Authentication Configuration
     auth_enabled: bool = False
     auth_api_keys: list[str] = field(default_factory=list)
     auth_header_name: str = "X-API-Key"  # HTTP header for API key
     auth_query_param: str = "api_key"  # Query parameter alternative
+    auth_key_file: Optional[str] = None  # Hot-reloaded key file (in addition to auth_api_keys)
+    auth_key_reload_interval: float = 5.0  # Seconds between key file change checks
+    auth_cache_ttl: float = 60.0  # Seconds a verified key stays in the positive cache
+
+    # Paths served without rate limiting or authentication (liveness/readiness probes)
+    exempt_paths: list[str] = field(default_factory=lambda: list(DEFAULT_EXEMPT_PATHS))
 
     # Logging Configuration
     log_requests: bool = False  # Log all requests for audit
@@ -79,6 +103,14 @@ class SecurityConfig:
             except ValueError:
                 return default
 
+        def parse_float(value: Optional[str], default: float) -> float:
+            if value is None:
+                return default
+            try:
+                return float(value)
+            except ValueError:
+                return default
+
         def parse_list(value: Optional[str]) -> list[str]:
             if value is None or value.strip() == "":
                 return []
@@ -90,11 +122,18 @@ class SecurityConfig:
             rate_limit_requests_per_minute=parse_int(os.getenv("SECURITY_RATE_LIMIT_RPM"), 60),
             rate_limit_burst=parse_int(os.getenv("SECURITY_RATE_LIMIT_BURST"), 10),
             rate_limit_by_ip=parse_bool(os.getenv("SECURITY_RATE_LIMIT_BY_IP"), True),
+            rate_limit_backend=os.getenv("SECURITY_RATE_LIMIT_BACKEND", "memory").strip().lower(),
+            rate_limit_sqlite_path=os.getenv("SECURITY_RATE_LIMIT_SQLITE_PATH") or DEFAULT_RATE_LIMIT_SQLITE_PATH,
+            rate_limit_lease_size=parse_int(os.getenv("SECURITY_RATE_LIMIT_LEASE"), 1),
             # Authentication
             auth_enabled=parse_bool(os.getenv("SECURITY_AUTH_ENABLED"), False),
             auth_api_keys=parse_list(os.getenv("SECURITY_API_KEYS")),
             auth_header_name=os.getenv("SECURITY_AUTH_HEADER", "X-API-Key"),
             auth_query_param=os.getenv("SECURITY_AUTH_PARAM", "api_key"),
+            auth_key_file=os.getenv("SECURITY_API_KEY_FILE") or None,
+            auth_key_reload_interval=parse_float(os.getenv("SECURITY_API_KEY_RELOAD_INTERVAL"), 5.0),
+            auth_cache_ttl=parse_float(os.getenv("SECURITY_API_KEY_CACHE_TTL"), 60.0),
+            exempt_paths=parse_list(os.getenv("SECURITY_EXEMPT_PATHS", ",".join(DEFAULT_EXEMPT_PATHS))),
             # Logging
             log_requests=parse_bool(os.getenv("SECURITY_LOG_REQUESTS"), False),
             log_auth_failures=parse_bool(os.getenv("SECURITY_LOG_AUTH_FAILURES"), True),
@@ -104,6 +143,10 @@ class SecurityConfig:
         """Check if any security feature is enabled."""
         return self.rate_limit_enabled or self.auth_enabled
 
+    def has_api_key_source(self) -> bool:
+        """Whether any API keys are configured (inline or via key file)."""
+        return bool(self.auth_api_keys or self.auth_key_file)
+
     def validate(self) -> list[str]:
         """
         Validate configuration and return list of warnings/errors.
@@ -113,8 +156,8 @@ class SecurityConfig:
         """
         warnings = []
 
-        if self.auth_enabled and not self.auth_api_keys:
-            warnings.append("Authentication is enabled but no API keys are configured. Set SECURITY_API_KEYS environment variable.")
+        if self.auth_enabled and not self.has_api_key_source():
+            warnings.append("Authentication is enabled but no API keys are configured. Set SECURITY_API_KEYS or SECURITY_API_KEY_FILE.")
 
         if self.rate_limit_enabled and self.rate_limit_requests_per_minute < 1:
             warnings.append("Rate limit requests per minute must be at least 1.")
@@ -122,6 +165,12 @@ class SecurityConfig:
         if self.rate_limit_burst < 1:
             warnings.append("Rate limit burst must be at least 1.")
 
+        if self.rate_limit_backend not in RATE_LIMIT_BACKENDS:
+            warnings.append(f"Unknown rate limit backend {self.rate_limit_backend!r}; expected one of {', '.join(RATE_LIMIT_BACKENDS)}.")
+
+        if self.rate_limit_lease_size < 1:
+            warnings.append("Rate limit lease size must be at least 1.")
+
         return warnings
 
     def __str__(self) -> str:
@@ -137,12 +186,15 @@ class SecurityConfig:
             lines.append(f"    - {self.rate_limit_requests_per_minute} requests/minute")
             lines.append(f"    - Burst: {self.rate_limit_burst}")
             lines.append(f"    - Per IP: {self.rate_limit_by_ip}")
+            lines.append(f"    - Backend: {self.rate_limit_backend}")
         else:
             lines.append("  Rate Limiting: disabled")
 
         if self.auth_enabled:
             lines.append("  Authentication: ENABLED")
             lines.append(f"    - {len(self.auth_api_keys)} API key(s) configured")
+            if self.auth_key_file:
+                lines.append(f"    - Key file: {self.auth_key_file} (hot reload)")
             lines.append(f"    - Header: {self.auth_header_name}")
         else:
             lines.append("  Authentication: disabled")
@@ -13,7 +13,8 @@ from typing import Any, Optional
 
 from .authenticator import APIAuthenticator, AuthenticationError
 from .config import SecurityConfig
-from .rate_limiter import RateLimiter
+from .rate_limiter import RateLimiter, RateLimiterBackend
+from .sqlite_backend import SQLiteRateLimiterBackend
 
 logger = logging.getLogger(__name__)
 
@@ -75,17 +76,28 @@ class SecurityMiddleware:
         self._rate_limiter: Optional[RateLimiter] = None
         if self.config.rate_limit_enabled:
             self._rate_limiter = RateLimiter(
-                requests_per_minute=self.config.rate_limit_requests_per_minute, burst=self.config.rate_limit_burst, per_client=self.config.rate_limit_by_ip
+                requests_per_minute=self.config.rate_limit_requests_per_minute,
+                burst=self.config.rate_limit_burst,
+                per_client=self.config.rate_limit_by_ip,
+                backend=self._create_rate_limit_backend(),
+            )
+            logger.info(
+                f"Rate limiting enabled: {self.config.rate_limit_requests_per_minute} req/min, burst={self.config.rate_limit_burst}, "
+                f"backend={self._rate_limiter.get_stats()['backend']}"
             )
-            logger.info(f"Rate limiting enabled: {self.config.rate_limit_requests_per_minute} req/min, burst={self.config.rate_limit_burst}")
 
         # Initialize authenticator (if enabled)
         self._authenticator: Optional[APIAuthenticator] = None
         if self.config.auth_enabled:
             self._authenticator = APIAuthenticator(
-                api_keys=self.config.auth_api_keys, header_name=self.config.auth_header_name, query_param=self.config.auth_query_param
+                api_keys=self.config.auth_api_keys,
+                header_name=self.config.auth_header_name,
+                query_param=self.config.auth_query_param,
+                key_file=self.config.auth_key_file,
+                reload_interval=self.config.auth_key_reload_interval,
+                cache_ttl=self.config.auth_cache_ttl,
             )
-            logger.info(f"Authentication enabled: {len(self.config.auth_api_keys)} API key(s) configured")
+            logger.info(f"Authentication enabled: {self._authenticator.get_stats()['keys_configured']} API key(s) configured")
 
         # Validate configuration
         warnings = self.config.validate()
@@ -142,6 +154,22 @@ class SecurityMiddleware:
 
         return ctx
 
+    def _create_rate_limit_backend(self) -> Optional[RateLimiterBackend]:
+        """Shared SQLite buckets when configured; None selects RateLimiter's in-memory default."""
+        if self.config.rate_limit_backend != "sqlite":
+            return None
+        return SQLiteRateLimiterBackend(self.config.rate_limit_sqlite_path, lease_size=max(1, self.config.rate_limit_lease_size))
+
+    @property
+    def rate_limiter(self) -> Optional[RateLimiter]:
+        """The rate limiter (None when rate limiting is disabled)."""
+        return self._rate_limiter
+
+    @property
+    def authenticator(self) -> Optional[APIAuthenticator]:
+        """The API key authenticator (None when authentication is disabled)."""
+        return self._authenticator
+
     def is_enabled(self) -> bool:
         """Check if any security feature is enabled."""
         return self.config.is_security_enabled()
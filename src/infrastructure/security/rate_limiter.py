@@ -3,13 +3,47 @@ Rate Limiter
 
 Optional request rate limiting using token bucket algorithm.
 Disabled by default - enable via SecurityConfig.
+
+Backends:
+    RateLimiter holds the policy (rate, burst, per-client or global) and
+    delegates bucket state to a RateLimiterBackend:
+    - InMemoryRateLimiterBackend (default): per-process buckets. Every worker
+      process gets its own budget.
+    - SQLiteRateLimiterBackend (sqlite_backend.py): buckets in a shared SQLite
+      file (WAL mode), so all workers on a host share one budget.
+
+Concurrency (in-memory backend):
+    Per-client buckets are spread over lock-striped shards keyed by the hash
+    of the client id, so concurrent requests from different clients rarely
+    contend for the same lock. Every bucket read or update happens under its
+    shard's lock.
+
+Eviction (in-memory backend):
+    Each shard keeps a timer wheel of client ids, bucketed by the time their
+    token bucket will be full again (a full bucket is indistinguishable from
+    a new one, so dropping it loses nothing). Requests that reach a shard
+    advance its wheel and only look at the slots that came due, instead of
+    periodically scanning every client.
 """
 
 import threading
 import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from typing import Any, Optional
 
+from ..metrics import get_metrics
+
+# Bucket key used for every request when per_client=False
+GLOBAL_CLIENT_ID = "__global__"
+
+# Lock stripes for per-client buckets
+DEFAULT_SHARDS = 64
+
+# Slots per shard timer wheel (the wheel spans cleanup_interval seconds)
+WHEEL_SLOTS = 64
+
 
 class RateLimitExceeded(Exception):
     """Exception raised when rate limit is exceeded."""
@@ -20,7 +54,7 @@ class RateLimitExceeded(Exception):
         self.client_id = client_id
 
 
-@dataclass
+@dataclass(slots=True)
 class TokenBucket:
     """
     Token bucket for rate limiting.
@@ -30,28 +64,33 @@ class TokenBucket:
     - Each request consumes one token
     - Requests are rejected when no tokens available
     - Bucket has maximum capacity (burst size)
+
+    Times come from time.monotonic(). A bucket is not thread-safe on its own;
+    InMemoryRateLimiterBackend only touches it while holding the owning
+    shard's lock.
     """
 
     capacity: float  # Maximum tokens (burst size)
     tokens: float  # Current available tokens
     refill_rate: float  # Tokens per second
-    last_update: float = field(default_factory=time.time)
+    last_update: float = field(default_factory=time.monotonic)
 
-    def consume(self, tokens: float = 1.0) -> bool:
+    def consume(self, tokens: float = 1.0, now: Optional[float] = None) -> bool:
         """
         Try to consume tokens from the bucket.
 
         Args:
             tokens: Number of tokens to consume (default: 1)
+            now: Current time.monotonic() value (read if omitted)
 
         Returns:
             True if tokens consumed successfully, False if rate limited
         """
-        now = time.time()
+        if now is None:
+            now = time.monotonic()
 
         # Refill tokens based on elapsed time
-        elapsed = now - self.last_update
-        self.tokens = min(self.capacity, self.tokens + elapsed * self.refill_rate)
+        self.tokens = self.available(now)
         self.last_update = now
 
         # Try to consume
@@ -60,6 +99,14 @@ class TokenBucket:
             return True
         return False
 
+    def available(self, now: float) -> float:
+        """Tokens available at ``now`` (without updating the bucket)."""
+        return min(self.capacity, self.tokens + (now - self.last_update) * self.refill_rate)
+
+    def full_at(self) -> float:
+        """Monotonic time at which the bucket is back to full capacity."""
+        return self.last_update + max(0.0, self.capacity - self.tokens) / self.refill_rate
+
     def time_until_available(self, tokens: float = 1.0) -> float:
         """
         Calculate time until tokens become available.
@@ -77,6 +124,145 @@ class TokenBucket:
         return needed / self.refill_rate
 
 
+class _Shard:
+    """One lock stripe: client buckets plus the timer wheel that evicts them."""
+
+    __slots__ = ("lock", "buckets", "wheel", "tick", "next_tick_at")
+
+    def __init__(self, tick: int, tick_seconds: float) -> None:
+        self.lock = threading.Lock()
+        self.buckets: dict[str, TokenBucket] = {}
+        self.wheel: list[list[str]] = [[] for _ in range(WHEEL_SLOTS)]
+        self.tick = tick  # Last wheel tick processed
+        self.next_tick_at = (tick + 1) * tick_seconds
+
+
+class RateLimiterBackend(ABC):
+    """
+    Storage for token buckets, keyed by client id.
+
+    The bucket policy (capacity, refill rate) is passed on every call, so one
+    backend instance can serve several limiters.
+    """
+
+    @abstractmethod
+    def consume(self, client_id: str, capacity: float, refill_rate: float) -> tuple[bool, float]:
+        """Take one token; returns (allowed, seconds until a token is available)."""
+
+    @abstractmethod
+    def available(self, client_id: str, capacity: float, refill_rate: float) -> float:
+        """Tokens a client could spend right now (capacity for unknown clients)."""
+
+    @abstractmethod
+    def reset(self, client_id: Optional[str] = None) -> None:
+        """Refill one client's bucket, or drop every bucket when client_id is None."""
+
+    @abstractmethod
+    def get_stats(self) -> dict[str, Any]:
+        """Backend statistics (merged into RateLimiter.get_stats())."""
+
+
+class InMemoryRateLimiterBackend(RateLimiterBackend):
+    """Per-process buckets in lock-striped shards with timer-wheel eviction."""
+
+    def __init__(self, shards: int = DEFAULT_SHARDS, cleanup_interval: float = 300.0, clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            shards: Number of lock stripes for per-client buckets
+            cleanup_interval: Span of each shard's eviction timer wheel in seconds;
+                inactive clients are dropped within cleanup_interval / WHEEL_SLOTS
+                of their bucket refilling
+            clock: Monotonic time source (injectable for tests)
+        """
+        if shards < 1:
+            raise ValueError("shards must be >= 1")
+
+        self._clock = clock
+        self._tick_seconds = cleanup_interval / WHEEL_SLOTS
+        tick = int(clock() / self._tick_seconds)
+        self._shards = tuple(_Shard(tick, self._tick_seconds) for _ in range(shards))
+
+    def _shard(self, client_id: str) -> _Shard:
+        return self._shards[hash(client_id) % len(self._shards)]
+
+    def consume(self, client_id: str, capacity: float, refill_rate: float) -> tuple[bool, float]:
+        now = self._clock()
+        shard = self._shards[hash(client_id) % len(self._shards)]
+        with shard.lock:
+            if now >= shard.next_tick_at:
+                self._advance_wheel(shard, now)
+            bucket = shard.buckets.get(client_id)
+            if bucket is None:
+                bucket = shard.buckets[client_id] = TokenBucket(capacity=capacity, tokens=capacity, refill_rate=refill_rate, last_update=now)
+                self._schedule(shard, client_id, now)
+            # TokenBucket.consume() inlined: this is the per-request hot path
+            tokens = bucket.tokens + (now - bucket.last_update) * bucket.refill_rate
+            if tokens > bucket.capacity:
+                tokens = bucket.capacity
+            bucket.last_update = now
+            if tokens >= 1.0:
+                bucket.tokens = tokens - 1.0
+                return True, 0.0
+            bucket.tokens = tokens
+            return False, (1.0 - tokens) / bucket.refill_rate
+
+    def _schedule(self, shard: _Shard, client_id: str, due: float) -> None:
+        """Put client_id in the first wheel slot after ``due`` (capped at one wheel span ahead)."""
+        tick = min(max(int(due / self._tick_seconds) + 1, shard.tick + 1), shard.tick + WHEEL_SLOTS)
+        shard.wheel[tick % WHEEL_SLOTS].append(client_id)
+
+    def _advance_wheel(self, shard: _Shard, now: float) -> None:
+        """Process the wheel slots that came due since the last advance (caller holds shard.lock)."""
+        target = int(now / self._tick_seconds)
+        # After a long idle period every slot is due; visit each one once
+        first = max(shard.tick + 1, target - WHEEL_SLOTS + 1)
+        buckets = shard.buckets
+        for tick in range(first, target + 1):
+            shard.tick = tick
+            slot = tick % WHEEL_SLOTS
+            due, shard.wheel[slot] = shard.wheel[slot], []
+            for client_id in due:
+                bucket = buckets.get(client_id)
+                if bucket is None:
+                    continue
+                full_at = bucket.full_at()
+                if full_at <= now:
+                    del buckets[client_id]
+                else:
+                    self._schedule(shard, client_id, full_at)
+        shard.tick = target
+        shard.next_tick_at = (target + 1) * self._tick_seconds
+
+    def available(self, client_id: str, capacity: float, refill_rate: float) -> float:
+        shard = self._shard(client_id)
+        with shard.lock:
+            bucket = shard.buckets.get(client_id)
+            if bucket is None:
+                return capacity
+            return bucket.available(self._clock())
+
+    def reset(self, client_id: Optional[str] = None) -> None:
+        if client_id is None:
+            for shard in self._shards:
+                with shard.lock:
+                    shard.buckets.clear()
+                    shard.wheel = [[] for _ in range(WHEEL_SLOTS)]
+            return
+
+        shard = self._shard(client_id)
+        with shard.lock:
+            bucket = shard.buckets.get(client_id)
+            if bucket is not None:
+                bucket.tokens = bucket.capacity
+
+    def get_stats(self) -> dict[str, Any]:
+        return {
+            "backend": "memory",
+            "shards": len(self._shards),
+            "active_clients": sum(len(shard.buckets) for shard in self._shards),
+        }
+
+
 class RateLimiter:
     """
     Rate limiter with per-client tracking.
@@ -85,8 +271,9 @@ class RateLimiter:
     - Token bucket algorithm for smooth rate limiting
     - Per-client (IP) rate limiting
     - Global rate limiting option
+    - Pluggable bucket storage (RateLimiterBackend): in-process by default,
+      or shared across worker processes
     - Thread-safe
-    - Automatic cleanup of inactive clients
 
     Usage:
         limiter = RateLimiter(requests_per_minute=60, burst=10)
@@ -99,6 +286,9 @@ class RateLimiter:
 
         # Or use check_and_raise (recommended)
         limiter.check_and_raise("client-ip")  # Raises if rate limited
+
+        # One budget for every worker process on the host
+        limiter = RateLimiter(requests_per_minute=60, burst=10, backend=SQLiteRateLimiterBackend("/tmp/rl.sqlite3"))
     """
 
     def __init__(
@@ -107,6 +297,9 @@ class RateLimiter:
         burst: int = 10,
         per_client: bool = True,
         cleanup_interval: float = 300.0,  # 5 minutes
+        shards: int = DEFAULT_SHARDS,
+        clock: Callable[[], float] = time.monotonic,
+        backend: Optional[RateLimiterBackend] = None,
     ):
         """
         Initialize rate limiter.
@@ -115,7 +308,10 @@ class RateLimiter:
             requests_per_minute: Maximum sustained request rate
             burst: Maximum burst size (token bucket capacity)
             per_client: If True, rate limit per client; if False, global limit
-            cleanup_interval: Seconds between inactive client cleanup
+            cleanup_interval: Eviction timer-wheel span of the default in-memory backend
+            shards: Lock stripes of the default in-memory backend
+            clock: Monotonic time source of the default in-memory backend
+            backend: Bucket storage (default: a new InMemoryRateLimiterBackend)
         """
         self.requests_per_minute = requests_per_minute
         self.burst = burst
@@ -124,24 +320,24 @@ class RateLimiter:
 
         # Calculate tokens per second
         self.refill_rate = requests_per_minute / 60.0
+        self._capacity = float(burst)
 
-        # Client buckets
-        self._buckets: dict[str, TokenBucket] = {}
-        self._lock = threading.Lock()
-        self._last_cleanup = time.time()
+        self.backend = backend or InMemoryRateLimiterBackend(shards=shards, cleanup_interval=cleanup_interval, clock=clock)
 
-        # Global bucket (used when per_client=False)
-        self._global_bucket = TokenBucket(capacity=float(burst), tokens=float(burst), refill_rate=self.refill_rate)
+    def try_acquire(self, client_id: str = "global") -> tuple[bool, float]:
+        """
+        Take one token for a request without raising.
 
-    def _get_bucket(self, client_id: str) -> TokenBucket:
-        """Get or create token bucket for client."""
-        if not self.per_client:
-            return self._global_bucket
+        Args:
+            client_id: Client identifier (e.g., IP address)
 
-        with self._lock:
-            if client_id not in self._buckets:
-                self._buckets[client_id] = TokenBucket(capacity=float(self.burst), tokens=float(self.burst), refill_rate=self.refill_rate)
-            return self._buckets[client_id]
+        Returns:
+            (allowed, retry_after): retry_after is the seconds until a token is available (0.0 if allowed)
+        """
+        result = self.backend.consume(client_id if self.per_client else GLOBAL_CLIENT_ID, self._capacity, self.refill_rate)
+        if not result[0]:
+            get_metrics().count_rate_limit_rejection()
+        return result
 
     def is_allowed(self, client_id: str = "global") -> bool:
         """
@@ -153,9 +349,7 @@ class RateLimiter:
         Returns:
             True if request is allowed, False if rate limited
         """
-        self._maybe_cleanup()
-        bucket = self._get_bucket(client_id)
-        return bucket.consume()
+        return self.try_acquire(client_id)[0]
 
     def check_and_raise(self, client_id: str = "global") -> None:
         """
@@ -167,10 +361,9 @@ class RateLimiter:
         Raises:
             RateLimitExceeded: If rate limit is exceeded
         """
-        bucket = self._get_bucket(client_id)
+        allowed, retry_after = self.try_acquire(client_id)
 
-        if not bucket.consume():
-            retry_after = bucket.time_until_available()
+        if not allowed:
             raise RateLimitExceeded(message=f"Rate limit exceeded. Try again in {retry_after:.1f} seconds.", retry_after=retry_after, client_id=client_id)
 
     def get_remaining(self, client_id: str = "global") -> int:
@@ -183,8 +376,7 @@ class RateLimiter:
         Returns:
             Number of remaining requests (integer)
         """
-        bucket = self._get_bucket(client_id)
-        return int(bucket.tokens)
+        return int(self._available(client_id))
 
     def get_reset_time(self, client_id: str = "global") -> float:
         """
@@ -196,34 +388,10 @@ class RateLimiter:
         Returns:
             Seconds until full capacity
         """
-        bucket = self._get_bucket(client_id)
-        needed = bucket.capacity - bucket.tokens
+        needed = self._capacity - self._available(client_id)
         if needed <= 0:
             return 0.0
-        return needed / bucket.refill_rate
-
-    def _maybe_cleanup(self) -> None:
-        """Remove inactive client buckets to free memory."""
-        now = time.time()
-        if now - self._last_cleanup < self.cleanup_interval:
-            return
-
-        with self._lock:
-            # Only cleanup if interval has passed (double-check with lock)
-            if now - self._last_cleanup < self.cleanup_interval:
-                return
-
-            self._last_cleanup = now
-
-            # Remove buckets that are full (inactive clients)
-            inactive = [
-                client_id
-                for client_id, bucket in self._buckets.items()
-                if bucket.tokens >= bucket.capacity * 0.99  # Nearly full = inactive
-            ]
-
-            for client_id in inactive:
-                del self._buckets[client_id]
+        return needed / self.refill_rate
 
     def reset(self, client_id: Optional[str] = None) -> None:
         """
@@ -232,20 +400,19 @@ class RateLimiter:
         Args:
             client_id: Client to reset, or None for all clients
         """
-        with self._lock:
-            if client_id is None:
-                self._buckets.clear()
-                self._global_bucket.tokens = self._global_bucket.capacity
-            elif client_id in self._buckets:
-                self._buckets[client_id].tokens = self._buckets[client_id].capacity
+        if client_id is not None and not self.per_client:
+            client_id = GLOBAL_CLIENT_ID
+        self.backend.reset(client_id)
+
+    def _available(self, client_id: str) -> float:
+        return self.backend.available(client_id if self.per_client else GLOBAL_CLIENT_ID, self._capacity, self.refill_rate)
 
     def get_stats(self) -> dict[str, Any]:
         """Get rate limiter statistics."""
-        with self._lock:
-            return {
-                "requests_per_minute": self.requests_per_minute,
-                "burst": self.burst,
-                "per_client": self.per_client,
-                "active_clients": len(self._buckets),
-                "global_remaining": int(self._global_bucket.tokens) if not self.per_client else None,
-            }
+        return {
+            "requests_per_minute": self.requests_per_minute,
+            "burst": self.burst,
+            "per_client": self.per_client,
+            "global_remaining": None if self.per_client else int(self._available(GLOBAL_CLIENT_ID)),
+            **self.backend.get_stats(),
+        }
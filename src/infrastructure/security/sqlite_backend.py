@@ -0,0 +1,248 @@
+"""
+SQLite Rate Limiter Backend
+
+Token buckets in a SQLite database shared by every worker process on a host,
+so a rate limit holds across processes instead of per process.
+
+Atomicity:
+    Each bucket update is a read-modify-write inside BEGIN IMMEDIATE, which
+    takes the database write lock up front: concurrent updates from any
+    process are serialized and no token is ever handed out twice. WAL mode
+    keeps readers (get_remaining, stats) from blocking writers.
+
+Leases:
+    A trip to the database costs far more than an in-memory bucket, so a
+    process may take up to ``lease_size`` tokens in one transaction and spend
+    them locally. Unspent leased tokens go back to the shared bucket once the
+    lease expires (``lease_ttl``). Leased tokens are already gone from the
+    shared bucket, so leasing can never let the host exceed the limit; it can
+    only make a process refuse a request while another process still holds
+    spare tokens. Use lease_size=1 for exact fairness.
+
+Time:
+    Bucket timestamps come from time.time() so all processes agree on them;
+    elapsed time is clamped at zero so a clock step back never drains or
+    overfills a bucket.
+
+This is a single-host stand-in for a networked store (e.g. Redis): the
+RateLimiterBackend interface is the same.
+"""
+
+import math
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from .rate_limiter import RateLimiterBackend
+
+# Lock stripes for per-client leases
+DEFAULT_LEASE_STRIPES = 64
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS buckets (
+    client_id TEXT PRIMARY KEY,
+    tokens REAL NOT NULL,
+    updated REAL NOT NULL,
+    full_at REAL NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS buckets_full_at ON buckets (full_at);
+"""
+
+_SELECT = "SELECT tokens, updated FROM buckets WHERE client_id = ?"
+_UPSERT = (
+    "INSERT INTO buckets (client_id, tokens, updated, full_at) VALUES (?, ?, ?, ?) "
+    "ON CONFLICT (client_id) DO UPDATE SET tokens = excluded.tokens, updated = excluded.updated, full_at = excluded.full_at"
+)
+
+
+@dataclass(slots=True)
+class _Lease:
+    """Tokens taken from the shared bucket and not yet spent by this process."""
+
+    tokens: int
+    expires_at: float
+    capacity: float
+    refill_rate: float
+
+
+class SQLiteRateLimiterBackend(RateLimiterBackend):
+    """
+    Cross-process token buckets in a SQLite (WAL) database.
+
+    Usage:
+        backend = SQLiteRateLimiterBackend("/var/run/medcalc/ratelimit.sqlite3", lease_size=4)
+        limiter = RateLimiter(requests_per_minute=600, burst=20, backend=backend)
+    """
+
+    def __init__(
+        self,
+        path: str,
+        lease_size: int = 1,
+        lease_ttl: float = 1.0,
+        cleanup_interval: float = 300.0,
+        busy_timeout: float = 5.0,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Args:
+            path: Database file; every process sharing the limit must use the same path
+            lease_size: Maximum tokens taken from the shared bucket per transaction
+            lease_ttl: Seconds before unspent leased tokens are given back
+            cleanup_interval: Seconds between deletions of fully refilled buckets
+            busy_timeout: Seconds to wait for the database write lock
+            clock: Wall-clock time source shared by all processes (injectable for tests)
+        """
+        if lease_size < 1:
+            raise ValueError("lease_size must be >= 1")
+
+        self.path = path
+        self.lease_size = lease_size
+        self.lease_ttl = lease_ttl
+        self.cleanup_interval = cleanup_interval
+        self._busy_timeout = busy_timeout
+        self._clock = clock
+
+        self._init_local_state()
+        conn = self._connection()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(_SCHEMA)
+
+    def _init_local_state(self) -> None:
+        """Per-process state: connections and leases are never shared with a forked child."""
+        self._pid = os.getpid()
+        self._local = threading.local()
+        self._stripes: tuple[tuple[threading.Lock, dict[str, _Lease]], ...] = tuple((threading.Lock(), {}) for _ in range(DEFAULT_LEASE_STRIPES))
+        self._cleanup_lock = threading.Lock()
+        self._next_cleanup = self._clock() + self.cleanup_interval
+
+    def _connection(self) -> sqlite3.Connection:
+        """This thread's connection (autocommit mode; transactions are explicit)."""
+        conn: Optional[sqlite3.Connection] = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=self._busy_timeout, isolation_level=None)
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _check_fork(self) -> None:
+        if self._pid != os.getpid():
+            # Forked: the parent's connections and leases are the parent's to use
+            self._init_local_state()
+
+    def _stripe(self, client_id: str) -> tuple[threading.Lock, dict[str, _Lease]]:
+        self._check_fork()
+        return self._stripes[hash(client_id) % len(self._stripes)]
+
+    def consume(self, client_id: str, capacity: float, refill_rate: float) -> tuple[bool, float]:
+        lock, leases = self._stripe(client_id)
+        now = self._clock()
+        with lock:
+            lease = leases.get(client_id)
+            if lease is not None and lease.tokens > 0 and now < lease.expires_at:
+                lease.tokens -= 1
+                return True, 0.0
+
+            returned = leases.pop(client_id).tokens if lease is not None else 0
+            taken, tokens = self._take(client_id, capacity, refill_rate, now, returned)
+            if taken > 1:
+                leases[client_id] = _Lease(taken - 1, now + self.lease_ttl, capacity, refill_rate)
+
+        if now >= self._next_cleanup:
+            self._cleanup(now)
+        if taken:
+            return True, 0.0
+        return False, (1.0 - tokens) / refill_rate
+
+    def _take(self, client_id: str, capacity: float, refill_rate: float, now: float, returned: int) -> tuple[int, float]:
+        """Atomically refill, give back ``returned`` tokens and take up to lease_size; returns (taken, tokens left)."""
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(_SELECT, (client_id,)).fetchone()
+            tokens = capacity if row is None else row[0] + max(0.0, now - row[1]) * refill_rate
+            tokens = min(capacity, tokens + returned)
+            taken = min(self.lease_size, math.floor(tokens)) if tokens >= 1.0 else 0
+            tokens -= taken
+            conn.execute(_UPSERT, (client_id, tokens, now, now + (capacity - tokens) / refill_rate))
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return taken, tokens
+
+    def _cleanup(self, now: float) -> None:
+        """Give back expired leases and delete buckets that are full again (indistinguishable from new ones)."""
+        if not self._cleanup_lock.acquire(blocking=False):
+            return
+        try:
+            if now < self._next_cleanup:
+                return
+            self._next_cleanup = now + self.cleanup_interval
+            expired: list[tuple[str, _Lease]] = []
+            for lock, leases in self._stripes:
+                with lock:
+                    for client_id in [cid for cid, lease in leases.items() if now >= lease.expires_at]:
+                        expired.append((client_id, leases.pop(client_id)))
+
+            conn = self._connection()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                for client_id, lease in expired:
+                    if lease.tokens:
+                        self._give_back(conn, client_id, lease, now)
+                conn.execute("DELETE FROM buckets WHERE full_at <= ?", (now,))
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        finally:
+            self._cleanup_lock.release()
+
+    @staticmethod
+    def _give_back(conn: sqlite3.Connection, client_id: str, lease: _Lease, now: float) -> None:
+        row = conn.execute(_SELECT, (client_id,)).fetchone()
+        if row is None:
+            return  # Already evicted as full
+        tokens = min(lease.capacity, row[0] + max(0.0, now - row[1]) * lease.refill_rate + lease.tokens)
+        conn.execute(_UPSERT, (client_id, tokens, now, now + (lease.capacity - tokens) / lease.refill_rate))
+
+    def available(self, client_id: str, capacity: float, refill_rate: float) -> float:
+        lock, leases = self._stripe(client_id)
+        now = self._clock()
+        with lock:
+            lease = leases.get(client_id)
+            leased = lease.tokens if lease is not None and now < lease.expires_at else 0
+        row: Optional[tuple[float, float]] = self._connection().execute(_SELECT, (client_id,)).fetchone()
+        if row is None:
+            return capacity
+        return min(capacity, row[0] + max(0.0, now - row[1]) * refill_rate + leased)
+
+    def reset(self, client_id: Optional[str] = None) -> None:
+        """Reset buckets for every process sharing the database."""
+        if client_id is None:
+            self._check_fork()
+            for lock, leases in self._stripes:
+                with lock:
+                    leases.clear()
+            self._connection().execute("DELETE FROM buckets")
+            return
+
+        lock, leases = self._stripe(client_id)
+        with lock:
+            leases.pop(client_id, None)
+            self._connection().execute("DELETE FROM buckets WHERE client_id = ?", (client_id,))
+
+    def get_stats(self) -> dict[str, Any]:
+        self._check_fork()
+        row = self._connection().execute("SELECT COUNT(*) FROM buckets").fetchone()
+        return {
+            "backend": "sqlite",
+            "path": self.path,
+            "lease_size": self.lease_size,
+            "active_clients": int(row[0]),
+            "leased_clients": sum(len(leases) for _, leases in self._stripes),
+        }
@@ -0,0 +1,21 @@
+"""
+Serving infrastructure for the Medical Calculator servers.
+
+- serve_prefork(): ``--workers N`` mode; one parent warms up every shared
+  read-only structure, freezes the GC and forks N uvicorn workers that keep
+  those structures copy-on-write shared
+- CalculationPool: thread or process pool running calculations off the
+  event loop, shared by the MCP calculate_batch executor and the REST
+  execution backend; process workers' usage events are replayed into the
+  serving process
+
+Usage:
+    from src.infrastructure.serving import serve_prefork
+
+    raise SystemExit(serve_prefork(app, host="0.0.0.0", port=8080, workers=4, warm_up=warm_up))
+"""
+
+from .calculation_pool import MAX_JOB_SIZE, CalculationPool, job_size
+from .prefork import serve_prefork
+
+__all__ = ["MAX_JOB_SIZE", "CalculationPool", "job_size", "serve_prefork"]
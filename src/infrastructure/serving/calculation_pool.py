@@ -0,0 +1,219 @@
+"""
+Calculation Pool
+
+The worker pool behind the MCP calculate_batch executor and the REST
+execution backend: runs lists of CalculateRequests on a thread or process
+pool and returns the responses in request order.
+
+    thread   the caller's CalculateUseCase runs on pool threads; usage events
+             go straight to its usage logger
+    process  each worker process sets up the registry once (pool initializer)
+             and executes with its own CalculateUseCase, whose usage events
+             are captured with the job and replayed into the caller's usage
+             logger, so the usage log, /stats/latency and /metrics of the
+             serving process cover every calculation
+
+Process workers use the process-wide registry: forked workers inherit the
+parent's, spawned ones restore it from the registry manifest (calculators
+load on first use) or, without a manifest, register every calculator.
+
+A worker that dies breaks a ProcessPoolExecutor for good; the pool is then
+dropped and a fresh one is started on next use.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+from collections.abc import Iterable, Sequence
+from concurrent.futures import BrokenExecutor, Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Optional
+
+from ...application.dto import CalculateRequest, CalculateResponse
+from ...application.use_cases.calculate_use_case import CalculateUseCase, ToolCallRecorder
+from ...domain.registry.tool_registry import ToolRegistry
+
+logger = logging.getLogger(__name__)
+
+POOL_KINDS = ("thread", "process")
+
+# Most requests in one pool job (see job_size())
+MAX_JOB_SIZE = 64
+
+
+def job_size(total: Optional[int], workers: int) -> int:
+    """
+    Requests per pool job for ``total`` requests (None: unknown, e.g. a stream).
+
+    About four jobs per worker, capped at MAX_JOB_SIZE: one job per request
+    would spend more on submission and pickling than on the calculations.
+    """
+    if total is None:
+        return MAX_JOB_SIZE
+    return max(1, min(MAX_JOB_SIZE, -(-total // (workers * 4))))
+
+
+# =============================================================================
+# Process-pool worker state (one registry per worker process)
+# =============================================================================
+
+# Captured record_tool_call(): (tool_id, param names, keyword arguments)
+RecordedCall = tuple[str, tuple[str, ...], dict[str, Any]]
+
+
+class _CallCapture:
+    """ToolCallRecorder that keeps a worker's usage events until its job returns."""
+
+    def __init__(self) -> None:
+        self.calls: list[RecordedCall] = []
+
+    def record_tool_call(self, tool_id: str, param_names: Iterable[str], **kwargs: Any) -> None:
+        self.calls.append((tool_id, tuple(param_names), kwargs))
+
+
+_worker_use_case: Optional[CalculateUseCase] = None
+_worker_capture = _CallCapture()
+
+
+def _worker_registry() -> ToolRegistry:
+    """The process-wide registry, populated from the manifest (or every calculator) if empty."""
+    from ...domain.registry.manifest import load_registry_manifest
+    from ...domain.registry.tool_registry import get_registry
+
+    registry = get_registry()
+    if registry.count():
+        return registry
+    manifest = load_registry_manifest()
+    if manifest is not None:
+        registry.load_manifest(manifest)
+        return registry
+
+    from ...domain.services.calculators import CALCULATORS
+
+    for calculator_cls in CALCULATORS:
+        registry.register(calculator_cls())
+    return registry
+
+
+def _init_process_worker() -> None:
+    """Set up the registry and use case once per worker process (inherited as-is when forked)."""
+    global _worker_use_case
+    _worker_use_case = CalculateUseCase(_worker_registry(), usage_logger=_worker_capture)
+
+
+def _execute_in_process(requests: list[CalculateRequest]) -> tuple[list[CalculateResponse], list[RecordedCall]]:
+    if _worker_use_case is None:
+        _init_process_worker()
+    assert _worker_use_case is not None  # nosec B101 - set by _init_process_worker
+    responses = [_worker_use_case.execute(request) for request in requests]
+    calls, _worker_capture.calls = _worker_capture.calls, []
+    return responses, calls
+
+
+def _execute_all(use_case: CalculateUseCase, requests: list[CalculateRequest]) -> list[CalculateResponse]:
+    return [use_case.execute(request) for request in requests]
+
+
+def _worker_ready() -> int:
+    return os.getpid()
+
+
+# =============================================================================
+# Pool
+# =============================================================================
+
+
+class CalculationPool:
+    """Thread or process pool running CalculateRequest jobs, created on first use."""
+
+    def __init__(
+        self,
+        use_case: CalculateUseCase,
+        kind: str = "thread",
+        max_workers: int = 1,
+        usage_logger: Optional[ToolCallRecorder] = None,
+        thread_name_prefix: str = "calculate",
+    ) -> None:
+        """
+        Args:
+            use_case: Runs requests on pool threads ("thread")
+            kind: "thread" or "process"
+            max_workers: Pool size
+            usage_logger: Receives the usage events of process workers
+            thread_name_prefix: Name prefix of pool threads
+        """
+        if kind not in POOL_KINDS:
+            raise ValueError(f"Pool kind must be one of {', '.join(POOL_KINDS)}, got {kind!r}")
+        self._use_case = use_case
+        self._kind = kind
+        self._max_workers = max_workers
+        self._usage_logger = usage_logger
+        self._thread_name_prefix = thread_name_prefix
+        self._pool: Optional[Executor] = None
+
+    @property
+    def kind(self) -> str:
+        return self._kind
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    def job_size(self, total: Optional[int]) -> int:
+        """Requests per job for ``total`` requests on this pool (see job_size())."""
+        return job_size(total, self._max_workers)
+
+    def start(self) -> None:
+        """
+        Create the pool now instead of on first use.
+
+        Process workers are started and initialized before this returns, so
+        the first jobs do not pay for forking and registry setup.
+        """
+        pool = self._get_pool()
+        if isinstance(pool, ProcessPoolExecutor):
+            for future in [pool.submit(_worker_ready) for _ in range(self._max_workers)]:
+                future.result()
+
+    def _get_pool(self) -> Executor:
+        if self._pool is None:
+            if self._kind == "process":
+                self._pool = ProcessPoolExecutor(max_workers=self._max_workers, initializer=_init_process_worker)
+            else:
+                self._pool = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix=self._thread_name_prefix)
+        return self._pool
+
+    def shutdown(self) -> None:
+        """Shut down the pool (if one was started)."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    async def run(self, requests: Sequence[CalculateRequest]) -> list[CalculateResponse]:
+        """
+        Run ``requests`` as one pool job; responses in request order.
+
+        Raises:
+            BrokenExecutor: A worker died; the pool is replaced on next use
+        """
+        pool = self._get_pool()
+        loop = asyncio.get_running_loop()
+        try:
+            if self._kind == "thread":
+                return await loop.run_in_executor(pool, _execute_all, self._use_case, list(requests))
+            responses, calls = await loop.run_in_executor(pool, _execute_in_process, list(requests))
+        except BrokenExecutor:
+            self._discard(pool)
+            raise
+        if self._usage_logger is not None:
+            for tool_id, param_names, kwargs in calls:
+                self._usage_logger.record_tool_call(tool_id, param_names, **kwargs)
+        return responses
+
+    def _discard(self, pool: Executor) -> None:
+        """Drop a broken pool (once, however many jobs saw it break)."""
+        if self._pool is pool:
+            logger.warning(f"Calculation {self._kind} pool broke (a worker died); starting a new one on next use")
+            self._pool = None
+            pool.shutdown(wait=False, cancel_futures=True)
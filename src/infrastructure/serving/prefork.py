@@ -0,0 +1,180 @@
+"""
+Pre-fork Multi-Worker Serving
+
+``--workers N`` for the REST API and the MCP streamable-HTTP server. Instead
+of N independent processes that each import every calculator, register them
+and build the discovery indexes, one parent does all of it once and forks:
+
+    parent  warm_up() (registry, calculator instances, discovery indexes,
+            resolvers, boundary registry, precomputed schemas), bind the
+            listening socket, gc.collect() + gc.freeze(), fork N workers
+    worker  gc.enable() and run uvicorn on the inherited socket; the ASGI
+            lifespan runs per worker, so execution pools, the event-loop lag
+            monitor and the usage-logger thread are created after the fork
+
+The warmed structures stay copy-on-write shared. The collector is disabled
+while warming up so freed objects do not leave holes in those pages, and
+gc.freeze() moves every object alive at fork time into a permanent
+generation the workers' collections never visit (a collection would write
+to each object's GC header and copy its page). Reference-count updates
+still copy the pages of objects a worker actually uses; the rest stays
+shared for the life of the worker.
+
+The parent only supervises:
+    - a worker that dies is replaced by a fresh fork of the warmed parent
+      (no re-import); one that dies during startup stops the whole server
+    - SIGTERM / SIGINT are forwarded to the workers once, as SIGTERM, and
+      serve_prefork() returns when every worker has exited
+    - workers run in their own process group, so a terminal Ctrl-C reaches
+      only the parent (a second signal would make uvicorn skip its graceful
+      shutdown), and exit on their own if the parent disappears
+
+POSIX only (os.fork).
+"""
+
+import gc
+import logging
+import os
+import signal
+import threading
+import time
+from collections.abc import Callable
+from socket import socket
+from types import FrameType
+from typing import Any, Optional
+
+import uvicorn
+
+# uvicorn configures this logger (as for its own multi-process supervisor)
+logger = logging.getLogger("uvicorn.error")
+
+# A worker exiting sooner than this after its fork failed to start: the server shuts down instead of respawning
+MIN_WORKER_UPTIME = 5.0
+
+# Seconds between a worker's checks that its parent is still alive
+PARENT_CHECK_INTERVAL = 1.0
+
+
+def serve_prefork(
+    app: Any,
+    *,
+    host: str,
+    port: int,
+    workers: int,
+    warm_up: Optional[Callable[[], None]] = None,
+    log_level: str = "info",
+    ssl_keyfile: Optional[str] = None,
+    ssl_certfile: Optional[str] = None,
+) -> int:
+    """
+    Serve an ASGI app from ``workers`` forked uvicorn workers sharing one warmed-up parent.
+
+    Args:
+        app: ASGI application (built in this process, inherited by the workers)
+        host: Host to bind
+        port: Port to bind
+        workers: Worker processes to fork
+        warm_up: Builds every shared read-only structure before the fork
+        log_level: uvicorn log level
+        ssl_keyfile: Path to SSL private key file (optional)
+        ssl_certfile: Path to SSL certificate file (optional)
+
+    Returns:
+        Exit status: 0 after a clean shutdown, 1 if a worker failed during startup
+
+    Raises:
+        RuntimeError: os.fork is not available on this platform
+    """
+    if not hasattr(os, "fork"):
+        raise RuntimeError("Multiple workers need os.fork (POSIX); run one process per replica instead")
+    if workers < 1:
+        raise ValueError(f"workers must be at least 1, got {workers}")
+
+    config = uvicorn.Config(app, host=host, port=port, log_level=log_level, ssl_keyfile=ssl_keyfile, ssl_certfile=ssl_certfile)
+    started = time.perf_counter()
+    gc.disable()
+    if warm_up is not None:
+        warm_up()
+    sock = config.bind_socket()
+    gc.collect()
+    gc.freeze()
+    logger.info(f"Warmed up in {time.perf_counter() - started:.2f}s ({gc.get_freeze_count()} objects frozen); forking {workers} workers")
+    return _Supervisor(config, sock, workers).run()
+
+
+class _Supervisor:
+    """Forks the workers, replaces dead ones and forwards shutdown signals."""
+
+    def __init__(self, config: uvicorn.Config, sock: socket, workers: int) -> None:
+        self._config = config
+        self._sock = sock
+        self._workers = workers
+        self._children: dict[int, float] = {}  # pid -> monotonic fork time
+        self._stopping = False
+
+    def run(self) -> int:
+        signal.signal(signal.SIGTERM, self._stop)
+        signal.signal(signal.SIGINT, self._stop)
+        for _ in range(self._workers):
+            self._spawn()
+
+        status = 0
+        while self._children:
+            try:
+                pid, wait_status = os.wait()
+            except ChildProcessError:  # pragma: no cover - children reaped elsewhere
+                break
+            forked_at = self._children.pop(pid, None)
+            if forked_at is None or self._stopping:
+                continue
+            code = os.waitstatus_to_exitcode(wait_status)
+            if time.monotonic() - forked_at < MIN_WORKER_UPTIME:
+                logger.error(f"Worker {pid} exited during startup (status {code}); shutting down")
+                status = 1
+                self._stop()
+                continue
+            logger.warning(f"Worker {pid} exited (status {code}); starting a replacement")
+            self._spawn()
+        self._sock.close()
+        return status
+
+    def _spawn(self) -> None:
+        parent = os.getpid()
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover - runs in the worker process
+            os._exit(_run_worker(self._config, self._sock, parent))
+        self._children[pid] = time.monotonic()
+        logger.info(f"Started worker {pid}")
+
+    def _stop(self, signum: Optional[int] = None, frame: Optional[FrameType] = None) -> None:
+        if self._stopping:
+            return
+        self._stopping = True
+        for pid in self._children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+
+def _run_worker(config: uvicorn.Config, sock: socket, parent: int) -> int:  # pragma: no cover - runs in the worker process
+    """Worker body: serve until told to stop; returns the process exit status."""
+    try:
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        signal.signal(signal.SIGINT, signal.SIG_DFL)
+        os.setpgid(0, 0)
+        gc.enable()
+        threading.Thread(target=_exit_with_parent, args=(parent,), name="prefork-parent-watch", daemon=True).start()
+        server = uvicorn.Server(config)
+        server.run(sockets=[sock])
+        return 0 if server.started else 3
+    except BaseException:
+        logger.exception("Worker crashed")
+        return 1
+
+
+def _exit_with_parent(parent: int) -> None:  # pragma: no cover - runs in the worker process
+    """Ask uvicorn to shut down (SIGTERM to self) once the supervising parent is gone."""
+    while os.getppid() == parent:
+        time.sleep(PARENT_CHECK_INTERVAL)
+    os.kill(os.getpid(), signal.SIGTERM)
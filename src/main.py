@@ -27,6 +27,9 @@ Usage:
     # Streamable HTTP mode
     python -m src.main --mode http
 
+    # Stateless streamable HTTP from 4 pre-forked workers sharing one warmed-up registry
+    python -m src.main --mode http --workers 4
+
 Docker:
     docker build -t medical-calc-mcp .
     docker run -p 8000:8000 medical-calc-mcp
@@ -35,6 +38,7 @@ Environment Variables:
     MCP_MODE       Transport mode: stdio, sse, http (default: stdio)
     MCP_HOST       Host to bind (default: 0.0.0.0)
     MCP_PORT       Port to bind (default: 8000)
+    MCP_WORKERS    Worker processes for HTTP mode (default: 1)
     LOG_LEVEL      Logging level: DEBUG, INFO, WARNING, ERROR (default: INFO)
     SSL_ENABLED    Enable SSL/TLS: true, false (default: false)
     SSL_KEYFILE    Path to SSL private key file
@@ -47,6 +51,7 @@ import logging
 import os
 import sys
 from pathlib import Path
+from typing import Any
 
 # Configure logging to stderr IMMEDIATELY to avoid interfering with MCP stdio transport
 logging.basicConfig(level=os.environ.get("LOG_LEVEL", "INFO"), format="%(asctime)s - %(name)s - %(levelname)s - %(message)s", stream=sys.stderr)
@@ -120,10 +125,14 @@ Examples:
   # Streamable HTTP mode
   python -m src.main --mode http
 
+  # Stateless streamable HTTP from 4 pre-forked workers
+  python -m src.main --mode http --workers 4
+
 Environment Variables:
   MCP_MODE       Transport mode (default: stdio)
   MCP_HOST       Host to bind (default: 0.0.0.0)
   MCP_PORT       Port to bind (default: 8000)
+  MCP_WORKERS    Worker processes for HTTP mode (default: 1)
   SSL_ENABLED    Enable SSL/TLS (default: false)
   SSL_KEYFILE    Path to SSL private key
   SSL_CERTFILE   Path to SSL certificate
@@ -151,6 +160,13 @@ Claude Desktop Configuration (for HTTPS SSE mode):
     parser.add_argument("--mode", "-m", choices=["stdio", "sse", "http"], default=os.environ.get("MCP_MODE", "stdio"), help="Transport mode (default: stdio)")
     parser.add_argument("--host", "-H", default=os.environ.get("MCP_HOST", "0.0.0.0"), help="Host to bind for SSE/HTTP mode (default: 0.0.0.0)")  # nosec B104 - CLI default supports container exposure
     parser.add_argument("--port", "-p", type=int, default=int(os.environ.get("MCP_PORT", "8000")), help="Port to bind for SSE/HTTP mode (default: 8000)")
+    parser.add_argument(
+        "--workers",
+        "-w",
+        type=int,
+        default=int(os.environ.get("MCP_WORKERS", "1")),
+        help="Worker processes forked from one warmed-up parent, HTTP mode only (default: 1)",
+    )
 
     # SSL/TLS arguments
     ssl_group = parser.add_argument_group("SSL/TLS Options", "Configure HTTPS with custom certificates")
@@ -175,6 +191,10 @@ Claude Desktop Configuration (for HTTPS SSE mode):
     # Validate SSL args (both must be provided if either is)
     if bool(args.ssl_keyfile) != bool(args.ssl_certfile):
         parser.error("--ssl-keyfile and --ssl-certfile must be specified together")
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.workers > 1 and args.mode != "http":
+        parser.error("--workers needs --mode http (stdio and SSE sessions live in one process)")
 
     logger.info("=" * 60)
     logger.info("Medical Calculator MCP Server")
@@ -222,17 +242,21 @@ Claude Desktop Configuration (for HTTPS SSE mode):
         logger.info(f"MCP Endpoint: {protocol}://{args.host}:{args.port}/mcp")
         if ssl_enabled:
             logger.info(f"SSL Enabled: keyfile={args.ssl_keyfile}, certfile={args.ssl_certfile}")
+        if args.workers > 1:
+            logger.info(f"Workers: {args.workers} (pre-forked, stateless HTTP)")
         logger.info("-" * 60)
 
-        # Run with SSL if configured
+        # Run with SSL and pre-forked workers if configured
+        run_kwargs: dict[str, Any] = {"workers": args.workers} if args.workers > 1 else {}
         if ssl_enabled:
             server.run(
                 transport="http",
                 ssl_keyfile=args.ssl_keyfile,
                 ssl_certfile=args.ssl_certfile,
+                **run_kwargs,
             )
         else:
-            server.run(transport="http")
+            server.run(transport="http", **run_kwargs)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,216 @@
+"""
+Latency Histograms
+
+Fixed-memory, log-linear (HDR-style) histograms for streaming latency
+percentiles:
+
+- LatencyHistogram: durations in nanoseconds are counted into buckets; values
+  below SUB_BUCKET_COUNT are exact and every power-of-two range above is split
+  into SUB_BUCKET_COUNT / 2 linear buckets, so reported percentiles are within
+  ~1.6% of the true value. Inserts are O(1), memory is bounded by BUCKET_COUNT
+  entries (stored sparsely), and histograms merge by adding counts.
+- RollingLatencyHistogram: an all-time histogram plus a ring of per-slice
+  histograms (SLICE_SECONDS each) answering rolling windows such as 1m, 5m
+  and 1h by merging the most recent slices.
+
+Not thread-safe: callers serialize writes (e.g. ToolUsageLogger's single
+writer thread) and take snapshots under the same lock.
+
+Zero external dependencies - pure Python stdlib only.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from bisect import bisect_left
+from collections.abc import Callable, Iterable, Sequence
+from typing import Any, Optional
+
+# Linear resolution: 2**SUB_BUCKET_BITS exact buckets, then 2**(SUB_BUCKET_BITS - 1) per octave
+SUB_BUCKET_BITS = 7
+SUB_BUCKET_COUNT = 1 << SUB_BUCKET_BITS
+HALF_SUB_BUCKET_COUNT = SUB_BUCKET_COUNT // 2
+
+# Largest trackable value: 2**42 ns (~73 minutes); larger values are clamped into the last bucket
+MAX_VALUE_BITS = 42
+MAX_VALUE_NS = (1 << MAX_VALUE_BITS) - 1
+BUCKET_COUNT = SUB_BUCKET_COUNT + (MAX_VALUE_BITS - SUB_BUCKET_BITS) * HALF_SUB_BUCKET_COUNT
+
+# Rolling windows (name → seconds), answered from SLICE_SECONDS slices
+SLICE_SECONDS = 10
+LATENCY_WINDOWS: dict[str, int] = {"1m": 60, "5m": 300, "1h": 3600}
+ALL_TIME_WINDOW = "all"
+
+# Percentiles reported by LatencyHistogram.summary()
+SUMMARY_PERCENTILES: tuple[tuple[str, float], ...] = (("p50", 50.0), ("p90", 90.0), ("p99", 99.0), ("p999", 99.9))
+
+
+def bucket_index(value_ns: int) -> int:
+    """Bucket holding ``value_ns`` (clamped to [0, MAX_VALUE_NS])."""
+    if value_ns < SUB_BUCKET_COUNT:
+        return max(value_ns, 0)
+    value_ns = min(value_ns, MAX_VALUE_NS)
+    shift = value_ns.bit_length() - SUB_BUCKET_BITS
+    return SUB_BUCKET_COUNT + (shift - 1) * HALF_SUB_BUCKET_COUNT + (value_ns >> shift) - HALF_SUB_BUCKET_COUNT
+
+
+def bucket_upper_bound(index: int) -> int:
+    """Largest value (ns) that maps to bucket ``index``."""
+    if index < SUB_BUCKET_COUNT:
+        return index
+    offset = index - SUB_BUCKET_COUNT
+    shift = offset // HALF_SUB_BUCKET_COUNT + 1
+    top = offset % HALF_SUB_BUCKET_COUNT + HALF_SUB_BUCKET_COUNT
+    return ((top + 1) << shift) - 1
+
+
+class LatencyHistogram:
+    """Log-linear histogram of durations in nanoseconds."""
+
+    __slots__ = ("_counts", "count", "total_ns", "min_ns", "max_ns")
+
+    def __init__(self) -> None:
+        self._counts: dict[int, int] = {}
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns = 0
+        self.max_ns = 0
+
+    def record(self, value_ns: int) -> None:
+        """Add one duration (nanoseconds)."""
+        index = bucket_index(value_ns)
+        counts = self._counts
+        counts[index] = counts.get(index, 0) + 1
+        if self.count == 0 or value_ns < self.min_ns:
+            self.min_ns = value_ns
+        if value_ns > self.max_ns:
+            self.max_ns = value_ns
+        self.count += 1
+        self.total_ns += value_ns
+
+    def merge(self, other: LatencyHistogram) -> None:
+        """Add another histogram's counts into this one."""
+        if other.count == 0:
+            return
+        counts = self._counts
+        for index, count in other._counts.items():
+            counts[index] = counts.get(index, 0) + count
+        self.min_ns = other.min_ns if self.count == 0 else min(self.min_ns, other.min_ns)
+        self.max_ns = max(self.max_ns, other.max_ns)
+        self.count += other.count
+        self.total_ns += other.total_ns
+
+    @classmethod
+    def merged(cls, histograms: Iterable[LatencyHistogram]) -> LatencyHistogram:
+        """Return a new histogram holding the sum of ``histograms``."""
+        result = cls()
+        for histogram in histograms:
+            result.merge(histogram)
+        return result
+
+    def percentiles(self, percentiles: Iterable[float]) -> list[int]:
+        """
+        Values (ns) at the given percentiles (0-100), in one pass over the buckets.
+
+        Each value is the upper bound of its bucket, clamped to the recorded
+        min/max; an empty histogram returns zeros.
+        """
+        wanted = list(percentiles)
+        if self.count == 0:
+            return [0] * len(wanted)
+
+        ranks = sorted((max(1, math.ceil(p / 100.0 * self.count)), position) for position, p in enumerate(wanted))
+        values = [0] * len(wanted)
+        cumulative = 0
+        next_rank = 0
+        for index in sorted(self._counts):
+            cumulative += self._counts[index]
+            while next_rank < len(ranks) and ranks[next_rank][0] <= cumulative:
+                values[ranks[next_rank][1]] = min(max(bucket_upper_bound(index), self.min_ns), self.max_ns)
+                next_rank += 1
+            if next_rank == len(ranks):
+                break
+        return values
+
+    def cumulative_counts(self, bounds_ns: Sequence[int]) -> list[int]:
+        """
+        Number of values at or below each bound (ascending, nanoseconds).
+
+        A value counts toward a bound when it falls in the bound's bucket or
+        below, so counts are exact up to the histogram resolution.
+        """
+        bound_indexes = [bucket_index(bound) for bound in bounds_ns]
+        counts = [0] * (len(bounds_ns) + 1)
+        for index, count in self._counts.items():
+            counts[bisect_left(bound_indexes, index)] += count
+        cumulative = 0
+        result = []
+        for count in counts[:-1]:
+            cumulative += count
+            result.append(cumulative)
+        return result
+
+    def summary(self) -> dict[str, Any]:
+        """Count, min/mean/max and SUMMARY_PERCENTILES, in milliseconds."""
+        if self.count == 0:
+            return {"count": 0}
+        summary: dict[str, Any] = {
+            "count": self.count,
+            "min_ms": _ns_to_ms(self.min_ns),
+            "mean_ms": _ns_to_ms(self.total_ns / self.count),
+            "max_ms": _ns_to_ms(self.max_ns),
+        }
+        values = self.percentiles(p for _, p in SUMMARY_PERCENTILES)
+        for (name, _), value in zip(SUMMARY_PERCENTILES, values):
+            summary[f"{name}_ms"] = _ns_to_ms(value)
+        return summary
+
+
+class RollingLatencyHistogram:
+    """
+    All-time histogram plus rolling windows built from fixed time slices.
+
+    A window of N seconds merges the current slice and the slices covering
+    the preceding N seconds (rounded down to whole slices), so it spans
+    between N - SLICE_SECONDS and N seconds of history.
+    """
+
+    __slots__ = ("_clock", "_slices", "all_time")
+
+    def __init__(self, max_window_seconds: int = max(LATENCY_WINDOWS.values()), clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._slices: list[Optional[tuple[int, LatencyHistogram]]] = [None] * max(1, math.ceil(max_window_seconds / SLICE_SECONDS))
+        self.all_time = LatencyHistogram()
+
+    def record(self, value_ns: int) -> None:
+        """Add one duration (nanoseconds) to the all-time and current-slice histograms."""
+        epoch = int(self._clock() // SLICE_SECONDS)
+        position = epoch % len(self._slices)
+        entry = self._slices[position]
+        if entry is None or entry[0] != epoch:
+            entry = (epoch, LatencyHistogram())
+            self._slices[position] = entry
+        entry[1].record(value_ns)
+        self.all_time.record(value_ns)
+
+    def window(self, seconds: Optional[int]) -> LatencyHistogram:
+        """Merged histogram for the last ``seconds`` (None: all time)."""
+        if seconds is None:
+            return self.all_time
+        current = int(self._clock() // SLICE_SECONDS)
+        oldest = current - min(max(1, seconds // SLICE_SECONDS), len(self._slices)) + 1
+        return LatencyHistogram.merged(entry[1] for entry in self._slices if entry is not None and oldest <= entry[0] <= current)
+
+
+def window_seconds(name: str) -> Optional[int]:
+    """Seconds for a window name from LATENCY_WINDOWS, None for ALL_TIME_WINDOW; ValueError otherwise."""
+    if name == ALL_TIME_WINDOW:
+        return None
+    if name not in LATENCY_WINDOWS:
+        raise ValueError(f"Unknown latency window '{name}'. Use one of: {', '.join([*LATENCY_WINDOWS, ALL_TIME_WINDOW])}")
+    return LATENCY_WINDOWS[name]
+
+
+def _ns_to_ms(value: float) -> float:
+    return round(value / 1_000_000, 3)
@@ -0,0 +1,91 @@
+"""
+Prometheus Text Format
+
+Helpers that render metrics in the Prometheus text exposition format
+(version 0.0.4) without a client library:
+
+- format_prometheus_samples(): counters and gauges
+- format_prometheus_histogram(): LatencyHistogram series as cumulative
+  ``le`` buckets in seconds plus ``_sum`` and ``_count``
+
+Zero external dependencies - pure Python stdlib only.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping, Sequence
+
+from .latency_histogram import LatencyHistogram
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Default bucket bounds (seconds) for format_prometheus_histogram()
+PROMETHEUS_BUCKETS_SECONDS: tuple[float, ...] = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def format_prometheus_samples(name: str, metric_type: str, help_text: str, samples: Iterable[tuple[Mapping[str, str], float]]) -> list[str]:
+    """
+    Prometheus text-format lines for one counter or gauge metric.
+
+    Args:
+        name: Metric name (counters should end in "_total")
+        metric_type: "counter" or "gauge"
+        help_text: HELP line text
+        samples: (labels, value) pairs, one per label set
+
+    Returns:
+        HELP/TYPE lines followed by one sample line per label set
+    """
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} {metric_type}"]
+    for labels, value in samples:
+        lines.append(f"{name}{format_labels(labels)} {_format_value(value)}")
+    return lines
+
+
+def format_prometheus_histogram(
+    name: str,
+    help_text: str,
+    series: Iterable[tuple[Mapping[str, str], LatencyHistogram]],
+    buckets_seconds: Sequence[float] = PROMETHEUS_BUCKETS_SECONDS,
+) -> list[str]:
+    """
+    Prometheus text-format lines for one histogram metric (values in seconds).
+
+    Args:
+        name: Metric name (e.g. "medcalc_tool_call_duration_seconds")
+        help_text: HELP line text
+        series: (labels, histogram) pairs, one per label set
+        buckets_seconds: Ascending ``le`` bounds; "+Inf" is appended
+
+    Returns:
+        HELP/TYPE lines followed by _bucket, _sum and _count samples
+    """
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+    bounds_ns = [round(bound * 1_000_000_000) for bound in buckets_seconds]
+    for labels, histogram in series:
+        label_text = ",".join(f'{key}="{_escape_label_value(value)}"' for key, value in labels.items())
+        prefix = f"{label_text}," if label_text else ""
+        for bound, count in zip(buckets_seconds, histogram.cumulative_counts(bounds_ns)):
+            lines.append(f'{name}_bucket{{{prefix}le="{bound:g}"}} {count}')
+        lines.append(f'{name}_bucket{{{prefix}le="+Inf"}} {histogram.count}')
+        suffix = format_labels(labels)
+        lines.append(f"{name}_sum{suffix} {histogram.total_ns / 1_000_000_000:.9g}")
+        lines.append(f"{name}_count{suffix} {histogram.count}")
+    return lines
+
+
+def format_labels(labels: Mapping[str, str]) -> str:
+    """Render ``{key="value",...}`` (empty string for no labels)."""
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape_label_value(value)}"' for key, value in labels.items()) + "}"
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if isinstance(value, int):
+        return str(value)
+    return f"{value:.9g}"
@@ -0,0 +1,174 @@
+"""
+Result Cache
+
+Bounded LRU cache with a TTL for memoizing results of pure computations,
+keyed by a canonical hash of their inputs:
+
+- canonical_key(): a fixed-size digest of a namespace (e.g. tool_id) and a
+  parameter mapping. Parameters are serialized as sorted-key JSON, so key
+  order does not matter while value types do (1, 1.0 and True differ).
+  Returns None for values that have no canonical JSON form.
+- ResultCache: values are stored pickled, which gives an exact byte size for
+  the byte bound and hands every hit a fresh copy the caller may mutate.
+  Entries are evicted least-recently-used first when either the entry or
+  the byte limit is exceeded, and dropped on access once older than the TTL.
+
+Thread-safe: every operation takes one lock (a dict lookup and a pickle
+round-trip, never the computation itself).
+
+Zero external dependencies - pure Python stdlib only.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import pickle  # nosec B403 - only values this process pickled itself are ever loaded
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from typing import Any, Generic, Optional, TypeVar
+
+T = TypeVar("T")
+
+# Enables the calculate result cache (CalculateUseCase) when set to true
+RESULT_CACHE_ENV_VAR = "CALCULATE_RESULT_CACHE"
+DEFAULT_MAX_ENTRIES = 4096
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+DEFAULT_TTL_SECONDS = 300.0
+
+
+def canonical_key(namespace: str, params: Mapping[str, Any]) -> Optional[bytes]:
+    """Digest of ``namespace`` and ``params``, or None when params are not JSON-serializable."""
+    try:
+        encoded = json.dumps(params, sort_keys=True, separators=(",", ":"), allow_nan=True)
+    except (TypeError, ValueError):
+        return None
+    digest = hashlib.blake2b(namespace.encode(), digest_size=16)
+    digest.update(b"\0")
+    digest.update(encoded.encode())
+    return digest.digest()
+
+
+class ResultCache(Generic[T]):
+    """LRU + TTL cache bounded by entry count and pickled size, with hit/miss/eviction counters."""
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        ttl: float = DEFAULT_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Args:
+            max_entries: Maximum number of cached results
+            max_bytes: Maximum total pickled size of cached results
+            ttl: Seconds a result stays valid (0 or less: no expiry)
+            clock: Monotonic time source (injectable for tests)
+        """
+        if max_entries < 1 or max_bytes < 1:
+            raise ValueError("max_entries and max_bytes must be >= 1")
+
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[bytes, tuple[bytes, float]] = OrderedDict()  # key -> (pickled value, stored at)
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.rejected = 0  # Values larger than max_bytes
+
+    @classmethod
+    def from_env(cls) -> Optional[ResultCache[Any]]:
+        """
+        Cache configured from the environment, or None unless CALCULATE_RESULT_CACHE is true.
+
+        Environment Variables:
+            CALCULATE_RESULT_CACHE: "true" enables the cache (default: "false")
+            CALCULATE_RESULT_CACHE_MAX_ENTRIES: entry limit (default: 4096)
+            CALCULATE_RESULT_CACHE_MAX_BYTES: byte limit (default: 16 MiB)
+            CALCULATE_RESULT_CACHE_TTL: seconds, 0 disables expiry (default: 300)
+        """
+        if os.environ.get(RESULT_CACHE_ENV_VAR, "false").lower() not in {"true", "1", "yes", "on"}:
+            return None
+        try:
+            return cls(
+                max_entries=int(os.environ.get(f"{RESULT_CACHE_ENV_VAR}_MAX_ENTRIES", DEFAULT_MAX_ENTRIES)),
+                max_bytes=int(os.environ.get(f"{RESULT_CACHE_ENV_VAR}_MAX_BYTES", DEFAULT_MAX_BYTES)),
+                ttl=float(os.environ.get(f"{RESULT_CACHE_ENV_VAR}_TTL", DEFAULT_TTL_SECONDS)),
+            )
+        except ValueError:
+            return cls()
+
+    def get(self, key: bytes) -> Optional[T]:
+        """A fresh copy of the cached value, or None on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            payload, stored_at = entry
+            if self.ttl > 0 and self._clock() - stored_at >= self.ttl:
+                self._discard(key, payload)
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        value: T = pickle.loads(payload)  # nosec B301 - pickled by put()
+        return value
+
+    def put(self, key: bytes, value: T) -> None:
+        """Store a copy of ``value``, evicting least-recently-used entries past either bound."""
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            if len(payload) > self.max_bytes:
+                self.rejected += 1
+                return
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= len(previous[0])
+            self._entries[key] = (payload, self._clock())
+            self._bytes += len(payload)
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, (evicted, _) = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
+                self.evictions += 1
+
+    def _discard(self, key: bytes, payload: bytes) -> None:
+        del self._entries[key]
+        self._bytes -= len(payload)
+
+    def clear(self) -> None:
+        """Drop every entry (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Size and hit/miss/eviction counters."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "ttl_seconds": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "rejected": self.rejected,
+            }
@@ -5,6 +5,11 @@ from __future__ import annotations
 import re
 from collections.abc import Iterable
 from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from functools import _CacheInfo
 
 from .fuzzy_matching import closest_matches
 
@@ -74,6 +79,111 @@ def build_identifier_aliases(candidate: str) -> set[str]:
     return {alias for alias in aliases if alias}
 
 
+class IdentifierResolver:
+    """
+    Identifier resolution against a fixed set of canonical candidates.
+
+    Everything that depends only on the candidates (normalized lookup, alias
+    map, ambiguity table, fuzzy search space) is built once
+    at construction, and resolutions are memoized per raw input in an LRU
+    since callers repeat the same handful of identifiers. Build a new
+    resolver when the candidate set changes.
+    """
+
+    def __init__(self, candidates: Iterable[str], *, cutoff: float = 0.72, cache_size: int = 1024) -> None:
+        self.cutoff = cutoff
+        self.candidates: tuple[str, ...] = tuple(sorted(set(candidates)))
+
+        self._canonical_by_normalized = {normalize_identifier(candidate): candidate for candidate in self.candidates}
+        self._alias_map: dict[str, str] = {}
+        self._ambiguous_aliases: dict[str, set[str]] = {}
+        for canonical_candidate in self.candidates:
+            for alias in build_identifier_aliases(canonical_candidate):
+                if alias in self._alias_map and self._alias_map[alias] != canonical_candidate:
+                    self._ambiguous_aliases.setdefault(alias, {self._alias_map[alias]}).add(canonical_candidate)
+                    continue
+                self._alias_map[alias] = canonical_candidate
+
+        # Fuzzy search space: normalized candidates plus every alias, sorted once
+        self._search_space = sorted(set(self._canonical_by_normalized) | set(self._alias_map))
+
+        self._resolve_cached = lru_cache(maxsize=cache_size)(self._resolve)
+
+    def resolve(self, raw_value: str) -> ResolutionResult:
+        """Resolve a raw input string (memoized)."""
+        return self._resolve_cached(raw_value)
+
+    def cache_info(self) -> _CacheInfo:
+        """Return LRU statistics (hits, misses, maxsize, currsize)."""
+        return self._resolve_cached.cache_info()
+
+    def _resolve(self, raw_value: str) -> ResolutionResult:
+        normalized_raw = normalize_identifier(raw_value)
+        if not normalized_raw:
+            return ResolutionResult(raw_value=raw_value, normalized_value=normalized_raw)
+
+        raw_aliases = build_identifier_aliases(raw_value)
+
+        matched_exact = next(
+            (self._canonical_by_normalized[alias] for alias in raw_aliases if alias in self._canonical_by_normalized),
+            None,
+        )
+        if matched_exact is not None:
+            return ResolutionResult(
+                raw_value=raw_value,
+                normalized_value=normalized_raw,
+                resolved_value=matched_exact,
+                matched_by="exact",
+            )
+
+        matched_alias = next(
+            (self._alias_map[alias] for alias in raw_aliases if alias in self._alias_map and alias not in self._ambiguous_aliases),
+            None,
+        )
+        if matched_alias is not None:
+            return ResolutionResult(
+                raw_value=raw_value,
+                normalized_value=normalized_raw,
+                resolved_value=matched_alias,
+                matched_by="alias",
+            )
+
+        close_keys: list[str] = []
+        for alias in sorted(raw_aliases):
+            for key in closest_matches(alias, self._search_space, limit=5, cutoff=self.cutoff):
+                if key not in close_keys:
+                    close_keys.append(key)
+        suggestions: list[str] = []
+        for key in close_keys:
+            matched_candidate: str | None = self._canonical_by_normalized.get(key)
+            if matched_candidate is None:
+                matched_candidate = self._alias_map.get(key)
+            if matched_candidate and matched_candidate not in suggestions:
+                suggestions.append(matched_candidate)
+
+        ambiguous_values: set[str] = set()
+        for alias in raw_aliases:
+            ambiguous_values.update(self._ambiguous_aliases.get(alias, ()))
+        ambiguous_matches = tuple(sorted(ambiguous_values))
+        return ResolutionResult(
+            raw_value=raw_value,
+            normalized_value=normalized_raw,
+            suggestions=tuple(suggestions),
+            matched_by="fuzzy" if suggestions else "none",
+            ambiguous_matches=ambiguous_matches,
+        )
+
+
+@lru_cache(maxsize=32)
+def _resolver_for(candidates: frozenset[str], cutoff: float) -> IdentifierResolver:
+    return IdentifierResolver(candidates, cutoff=cutoff)
+
+
+def get_identifier_resolver(candidates: Iterable[str], *, cutoff: float = 0.72) -> IdentifierResolver:
+    """Get a shared resolver for a candidate set (built on first use)."""
+    return _resolver_for(frozenset(candidates), cutoff)
+
+
 def resolve_identifier(
     raw_value: str,
     candidates: Iterable[str],
@@ -81,70 +191,4 @@ def resolve_identifier(
     cutoff: float = 0.72,
 ) -> ResolutionResult:
     """Resolve an arbitrary input string against a set of canonical candidates."""
-    candidate_list = sorted(set(candidates))
-    normalized_raw = normalize_identifier(raw_value)
-    if not normalized_raw:
-        return ResolutionResult(raw_value=raw_value, normalized_value=normalized_raw)
-
-    raw_aliases = build_identifier_aliases(raw_value)
-
-    canonical_by_normalized = {normalize_identifier(candidate): candidate for candidate in candidate_list}
-    matched_exact = next(
-        (canonical_by_normalized[alias] for alias in raw_aliases if alias in canonical_by_normalized),
-        None,
-    )
-    if matched_exact is not None:
-        return ResolutionResult(
-            raw_value=raw_value,
-            normalized_value=normalized_raw,
-            resolved_value=matched_exact,
-            matched_by="exact",
-        )
-
-    alias_map: dict[str, str] = {}
-    ambiguous_aliases: dict[str, set[str]] = {}
-    for canonical_candidate in candidate_list:
-        for alias in build_identifier_aliases(canonical_candidate):
-            if alias in alias_map and alias_map[alias] != canonical_candidate:
-                ambiguous_aliases.setdefault(alias, {alias_map[alias]}).add(canonical_candidate)
-                continue
-            alias_map[alias] = canonical_candidate
-
-    matched_alias = next(
-        (alias_map[alias] for alias in raw_aliases if alias in alias_map and alias not in ambiguous_aliases),
-        None,
-    )
-    if matched_alias is not None:
-        return ResolutionResult(
-            raw_value=raw_value,
-            normalized_value=normalized_raw,
-            resolved_value=matched_alias,
-            matched_by="alias",
-        )
-
-    search_space = sorted(set(canonical_by_normalized) | set(alias_map))
-    fuzzy_inputs = sorted(raw_aliases)
-    close_keys: list[str] = []
-    for alias in fuzzy_inputs:
-        for key in closest_matches(alias, search_space, limit=5, cutoff=cutoff):
-            if key not in close_keys:
-                close_keys.append(key)
-    suggestions: list[str] = []
-    for key in close_keys:
-        matched_candidate: str | None = canonical_by_normalized.get(key)
-        if matched_candidate is None:
-            matched_candidate = alias_map.get(key)
-        if matched_candidate and matched_candidate not in suggestions:
-            suggestions.append(matched_candidate)
-
-    ambiguous_values: set[str] = set()
-    for alias in raw_aliases:
-        ambiguous_values.update(ambiguous_aliases.get(alias, ()))
-    ambiguous_matches = tuple(sorted(ambiguous_values))
-    return ResolutionResult(
-        raw_value=raw_value,
-        normalized_value=normalized_raw,
-        suggestions=tuple(suggestions),
-        matched_by="fuzzy" if suggestions else "none",
-        ambiguous_matches=ambiguous_matches,
-    )
+    return get_identifier_resolver(candidates, cutoff=cutoff).resolve(raw_value)
@@ -7,7 +7,11 @@ Provides shared fixtures and configuration for all tests.
 Compatible with VS Code Python Test Explorer and Copilot.
 """
 
+import os
 import sys
+import threading
+import time
+from collections.abc import Iterable
 from pathlib import Path
 
 import pytest
@@ -17,6 +21,14 @@ src_path = Path(__file__).parent.parent / "src"
 if str(src_path) not in sys.path:
     sys.path.insert(0, str(src_path))
 
+from src.application.dto import CalculateRequest, CalculateResponse  # noqa: E402
+from src.application.use_cases import CalculateUseCase  # noqa: E402
+from src.domain.registry import ToolRegistry  # noqa: E402
+
+# Build discovery indexes from the registered calculators instead of loading a
+# snapshot left in build/ (tests of the snapshot point this at a temp file)
+os.environ["MEDCALC_DISCOVERY_SNAPSHOT"] = "off"
+
 
 @pytest.fixture
 def registry() -> Any:
@@ -31,6 +43,22 @@ def registry() -> Any:
     return reg
 
 
+@pytest.fixture(scope="session")
+def shared_registry() -> ToolRegistry:
+    """
+    One ToolRegistry with all calculators and discovery indexes for the whole session.
+
+    Read-only: tests that register tools or reset state use ``registry``.
+    """
+    from src.domain.services.calculators import CALCULATORS
+
+    reg = ToolRegistry()
+    for calc_class in CALCULATORS:
+        reg.register(calc_class())
+    reg.build_discovery_indexes()
+    return reg
+
+
 @pytest.fixture
 def calculator_classes() -> Any:
     """Provide list of all calculator classes."""
@@ -244,3 +272,60 @@ def sample_params() -> Any:
             "central_venous_access": False,
         },
     }
+
+
+# =============================================================================
+# Calculation helpers shared by the executor / pool tests
+# =============================================================================
+
+
+def summarize_responses(responses: Iterable[CalculateResponse]) -> list[tuple[str, bool, Any, Any]]:
+    """(tool_id, success, result, error) per response, for comparing execution paths."""
+    return [(r.tool_id, r.success, r.result, r.error) for r in responses]
+
+
+class SlowUseCase(CalculateUseCase):
+    """CalculateUseCase that sleeps per call and records the tools and threads it ran on."""
+
+    def __init__(self, registry: ToolRegistry, delay: float) -> None:
+        super().__init__(registry)
+        self.delay = delay
+        self.calls: list[str] = []
+        self.threads: set[int] = set()
+        self._lock = threading.Lock()
+
+    def execute(self, request: CalculateRequest) -> CalculateResponse:
+        with self._lock:
+            self.calls.append(request.tool_id)
+            self.threads.add(threading.get_ident())
+        time.sleep(self.delay)
+        return super().execute(request)
+
+
+class BlockingUseCase(CalculateUseCase):
+    """CalculateUseCase whose calls wait until ``release`` is set."""
+
+    def __init__(self, registry: ToolRegistry) -> None:
+        super().__init__(registry)
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def execute(self, request: CalculateRequest) -> CalculateResponse:
+        self.started.set()
+        self.release.wait(timeout=10)
+        return super().execute(request)
+
+
+# =============================================================================
+# MCP handler helpers
+# =============================================================================
+
+
+class FakeContext:
+    """MCP Context stand-in that records ``report_progress`` calls."""
+
+    def __init__(self) -> None:
+        self.progress: list[tuple[float, float, str]] = []
+
+    async def report_progress(self, progress: float, total: float, message: str) -> None:
+        self.progress.append((progress, total, message))
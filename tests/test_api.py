@@ -17,6 +17,9 @@ Requirements:
 """
 
 
+import json
+from collections.abc import AsyncIterator
+
 import pytest
 from httpx import ASGITransport, AsyncClient
 
@@ -207,6 +210,41 @@ class TestCalculatorDiscovery:
         assert response.status_code == 404
 
 
+class TestCalculatorSchema:
+    """Tests for the precomputed schema endpoint"""
+
+    @pytest.mark.anyio
+    async def test_schema_with_etag_revalidation(self, client: AsyncClient) -> None:
+        response = await client.get("/api/v1/calculators/sofa_score/schema")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["tool_id"] == "sofa_score"
+        assert "param_schemas" in data and "references" in data
+        etag = response.headers["etag"]
+        assert etag.startswith('"') and etag.endswith('"')
+        assert "max-age=" in response.headers["cache-control"]
+
+        revalidated = await client.get("/api/v1/calculators/sofa_score/schema", headers={"If-None-Match": f'"other", W/{etag}'})
+        assert revalidated.status_code == 304
+        assert revalidated.content == b""
+        assert revalidated.headers["etag"] == etag
+
+    @pytest.mark.anyio
+    async def test_schema_variants(self, client: AsyncClient) -> None:
+        full = await client.get("/api/v1/calculators/sofa_score/schema")
+        minimal = await client.get("/api/v1/calculators/sofa_score/schema", params={"include_references": "false", "include_param_sources": "false"})
+        assert minimal.status_code == 200
+        assert "references" not in minimal.json()
+        assert minimal.headers["etag"] != full.headers["etag"]
+
+    @pytest.mark.anyio
+    async def test_schema_alias_and_not_found(self, client: AsyncClient) -> None:
+        aliased = await client.get("/api/v1/calculators/sofa/schema")
+        assert aliased.status_code == 200
+        assert aliased.json()["resolved_tool_id"] == "sofa_score"
+        assert (await client.get("/api/v1/calculators/nonexistent_calc/schema")).status_code == 404
+
+
 # =============================================================================
 # Calculator Execution Tests
 # =============================================================================
@@ -321,6 +359,195 @@ class TestCalculatorExecution:
             assert data["success"] is False
 
 
+# =============================================================================
+# Batch Calculate Endpoint Tests
+# =============================================================================
+
+BATCH_ROWS: list[dict[str, Any]] = [
+    {"tool_id": "ckd_epi_2021", "params": {"serum_creatinine": 1.2, "age": 65, "sex": "female"}},
+    {"tool_id": "nonexistent_calc", "params": {}},
+    {"tool_id": "glasgow_coma_scale", "params": {"eye_response": 4, "verbal_response": 5, "motor_response": 6}},
+]
+
+
+def _ndjson(rows: list[Any]) -> bytes:
+    return b"".join(json.dumps(row).encode() + b"\n" for row in rows)
+
+
+def _lines_by_index(response: Any) -> dict[int, dict[str, Any]]:
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines() if line]
+    by_index = {line["index"]: line for line in lines}
+    assert len(by_index) == len(lines)
+    return by_index
+
+
+class TestBatchCalculate:
+    """Test POST /api/v1/calculate:batch"""
+
+    @pytest.mark.anyio
+    async def test_json_array_matches_single_endpoint(self, client: AsyncClient) -> None:
+        response = await client.post("/api/v1/calculate:batch", json=BATCH_ROWS)
+        assert response.status_code == 200
+        lines = _lines_by_index(response)
+
+        assert sorted(lines) == [0, 1, 2]
+        for index, row in enumerate(BATCH_ROWS):
+            single = (await client.post(f"/api/v1/calculate/{row['tool_id']}", json={"params": row["params"]})).json()
+            assert lines[index] == {"index": index, **single}
+        assert lines[0]["success"] is True and lines[1]["success"] is False
+
+    @pytest.mark.anyio
+    async def test_ndjson_body_isolates_bad_rows(self, client: AsyncClient) -> None:
+        body = _ndjson([BATCH_ROWS[0]]) + b"{not json\n" + _ndjson([["not", "an", "object"], {"params": {}}, BATCH_ROWS[2]])
+        response = await client.post("/api/v1/calculate:batch", content=body, headers={"Content-Type": "application/x-ndjson"})
+        assert response.status_code == 200
+        lines = _lines_by_index(response)
+
+        assert sorted(lines) == [0, 1, 2, 3, 4]
+        assert lines[0]["success"] is True and lines[4]["success"] is True
+        assert "Invalid JSON" in lines[1]["error"]
+        assert "JSON object" in lines[2]["error"]
+        assert "tool_id" in lines[3]["error"]
+
+    @pytest.mark.anyio
+    async def test_ndjson_oversized_line_is_reported_in_band(self, client: AsyncClient, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(api_server, "API_BATCH_MAX_LINE_BYTES", 200)
+        oversized = {"tool_id": "ckd_epi_2021", "params": {"padding": "x" * 500}}
+        body = _ndjson([oversized, BATCH_ROWS[0]])
+        response = await client.post("/api/v1/calculate:batch", content=body, headers={"Content-Type": "application/x-ndjson"})
+        lines = _lines_by_index(response)
+
+        assert "exceeds" in lines[0]["error"]
+        assert lines[1]["success"] is True
+
+    @pytest.mark.anyio
+    async def test_row_limit(self, client: AsyncClient, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(api_server, "API_BATCH_MAX_ROWS", 2)
+
+        response = await client.post("/api/v1/calculate:batch", json=BATCH_ROWS)
+        assert response.status_code == 413
+
+        response = await client.post("/api/v1/calculate:batch", content=_ndjson(BATCH_ROWS), headers={"Content-Type": "application/x-ndjson"})
+        lines = _lines_by_index(response)
+        assert sorted(lines) == [0, 1, 2]
+        assert "maximum of 2 rows" in lines[2]["error"]
+
+    @pytest.mark.anyio
+    async def test_json_array_body_limit(self, client: AsyncClient, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(api_server, "API_BATCH_MAX_BODY_BYTES", 100)
+        body = json.dumps(BATCH_ROWS).encode()
+
+        response = await client.post("/api/v1/calculate:batch", content=body, headers={"Content-Type": "application/json"})
+        assert response.status_code == 413
+        assert "100 bytes" in response.json()["detail"]
+
+        async def chunked() -> AsyncIterator[bytes]:  # no Content-Length: the streamed size is checked
+            for start in range(0, len(body), 64):
+                yield body[start : start + 64]
+
+        response = await client.post("/api/v1/calculate:batch", content=chunked(), headers={"Content-Type": "application/json"})
+        assert response.status_code == 413
+
+    @pytest.mark.anyio
+    async def test_invalid_json_array_body(self, client: AsyncClient) -> None:
+        response = await client.post("/api/v1/calculate:batch", content=b"[1,", headers={"Content-Type": "application/json"})
+        assert response.status_code == 400
+        response = await client.post("/api/v1/calculate:batch", json={"tool_id": "ckd_epi_2021"})
+        assert response.status_code == 400
+
+    @pytest.mark.anyio
+    async def test_large_batch_with_bounded_concurrency(self, client: AsyncClient, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(api_server, "API_BATCH_CONCURRENCY", 3)
+        rows = [{"tool_id": "ckd_epi_2021", "params": {"serum_creatinine": 1.0, "age": 20 + i % 80, "sex": "male"}} for i in range(200)]
+        response = await client.post("/api/v1/calculate:batch", content=_ndjson(rows), headers={"Content-Type": "application/x-ndjson"})
+        lines = _lines_by_index(response)
+
+        assert sorted(lines) == list(range(200))
+        assert all(line["success"] for line in lines.values())
+
+
+class TestScorePatient:
+    """Test POST /api/v1/score-patient"""
+
+    RECORD = {
+        "age": 67,
+        "sex": "male",
+        "respiratory_rate": 26,
+        "sbp": 92,
+        "dbp": 54,
+        "creatinine": 2.1,
+        "eye_response": 3,
+        "verbal_response": 4,
+        "motor_response": 6,
+    }
+
+    @pytest.mark.anyio
+    async def test_scores_requested_tools(self, client: AsyncClient) -> None:
+        response = await client.post("/api/v1/score-patient", json={"record": self.RECORD, "tools": ["qsofa_score", "ckd_epi_2021", "sofa_score"]})
+        assert response.status_code == 200
+        body = response.json()
+
+        assert [r["tool_id"] for r in body["results"]] == ["qsofa_score", "ckd_epi_2021"]
+        assert all(r["success"] for r in body["results"])
+        assert body["results"][0]["inputs"]["gcs_score"] == "derived:gcs_score"
+        assert body["derived"]["gcs_score"]["value"] == 13
+        assert body["skipped"][0]["tool_id"] == "sofa_score"
+        assert "pao2_fio2_ratio" in body["skipped"][0]["missing"]
+
+        single = (await client.post("/api/v1/calculate/ckd_epi_2021", json={"params": {"age": 67, "sex": "male", "serum_creatinine": 2.1}})).json()
+        assert body["results"][1]["result"] == single["result"]["value"]
+
+    @pytest.mark.anyio
+    async def test_rejects_invalid_tools(self, client: AsyncClient) -> None:
+        response = await client.post("/api/v1/score-patient", json={"record": self.RECORD, "tools": "everything"})
+        assert response.status_code == 400
+
+
+class TestDebugTimings:
+    """Test per-request stage timings on the calculate endpoint"""
+
+    @pytest.mark.anyio
+    async def test_debug_timings(self, client: AsyncClient) -> None:
+        """debug_timings=true attaches component_scores._timings"""
+        params = {"params": {"serum_creatinine": 1.2, "age": 65, "sex": "female"}}
+        response = await client.post("/api/v1/calculate/ckd_epi_2021", params={"debug_timings": "true"}, json=params)
+        assert response.status_code == 200
+        timings = response.json()["result"]["component_scores"]["_timings"]
+        assert {"resolve", "calculate", "total"} <= set(timings)
+
+        response = await client.post("/api/v1/calculate/ckd_epi_2021", json=params)
+        assert "_timings" not in response.json()["result"].get("component_scores", {})
+
+
+# =============================================================================
+# Monitoring Endpoint Tests
+# =============================================================================
+
+
+class TestLatencyStats:
+    """Test latency percentile endpoint"""
+
+    @pytest.mark.anyio
+    async def test_latency_after_calculation(self, client: AsyncClient) -> None:
+        """A calculation shows up in the all-time window"""
+        response = await client.post("/api/v1/calculate/ckd_epi_2021", json={"params": {"serum_creatinine": 1.2, "age": 65, "sex": "female"}})
+        assert response.status_code == 200
+
+        response = await client.get("/api/v1/stats/latency", params={"window": "all"})
+        assert response.status_code == 200
+        data = response.json()
+        assert data["unit"] == "ms"
+        assert list(data["windows"]) == ["all"]
+        assert data["windows"]["all"]["tools"]["ckd_epi_2021"]["count"] >= 1
+
+    @pytest.mark.anyio
+    async def test_unknown_window(self, client: AsyncClient) -> None:
+        """Unknown window names are rejected"""
+        response = await client.get("/api/v1/stats/latency", params={"window": "2d"})
+        assert response.status_code == 400
+
+
 # =============================================================================
 # Quick Calculate Endpoint Tests
 # =============================================================================
@@ -0,0 +1,154 @@
+"""
+Tests for the REST API execution backends
+
+Verifies size-based routing, 503 shedding when the pool is full, that the
+process pool returns the same responses as inline execution and replays its
+usage events into the API process's usage logger, and that a pool broken by a
+dying worker is replaced.
+"""
+
+import asyncio
+import os
+import signal
+from collections.abc import Iterable
+from concurrent.futures import BrokenExecutor
+from typing import Any
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from src.application.dto import CalculateRequest
+from src.application.use_cases import CalculateUseCase
+from src.domain.registry.tool_registry import ToolRegistry
+from src.infrastructure.api.execution import MAX_JOB_ROWS, ExecutionBackend, ExecutionConfig, ExecutionOverloaded
+from src.infrastructure.api.server import app
+from tests.conftest import BlockingUseCase, summarize_responses
+
+REQUESTS = [
+    CalculateRequest(tool_id="qsofa_score", params={"respiratory_rate": 24, "systolic_bp": 95, "altered_mentation": True}),
+    CalculateRequest(tool_id="ckd_epi_2021", params={"age": 65, "sex": "female", "serum_creatinine": 1.2}),
+    CalculateRequest(tool_id="ckd_epi_2021", params={"age": 65}),
+    CalculateRequest(tool_id="not_a_tool", params={"x": 1}),
+]
+
+
+class RecordingLogger:
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, tuple[str, ...], bool]] = []
+
+    def record_tool_call(self, tool_id: str, param_names: Iterable[str], *, success: bool, **kwargs: Any) -> None:
+        self.calls.append((tool_id, tuple(sorted(param_names)), success))
+
+
+class TestExecutionConfig:
+    def test_from_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("API_EXECUTION_BACKEND", "PROCESS")
+        monkeypatch.setenv("API_EXECUTION_WORKERS", "3")
+        monkeypatch.setenv("API_EXECUTION_INLINE_MAX_ROWS", "0")
+        monkeypatch.setenv("API_EXECUTION_MAX_QUEUE_DEPTH", "5")
+        config = ExecutionConfig.from_env()
+        assert (config.backend, config.max_workers, config.inline_max_rows, config.max_queue_depth) == ("process", 3, 0, 5)
+
+    def test_rejects_invalid_values(self) -> None:
+        with pytest.raises(ValueError, match="API_EXECUTION_BACKEND"):
+            ExecutionConfig(backend="gpu")
+        with pytest.raises(ValueError, match="API_EXECUTION_WORKERS"):
+            ExecutionConfig(max_workers=0)
+        with pytest.raises(ValueError, match="must not be negative"):
+            ExecutionConfig(max_queue_depth=-1)
+
+
+class TestRouting:
+    def test_small_requests_inline_large_and_unknown_to_pool(self, shared_registry: ToolRegistry) -> None:
+        backend = ExecutionBackend(CalculateUseCase(shared_registry), ExecutionConfig(backend="thread", inline_max_rows=10))
+        assert backend.routes_to_pool(1) is False
+        assert backend.routes_to_pool(10) is False
+        assert backend.routes_to_pool(11) is True
+        assert backend.routes_to_pool(None) is True
+
+    def test_pool_job_sizes(self, shared_registry: ToolRegistry) -> None:
+        backend = ExecutionBackend(CalculateUseCase(shared_registry), ExecutionConfig(backend="process", max_workers=2))
+        assert [backend.job_rows(rows) for rows in (1, 20, 10_000, None)] == [1, 3, MAX_JOB_ROWS, MAX_JOB_ROWS]
+
+    def test_inline_backend_never_pools(self, shared_registry: ToolRegistry) -> None:
+        backend = ExecutionBackend(CalculateUseCase(shared_registry), ExecutionConfig(backend="inline", inline_max_rows=0, max_queue_depth=1))
+        assert backend.routes_to_pool(None) is False
+
+    async def test_sheds_new_requests_when_pool_is_full(self, shared_registry: ToolRegistry) -> None:
+        use_case = BlockingUseCase(shared_registry)
+        backend = ExecutionBackend(use_case, ExecutionConfig(backend="thread", max_workers=1, inline_max_rows=0, max_queue_depth=1, retry_after=7))
+        try:
+            running = asyncio.ensure_future(backend.execute(REQUESTS[0], backend.routes_to_pool(1)))
+            await asyncio.to_thread(use_case.started.wait, 5)
+            assert backend.depth == 1
+
+            with pytest.raises(ExecutionOverloaded) as excinfo:
+                backend.routes_to_pool(1)
+            assert excinfo.value.retry_after == 7
+
+            use_case.release.set()
+            assert (await running).success
+            assert backend.depth == 0 and backend.routes_to_pool(1) is True
+        finally:
+            use_case.release.set()
+            backend.shutdown()
+
+
+class TestProcessBackend:
+    async def test_matches_inline_and_replays_usage(self, shared_registry: ToolRegistry) -> None:
+        logger = RecordingLogger()
+        backend = ExecutionBackend(CalculateUseCase(shared_registry), ExecutionConfig(backend="process", max_workers=1), usage_logger=logger)
+        try:
+            backend.start()
+            pooled = await backend.execute_many(REQUESTS)
+            single = await backend.execute(REQUESTS[1], backend.routes_to_pool(2))
+        finally:
+            backend.shutdown()
+
+        inline = [CalculateUseCase(shared_registry).execute(request) for request in REQUESTS]
+        assert summarize_responses(pooled) == summarize_responses(inline)
+        assert summarize_responses([single]) == summarize_responses(inline[1:2])
+        assert [call[0] for call in logger.calls] == ["qsofa_score", "ckd_epi_2021", "ckd_epi_2021", "not_a_tool", "ckd_epi_2021"]
+        assert logger.calls[2] == ("ckd_epi_2021", ("age",), False)
+
+    async def test_replaces_pool_broken_by_dying_worker(self, shared_registry: ToolRegistry) -> None:
+        backend = ExecutionBackend(CalculateUseCase(shared_registry), ExecutionConfig(backend="process", max_workers=1))
+        try:
+            backend.start()
+            pid = await asyncio.get_running_loop().run_in_executor(backend._pool._get_pool(), os.getpid)
+            os.kill(pid, signal.SIGKILL)
+            with pytest.raises(BrokenExecutor):
+                await backend.execute_many(REQUESTS[:1])
+            assert backend.depth == 0
+
+            recovered = await backend.execute_many(REQUESTS[:1])
+        finally:
+            backend.shutdown()
+        assert recovered[0].success
+
+
+class TestOverloadedEndpoints:
+    @pytest.mark.anyio
+    async def test_calculate_and_batch_return_503_with_retry_after(self, shared_registry: ToolRegistry, monkeypatch: pytest.MonkeyPatch) -> None:
+        use_case = BlockingUseCase(shared_registry)
+        backend = ExecutionBackend(use_case, ExecutionConfig(backend="thread", max_workers=1, inline_max_rows=0, max_queue_depth=1, retry_after=3))
+        monkeypatch.setattr(app.state, "execution_backend", backend, raising=False)
+
+        body = {"params": {"age": 65, "sex": "female", "serum_creatinine": 1.2}}
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            try:
+                first = asyncio.ensure_future(client.post("/api/v1/calculate/ckd_epi_2021", json=body))
+                await asyncio.to_thread(use_case.started.wait, 5)
+
+                shed = await client.post("/api/v1/calculate/ckd_epi_2021", json=body)
+                assert shed.status_code == 503
+                assert shed.headers["retry-after"] == "3"
+                batch = await client.post("/api/v1/calculate:batch", json=[{"tool_id": "ckd_epi_2021", "params": body["params"]}])
+                assert batch.status_code == 503
+
+                use_case.release.set()
+                assert (await first).json()["success"] is True
+                assert (await client.post("/api/v1/calculate/ckd_epi_2021", json=body)).status_code == 200
+            finally:
+                use_case.release.set()
+                backend.shutdown()
@@ -0,0 +1,170 @@
+"""
+Tests for BatchExecutor and the calculate_batch MCP tool
+
+Verifies deduplication, order preservation, progress throttling, that
+thread-pool execution keeps the event loop responsive, and that the process
+pool produces the same responses as inline execution and replays its usage
+events into the server's usage logger. Also checks that the MCP server shuts
+the pool down when it stops.
+"""
+
+import asyncio
+import time
+from typing import Any
+
+import pytest
+
+from src.application.use_cases import CalculateUseCase
+from src.domain.registry.tool_registry import ToolRegistry
+from src.infrastructure.mcp.batch_executor import BatchExecutor, batch_item_key
+from src.infrastructure.mcp.config import BatchConfig
+from tests.conftest import FakeContext, SlowUseCase, summarize_responses
+
+SEPSIS_ITEMS: list[tuple[str, dict[str, Any]]] = [
+    ("qsofa_score", {"respiratory_rate": 24, "systolic_bp": 95, "altered_mentation": True}),
+    ("ckd_epi_2021", {"age": 65, "sex": "female", "serum_creatinine": 1.2}),
+    ("qsofa_score", {"altered_mentation": True, "systolic_bp": 95, "respiratory_rate": 24}),
+    ("not_a_tool", {"x": 1}),
+]
+
+
+class TestBatchConfig:
+    def test_from_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("BATCH_EXECUTOR", "PROCESS")
+        monkeypatch.setenv("BATCH_MAX_WORKERS", "3")
+        monkeypatch.setenv("BATCH_PROGRESS_INTERVAL", "1.5")
+        config = BatchConfig.from_env()
+        assert (config.executor, config.max_workers, config.progress_interval) == ("process", 3, 1.5)
+
+    def test_rejects_invalid_values(self) -> None:
+        with pytest.raises(ValueError, match="BATCH_EXECUTOR"):
+            BatchConfig(executor="gpu")
+        with pytest.raises(ValueError, match="BATCH_MAX_WORKERS"):
+            BatchConfig(max_workers=0)
+
+
+class TestBatchExecutor:
+    def test_item_key_ignores_param_order(self) -> None:
+        assert batch_item_key("t", {"a": 1, "b": 2}) == batch_item_key("t", {"b": 2, "a": 1})
+        assert batch_item_key("t", {"a": 1}) != batch_item_key("u", {"a": 1})
+
+    async def test_dedupes_and_preserves_order(self, shared_registry: ToolRegistry) -> None:
+        use_case = SlowUseCase(shared_registry, delay=0.0)
+        executor = BatchExecutor(use_case, BatchConfig(executor="thread", max_workers=4))
+        try:
+            responses = await executor.run(SEPSIS_ITEMS)
+        finally:
+            executor.shutdown()
+
+        assert [r.tool_id for r in responses][1] == "ckd_epi_2021"
+        assert responses[0] is responses[2]
+        assert responses[0].success and not responses[3].success
+        assert sorted(use_case.calls) == ["ckd_epi_2021", "not_a_tool", "qsofa_score"]
+
+    async def test_thread_pool_matches_inline(self, shared_registry: ToolRegistry) -> None:
+        inline = BatchExecutor(CalculateUseCase(shared_registry), BatchConfig(executor="inline"))
+        threaded = BatchExecutor(CalculateUseCase(shared_registry), BatchConfig(executor="thread", max_workers=4))
+        try:
+            assert summarize_responses(await threaded.run(SEPSIS_ITEMS)) == summarize_responses(await inline.run(SEPSIS_ITEMS))
+        finally:
+            threaded.shutdown()
+
+    async def test_process_pool_matches_inline_and_replays_usage(self, shared_registry: ToolRegistry) -> None:
+        recorded: list[str] = []
+
+        class RecordingLogger:
+            def record_tool_call(self, tool_id: str, param_names: Any, **kwargs: Any) -> None:
+                recorded.append(tool_id)
+
+        inline = BatchExecutor(CalculateUseCase(shared_registry), BatchConfig(executor="inline"))
+        processes = BatchExecutor(CalculateUseCase(shared_registry), BatchConfig(executor="process", max_workers=2), usage_logger=RecordingLogger())
+        try:
+            assert summarize_responses(await processes.run(SEPSIS_ITEMS)) == summarize_responses(await inline.run(SEPSIS_ITEMS))
+        finally:
+            processes.shutdown()
+        assert sorted(recorded) == ["ckd_epi_2021", "not_a_tool", "qsofa_score"]
+
+    async def test_progress_is_throttled(self, shared_registry: ToolRegistry) -> None:
+        items = [("ckd_epi_2021", {"age": 40 + i, "sex": "male", "serum_creatinine": 1.0}) for i in range(20)]
+        reports: list[tuple[int, int]] = []
+
+        async def on_progress(completed: int, total: int) -> None:
+            reports.append((completed, total))
+
+        executor = BatchExecutor(CalculateUseCase(shared_registry), BatchConfig(executor="inline", progress_interval=3600))
+        await executor.run(items, on_progress=on_progress)
+        assert reports == [(20, 20)]
+
+        reports.clear()
+        executor = BatchExecutor(CalculateUseCase(shared_registry), BatchConfig(executor="inline", progress_interval=0))
+        await executor.run(items, on_progress=on_progress)
+        assert reports[-1] == (20, 20)
+        assert len(reports) == 21
+
+    async def test_thread_pool_runs_concurrently_and_keeps_loop_responsive(self, shared_registry: ToolRegistry) -> None:
+        items = [("ckd_epi_2021", {"age": 40 + i, "sex": "male", "serum_creatinine": 1.0}) for i in range(8)]
+        executor = BatchExecutor(SlowUseCase(shared_registry, delay=0.1), BatchConfig(executor="thread", max_workers=8))
+        ticks = 0
+
+        async def ticker() -> None:
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticker_task = asyncio.create_task(ticker())
+        try:
+            started = time.perf_counter()
+            responses = await executor.run(items)
+            elapsed = time.perf_counter() - started
+        finally:
+            ticker_task.cancel()
+            executor.shutdown()
+
+        assert all(r.success for r in responses)
+        assert elapsed < 0.6  # sequential would take >= 0.8s
+        assert ticks >= 3  # the event loop kept serving other work
+
+
+async def test_calculate_batch_tool_uses_executor(shared_registry: ToolRegistry) -> None:
+    from src.infrastructure.mcp.handlers.calculator_handler import CalculatorHandler
+
+    tools: dict[str, Any] = {}
+
+    class MockMCP:
+        def tool(self) -> Any:
+            def decorator(func: Any) -> Any:
+                tools[func.__name__] = func
+                return func
+
+            return decorator
+
+    handler = CalculatorHandler(MockMCP(), shared_registry, BatchConfig(executor="thread", max_workers=2))  # type: ignore[arg-type]
+    ctx = FakeContext()
+    calculations = [{"tool_id": tool_id, "params": params} for tool_id, params in SEPSIS_ITEMS]
+    try:
+        output = await tools["calculate_batch"](calculations, ctx)
+    finally:
+        handler._batch_executor.shutdown()
+
+    assert output["count"] == 4
+    assert [r["tool_id"] for r in output["results"]] == [tool_id for tool_id, _ in SEPSIS_ITEMS]
+    assert output["results"][0]["result"] == output["results"][2]["result"]
+    assert output["summary"] == {"tools_executed": [tool_id for tool_id, _ in SEPSIS_ITEMS], "successful": 3, "failed": 1}
+    assert ctx.progress[0][0] == 5 and ctx.progress[-1][0] == 100
+
+
+def test_server_run_shuts_down_batch_pool(monkeypatch: pytest.MonkeyPatch) -> None:
+    from src.infrastructure.mcp.server import MedicalCalculatorServer
+
+    server = MedicalCalculatorServer()
+    shutdowns: list[bool] = []
+    monkeypatch.setattr(server._calculator_handler._batch_executor, "shutdown", lambda: shutdowns.append(True))
+
+    def stop(**kwargs: Any) -> None:
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(server._mcp, "run", stop)
+    with pytest.raises(KeyboardInterrupt):
+        server.run(transport="stdio")
+    assert shutdowns == [True]
@@ -0,0 +1,224 @@
+"""
+Tests for cohort scoring (CohortScoringUseCase, score_file and `medcalc score`)
+
+Every scored cell must agree with CalculateUseCase on the same row: values
+and stages for successful rows, failure for failed rows. File round trips
+cover CSV, JSONL and Parquet (when pyarrow is installed), chunking and the
+process pool, which must produce output identical to a single process.
+"""
+
+import csv
+import json
+import random
+from importlib import import_module
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from src.application.dto import CalculateRequest
+from src.application.use_cases import CalculateUseCase, CohortScoringUseCase
+from src.domain.registry.tool_registry import ToolRegistry
+from src.infrastructure.cohort import open_reader, parse_text_value, score_file
+from src.infrastructure.cohort.cli import main as medcalc_main
+
+try:
+    pq: Any = import_module("pyarrow.parquet")
+except ImportError:  # pragma: no cover - optional dependency
+    pq = None
+
+TOOLS = ["ckd_epi_2021", "phq2", "qsofa_score"]
+HEADER = ["patient_id", "age", "sex", "creatinine", "interest_pleasure", "feeling_down", "respiratory_rate", "systolic_bp", "altered_mentation"]
+
+
+def _rows(count: int, seed: int = 0) -> list[dict[str, Any]]:
+    rng = random.Random(seed)
+    rows = []
+    for index in range(count):
+        rows.append(
+            {
+                "patient_id": f"p{index}",
+                "age": rng.choice([rng.randint(18, 95), rng.randint(18, 95), 5, None]),
+                "sex": rng.choice(["female", "male"]),
+                "creatinine": rng.choice([round(rng.uniform(0.4, 6.0), 2), 45.0, None]),
+                "interest_pleasure": rng.randint(0, 3),
+                "feeling_down": rng.choice([rng.randint(0, 3), 7, None]),
+                "respiratory_rate": rng.randint(8, 40),
+                "systolic_bp": rng.choice([rng.randint(75, 180), 50, None]),
+                "altered_mentation": rng.random() < 0.3,
+            }
+        )
+    return rows
+
+
+def _write_csv(path: Path, rows: list[dict[str, Any]]) -> None:
+    with open(path, "w", newline="") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(HEADER)
+        for row in rows:
+            writer.writerow(["" if row[name] is None else str(row[name]).lower() if isinstance(row[name], bool) else row[name] for name in HEADER])
+
+
+def _read_csv(path: Path) -> list[dict[str, str]]:
+    with open(path, newline="") as handle:
+        return list(csv.DictReader(handle))
+
+
+class TestCohortScoringUseCase:
+    def test_binds_columns_once_with_param_matcher(self, shared_registry: ToolRegistry) -> None:
+        use_case = CohortScoringUseCase(shared_registry, ["ckd_epi_2021", "qsofa"], HEADER)
+
+        bindings = {binding.tool_id: binding for binding in use_case.bindings}
+        assert bindings["ckd_epi_2021"].columns == {"age": "age", "sex": "sex", "serum_creatinine": "creatinine"}
+        assert bindings["ckd_epi_2021"].engine == "renal_batch"
+        assert bindings["qsofa_score"].requested == "qsofa" and bindings["qsofa_score"].engine == "scalar"
+        assert "patient_id" not in use_case.used_columns
+        assert use_case.output_columns[:4] == ("ckd_epi_2021_value", "ckd_epi_2021_stage", "ckd_epi_2021_warnings", "ckd_epi_2021_error")
+
+    def test_explicit_map_and_binding_errors(self, shared_registry: ToolRegistry) -> None:
+        use_case = CohortScoringUseCase(shared_registry, ["ckd_epi_2021"], ["years", "sex", "scr"], column_map={"ckd_epi_2021.age": "years"})
+        assert use_case.bindings[0].columns == {"age": "years", "sex": "sex", "serum_creatinine": "scr"}
+
+        with pytest.raises(ValueError, match="no column for required parameters: age"):
+            CohortScoringUseCase(shared_registry, ["ckd_epi_2021"], ["sex", "scr"])
+        with pytest.raises(ValueError, match="not found"):
+            CohortScoringUseCase(shared_registry, ["no_such_tool"], HEADER)
+        with pytest.raises(ValueError, match="Mapped columns not in input"):
+            CohortScoringUseCase(shared_registry, ["ckd_epi_2021"], HEADER, column_map={"age": "missing"})
+
+    def test_rejects_map_keys_matching_no_parameter(self, shared_registry: ToolRegistry) -> None:
+        with pytest.raises(ValueError, match="ckd_epi_2021: column_map key 'ckd_epi_2021.years' names no parameter"):
+            CohortScoringUseCase(shared_registry, ["ckd_epi_2021"], HEADER, column_map={"ckd_epi_2021.years": "age"})
+        with pytest.raises(ValueError, match="match no parameter of the selected tools: frequency, phq2.interest_pleasure"):
+            CohortScoringUseCase(shared_registry, ["ckd_epi_2021"], HEADER, column_map={"frequency": "age", "phq2.interest_pleasure": "age"})
+
+        items = ["drinking_frequency", "typical_quantity", "six_or_more_frequency"]
+        column_map = {f"audit_c.{item}": column for item, column in zip(items, ["q1", "q2", "q3"])}
+        use_case = CohortScoringUseCase(shared_registry, ["audit_c"], ["patient_id", "q1", "q2", "q3"], column_map=column_map)
+        assert use_case.bindings[0].columns == dict(zip(items, ["q1", "q2", "q3"]))
+
+    def test_questionnaire_items_are_required(self, shared_registry: ToolRegistry) -> None:
+        with pytest.raises(ValueError, match="phq2: no column for required parameters: interest_pleasure, feeling_down"):
+            CohortScoringUseCase(shared_registry, ["phq2"], ["patient_id", "age"])
+        with pytest.raises(ValueError, match="no column for required parameters: feeling_down"):
+            CohortScoringUseCase(shared_registry, ["phq2"], ["patient_id", "interest_pleasure"])
+
+    def test_scores_match_calculate_use_case(self, shared_registry: ToolRegistry) -> None:
+        rows = _rows(300)
+        use_case = CohortScoringUseCase(shared_registry, TOOLS, HEADER)
+        scored = use_case.score({name: [row[name] for row in rows] for name in HEADER})
+        reference = CalculateUseCase(shared_registry)
+
+        for binding in use_case.bindings:
+            for index, row in enumerate(rows):
+                params = {param: row[column] for param, column in binding.columns.items() if row[column] is not None}
+                expected = reference.execute(CalculateRequest(tool_id=binding.tool_id, params=params))
+                error = scored[f"{binding.tool_id}_error"][index]
+                if not expected.success:
+                    assert error is not None, (binding.tool_id, row)
+                    continue
+                assert error is None, (binding.tool_id, row, error)
+                assert scored[f"{binding.tool_id}_value"][index] == expected.result
+                assert expected.interpretation is not None
+                assert scored[f"{binding.tool_id}_stage"][index] == expected.interpretation.details.get("stage")
+
+    def test_boundary_warnings_and_missing_values(self, shared_registry: ToolRegistry) -> None:
+        use_case = CohortScoringUseCase(shared_registry, ["ckd_epi_2021", "qsofa_score"], HEADER)
+        chunk = {name: [row[name] for row in _rows(1)] for name in HEADER}
+        chunk.update(creatinine=[45.0], systolic_bp=[None], respiratory_rate=[None])
+
+        scored = use_case.score(chunk)
+        assert scored["ckd_epi_2021_warnings"][0] is not None and scored["ckd_epi_2021_warnings"][0].startswith("⚠️ CRITICAL")
+        assert scored["ckd_epi_2021_value"] == [None]
+        assert scored["qsofa_score_error"] == ["Missing required parameters: respiratory_rate, systolic_bp"]
+
+
+class TestScoreFile:
+    def test_csv_round_trip_in_chunks_matches_in_memory_scoring(self, tmp_path: Path, shared_registry: ToolRegistry) -> None:
+        rows = _rows(250, seed=1)
+        _write_csv(tmp_path / "in.csv", rows)
+
+        bound: list[tuple[dict[str, dict[str, str]], bool]] = []
+        summary = score_file(
+            tmp_path / "in.csv",
+            tmp_path / "out.csv",
+            TOOLS,
+            chunk_size=64,
+            keep_columns=["patient_id"],
+            registry=shared_registry,
+            on_bound=lambda bindings: bound.append((bindings, (tmp_path / "out.csv").exists())),
+        )
+        assert (summary.rows, summary.chunks) == (250, 4)
+        assert bound == [(summary.bindings, False)]
+
+        output = _read_csv(tmp_path / "out.csv")
+        use_case = CohortScoringUseCase(shared_registry, TOOLS, HEADER)
+        expected = use_case.score({name: [parse_text_value(row[name]) for row in _read_csv(tmp_path / "in.csv")] for name in HEADER})
+        assert list(output[0]) == ["patient_id", *use_case.output_columns]
+        for column, values in expected.items():
+            assert [row[column] for row in output] == ["" if value is None else str(value) for value in values], column
+        assert summary.errors == {tool: sum(1 for error in expected[f"{tool}_error"] if error is not None) for tool in TOOLS}
+
+    def test_process_pool_output_identical(self, tmp_path: Path, shared_registry: ToolRegistry) -> None:
+        _write_csv(tmp_path / "in.csv", _rows(400, seed=2))
+
+        score_file(tmp_path / "in.csv", tmp_path / "serial.jsonl", TOOLS, chunk_size=50, registry=shared_registry)
+        summary = score_file(tmp_path / "in.csv", tmp_path / "parallel.jsonl", TOOLS, chunk_size=50, workers=2, registry=shared_registry)
+
+        assert summary.rows == 400
+        assert (tmp_path / "parallel.jsonl").read_bytes() == (tmp_path / "serial.jsonl").read_bytes()
+
+    def test_jsonl_input_keeps_native_types(self, tmp_path: Path, shared_registry: ToolRegistry) -> None:
+        rows = _rows(20, seed=3)
+        (tmp_path / "in.jsonl").write_text("".join(json.dumps(row) + "\n" for row in rows))
+
+        score_file(tmp_path / "in.jsonl", tmp_path / "out.jsonl", ["phq2"], registry=shared_registry)
+        output = [json.loads(line) for line in (tmp_path / "out.jsonl").read_text().splitlines()]
+        assert [row["patient_id"] for row in output] == [row["patient_id"] for row in rows]
+        valid = [row for row in output if row["phq2_error"] is None]
+        assert valid and all(row["phq2_value"] == row["interest_pleasure"] + row["feeling_down"] for row in valid)
+
+    @pytest.mark.skipif(pq is None, reason="pyarrow not installed")
+    def test_parquet_round_trip(self, tmp_path: Path, shared_registry: ToolRegistry) -> None:
+        _write_csv(tmp_path / "in.csv", _rows(120, seed=4))
+        score_file(tmp_path / "in.csv", tmp_path / "scored.parquet", TOOLS, chunk_size=50, registry=shared_registry)
+        table = pq.read_table(tmp_path / "scored.parquet")
+        assert table.num_rows == 120
+        assert str(table.schema.field("ckd_epi_2021_value").type) == "double"
+
+        score_file(tmp_path / "scored.parquet", tmp_path / "again.csv", ["ckd_epi_2021"], keep_columns=["patient_id"], chunk_size=32, registry=shared_registry)
+        again = _read_csv(tmp_path / "again.csv")
+        assert [row["ckd_epi_2021_value"] for row in again] == ["" if value is None else str(value) for value in table.column("ckd_epi_2021_value").to_pylist()]
+
+    def test_rejects_clashing_and_unknown_columns(self, tmp_path: Path, shared_registry: ToolRegistry) -> None:
+        _write_csv(tmp_path / "in.csv", _rows(3))
+        with pytest.raises(ValueError, match="not in input"):
+            score_file(tmp_path / "in.csv", tmp_path / "out.csv", ["phq2"], keep_columns=["nope"], registry=shared_registry)
+        with pytest.raises(ValueError, match="Cannot infer the format"):
+            score_file(tmp_path / "in.csv", tmp_path / "out.txt", ["phq2"], registry=shared_registry)
+
+    def test_csv_reader_parses_only_on_request(self, tmp_path: Path) -> None:
+        _write_csv(tmp_path / "in.csv", _rows(5))
+        with open_reader(tmp_path / "in.csv", chunk_size=2) as reader:
+            chunks = list(reader)
+        assert reader.text_cells and [len(chunk["age"]) for chunk in chunks] == [2, 2, 1]
+        assert [parse_text_value(text) for text in ("", "3", "1.5", "TRUE", "no", "female", "nan")] == [None, 3, 1.5, True, False, "female", None]
+
+
+def test_medcalc_score_cli(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    _write_csv(tmp_path / "in.csv", _rows(10))
+
+    assert medcalc_main(["score", str(tmp_path / "in.csv"), str(tmp_path / "out.csv"), "-t", "phq2", "--keep", "patient_id", "--json"]) == 0
+    assert json.loads(capsys.readouterr().out)["rows"] == 10
+    assert list(_read_csv(tmp_path / "out.csv")[0]) == ["patient_id", "phq2_value", "phq2_stage", "phq2_warnings", "phq2_error"]
+
+    assert medcalc_main(["score", str(tmp_path / "in.csv"), str(tmp_path / "out.csv"), "-t", "phq2"]) == 0
+    assert capsys.readouterr().err.splitlines()[0] == "phq2: interest_pleasure, feeling_down"
+
+    assert medcalc_main(["score", str(tmp_path / "in.csv"), str(tmp_path / "out.csv"), "-t", "sofa_score"]) == 2
+    assert "no column for required parameters" in capsys.readouterr().err
+
+    (tmp_path / "items_missing.csv").write_text("patient_id,age\np0,40\n")
+    assert medcalc_main(["score", str(tmp_path / "items_missing.csv"), str(tmp_path / "phq2.csv"), "-t", "phq2"]) == 2
+    assert "interest_pleasure, feeling_down" in capsys.readouterr().err
+    assert not (tmp_path / "phq2.csv").exists()
@@ -0,0 +1,124 @@
+"""
+Tests for the discovery index snapshot
+
+A registry whose discovery indexes come from the snapshot must answer exactly
+like one that built them; a missing, stale, or corrupt snapshot must be
+rebuilt rather than served.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from src.domain.registry.auto_discovery import AutoDiscoveryEngine
+from src.domain.registry.discovery_snapshot import (
+    HEADER,
+    SNAPSHOT_ENV_VAR,
+    compute_snapshot_key,
+    load_discovery_snapshot,
+    read_snapshot_key,
+    write_discovery_snapshot,
+)
+from src.domain.registry.tool_registry import ToolRegistry
+from src.domain.services.base import BaseCalculator
+from src.domain.services.calculators import CALCULATORS
+
+QUERIES = ["sepsis", "kidney", "creatinine", "heart failure", "gcs", "xyz-not-a-tool"]
+
+
+@pytest.fixture(scope="module")
+def calculators() -> list[BaseCalculator]:
+    return [calculator_cls() for calculator_cls in CALCULATORS]
+
+
+@pytest.fixture
+def snapshot_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    path = tmp_path / "discovery_snapshot.bin"
+    monkeypatch.setenv(SNAPSHOT_ENV_VAR, str(path))
+    return path
+
+
+def make_registry(calculators: list[BaseCalculator]) -> ToolRegistry:
+    registry = ToolRegistry()
+    for calculator in calculators:
+        registry.register(calculator)
+    return registry
+
+
+def forbid_rebuild(monkeypatch: pytest.MonkeyPatch) -> None:
+    def fail(self: AutoDiscoveryEngine, registry: ToolRegistry) -> None:
+        raise AssertionError("discovery indexes were rebuilt instead of loaded from the snapshot")
+
+    monkeypatch.setattr(AutoDiscoveryEngine, "build_from_registry", fail)
+
+
+class TestSnapshotRegistry:
+    def test_second_registry_loads_identical_indexes(self, calculators: list[BaseCalculator], snapshot_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        built = make_registry(calculators)
+        built.build_discovery_indexes()
+        assert not snapshot_path.exists()  # the runtime never writes snapshots
+        write_discovery_snapshot(built.export_discovery_snapshot(), snapshot_path)
+        assert read_snapshot_key(snapshot_path) == compute_snapshot_key(built)
+
+        forbid_rebuild(monkeypatch)
+        loaded = make_registry(calculators)
+        loaded.build_discovery_indexes()
+
+        for query in QUERIES:
+            assert [m.tool_id for m in loaded.search(query)] == [m.tool_id for m in built.search(query)], query
+            assert [m.tool_id for m in loaded.smart_search(query)] == [m.tool_id for m in built.smart_search(query)], query
+        assert loaded.get_related_tools("sofa_score") == built.get_related_tools("sofa_score")
+        assert loaded.get_discovery_statistics() == built.get_discovery_statistics()
+
+    def test_stale_snapshot_is_rebuilt_in_memory(self, calculators: list[BaseCalculator], snapshot_path: Path) -> None:
+        partial = make_registry(calculators[:10])
+        write_discovery_snapshot(partial.export_discovery_snapshot(), snapshot_path)
+        stale = snapshot_path.read_bytes()
+
+        full = make_registry(calculators)
+        full.build_discovery_indexes()
+        assert full.get_discovery_statistics()["discovery_engine"]["total_tools"] == len(calculators)
+        assert snapshot_path.read_bytes() == stale
+
+    def test_missing_snapshot_is_not_written(self, calculators: list[BaseCalculator], tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delenv(SNAPSHOT_ENV_VAR)
+        monkeypatch.setattr("src.domain.registry.discovery_snapshot.DEFAULT_SNAPSHOT_PATH", tmp_path / "build" / "discovery_snapshot.bin")
+        registry = make_registry(calculators[:10])
+        registry.build_discovery_indexes()
+        assert registry.get_discovery_statistics()["discovery_engine"]["total_tools"] == 10
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestSnapshotFile:
+    def test_key_tracks_catalog(self, calculators: list[BaseCalculator]) -> None:
+        key = compute_snapshot_key(make_registry(calculators))
+        assert compute_snapshot_key(make_registry(calculators)) == key
+        assert compute_snapshot_key(make_registry(calculators[:-1])) != key
+
+    def test_invalid_snapshots_are_ignored(self, calculators: list[BaseCalculator], tmp_path: Path) -> None:
+        registry = make_registry(calculators[:10])
+        snapshot = registry.export_discovery_snapshot()
+        path = write_discovery_snapshot(snapshot, tmp_path / "snapshot.bin")
+        assert load_discovery_snapshot(path, snapshot.key) is not None
+
+        assert load_discovery_snapshot(tmp_path / "missing.bin", snapshot.key) is None
+        assert load_discovery_snapshot(path, "0" * 64) is None
+
+        data = path.read_bytes()
+        truncated = tmp_path / "truncated.bin"
+        truncated.write_bytes(data[:-100])
+        assert load_discovery_snapshot(truncated, snapshot.key) is None
+
+        empty = tmp_path / "empty.bin"
+        empty.write_bytes(b"")
+        assert load_discovery_snapshot(empty, snapshot.key) is None
+        assert read_snapshot_key(empty) is None
+
+        wrong_magic = tmp_path / "magic.bin"
+        wrong_magic.write_bytes(b"XXXX" + data[4:])
+        assert load_discovery_snapshot(wrong_magic, snapshot.key) is None
+        assert read_snapshot_key(wrong_magic) is None
+
+        corrupt = tmp_path / "corrupt.bin"
+        corrupt.write_bytes(data[: HEADER.size] + b"\x00" * (len(data) - HEADER.size))
+        assert load_discovery_snapshot(corrupt, snapshot.key) is None
@@ -0,0 +1,120 @@
+"""
+Tests for the log-linear latency histograms
+
+Bucket boundaries must be contiguous, percentiles must stay within the
+histogram's relative resolution, histograms must merge exactly, and rolling
+windows must only include the slices they cover.
+"""
+
+import math
+import random
+
+import pytest
+
+from src.shared.latency_histogram import (
+    BUCKET_COUNT,
+    MAX_VALUE_NS,
+    SLICE_SECONDS,
+    LatencyHistogram,
+    RollingLatencyHistogram,
+    bucket_index,
+    bucket_upper_bound,
+    window_seconds,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def exact_percentile(values: list[int], percentile: float) -> int:
+    ordered = sorted(values)
+    return ordered[max(1, math.ceil(percentile / 100 * len(ordered))) - 1]
+
+
+class TestBuckets:
+    def test_buckets_are_contiguous(self) -> None:
+        rng = random.Random(7)
+        samples = list(range(5000)) + [rng.randrange(MAX_VALUE_NS) for _ in range(20000)]
+        for value in samples:
+            index = bucket_index(value)
+            assert 0 <= index < BUCKET_COUNT
+            assert bucket_upper_bound(index) >= value
+            assert index == 0 or bucket_upper_bound(index - 1) < value
+
+    def test_out_of_range_values_are_clamped(self) -> None:
+        assert bucket_index(-5) == 0
+        assert bucket_index(MAX_VALUE_NS * 10) == BUCKET_COUNT - 1
+
+
+class TestLatencyHistogram:
+    def test_percentiles_within_resolution(self) -> None:
+        rng = random.Random(11)
+        values = [int(rng.lognormvariate(13, 1)) for _ in range(20000)]
+        histogram = LatencyHistogram()
+        for value in values:
+            histogram.record(value)
+
+        for percentile in (50.0, 90.0, 99.0, 99.9):
+            exact = exact_percentile(values, percentile)
+            assert histogram.percentiles([percentile])[0] == pytest.approx(exact, rel=0.016)
+        assert histogram.percentiles([100.0])[0] == max(values)
+
+    def test_merge_equals_combined_recording(self) -> None:
+        rng = random.Random(3)
+        left, right, combined = LatencyHistogram(), LatencyHistogram(), LatencyHistogram()
+        for i in range(2000):
+            value = rng.randrange(1, 50_000_000)
+            (left if i % 2 else right).record(value)
+            combined.record(value)
+
+        merged = LatencyHistogram.merged([left, right])
+        assert merged.summary() == combined.summary()
+
+    def test_summary(self) -> None:
+        assert LatencyHistogram().summary() == {"count": 0}
+
+        histogram = LatencyHistogram()
+        for value_ms in (1, 2, 3, 4):
+            histogram.record(value_ms * 1_000_000)
+        summary = histogram.summary()
+        assert summary["count"] == 4
+        assert (summary["min_ms"], summary["max_ms"], summary["mean_ms"]) == (1.0, 4.0, 2.5)
+        assert summary["p50_ms"] == pytest.approx(2.0, rel=0.016)
+        assert summary["p999_ms"] == 4.0
+
+
+class TestRollingLatencyHistogram:
+    def test_windows_only_include_recent_slices(self) -> None:
+        clock = FakeClock()
+        rolling = RollingLatencyHistogram(clock=clock)
+        rolling.record(1_000)
+        clock.now += 120
+        rolling.record(2_000)
+        clock.now += 2 * SLICE_SECONDS
+        rolling.record(3_000)
+
+        assert rolling.window(window_seconds("1m")).count == 2
+        assert rolling.window(window_seconds("5m")).count == 3
+        assert rolling.window(window_seconds("all")).count == 3
+
+        clock.now += 3600
+        assert rolling.window(window_seconds("1h")).count == 0
+        assert rolling.all_time.count == 3
+
+    def test_slots_are_reused_after_the_ring_wraps(self) -> None:
+        clock = FakeClock()
+        rolling = RollingLatencyHistogram(max_window_seconds=60, clock=clock)
+        for _ in range(100):
+            rolling.record(1_000)
+            clock.now += SLICE_SECONDS
+        assert rolling.window(60).count == 5
+        assert rolling.all_time.count == 100
+
+    def test_unknown_window(self) -> None:
+        with pytest.raises(ValueError, match="Unknown latency window"):
+            window_seconds("2d")
@@ -6,6 +6,8 @@ Tests for main entry point functions and CLI argument parsing.
 
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 
 class TestCreateServer:
     """Tests for create_server function"""
@@ -90,6 +92,29 @@ class TestArgumentParsing:
                     main()
                     mock_server.run.assert_called_once_with(transport="http")
 
+    def test_http_mode_with_workers(self) -> None:
+        """Test --workers is passed through in HTTP mode"""
+        from src.main import main
+
+        with patch("sys.argv", ["main.py", "--mode", "http", "--workers", "4"]):
+            with patch("src.main.create_server") as mock_create:
+                mock_server = MagicMock()
+                mock_create.return_value = mock_server
+                with patch("src.main.logger"):
+                    main()
+                    mock_server.run.assert_called_once_with(transport="http", workers=4)
+
+    def test_workers_rejected_outside_http_mode(self) -> None:
+        """Test --workers > 1 is refused for stdio and SSE"""
+        from src.main import main
+
+        for mode in ("stdio", "sse"):
+            with patch("sys.argv", ["main.py", "--mode", mode, "--workers", "2"]):
+                with patch("src.main.create_server") as mock_create:
+                    with pytest.raises(SystemExit):
+                        main()
+                    mock_create.assert_not_called()
+
     def test_custom_host(self) -> None:
         """Test custom host parameter"""
         from src.main import main
@@ -302,3 +302,32 @@ class TestResourceContent:
 
         # Should have numbered references
         assert "## Reference 1" in result
+
+
+class TestMonitoringResourceHandler:
+    """Tests for MonitoringResourceHandler"""
+
+    def test_latency_resources(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        import json
+
+        from src.infrastructure.logging import ToolUsageLogger
+        from src.infrastructure.mcp.resources.monitoring_resources import MonitoringResourceHandler
+
+        monkeypatch.setenv("TOOL_USAGE_LOGGING_ENABLED", "true")
+        ToolUsageLogger.reset_instance()
+        try:
+            usage_logger = ToolUsageLogger.get_instance()
+            usage_logger.record_tool_call("gcs", ["eye"], success=True, duration_ms=1.5)
+
+            mcp = MagicMock()
+            resources: dict[str, Any] = {}
+            mcp.resource = lambda uri: lambda func: resources.setdefault(uri, func)
+            MonitoringResourceHandler(mcp, usage_logger)
+
+            assert set(resources) == {"stats://latency", "stats://latency/{window}"}
+            snapshot = json.loads(resources["stats://latency"]())
+            assert snapshot["windows"]["all"]["tools"]["gcs"]["count"] == 1
+            assert list(json.loads(resources["stats://latency/{window}"]("5m"))["windows"]) == ["5m"]
+            assert "error" in json.loads(resources["stats://latency/{window}"]("2d"))
+        finally:
+            ToolUsageLogger.reset_instance()
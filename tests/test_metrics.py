@@ -0,0 +1,142 @@
+"""
+Tests for the Prometheus /metrics endpoints
+
+Both servers must serve text exposition with request counters, latency
+histograms, in-flight gauges, rate-limiter rejections and event-loop lag,
+labelled by route template, MCP tool and tool_id.
+"""
+
+import asyncio
+from collections.abc import Iterator
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from mcp.server.fastmcp.exceptions import ToolError
+from starlette.testclient import TestClient
+
+from src.infrastructure.mcp.config import McpServerConfig
+from src.infrastructure.mcp.server import MedicalCalculatorServer
+from src.infrastructure.metrics import MetricsCollector, get_metrics, reset_metrics
+from src.infrastructure.security import RateLimiter
+from src.shared.latency_histogram import LatencyHistogram
+from src.shared.prometheus_format import PROMETHEUS_CONTENT_TYPE, format_prometheus_histogram, format_prometheus_samples
+
+
+@pytest.fixture(autouse=True)
+def fresh_metrics(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    monkeypatch.setenv("METRICS_EVENT_LOOP_LAG_INTERVAL", "0")
+    reset_metrics()
+    yield
+    reset_metrics()
+
+
+class TestPrometheusFormat:
+    def test_cumulative_buckets(self) -> None:
+        histogram = LatencyHistogram()
+        for value_ns in (50_000, 1_000_000, 3_000_000, 20_000_000_000):
+            histogram.record(value_ns)
+        assert histogram.cumulative_counts([100_000, 1_000_000, 5_000_000]) == [1, 2, 3]
+
+        lines = format_prometheus_histogram("latency_seconds", "Latency.", [({"tool_id": 'a"b'}, histogram)], buckets_seconds=(0.001, 0.01))
+        assert lines == [
+            "# HELP latency_seconds Latency.",
+            "# TYPE latency_seconds histogram",
+            'latency_seconds_bucket{tool_id="a\\"b",le="0.001"} 2',
+            'latency_seconds_bucket{tool_id="a\\"b",le="0.01"} 3',
+            'latency_seconds_bucket{tool_id="a\\"b",le="+Inf"} 4',
+            'latency_seconds_sum{tool_id="a\\"b"} 20.00405',
+            'latency_seconds_count{tool_id="a\\"b"} 4',
+        ]
+
+    def test_samples(self) -> None:
+        assert format_prometheus_samples("up", "gauge", "Up.", [({}, 1), ({"x": "y"}, 0.5)]) == ["# HELP up Up.", "# TYPE up gauge", "up 1", 'up{x="y"} 0.5']
+
+
+class TestMetricsCollector:
+    def test_render_after_opportunistic_drain(self) -> None:
+        collector = MetricsCollector(drain_threshold=3, lag_interval=0)
+        collector.observe_http("GET", "/health", 200, 1_000_000)
+        collector.observe_http("GET", "/health", 200, 2_000_000)
+        assert len(collector._pending) == 2
+        collector.observe_mcp_tool("calculate", False, 500_000)
+        assert len(collector._pending) == 0
+        collector.count_rate_limit_rejection()
+        collector.observe_event_loop_lag(3_000_000)
+
+        lines = collector.render().splitlines()
+        assert 'medcalc_http_requests_total{method="GET",route="/health",status="200"} 2' in lines
+        assert 'medcalc_http_request_duration_seconds_count{method="GET",route="/health"} 2' in lines
+        assert 'medcalc_mcp_tool_calls_total{tool="calculate",outcome="error"} 1' in lines
+        assert "medcalc_rate_limit_rejections_total 1" in lines
+        assert 'medcalc_event_loop_lag_seconds_bucket{le="0.005"} 1' in lines
+        assert "medcalc_event_loop_lag_last_seconds 0.003" in lines
+        assert 'medcalc_requests_in_flight{surface="http"} 0' in lines
+
+    async def test_event_loop_lag_monitor(self) -> None:
+        collector = MetricsCollector(lag_interval=0.01)
+        collector.ensure_lag_monitor()
+        collector.ensure_lag_monitor()
+        await asyncio.sleep(0.05)
+        assert collector._lag_task is not None
+        collector._lag_task.cancel()
+        counts = [line for line in collector.render().splitlines() if line.startswith("medcalc_event_loop_lag_seconds_count")]
+        assert counts and int(counts[0].split()[-1]) >= 2
+
+    def test_rate_limiter_rejections_are_counted(self) -> None:
+        limiter = RateLimiter(requests_per_minute=60, burst=1)
+        assert limiter.is_allowed("client")
+        assert not limiter.is_allowed("client")
+        assert "medcalc_rate_limit_rejections_total 1" in get_metrics().render().splitlines()
+
+
+class TestApiMetrics:
+    async def test_routes_are_labelled_by_template(self) -> None:
+        from src.infrastructure.api.server import app
+
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            assert (await client.get("/api/v1/calculators/sofa_score")).status_code == 200
+            assert (await client.get("/no/such/route")).status_code == 404
+            await client.post("/api/v1/calculate/ckd_epi_2021", json={"params": {"serum_creatinine": 1.2, "age": 65, "sex": "female"}})
+            response = await client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == PROMETHEUS_CONTENT_TYPE
+        lines = response.text.splitlines()
+        assert 'medcalc_http_requests_total{method="GET",route="/api/v1/calculators/{tool_id}",status="200"} 1' in lines
+        assert any(line.startswith('medcalc_http_requests_total{method="GET",route="unmatched",status="404"}') for line in lines)
+        # Per-tool_id series are rendered by ToolUsageLogger (see test_tool_usage_logger.py)
+        assert "# TYPE medcalc_tool_calls_total counter" in lines
+        assert "# TYPE medcalc_tool_call_duration_seconds histogram" in lines
+        # The scrape itself is still in flight while rendering
+        assert 'medcalc_requests_in_flight{surface="http"} 1' in lines
+
+
+class TestMcpMetrics:
+    @pytest.fixture
+    def server(self) -> MedicalCalculatorServer:
+        return MedicalCalculatorServer(config=McpServerConfig(host="0.0.0.0", port=8891))
+
+    async def test_tool_calls_are_counted(self, server: MedicalCalculatorServer) -> None:
+        await server.mcp.call_tool("discover", {"by": "keyword", "value": "sepsis"})
+        await server.mcp.call_tool("find_tools_by_params", {"params": ["creatinine"]})
+        with pytest.raises(ToolError):
+            await server.mcp.call_tool("no_such_tool", {})
+
+        lines = get_metrics().render().splitlines()
+        assert 'medcalc_mcp_tool_calls_total{tool="discover",outcome="success"} 1' in lines
+        assert 'medcalc_mcp_tool_calls_total{tool="find_tools_by_params",outcome="success"} 1' in lines
+        assert 'medcalc_mcp_tool_calls_total{tool="unknown",outcome="error"} 1' in lines
+        assert 'medcalc_mcp_tool_duration_seconds_count{tool="discover"} 1' in lines
+
+    def test_metrics_route(self, server: MedicalCalculatorServer) -> None:
+        with TestClient(server.mcp.sse_app()) as client:
+            response = client.get("/metrics")
+        assert response.status_code == 200
+        assert response.headers["content-type"] == PROMETHEUS_CONTENT_TYPE
+        assert "# TYPE medcalc_mcp_tool_calls_total counter" in response.text
+        assert "# TYPE medcalc_event_loop_lag_seconds histogram" in response.text
+
+    def test_disabled_metrics(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("METRICS_ENABLED", "false")
+        server = MedicalCalculatorServer(config=McpServerConfig(host="0.0.0.0", port=8892))
+        assert "/metrics" not in [getattr(route, "path", None) for route in server.mcp.sse_app().routes]
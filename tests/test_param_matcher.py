@@ -9,6 +9,7 @@ Tests the intelligent parameter matching functionality:
 - Fuzzy match
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, cast
 
 import pytest
@@ -19,8 +20,15 @@ from src.domain.services.param_matcher import (
     UNIT_SUFFIXES,
     ParamMatcher,
     ParamMatchResult,
+    _learned_candidates,
+    canonical_param_name,
+    compile_calculate_plan,
+    convert_unit,
+    expected_unit,
     generate_param_template,
+    get_calculate_plan,
     get_param_matcher,
+    param_unit,
 )
 
 # =============================================================================
@@ -116,6 +124,41 @@ class TestUnitSuffixes:
         assert "_mg_kg" in UNIT_SUFFIXES
 
 
+class TestCanonicalParamName:
+    """Test canonical_param_name (exact, alias and unit-suffix matching only)."""
+
+    def test_aliases_and_units_share_a_name(self) -> None:
+        assert canonical_param_name("creatinine") == "serum_creatinine"
+        assert canonical_param_name("Serum-Creatinine_mg_dl") == "serum_creatinine"
+        assert canonical_param_name("mean_arterial_pressure") == "map_value"
+        assert canonical_param_name("gcs") == canonical_param_name("gcs_score") == "gcs_score"
+        assert canonical_param_name("weight_kg") == "weight"
+
+    def test_no_partial_matching(self) -> None:
+        assert canonical_param_name("age_group") != canonical_param_name("age")
+        assert canonical_param_name("urine_sodium") != canonical_param_name("sodium")
+
+
+class TestParamUnits:
+    """Test param_unit / expected_unit / convert_unit."""
+
+    def test_stated_and_expected_units(self) -> None:
+        assert param_unit("height_m") == "m" and param_unit("Height_CM") == "cm"
+        assert param_unit("glucose_mmol_l") == "mmol/L"
+        assert param_unit("gcs_score") is None and param_unit("glucose") is None
+        assert expected_unit("glucose") == "mg/dL"
+        assert expected_unit("height") == expected_unit("height_cm") == "cm"
+
+    def test_conversion(self) -> None:
+        assert convert_unit(1.75, "m", "cm") == 175.0
+        assert convert_unit(69, "in", "cm") == 175.26
+        assert convert_unit(110, None, "mg/dL") == 110
+        with pytest.raises(ValueError, match="cannot convert"):
+            convert_unit(5.5, "mmol/L", "mg/dL")
+        with pytest.raises(ValueError, match="cannot convert"):
+            convert_unit(40, "%", None)
+
+
 class TestParamMatcher:
     """Test ParamMatcher class."""
 
@@ -441,3 +484,72 @@ class TestAliasMatching:
         assert result.matched_params.get("respiratory_rate") == 18
         assert result.matched_params.get("heart_rate") == 80
         assert result.matched_params.get("systolic_bp") == 120
+
+
+class TestCalculatePlan:
+    """Test compiled calculate plans."""
+
+    def test_plan_compiled_once_per_calculator(self) -> None:
+        calculator = cast(BaseCalculator, MockCKDCalculator())
+        plan = get_calculate_plan(calculator)
+
+        assert get_calculate_plan(calculator) is plan
+        assert plan.expected_params == ("serum_creatinine", "age", "sex", "is_black")
+        assert plan.required_params == ("serum_creatinine", "age", "sex")
+
+    def test_alias_table_prepopulated(self) -> None:
+        plan = compile_calculate_plan(cast(BaseCalculator, MockCKDCalculator()))
+
+        assert plan.alias_table["cr"][0] == "serum_creatinine"
+        assert plan.alias_table["patient_age"][0] == "age"
+
+    def test_unit_suffixed_names_memoized_outside_the_plan(self) -> None:
+        plan = compile_calculate_plan(cast(BaseCalculator, MockCKDCalculator()))
+        compiled = dict(plan.alias_table)
+
+        hits = _learned_candidates.cache_info().hits
+        assert plan.candidates_for("scr_mg_dl")[0] == "serum_creatinine"
+        assert plan.candidates_for("scr_mg_dl")[0] == "serum_creatinine"
+        assert _learned_candidates.cache_info().hits > hits
+        assert plan.alias_table == compiled
+
+    def test_concurrent_lookups_leave_the_plan_unchanged(self) -> None:
+        plan = compile_calculate_plan(cast(BaseCalculator, MockCKDCalculator()))
+        compiled = dict(plan.alias_table)
+        names = [f"scr_{i}_mg_dl" for i in range(200)] + ["patient_age", "cr"]
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda _: [plan.candidates_for(name) for name in names], range(16)))
+
+        assert all(result == results[0] for result in results)
+        assert plan.alias_table == compiled
+
+    def test_claimed_candidate_falls_through(self) -> None:
+        """A second name for an already-matched param keeps the legacy cascade order."""
+        matcher = ParamMatcher(allow_fuzzy=False)
+        result = matcher.match(
+            {"serum_creatinine": 1.2, "creatinine": 1.3, "age": 65, "sex": "male"},
+            cast(BaseCalculator, MockCKDCalculator()),
+        )
+
+        assert result.matched_params == {"serum_creatinine": 1.2, "age": 65, "sex": "male"}
+        assert result.unmatched_provided == ["creatinine"]
+
+    def test_template_copies_are_independent(self) -> None:
+        calculator = cast(BaseCalculator, MockSimpleCalculator())
+        template = generate_param_template(calculator)
+        template["param1"] = "changed"
+
+        assert generate_param_template(calculator)["param1"] == "<integer> (required)"
+
+    def test_var_keyword_calculator_uses_metadata_params(self) -> None:
+        from src.domain.services.calculators.scale_expansion_batch import PHQ2Calculator
+
+        calculator = PHQ2Calculator()
+        plan = get_calculate_plan(calculator)
+        result = ParamMatcher().match({"interest": 1, "feeling_down": 2}, calculator)
+
+        assert plan.expected_params == tuple(calculator.metadata.low_level.input_params)
+        assert plan.required_params == ()
+        assert result.success is True
+        assert result.matched_params == {"interest_pleasure": 1, "feeling_down": 2}
@@ -0,0 +1,220 @@
+"""
+Tests for patient scoring (one record, many calculators)
+
+Derived quantities are computed once and shared, tools without their
+required inputs are skipped with the missing parameters, every planned tool
+gives the same answer as a direct calculate() call, and the MCP tool runs
+the plan on the batch executor.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import pytest
+
+from src.application.dto import CalculateRequest
+from src.application.use_cases import ALL_APPLICABLE, CalculateUseCase, PatientScoringUseCase
+from src.domain.registry.tool_registry import ToolRegistry
+from src.domain.services.derived_params import DERIVATIONS, Derivation, glasgow_coma_score, pao2_fio2_ratio, plan_derivations
+from tests.conftest import FakeContext, SlowUseCase
+
+SEPSIS_TOOLS = ["sofa_score", "qsofa_score", "news2_score", "apache_ii", "meld_score", "ckd_epi_2021"]
+
+RECORD: dict[str, Any] = {
+    "age": 67,
+    "sex": "male",
+    "temperature": 38.6,
+    "heart_rate": 118,
+    "respiratory_rate": 26,
+    "systolic_bp": 92,
+    "diastolic_bp": 54,
+    "spo2": 91,
+    "on_supplemental_o2": True,
+    "pao2": 70,
+    "fio2": 0.5,
+    "platelets": 95,
+    "bilirubin": 2.4,
+    "creatinine": 2.1,
+    "inr": 1.8,
+    "sodium": 132,
+    "eye_response": 3,
+    "verbal_response": 4,
+    "motor_response": 6,
+    "weight_kg": 82,
+    "height_cm": 176,
+}
+
+
+@pytest.fixture
+def use_case(shared_registry: ToolRegistry) -> PatientScoringUseCase:
+    return PatientScoringUseCase(shared_registry)
+
+
+class CountingDerivation(Derivation):
+    """Derivation that counts its calls."""
+
+    calls = 0
+
+    def __call__(self, *values: object) -> float:
+        type(self).calls += 1
+        return super().__call__(*values)
+
+
+class TestDerivedParams:
+    def test_formulas(self) -> None:
+        assert pao2_fio2_ratio(70, 0.5) == pao2_fio2_ratio(70, 50) == 140.0
+        assert glasgow_coma_score(3, 4, 6) == 13
+        by_name = {derivation.name: derivation for derivation in DERIVATIONS}
+        assert by_name["map_value"](92, 54) == 66.7
+        assert by_name["bmi"](82, 176) == 26.5
+
+    def test_invalid_inputs(self) -> None:
+        by_name = {derivation.name: derivation for derivation in DERIVATIONS}
+        with pytest.raises(ValueError, match="fio2"):
+            by_name["pao2_fio2_ratio"](70, 0.1)
+        with pytest.raises(ValueError, match="verbal"):
+            by_name["gcs_score"](3, 7, 6)
+        with pytest.raises(ValueError, match="finite number"):
+            by_name["map_value"]("92", 54)
+        with pytest.raises(ValueError, match="exceeds"):
+            by_name["map_value"](54, 92)
+
+    def test_plan_orders_dependencies_and_skips_measured(self) -> None:
+        chained = Derivation("double_map", ("map_value",), "2 × MAP", lambda value: 2 * value)
+        ordered = plan_derivations({"systolic_bp", "diastolic_bp", "pao2", "fio2", "pao2_fio2_ratio"}, (chained, *DERIVATIONS))
+        assert [derivation.name for derivation in ordered] == ["map_value", "double_map"]
+
+
+class TestPatientScoringUseCase:
+    def test_sepsis_panel_matches_direct_calculations(self, shared_registry: ToolRegistry, use_case: PatientScoringUseCase) -> None:
+        answer = use_case.score_patient(RECORD, SEPSIS_TOOLS)
+
+        assert answer["all_success"] is True
+        assert [result["tool_id"] for result in answer["results"]] == SEPSIS_TOOLS
+        assert answer["skipped"] == []
+        assert set(answer["derived"]) == {"map_value", "pao2_fio2_ratio", "gcs_score"}
+        assert answer["derived"]["map_value"]["used_by"] == ["sofa_score", "apache_ii"]
+        assert answer["unused_fields"] == ["weight_kg", "height_cm"]
+
+        direct = CalculateUseCase(shared_registry)
+        plan = use_case.plan(RECORD, SEPSIS_TOOLS)
+        for planned, result in zip(plan.tools, answer["results"], strict=True):
+            assert direct.execute(CalculateRequest(tool_id=planned.tool_id, params=planned.params)).result == result["result"]
+
+        apache = plan.tools[SEPSIS_TOOLS.index("apache_ii")]
+        assert apache.params["mean_arterial_pressure"] == 66.7
+        assert apache.sources["serum_creatinine"] == "creatinine"
+        assert apache.sources["gcs_score"] == "derived:gcs_score"
+        assert "arterial_ph" in apache.defaulted
+
+    def test_shared_intermediates_are_computed_once(self, shared_registry: ToolRegistry) -> None:
+        counting = tuple(CountingDerivation(d.name, d.inputs, d.formula, d.compute) for d in DERIVATIONS)
+        CountingDerivation.calls = 0
+        scoring = PatientScoringUseCase(shared_registry, derivations=counting)
+        plan = scoring.plan(RECORD, ["sofa_score", "sofa2_score", "qsofa_score", "apache_ii"])
+        assert CountingDerivation.calls == 3  # MAP, P/F and GCS, not bmi
+        assert len(plan.tools) == 4
+
+    def test_measured_values_win_over_derivations(self, use_case: PatientScoringUseCase) -> None:
+        plan = use_case.plan({**RECORD, "map": 80}, ["sofa_score"])
+        assert plan.tools[0].params["map_value"] == 80
+        assert plan.tools[0].sources["map_value"] == "map"
+        assert "map_value" not in plan.derived
+
+    def test_stated_units_convert_or_stay_unused(self, use_case: PatientScoringUseCase) -> None:
+        record = {"weight_kg": 70, "height_m": 1.75, "sodium": 140, "glucose_mmol_l": 5.5, "bun": 14}
+        answer = use_case.score_patient(record, ["body_surface_area", "serum_osmolality"])
+
+        assert answer["derived"] == {}
+        results = {result["tool_id"]: result for result in answer["results"]}
+        assert results["body_surface_area"]["inputs"]["height_cm"] == "height_m"
+        plan = use_case.plan(record, ["body_surface_area", "nrs_2002"])
+        assert plan.tools[0].params["height_cm"] == 175.0
+        assert plan.derived["bmi"].value == 22.9
+        assert plan.derived["bmi"].inputs == {"weight_kg": 70, "height_m": 1.75}
+
+        # mmol/L glucose never reaches the mg/dL parameter
+        assert answer["skipped"][0]["tool_id"] == "serum_osmolality"
+        assert answer["skipped"][0]["missing"] == ["glucose"]
+        assert answer["unused_fields"] == ["sodium", "glucose_mmol_l", "bun"]
+
+    def test_unconvertible_values_stay_unused(self, use_case: PatientScoringUseCase) -> None:
+        record = {"age": 60, "sex": "male", "weight_kg": 70, "creatinine": 1.1, "height_m": "1.75"}
+        answer = use_case.score_patient(record, ["cockcroft_gault", "body_surface_area"])
+
+        assert [result["tool_id"] for result in answer["results"]] == ["cockcroft_gault"]
+        assert "height_cm" in answer["results"][0]["defaulted"]
+        assert answer["skipped"] == [{"tool_id": "body_surface_area", "reason": "could not convert height_m", "missing": ["height_cm"]}]
+        assert answer["unused_fields"] == ["height_m"]
+
+    def test_missing_inputs_are_skipped(self, use_case: PatientScoringUseCase) -> None:
+        record = {key: value for key, value in RECORD.items() if key not in ("pao2", "inr")}
+        answer = use_case.score_patient(record, [*SEPSIS_TOOLS, "not_a_tool"])
+
+        skipped = {entry["tool_id"]: entry for entry in answer["skipped"]}
+        assert skipped["sofa_score"]["missing"] == ["pao2_fio2_ratio"]
+        assert skipped["meld_score"]["missing"] == ["inr"]
+        assert "not found" in skipped["not_a_tool"]["reason"]
+        assert [result["tool_id"] for result in answer["results"]] == ["qsofa_score", "news2_score", "apache_ii", "ckd_epi_2021"]
+
+    def test_failed_derivation_skips_dependent_tools(self, use_case: PatientScoringUseCase) -> None:
+        answer = use_case.score_patient({**RECORD, "fio2": 0.05}, ["sofa_score", "qsofa_score"])
+        assert "error" in answer["derived"]["pao2_fio2_ratio"]
+        assert answer["skipped"][0]["tool_id"] == "sofa_score"
+        assert answer["skipped"][0]["reason"] == "could not derive pao2_fio2_ratio"
+        assert [result["tool_id"] for result in answer["results"]] == ["qsofa_score"]
+
+    def test_all_applicable(self, use_case: PatientScoringUseCase) -> None:
+        answer = use_case.score_patient(RECORD, ALL_APPLICABLE)
+        tool_ids = {result["tool_id"] for result in answer["results"]}
+        assert set(SEPSIS_TOOLS) <= tool_ids
+        assert {"glasgow_coma_scale", "pf_ratio", "body_surface_area"} <= tool_ids
+        assert "pediatric_sofa" in {entry["tool_id"] for entry in answer["skipped"]}
+        assert answer["unused_fields"] == []
+
+    def test_invalid_selection(self, use_case: PatientScoringUseCase) -> None:
+        with pytest.raises(ValueError, match="all_applicable"):
+            use_case.plan(RECORD, "everything")
+        with pytest.raises(ValueError, match="At least one tool"):
+            use_case.plan(RECORD, [])
+
+    def test_tools_run_on_the_given_executor(self, shared_registry: ToolRegistry) -> None:
+        slow = SlowUseCase(shared_registry, delay=0.1)
+        scoring = PatientScoringUseCase(shared_registry, slow)
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            started = time.perf_counter()
+            answer = scoring.score_patient(RECORD, SEPSIS_TOOLS, executor)
+            elapsed = time.perf_counter() - started
+        assert answer["all_success"] is True
+        assert elapsed < 0.45  # sequential would take >= 0.6s
+        assert len(slow.threads) > 1
+
+
+async def test_score_patient_tool(shared_registry: ToolRegistry) -> None:
+    from src.infrastructure.mcp.config import BatchConfig
+    from src.infrastructure.mcp.handlers.calculator_handler import CalculatorHandler
+
+    tools: dict[str, Any] = {}
+
+    class MockMCP:
+        def tool(self) -> Any:
+            def decorator(func: Any) -> Any:
+                tools[func.__name__] = func
+                return func
+
+            return decorator
+
+    handler = CalculatorHandler(MockMCP(), shared_registry, BatchConfig(executor="thread", max_workers=2))  # type: ignore[arg-type]
+    ctx = FakeContext()
+    try:
+        output = await tools["score_patient"](RECORD, ctx, SEPSIS_TOOLS)
+        invalid = await tools["score_patient"](RECORD, ctx, "everything")
+    finally:
+        handler._batch_executor.shutdown()
+
+    assert output["all_success"] is True
+    assert output["summary"] == {"evaluated": 6, "successful": 6, "failed": 0, "skipped": 0}
+    assert output["results"] == PatientScoringUseCase(shared_registry).score_patient(RECORD, SEPSIS_TOOLS)["results"]
+    assert ctx.progress[-1][0] == 100
+    assert invalid["all_success"] is False and "all_applicable" in invalid["error"]
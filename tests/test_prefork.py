@@ -0,0 +1,110 @@
+"""
+Tests for pre-fork multi-worker serving
+
+serve_prefork() must warm up with the collector disabled, freeze everything
+alive before forking, serve from several worker processes on one socket and
+shut all of them down on SIGTERM.
+"""
+
+import gc
+import os
+import signal
+import socket
+import subprocess  # nosec B404
+import sys
+import time
+import urllib.request
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from src.infrastructure.serving import prefork, serve_prefork
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+needs_fork = pytest.mark.skipif(not hasattr(os, "fork"), reason="pre-fork serving needs os.fork")
+
+WORKER_SCRIPT = """
+import os, sys
+from src.infrastructure.serving import serve_prefork
+
+async def app(scope, receive, send):
+    if scope["type"] != "http":
+        return
+    await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"text/plain")]})
+    await send({"type": "http.response.body", "body": str(os.getpid()).encode()})
+
+sys.exit(serve_prefork(app, host="127.0.0.1", port=int(sys.argv[1]), workers=2, log_level="warning"))
+"""
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return int(sock.getsockname()[1])
+
+
+class TestServePrefork:
+    def test_rejects_bad_worker_count(self) -> None:
+        with pytest.raises(ValueError, match="at least 1"):
+            serve_prefork(object(), host="127.0.0.1", port=0, workers=0)
+
+    def test_requires_fork(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delattr(os, "fork", raising=False)
+        with pytest.raises(RuntimeError, match="os.fork"):
+            serve_prefork(object(), host="127.0.0.1", port=0, workers=2)
+
+    @needs_fork
+    def test_warms_up_then_freezes_before_forking(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        seen: dict[str, Any] = {}
+
+        def warm_up() -> None:
+            seen["gc_enabled_during_warm_up"] = gc.isenabled()
+            seen["warmed"] = object()
+
+        def run(supervisor: Any) -> int:
+            seen["frozen"] = gc.get_freeze_count()
+            seen["workers"] = supervisor._workers
+            supervisor._sock.close()
+            return 0
+
+        monkeypatch.setattr(prefork._Supervisor, "run", run)
+        try:
+            assert serve_prefork(object(), host="127.0.0.1", port=0, workers=3, warm_up=warm_up) == 0
+        finally:
+            gc.unfreeze()
+            gc.enable()
+
+        assert seen["gc_enabled_during_warm_up"] is False
+        assert seen["frozen"] > 0
+        assert seen["workers"] == 3
+
+
+@needs_fork
+def test_workers_share_one_socket_and_stop_on_sigterm() -> None:
+    port = _free_port()
+    process = subprocess.Popen(  # nosec B603
+        [sys.executable, "-c", WORKER_SCRIPT, str(port)], cwd=PROJECT_ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
+    )
+    try:
+        pids: set[str] = set()
+        deadline = time.monotonic() + 30
+        while len(pids) < 2 and time.monotonic() < deadline:
+            try:
+                # A fresh connection per request lets the kernel spread them over the workers
+                with urllib.request.urlopen(f"http://127.0.0.1:{port}/", timeout=2) as response:  # nosec B310
+                    pids.add(response.read().decode())
+            except OSError:
+                time.sleep(0.05)
+        assert len(pids) == 2
+        assert str(process.pid) not in pids
+
+        process.send_signal(signal.SIGTERM)
+        assert process.wait(timeout=30) == 0
+    finally:
+        if process.poll() is None:
+            process.kill()
+            process.wait()
+        assert process.stderr is not None
+        process.stderr.close()
@@ -0,0 +1,182 @@
+"""
+Tests for the questionnaire batch engine
+
+Property-style equivalence: for randomly generated responses (seeded,
+including out-of-range, fractional, non-numeric and missing answers) every
+batch total must equal the scalar calculate() value, every band must carry
+the scalar interpretation stage, and every scalar ValueError must surface as
+the same row error. Both the NumPy and the pure-Python paths are covered.
+"""
+
+import random
+from typing import Any
+
+import pytest
+
+from src.domain.services import questionnaire_batch
+from src.domain.services.calculators import ISICalculator, PHQ2Calculator
+from src.domain.services.calculators.scale_expansion_batch import ItemSpec, QuestionnaireDefinition, QuestionnaireScaleCalculator, ScaleBand
+from src.domain.services.questionnaire_batch import QUESTIONNAIRE_BATCH_TOOL_IDS, calculate_questionnaire_batch, numpy_available
+from src.domain.value_objects.interpretation import Severity
+
+ROWS_PER_TOOL = 1500
+
+NUMPY_MODES = [pytest.param(True, id="numpy"), pytest.param(False, id="pure")]
+
+
+def _calculators() -> dict[str, QuestionnaireScaleCalculator]:
+    pending: list[type[QuestionnaireScaleCalculator]] = list(QuestionnaireScaleCalculator.__subclasses__())
+    calculators: dict[str, QuestionnaireScaleCalculator] = {}
+    while pending:
+        calculator_type = pending.pop()
+        pending.extend(calculator_type.__subclasses__())
+        calculators[calculator_type.DEFINITION.tool_id] = calculator_type()
+    return calculators
+
+
+CALCULATORS = _calculators()
+
+
+def _answer(rng: random.Random, spec: ItemSpec) -> Any:
+    roll = rng.random()
+    if roll < 0.01:
+        return None
+    if roll < 0.02:
+        return rng.choice([spec.min_value - 1, spec.max_value + 1])
+    if roll < 0.03:
+        return rng.choice([0.5, "2", float(spec.max_value)])
+    if roll < 0.04:
+        return bool(rng.getrandbits(1))
+    return rng.randint(spec.min_value, spec.max_value)
+
+
+def _rows(tool_id: str, seed: int) -> list[dict[str, Any]]:
+    rng = random.Random(seed)
+    specs = CALCULATORS[tool_id].DEFINITION.item_specs
+    return [{spec.name: _answer(rng, spec) for spec in specs} for _ in range(ROWS_PER_TOOL)]
+
+
+@pytest.fixture(params=NUMPY_MODES)
+def use_numpy(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> bool:
+    if request.param and not numpy_available():
+        pytest.skip("numpy not installed")
+    if not request.param:
+        monkeypatch.setattr(questionnaire_batch, "_numpy", None)
+    return bool(request.param)
+
+
+def test_every_questionnaire_scale_is_batch_capable() -> None:
+    assert set(QUESTIONNAIRE_BATCH_TOOL_IDS) == set(CALCULATORS)
+    assert {"phq2", "audit", "cage", "gds_15", "insomnia_severity_index", "lawton_iadl"} <= set(QUESTIONNAIRE_BATCH_TOOL_IDS)
+
+
+@pytest.mark.parametrize("tool_id", QUESTIONNAIRE_BATCH_TOOL_IDS)
+def test_batch_matches_scalar(tool_id: str, use_numpy: bool) -> None:
+    rows = _rows(tool_id, 0)
+    result = calculate_questionnaire_batch(tool_id, rows)
+    calculator = CALCULATORS[tool_id]
+
+    assert len(result) == len(rows)
+    for index, row in enumerate(rows):
+        try:
+            expected = calculator.calculate(**{name: value for name, value in row.items() if value is not None})
+        except ValueError as e:
+            assert result.errors[index] == str(e), row
+            assert result.totals[index] is None and result.band_indices[index] is None
+            continue
+        assert result.errors[index] is None, (row, result.errors[index])
+        assert type(result.totals[index]) is int and result.totals[index] == expected.value, row
+        assert result.stages[index] == expected.interpretation.stage, row
+        assert result.interpretation(index) == expected.interpretation, row
+
+
+def test_columnar_input_matches_row_input(use_numpy: bool) -> None:
+    rows = _rows("audit", 3)
+    columns = {name: [row[name] for row in rows] for name in rows[0]}
+
+    by_rows = calculate_questionnaire_batch("audit", rows)
+    by_columns = calculate_questionnaire_batch("audit", columns)
+
+    assert by_columns.totals == by_rows.totals
+    assert by_columns.band_indices == by_rows.band_indices
+    assert by_columns.errors == by_rows.errors
+
+
+@pytest.mark.skipif(not numpy_available(), reason="numpy not installed")
+def test_numpy_integer_columns_and_output() -> None:
+    import numpy as np
+
+    rng = np.random.default_rng(11)
+    specs = ISICalculator.DEFINITION.item_specs
+    columns = {spec.name: rng.integers(0, 5, size=500).astype(np.int8) for spec in specs}
+    columns["distress"][7] = 9
+
+    by_arrays = calculate_questionnaire_batch("insomnia_severity_index", columns)
+    by_lists = calculate_questionnaire_batch("insomnia_severity_index", {name: column.tolist() for name, column in columns.items()})
+    assert by_arrays.totals == by_lists.totals
+    assert by_arrays.errors == by_lists.errors
+    assert by_arrays.errors[7] == "distress must be between 0 and 4"
+
+    totals, band_indices = by_arrays.to_numpy()
+    assert totals.dtype == np.int64 and band_indices.dtype == np.int64
+    assert totals[7] == -1 and band_indices[7] == -1
+    assert band_indices.tolist()[:7] == by_lists.band_indices[:7]
+
+
+def test_band_search_matches_linear_walk_for_unordered_bands(use_numpy: bool) -> None:
+    bands = (
+        ScaleBand(4, Severity.NORMAL, "Low", "low"),
+        ScaleBand(2, Severity.MILD, "Shadowed", "never reached"),
+        ScaleBand(7, Severity.MODERATE, "Mid", "mid"),
+        ScaleBand(6, Severity.SEVERE, "Tail", "fallback"),
+    )
+    definition = QuestionnaireDefinition(
+        tool_id="unordered_scale",
+        name="Unordered",
+        purpose="test",
+        specialties=(),
+        conditions=(),
+        clinical_contexts=(),
+        clinical_questions=(),
+        keywords=(),
+        references=(),
+        item_specs=(ItemSpec("a", 0, 5), ItemSpec("b", 0, 5, allowed_values=(0, 1, 5))),
+        bands=bands,
+    )
+
+    def linear(total: int) -> int:
+        return next((index for index, band in enumerate(bands) if total <= band.upper_bound), len(bands) - 1)
+
+    rows = [{"a": a, "b": b} for a in range(6) for b in (0, 1, 5)]
+    result = calculate_questionnaire_batch(definition, rows)
+    assert result.tool_id == "unordered_scale"
+    assert definition.band_bounds == (4, 4, 7, 7)
+    assert result.band_indices == [linear(row["a"] + row["b"]) for row in rows]
+    assert calculate_questionnaire_batch(definition, [{"a": 1, "b": 2}]).errors == ["b must be one of (0, 1, 5)"]
+
+
+def test_interpretation_built_lazily_and_matches_scalar() -> None:
+    rows: list[dict[str, Any]] = [{"interest_pleasure": 2, "feeling_down": 1}, {"interest_pleasure": 2}]
+    result = calculate_questionnaire_batch("phq2", rows)
+
+    assert result._interpretations == {}
+    interpretation = result.interpretation(0)
+    assert interpretation == PHQ2Calculator().calculate(**rows[0]).interpretation
+    assert result.interpretation(0) is interpretation
+    assert result.band(0) is PHQ2Calculator.DEFINITION.bands[1]
+    assert result.interpretation(1) is None and result.band(1) is None
+    assert result.errors[1] == "Missing required parameter: feeling_down"
+    assert result.error_count == 1
+
+
+def test_missing_column_unknown_tool_and_misaligned_columns() -> None:
+    result = calculate_questionnaire_batch("phq2", {"interest_pleasure": [1, 2]})
+    assert result.errors == ["Missing required parameter: feeling_down"] * 2
+
+    assert len(calculate_questionnaire_batch("phq2", [])) == 0
+
+    with pytest.raises(ValueError, match="not a questionnaire scale"):
+        calculate_questionnaire_batch("sofa_score", [])
+
+    with pytest.raises(ValueError, match="Column lengths differ"):
+        calculate_questionnaire_batch("phq2", {"interest_pleasure": [1, 2], "feeling_down": [1]})
@@ -1,5 +1,9 @@
 """Tests for Tool Registry"""
 
+from typing import Any
+
+import pytest
+
 
 class TestToolRegistry:
     def test_registry_not_empty(self) -> None:
@@ -25,3 +29,53 @@ class TestCalculatorMetadata:
             calc = cls()
             assert hasattr(calc, "tool_id")
             assert calc.tool_id is not None
+
+
+class TestMetadataCache:
+    def test_metadata_built_once_per_instance(self) -> None:
+        from src.domain.services.calculators import CkdEpi2021Calculator
+
+        calc = CkdEpi2021Calculator()
+        assert calc.metadata is calc.metadata
+        assert calc.high_level_key is calc.metadata.high_level
+
+    def test_registry_shares_calculator_metadata(self, registry: Any) -> None:
+        calc = registry.get_calculator("ckd_epi_2021")
+        assert registry.get("ckd_epi_2021") is calc.metadata
+        assert any(meta is calc.metadata for meta in registry.list_all())
+        assert any(meta is calc.metadata for meta in registry.search("kidney"))
+
+    def test_input_params_are_immutable(self, registry: Any) -> None:
+        metadata = registry.get("ckd_epi_2021")
+        assert isinstance(metadata.low_level.input_params, tuple)
+        assert metadata.to_dict()["low_level"]["input_params"] == ["age", "sex", "serum_creatinine"]
+
+    def test_all_registered_metadata_is_frozen(self, registry: Any) -> None:
+        from src.domain.entities.tool_metadata import ensure_frozen_metadata
+
+        for metadata in registry.list_all():
+            ensure_frozen_metadata(metadata)
+
+    def test_mutable_metadata_rejected(self) -> None:
+        from dataclasses import dataclass
+
+        from src.domain.entities.tool_metadata import ensure_frozen_metadata
+
+        @dataclass
+        class MutableReference:
+            citation: str
+
+        metadata = _build_metadata(references=(MutableReference("x"),))
+        with pytest.raises(TypeError, match="not a frozen dataclass"):
+            ensure_frozen_metadata(metadata)
+
+
+def _build_metadata(**overrides: Any) -> Any:
+    from src.domain.entities.tool_metadata import ToolMetadata
+    from src.domain.value_objects.tool_keys import HighLevelKey, LowLevelKey
+
+    return ToolMetadata(
+        low_level=LowLevelKey(tool_id="demo", name="Demo", purpose="Demo", input_params=["a"], output_type="score"),
+        high_level=HighLevelKey(),
+        **overrides,
+    )
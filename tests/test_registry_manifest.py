@@ -0,0 +1,166 @@
+"""
+Tests for the registry manifest (lazy calculator loading)
+
+A registry restored from a manifest must answer every lookup, search and
+discovery query exactly like an eagerly built one, import calculators only on
+first use, and ignore manifests that are missing, corrupt, or stale.
+"""
+
+import json
+import os
+import pickle
+import subprocess  # nosec B404
+import sys
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+from src.application.dto import CalculateRequest
+from src.application.use_cases import CalculateUseCase
+from src.domain.registry.manifest import (
+    MANIFEST_ENV_VAR,
+    RegistryManifest,
+    build_registry_manifest,
+    compute_source_fingerprint,
+    load_registry_manifest,
+    write_registry_manifest,
+)
+from src.domain.registry.tool_registry import ToolRegistry
+from src.domain.services.calculators import CALCULATOR_MODULES, CALCULATOR_NAMES, CALCULATORS, CkdEpi2021Calculator
+from src.domain.services.param_matcher import get_calculate_plan
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+QUERIES = ["sepsis", "kidney", "creatinine", "pneumonia", "heart failure", "gcs", "bleeding risk", "xyz-not-a-tool"]
+
+
+@pytest.fixture(scope="module")
+def manifest() -> RegistryManifest:
+    return build_registry_manifest()
+
+
+@pytest.fixture(scope="module")
+def eager() -> ToolRegistry:
+    registry = ToolRegistry()
+    for calculator_cls in CALCULATORS:
+        registry.register(calculator_cls())
+    registry.build_discovery_indexes()
+    return registry
+
+
+@pytest.fixture
+def lazy(manifest: RegistryManifest, tmp_path: Path) -> ToolRegistry:
+    path = write_registry_manifest(manifest, tmp_path / "manifest.pickle")
+    loaded = load_registry_manifest(path, fingerprint=manifest.fingerprint)
+    assert loaded is not None
+    registry = ToolRegistry()
+    registry.load_manifest(loaded)
+    return registry
+
+
+class TestLazyCalculatorPackage:
+    def test_names_and_modules_agree(self) -> None:
+        assert set(CALCULATOR_NAMES) == set(CALCULATOR_MODULES)
+        assert [cls.__name__ for cls in CALCULATORS] == list(CALCULATOR_NAMES)
+        assert CkdEpi2021Calculator.__module__.endswith(".ckd_epi_2021")
+
+    def test_unknown_attribute(self) -> None:
+        import src.domain.services.calculators as calculators
+
+        with pytest.raises(AttributeError):
+            calculators.NotACalculator  # noqa: B018
+
+
+class TestManifestRegistry:
+    def test_lookups_match_eager_registry(self, eager: ToolRegistry, lazy: ToolRegistry) -> None:
+        assert lazy.list_all_ids() == eager.list_all_ids()
+        assert lazy.list_all() == eager.list_all()
+        assert lazy.get_statistics()["specialties"] == eager.get_statistics()["specialties"]
+        assert set(lazy.list_contexts()) == set(eager.list_contexts())
+        assert lazy.get_discovery_statistics() == eager.get_discovery_statistics()
+
+    def test_search_and_discovery_match_eager_registry(self, eager: ToolRegistry, lazy: ToolRegistry) -> None:
+        for query in QUERIES:
+            assert [m.tool_id for m in lazy.search(query)] == [m.tool_id for m in eager.search(query)], query
+            assert [m.tool_id for m in lazy.smart_search(query)] == [m.tool_id for m in eager.smart_search(query)], query
+        # Ties in find_tools_by_params follow set iteration order, which is hash-seed dependent
+        params = ["creatinine", "age"]
+        assert sorted(m.tool_id for m in lazy.find_tools_by_params(params)) == sorted(m.tool_id for m in eager.find_tools_by_params(params))
+        assert lazy.get_related_tools("sofa_score") == eager.get_related_tools("sofa_score")
+        assert lazy.get_tool_resolver().resolve("ckd_epi").resolved_value == eager.get_tool_resolver().resolve("ckd_epi").resolved_value
+
+    def test_calculators_load_on_first_use(self, lazy: ToolRegistry) -> None:
+        assert lazy.get_statistics()["loaded_tools"] == 0
+        assert not lazy.is_loaded("ckd_epi_2021")
+
+        calculator = lazy.get_calculator("ckd_epi_2021")
+        assert isinstance(calculator, CkdEpi2021Calculator)
+        assert lazy.is_loaded("ckd_epi_2021")
+        assert lazy.get_calculator("ckd_epi_2021") is calculator
+        assert get_calculate_plan(calculator) is lazy.get_calculate_plan("ckd_epi_2021")
+        assert lazy.get_statistics()["loaded_tools"] == 1
+        assert lazy.get_calculator("not_a_tool") is None
+
+    def test_warm_up_loads_everything(self, lazy: ToolRegistry) -> None:
+        lazy.warm_up()
+        assert lazy.get_statistics()["loaded_tools"] == lazy.count()
+        assert all(lazy.is_loaded(tool_id) for tool_id in lazy.list_all_ids())
+        resolver = lazy.get_tool_resolver()
+        lazy.warm_up()
+        assert lazy.get_tool_resolver() is resolver
+
+    def test_calculate_matches_eager_registry(self, eager: ToolRegistry, lazy: ToolRegistry) -> None:
+        request = CalculateRequest(tool_id="ckd_epi_2021", params={"creatinine": 1.2, "age": 65, "sex": "female"})
+        assert CalculateUseCase(lazy).execute(request) == CalculateUseCase(eager).execute(request)
+
+    def test_guards(self, manifest: RegistryManifest, lazy: ToolRegistry, eager: ToolRegistry) -> None:
+        with pytest.raises(ValueError, match="empty registry"):
+            eager.load_manifest(manifest)
+        with pytest.raises(ValueError, match="unloaded calculators"):
+            lazy.export_manifest("fingerprint")
+
+
+class TestManifestFile:
+    def test_missing_corrupt_and_stale_manifests_are_ignored(self, manifest: RegistryManifest, tmp_path: Path) -> None:
+        assert load_registry_manifest(tmp_path / "missing.pickle") is None
+
+        corrupt = tmp_path / "corrupt.pickle"
+        corrupt.write_bytes(b"not a pickle")
+        assert load_registry_manifest(corrupt) is None
+
+        stale = write_registry_manifest(replace(manifest, fingerprint="0" * 64), tmp_path / "stale.pickle")
+        assert load_registry_manifest(stale) is None
+
+        old_format = tmp_path / "old.pickle"
+        old_format.write_bytes(pickle.dumps(replace(manifest, format_version=0)))
+        assert load_registry_manifest(old_format, fingerprint=manifest.fingerprint) is None
+
+    def test_fingerprint_tracks_sources(self, tmp_path: Path) -> None:
+        (tmp_path / "calc.py").write_text("VALUE = 1\n")
+        before = compute_source_fingerprint(tmp_path)
+        assert compute_source_fingerprint(tmp_path) == before
+        (tmp_path / "calc.py").write_text("VALUE = 2\n")
+        assert compute_source_fingerprint(tmp_path) != before
+
+
+def test_server_cold_start_imports_no_calculators(manifest: RegistryManifest, tmp_path: Path) -> None:
+    """In a fresh interpreter, a manifest-backed server imports calculators only when called."""
+    path = write_registry_manifest(manifest, tmp_path / "manifest.pickle")
+    script = """
+import json, sys
+from src.infrastructure.mcp.server import MedicalCalculatorServer
+server = MedicalCalculatorServer()
+prefix = "src.domain.services.calculators."
+before = sorted(m for m in sys.modules if m.startswith(prefix))
+server.registry.get_calculator("ckd_epi_2021")
+after = sorted(m for m in sys.modules if m.startswith(prefix))
+print(json.dumps({"count": server.registry.count(), "before": before, "after": after}))
+"""
+    env = {**os.environ, MANIFEST_ENV_VAR: str(path)}
+    completed = subprocess.run([sys.executable, "-c", script], cwd=PROJECT_ROOT, env=env, capture_output=True, text=True, timeout=120, check=True)  # nosec B603
+    result = json.loads(completed.stdout.strip().splitlines()[-1])
+
+    assert result["count"] == len(CALCULATOR_NAMES)
+    assert result["before"] == []
+    assert result["after"] == ["src.domain.services.calculators.ckd_epi_2021"]
@@ -0,0 +1,183 @@
+"""
+Tests for the renal batch engine
+
+Property-style equivalence: for randomly generated rows (seeded, including
+out-of-range and missing values) every batch value must be bit-for-bit the
+scalar calculate() value, every stage code must equal the scalar
+interpretation stage, and every scalar ValueError must surface as a row error.
+"""
+
+import math
+import random
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+from src.domain.services.base import BaseCalculator
+from src.domain.services.calculators import CkdEpi2021Calculator, CockcroftGaultCalculator, FENaCalculator, KdigoAkiCalculator
+from src.domain.services.renal_batch import RENAL_BATCH_TOOL_IDS, calculate_renal_batch, numpy_available
+
+ROWS_PER_TOOL = 2000
+
+
+def _maybe(rng: random.Random, value: float, probability: float = 0.3) -> float | None:
+    return None if rng.random() < probability else value
+
+
+def _ckd_row(rng: random.Random) -> dict[str, Any]:
+    return {
+        "age": rng.randint(10, 125),
+        "sex": rng.choice(["male", "female"]),
+        "serum_creatinine": rng.uniform(0.05, 32.0),
+    }
+
+
+def _cg_row(rng: random.Random) -> dict[str, Any]:
+    return {
+        "age": rng.randint(15, 125),
+        "weight_kg": rng.uniform(25.0, 310.0),
+        "creatinine_mg_dl": rng.uniform(0.1, 21.0),
+        "sex": rng.choice(["male", "female"]),
+        "height_cm": _maybe(rng, rng.uniform(95.0, 255.0)),
+    }
+
+
+def _fena_row(rng: random.Random) -> dict[str, Any]:
+    return {
+        "urine_sodium": rng.uniform(-5.0, 310.0),
+        "plasma_sodium": rng.uniform(95.0, 185.0),
+        "urine_creatinine": rng.uniform(0.0, 510.0),
+        "plasma_creatinine": rng.uniform(0.0, 31.0),
+        "on_diuretics": rng.random() < 0.2,
+    }
+
+
+def _kdigo_row(rng: random.Random) -> dict[str, Any]:
+    return {
+        "current_creatinine": rng.uniform(0.3, 8.0),
+        "baseline_creatinine": _maybe(rng, rng.uniform(0.3, 3.0)),
+        "creatinine_increase_48h": _maybe(rng, rng.uniform(0.0, 1.0)),
+        "urine_output_ml_kg_h": _maybe(rng, rng.uniform(0.0, 1.5)),
+        "urine_output_duration_hours": _maybe(rng, rng.uniform(0.0, 36.0)),
+        "on_rrt": rng.random() < 0.05,
+    }
+
+
+GENERATORS: dict[str, tuple[Callable[[random.Random], dict[str, Any]], type[BaseCalculator]]] = {
+    "ckd_epi_2021": (_ckd_row, CkdEpi2021Calculator),
+    "cockcroft_gault": (_cg_row, CockcroftGaultCalculator),
+    "fena": (_fena_row, FENaCalculator),
+    "kdigo_aki": (_kdigo_row, KdigoAkiCalculator),
+}
+
+
+def _rows(tool_id: str, seed: int) -> list[dict[str, Any]]:
+    generator, _ = GENERATORS[tool_id]
+    rng = random.Random(seed)
+    return [generator(rng) for _ in range(ROWS_PER_TOOL)]
+
+
+def _scalar(tool_id: str, row: dict[str, Any]) -> tuple[float | None, str | None]:
+    _, calculator_type = GENERATORS[tool_id]
+    kwargs = {name: value for name, value in row.items() if value is not None}
+    try:
+        result = calculator_type().calculate(**kwargs)
+    except ValueError:
+        return None, None
+    assert result.value is not None
+    return float(result.value), result.interpretation.stage
+
+
+def test_every_batch_tool_has_a_generator() -> None:
+    assert set(RENAL_BATCH_TOOL_IDS) == set(GENERATORS)
+
+
+@pytest.mark.parametrize("tool_id", RENAL_BATCH_TOOL_IDS)
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_batch_matches_scalar_bit_for_bit(tool_id: str, seed: int) -> None:
+    rows = _rows(tool_id, seed)
+    result = calculate_renal_batch(tool_id, rows)
+
+    assert len(result) == len(rows)
+    for index, row in enumerate(rows):
+        expected_value, expected_stage = _scalar(tool_id, row)
+        if expected_value is None:
+            assert result.errors[index] is not None, row
+            assert math.isnan(result.values[index])
+            assert result.stages[index] is None
+            continue
+        assert result.errors[index] is None, (row, result.errors[index])
+        assert result.values[index].hex() == expected_value.hex(), row
+        assert result.stages[index] == expected_stage, row
+
+
+@pytest.mark.parametrize("tool_id", RENAL_BATCH_TOOL_IDS)
+def test_columnar_input_matches_row_input(tool_id: str) -> None:
+    rows = _rows(tool_id, 99)[:300]
+    columns = {name: [row[name] for row in rows] for name in rows[0]}
+
+    by_rows = calculate_renal_batch(tool_id, rows)
+    by_columns = calculate_renal_batch(tool_id, columns)
+
+    assert [v.hex() for v in by_columns.values] == [v.hex() for v in by_rows.values]
+    assert by_columns.stages == by_rows.stages
+    assert by_columns.errors == by_rows.errors
+
+
+@pytest.mark.skipif(not numpy_available(), reason="numpy not installed")
+def test_numpy_columns_and_output() -> None:
+    import numpy as np
+
+    rows = _rows("cockcroft_gault", 7)[:300]
+    columns = {
+        "age": np.array([row["age"] for row in rows], dtype=np.int64),
+        "weight_kg": np.array([row["weight_kg"] for row in rows]),
+        "creatinine_mg_dl": np.array([row["creatinine_mg_dl"] for row in rows]),
+        "sex": np.array([row["sex"] for row in rows]),
+        "height_cm": np.array([np.nan if row["height_cm"] is None else row["height_cm"] for row in rows]),
+    }
+
+    by_arrays = calculate_renal_batch("cockcroft_gault", columns)
+    by_rows = calculate_renal_batch("cockcroft_gault", rows)
+    assert [v.hex() for v in by_arrays.values] == [v.hex() for v in by_rows.values]
+
+    values, stages = by_arrays.to_numpy()
+    assert values.dtype == np.float64
+    assert stages.tolist() == by_rows.stages
+
+
+def test_interpretation_built_lazily_and_matches_scalar() -> None:
+    rows: list[dict[str, Any]] = [{"age": 65, "sex": "female", "serum_creatinine": 1.2}, {"age": 5, "sex": "male", "serum_creatinine": 1.0}]
+    result = calculate_renal_batch("ckd_epi_2021", rows)
+
+    assert result._interpretations == {}
+    interpretation = result.interpretation(0)
+    assert interpretation == CkdEpi2021Calculator().calculate(**rows[0]).interpretation
+    assert result.interpretation(0) is interpretation
+    assert result.interpretation(1) is None
+    assert result.error_count == 1
+
+
+def test_missing_required_and_unknown_tool() -> None:
+    result = calculate_renal_batch("fena", [{"urine_sodium": 20, "plasma_sodium": 140}])
+    assert result.errors[0] is not None and "urine_creatinine" in result.errors[0]
+
+    with pytest.raises(ValueError, match="no batch kernel"):
+        calculate_renal_batch("sofa", [])
+
+    with pytest.raises(ValueError, match="Column lengths differ"):
+        calculate_renal_batch("ckd_epi_2021", {"age": [50, 60], "sex": ["male"], "serum_creatinine": [1.0, 1.1]})
+
+
+def test_non_numeric_cells_are_row_errors() -> None:
+    result = calculate_renal_batch(
+        "ckd_epi_2021",
+        {"age": [65, "65", 40], "sex": ["female", "female", "male"], "serum_creatinine": ["abc", 1.2, 0.9]},
+    )
+    assert result.errors[:2] == ["Expected numeric type, got str", "Expected numeric type, got str"]
+    assert result.errors[2] is None and result.stages[2] == "G1"
+    assert math.isnan(result.values[0])
+
+    result = calculate_renal_batch("kdigo_aki", [{"current_creatinine": 1.0, "baseline_creatinine": "n/a"}])
+    assert result.errors == ["Expected numeric type, got str"]
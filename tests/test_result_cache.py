@@ -0,0 +1,100 @@
+"""
+Tests for the calculate result cache
+
+Keys must ignore parameter order but not value types, hits must return
+independent copies, and the cache must stay within its entry, byte and TTL
+bounds while counting hits, misses and evictions.
+"""
+
+import pytest
+
+from src.shared.result_cache import ResultCache, canonical_key
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestCanonicalKey:
+    def test_order_independent(self) -> None:
+        assert canonical_key("sofa", {"a": 1, "b": [1, 2]}) == canonical_key("sofa", {"b": [1, 2], "a": 1})
+
+    def test_namespace_and_types_matter(self) -> None:
+        key = canonical_key("sofa", {"a": 1})
+        assert key != canonical_key("qsofa", {"a": 1})
+        assert key != canonical_key("sofa", {"a": 1.0})
+        assert key != canonical_key("sofa", {"a": True})
+        assert key is not None and len(key) == 16
+
+    def test_unserializable_params_have_no_key(self) -> None:
+        assert canonical_key("sofa", {"a": object()}) is None
+
+
+class TestResultCache:
+    def test_hit_returns_independent_copy(self) -> None:
+        cache: ResultCache[dict[str, list[int]]] = ResultCache()
+        value = {"scores": [1, 2]}
+        cache.put(b"k", value)
+        value["scores"].append(3)
+
+        hit = cache.get(b"k")
+        assert hit == {"scores": [1, 2]}
+        assert hit is not None
+        hit["scores"].clear()
+        assert cache.get(b"k") == {"scores": [1, 2]}
+        assert cache.get(b"missing") is None
+        assert (cache.hits, cache.misses) == (2, 1)
+
+    def test_entry_limit_evicts_least_recently_used(self) -> None:
+        cache: ResultCache[int] = ResultCache(max_entries=2)
+        cache.put(b"a", 1)
+        cache.put(b"b", 2)
+        assert cache.get(b"a") == 1
+        cache.put(b"c", 3)
+
+        assert cache.get(b"b") is None
+        assert cache.get(b"a") == 1 and cache.get(b"c") == 3
+        assert cache.evictions == 1
+
+    def test_byte_limit(self) -> None:
+        cache: ResultCache[str] = ResultCache(max_bytes=300)
+        for i in range(10):
+            cache.put(bytes([i]), "x" * 100)
+        stats = cache.get_stats()
+        assert stats["bytes"] <= 300
+        assert stats["entries"] == 2
+        assert stats["evictions"] == 8
+
+        cache.put(b"huge", "x" * 1000)
+        assert cache.get(b"huge") is None
+        assert cache.rejected == 1
+
+    def test_ttl(self) -> None:
+        clock = FakeClock()
+        cache: ResultCache[int] = ResultCache(ttl=10.0, clock=clock)
+        cache.put(b"k", 1)
+        clock.now += 9.0
+        assert cache.get(b"k") == 1
+        clock.now += 1.0
+        assert cache.get(b"k") is None
+        assert cache.expirations == 1
+        assert len(cache) == 0
+
+    def test_from_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delenv("CALCULATE_RESULT_CACHE", raising=False)
+        assert ResultCache.from_env() is None
+
+        monkeypatch.setenv("CALCULATE_RESULT_CACHE", "true")
+        monkeypatch.setenv("CALCULATE_RESULT_CACHE_MAX_ENTRIES", "10")
+        monkeypatch.setenv("CALCULATE_RESULT_CACHE_TTL", "0")
+        cache = ResultCache.from_env()
+        assert cache is not None
+        assert (cache.max_entries, cache.ttl) == (10, 0.0)
+
+    def test_invalid_bounds(self) -> None:
+        with pytest.raises(ValueError):
+            ResultCache(max_entries=0)
@@ -0,0 +1,136 @@
+"""
+Tests for KeywordSearchIndex
+
+Verifies the n-gram substring index used by ToolRegistry.search() produces
+exactly the same scores and rankings as the original linear scorer.
+"""
+
+import random
+from typing import Any
+
+import pytest
+
+from src.domain.entities.tool_metadata import ToolMetadata
+from src.domain.registry.search_index import FIELD_WEIGHTS, KeywordSearchIndex
+
+
+def _linear_scores(metadata: list[ToolMetadata], query: str) -> list[tuple[int, str]]:
+    """Reference implementation: the original ToolRegistry.search linear scan."""
+    query_lower = query.lower()
+    results: list[tuple[int, str]] = []
+
+    for meta in metadata:
+        score = 0
+        low = meta.low_level
+        high = meta.high_level
+
+        if query_lower in low.tool_id.lower():
+            score += 10
+        if query_lower in low.name.lower():
+            score += 8
+        if query_lower in low.purpose.lower():
+            score += 5
+        for specialty in high.specialties:
+            if query_lower in specialty.value.lower():
+                score += 7
+        for condition in high.conditions:
+            if query_lower in condition.lower():
+                score += 6
+        for keyword in high.keywords:
+            if query_lower in keyword.lower():
+                score += 4
+        for question in high.clinical_questions:
+            if query_lower in question.lower():
+                score += 3
+
+        if score > 0:
+            results.append((score, meta.tool_id))
+
+    results.sort(key=lambda x: x[0], reverse=True)
+    return results
+
+
+def _sample_queries(metadata: list[ToolMetadata]) -> list[str]:
+    rng = random.Random(20240613)
+    queries = {"", "a", "ck", "sepsis", "kidney", "CKD", "Heart Failure", "score", "zzz-no-match", "評估", "what is the"}
+    for meta in metadata:
+        high = meta.high_level
+        texts = [meta.tool_id, meta.name, meta.purpose, *high.conditions, *high.keywords, *high.clinical_questions]
+        for text in rng.sample(texts, min(3, len(texts))):
+            queries.add(text)
+            if len(text) > 4:
+                start = rng.randrange(len(text) - 3)
+                queries.add(text[start : start + rng.randint(2, 8)])
+    return sorted(queries)
+
+
+@pytest.fixture(scope="module")
+def all_metadata() -> list[ToolMetadata]:
+    from src.domain.services.calculators import CALCULATORS
+
+    return [calc_class().metadata for calc_class in CALCULATORS]
+
+
+@pytest.fixture(scope="module")
+def search_index(all_metadata: list[ToolMetadata]) -> KeywordSearchIndex:
+    index = KeywordSearchIndex()
+    index.build(all_metadata)
+    return index
+
+
+class TestFieldWeights:
+    def test_weights_unchanged(self) -> None:
+        assert FIELD_WEIGHTS == {
+            "tool_id": 10,
+            "name": 8,
+            "purpose": 5,
+            "specialty": 7,
+            "condition": 6,
+            "keyword": 4,
+            "clinical_question": 3,
+        }
+
+
+class TestParityWithLinearScorer:
+    def test_scores_match(self, all_metadata: list[ToolMetadata], search_index: KeywordSearchIndex) -> None:
+        for query in _sample_queries(all_metadata):
+            expected = {tool_id: score for score, tool_id in _linear_scores(all_metadata, query)}
+            assert search_index.score(query) == expected, query
+
+    def test_rankings_match(self, all_metadata: list[ToolMetadata], search_index: KeywordSearchIndex) -> None:
+        for query in _sample_queries(all_metadata):
+            for limit in (1, 5, 10, 500):
+                expected = [tool_id for _, tool_id in _linear_scores(all_metadata, query)[:limit]]
+                assert search_index.search(query, limit) == expected, (query, limit)
+
+
+class TestRegistryIntegration:
+    def test_registry_search_uses_index(self, registry: Any) -> None:
+        results = registry.search("kidney", limit=5)
+        assert results
+        assert registry._search_index is not None
+
+    def test_register_invalidates_index(self, registry: Any) -> None:
+        from src.domain.services.base import BaseCalculator
+
+        calc = registry.get_calculator("ckd_epi_2021")
+        registry.search("kidney")
+
+        class RenamedCalculator(type(calc)):  # type: ignore[misc]
+            @property
+            def metadata(self) -> ToolMetadata:
+                from dataclasses import replace
+
+                base: ToolMetadata = super().metadata
+                return replace(base, low_level=replace(base.low_level, tool_id="zz_index_probe", name="Index Probe"))
+
+        probe: BaseCalculator = RenamedCalculator()
+        registry.register(probe)
+
+        assert [meta.tool_id for meta in registry.search("index probe")] == ["zz_index_probe"]
+
+    def test_statistics(self, search_index: KeywordSearchIndex) -> None:
+        stats = search_index.get_statistics()
+        assert stats["tools"] == search_index.size
+        assert stats["strings"] > 0
+        assert stats["grams"] > 0
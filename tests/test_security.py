@@ -5,19 +5,31 @@ Tests rate limiting, authentication, and security middleware.
 All security features are optional and disabled by default.
 """
 
+import hashlib
+import multiprocessing
 import os
+import threading
 import time
+from pathlib import Path
 from unittest.mock import patch
 
 import pytest
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
 
 from src.infrastructure.security import (
     APIAuthenticator,
+    ASGISecurityMiddleware,
     AuthenticationError,
+    InMemoryRateLimiterBackend,
     RateLimiter,
     RateLimitExceeded,
     SecurityConfig,
     SecurityMiddleware,
+    SQLiteRateLimiterBackend,
 )
 
 
@@ -186,6 +198,165 @@ class TestRateLimiter:
         limiter.reset("client1")
         assert limiter.is_allowed("client1") is True
 
+    def test_concurrent_consume_is_exact(self) -> None:
+        """Threads sharing one client must not over-spend its bucket"""
+        limiter = RateLimiter(requests_per_minute=1, burst=100)
+        allowed: list[bool] = []
+
+        def worker() -> None:
+            allowed.extend(limiter.is_allowed("shared") for _ in range(50))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sum(allowed) == 100
+
+    def test_clients_are_spread_over_shards(self) -> None:
+        """Per-client buckets should be striped across shards"""
+        backend = InMemoryRateLimiterBackend(shards=8)
+        limiter = RateLimiter(requests_per_minute=60, burst=2, backend=backend)
+        for i in range(400):
+            limiter.is_allowed(f"client-{i}")
+
+        assert limiter.get_stats()["shards"] == 8
+        assert limiter.get_stats()["active_clients"] == 400
+        assert all(shard.buckets for shard in backend._shards)
+
+    def test_timer_wheel_evicts_refilled_clients(self) -> None:
+        """Inactive clients are dropped once their bucket is full again, active ones are kept"""
+        now = [1000.0]
+        limiter = RateLimiter(requests_per_minute=60, burst=5, cleanup_interval=64.0, shards=1, clock=lambda: now[0])
+        for i in range(100):
+            limiter.is_allowed(f"idle-{i}")
+        limiter.is_allowed("busy")
+
+        # Idle buckets refill 1 token/s: full again 1s after their only request
+        for _ in range(10):
+            now[0] += 1.0
+            for _ in range(2):
+                limiter.is_allowed("busy")
+
+        assert limiter.get_stats()["active_clients"] == 1
+        assert limiter.get_remaining("busy") == 0
+
+    def test_long_idle_period_evicts_everything(self) -> None:
+        """Advancing past a whole wheel span visits every slot once"""
+        now = [50.0]
+        limiter = RateLimiter(requests_per_minute=60, burst=3, cleanup_interval=6.4, shards=1, clock=lambda: now[0])
+        for i in range(20):
+            limiter.is_allowed(f"client-{i}")
+
+        now[0] += 3600.0
+        limiter.is_allowed("late")
+
+        assert limiter.get_stats()["active_clients"] == 1
+
+
+def _spend_shared_budget(path: str, backend_name: str, start: "multiprocessing.synchronize.Event", allowed: "multiprocessing.Queue[int]") -> None:
+    """Worker process: hammer one client id and report how many requests were allowed."""
+    backend = SQLiteRateLimiterBackend(path, lease_size=4) if backend_name == "sqlite" else InMemoryRateLimiterBackend()
+    limiter = RateLimiter(requests_per_minute=1, burst=20, backend=backend)
+    start.wait()
+    allowed.put(sum(limiter.is_allowed("shared-client") for _ in range(200)))
+
+
+class TestSQLiteRateLimiterBackend:
+    """Tests for the cross-process SQLite backend"""
+
+    def test_limit_is_shared_between_backends(self, tmp_path: Path) -> None:
+        """Two backends on one file (as two workers would be) draw from one bucket"""
+        path = str(tmp_path / "rl.sqlite3")
+        first = RateLimiter(requests_per_minute=60, burst=3, backend=SQLiteRateLimiterBackend(path))
+        second = RateLimiter(requests_per_minute=60, burst=3, backend=SQLiteRateLimiterBackend(path))
+
+        assert first.is_allowed("client") is True
+        assert second.is_allowed("client") is True
+        assert first.is_allowed("client") is True
+        assert second.is_allowed("client") is False
+        assert first.get_remaining("client") == 0
+        allowed, retry_after = first.try_acquire("client")
+        assert allowed is False and 0 < retry_after <= 1.0
+        assert second.is_allowed("other") is True
+
+        second.reset("client")
+        assert first.is_allowed("client") is True
+
+    def test_lease_is_spent_locally_and_given_back(self, tmp_path: Path) -> None:
+        """Leased tokens leave the shared bucket at once and return when the lease expires"""
+        path = str(tmp_path / "rl.sqlite3")
+        now = [1000.0]
+        leasing = SQLiteRateLimiterBackend(path, lease_size=4, lease_ttl=1.0, clock=lambda: now[0])
+        other = SQLiteRateLimiterBackend(path, clock=lambda: now[0])
+
+        # burst=5, no refill to speak of: one transaction takes 4 tokens
+        assert leasing.consume("client", 5.0, 1e-6) == (True, 0.0)
+        assert other.available("client", 5.0, 1e-6) == pytest.approx(1.0)
+        assert leasing.available("client", 5.0, 1e-6) == pytest.approx(4.0)
+        assert other.consume("client", 5.0, 1e-6)[0] is True
+        assert other.consume("client", 5.0, 1e-6)[0] is False
+        for _ in range(2):
+            assert leasing.consume("client", 5.0, 1e-6)[0] is True
+
+        # One token left in the expired lease goes back to the shared bucket
+        now[0] += 2.0
+        assert leasing.consume("client", 5.0, 1e-6)[0] is True
+        assert leasing.consume("client", 5.0, 1e-6)[0] is False
+        assert leasing.get_stats()["leased_clients"] == 0
+
+    def test_cleanup_drops_refilled_buckets(self, tmp_path: Path) -> None:
+        now = [1000.0]
+        backend = SQLiteRateLimiterBackend(str(tmp_path / "rl.sqlite3"), lease_size=2, cleanup_interval=10.0, clock=lambda: now[0])
+        for i in range(20):
+            backend.consume(f"idle-{i}", 5.0, 1.0)
+        assert backend.get_stats()["active_clients"] == 20
+        assert backend.get_stats()["leased_clients"] == 20
+
+        now[0] += 11.0
+        backend.consume("busy", 5.0, 1.0)
+        assert backend.get_stats()["active_clients"] == 1
+        assert backend.get_stats()["leased_clients"] == 1
+
+    def test_global_limit_holds_across_processes(self, tmp_path: Path) -> None:
+        """Four worker processes together never get more than one burst"""
+        ctx = multiprocessing.get_context("spawn")
+
+        def run(backend_name: str) -> int:
+            path = str(tmp_path / f"{backend_name}.sqlite3")
+            SQLiteRateLimiterBackend(path)  # Create the schema before the race
+            start = ctx.Event()
+            allowed: multiprocessing.Queue[int] = ctx.Queue()
+            workers = [ctx.Process(target=_spend_shared_budget, args=(path, backend_name, start, allowed)) for _ in range(4)]
+            for worker in workers:
+                worker.start()
+            start.set()
+            total = sum(allowed.get(timeout=60) for _ in workers)
+            for worker in workers:
+                worker.join(timeout=60)
+                assert worker.exitcode == 0
+            return total
+
+        # 20 tokens of burst; the run is far too short to refill another (1/min)
+        assert run("sqlite") == 20
+        # Per-process buckets: every worker gets its own burst
+        assert run("memory") == 80
+
+    def test_selected_by_config(self, tmp_path: Path) -> None:
+        config = SecurityConfig(
+            rate_limit_enabled=True, rate_limit_backend="sqlite", rate_limit_sqlite_path=str(tmp_path / "rl.sqlite3"), rate_limit_lease_size=2
+        )
+        assert config.validate() == []
+        middleware = SecurityMiddleware(config)
+        assert middleware.get_stats()["rate_limiter"]["backend"] == "sqlite"
+        assert middleware.get_stats()["rate_limiter"]["lease_size"] == 2
+
+        with patch.dict(os.environ, {"SECURITY_RATE_LIMIT_BACKEND": "Redis"}):
+            config = SecurityConfig.from_env()
+        assert config.rate_limit_backend == "redis"
+        assert any("Unknown rate limit backend" in warning for warning in config.validate())
+
 
 class TestAPIAuthenticator:
     """Tests for APIAuthenticator"""
@@ -301,6 +472,82 @@ class TestAPIAuthenticator:
         assert APIAuthenticator._mask_key("abcd1234wxyz5678") == "abcd****5678"
         assert APIAuthenticator._mask_key("short") == "****"
 
+    def test_hundreds_of_keys_use_hash_table(self) -> None:
+        """Verification is a digest lookup, independent of how many keys exist"""
+        keys = [f"integration-{i:04d}-secret" for i in range(500)]
+        auth = APIAuthenticator(api_keys=keys, cache_ttl=0)
+
+        assert auth.get_stats()["keys_configured"] == 500
+        assert all(auth.is_valid(key) for key in keys[::50])
+        assert auth.is_valid("integration-9999-secret") is False
+        assert auth.authenticate(keys[7]).api_key_id == "inte****cret"
+
+    def test_remove_key_invalidates_cache(self) -> None:
+        """Removed keys must not be served from the positive cache"""
+        auth = APIAuthenticator(api_keys=["rotating-key-1234"])
+        assert auth.is_valid("rotating-key-1234") is True
+        assert auth.remove_key("rotating-key-1234") is True
+        assert auth.is_valid("rotating-key-1234") is False
+        assert auth.remove_key("rotating-key-1234") is False
+
+    def test_positive_cache_ttl(self) -> None:
+        """Verified keys are cached for cache_ttl seconds"""
+        now = [100.0]
+        auth = APIAuthenticator(api_keys=["cached-key-1234"], cache_ttl=30.0, clock=lambda: now[0])
+        assert auth.is_valid("cached-key-1234") is True
+        assert auth.get_stats()["cached_keys"] == 1
+
+        # Bypass remove_key() (which clears the cache) to observe the cache alone
+        auth._key_hashes = {}
+        now[0] += 29.0
+        assert auth.is_valid("cached-key-1234") is True
+        now[0] += 2.0
+        assert auth.is_valid("cached-key-1234") is False
+
+    def test_key_file_hot_reload(self, tmp_path: Path) -> None:
+        """Key file edits are picked up after reload_interval without a restart"""
+        hashed = "hashed-only-key-5678"
+        key_file = tmp_path / "api_keys.txt"
+        key_file.write_text(f"# integrations\nfile-key-00000001\nsha256:{hashlib.sha256(hashed.encode()).hexdigest()}\nshort\n")
+        now = [0.0]
+        auth = APIAuthenticator(api_keys=["inline-key-1234"], key_file=str(key_file), reload_interval=5.0, clock=lambda: now[0])
+
+        assert auth.is_valid("file-key-00000001") is True
+        masked_id = auth.authenticate(hashed).api_key_id
+        assert masked_id is not None and masked_id.startswith("sha256:")
+        assert auth.is_valid("short") is False
+
+        key_file.write_text("file-key-00000002\n")
+        os.utime(key_file, ns=(time.time_ns(), time.time_ns() + 1_000_000_000))
+        now[0] += 1.0
+        assert auth.is_valid("file-key-00000001") is True  # not checked again yet
+        now[0] += 5.0
+        assert auth.is_valid("file-key-00000001") is False
+        assert auth.is_valid("file-key-00000002") is True
+        assert auth.is_valid("inline-key-1234") is True  # inline keys survive reloads
+
+    def test_unreadable_key_file_keeps_current_keys(self, tmp_path: Path) -> None:
+        """A failed reload must not lock everyone out"""
+        key_file = tmp_path / "api_keys.txt"
+        key_file.write_text("file-key-00000001\n")
+        auth = APIAuthenticator(key_file=str(key_file))
+        key_file.unlink()
+
+        assert auth.reload_keys() is False
+        assert auth.is_valid("file-key-00000001") is True
+
+    def test_key_file_from_config(self, tmp_path: Path) -> None:
+        """SECURITY_API_KEY_FILE wires the key file into the middleware"""
+        key_file = tmp_path / "api_keys.txt"
+        key_file.write_text("file-key-00000001\n")
+        with patch.dict(os.environ, {"SECURITY_AUTH_ENABLED": "true", "SECURITY_API_KEY_FILE": str(key_file)}, clear=True):
+            config = SecurityConfig.from_env()
+
+        assert config.has_api_key_source() is True
+        assert config.validate() == []
+        middleware = SecurityMiddleware(config)
+        assert middleware.check_request(headers={"X-API-Key": "file-key-00000001"}).api_key_id == "file****0001"
+
 
 class TestSecurityMiddleware:
     """Tests for SecurityMiddleware"""
@@ -446,5 +693,101 @@ class TestSecurityIntegration:
         assert ctx.api_key_id is not None
 
 
+def _downstream_app(calls: list[str]) -> Starlette:
+    async def endpoint(request: Request) -> JSONResponse:
+        calls.append(request.url.path)
+        return JSONResponse({"api_key_id": request.state.api_key_id if hasattr(request.state, "api_key_id") else None})
+
+    return Starlette(routes=[Route("/{path:path}", endpoint, methods=["GET", "POST"])])
+
+
+class TestASGISecurityMiddleware:
+    """Tests for ASGISecurityMiddleware (enforcement on real ASGI apps)"""
+
+    API_KEY = "test-api-key-0123456789"
+
+    def make_client(self, config: SecurityConfig, calls: list[str], client: tuple[str, int] = ("10.0.0.1", 40000)) -> TestClient:
+        app = _downstream_app(calls)
+        app.add_middleware(ASGISecurityMiddleware, security=SecurityMiddleware(config))
+        return TestClient(app, client=client)
+
+    def test_disabled_passes_through(self) -> None:
+        calls: list[str] = []
+        client = self.make_client(SecurityConfig(), calls)
+        assert client.get("/api/v1/calculators").status_code == 200
+        assert calls == ["/api/v1/calculators"]
+
+    def test_missing_and_invalid_key_get_401(self) -> None:
+        calls: list[str] = []
+        client = self.make_client(SecurityConfig(auth_enabled=True, auth_api_keys=[self.API_KEY], log_auth_failures=False), calls)
+
+        missing = client.post("/mcp", content=b"x" * 1024)
+        assert missing.status_code == 401
+        assert missing.json()["error"] == "MISSING_API_KEY"
+        assert missing.headers["www-authenticate"].startswith("Bearer")
+        assert client.get("/sse", headers={"X-API-Key": "wrong-key-0000"}).json()["error"] == "INVALID_API_KEY"
+        assert calls == []
+
+    def test_valid_key_sources(self) -> None:
+        calls: list[str] = []
+        client = self.make_client(SecurityConfig(auth_enabled=True, auth_api_keys=[self.API_KEY]), calls)
+
+        assert client.get("/a", headers={"X-API-Key": self.API_KEY}).json()["api_key_id"] is not None
+        assert client.get("/b", headers={"Authorization": f"Bearer {self.API_KEY}"}).status_code == 200
+        assert client.get("/c", params={"api_key": self.API_KEY}).status_code == 200
+        assert calls == ["/a", "/b", "/c"]
+
+    def test_rate_limited_gets_429_with_headers(self) -> None:
+        calls: list[str] = []
+        client = self.make_client(SecurityConfig(rate_limit_enabled=True, rate_limit_requests_per_minute=60, rate_limit_burst=2), calls)
+
+        assert [client.get("/x").status_code for _ in range(3)] == [200, 200, 429]
+        rejected = client.get("/x")
+        assert rejected.status_code == 429
+        assert int(rejected.headers["retry-after"]) >= 1
+        assert rejected.headers["x-ratelimit-limit"] == "60"
+        assert rejected.headers["x-ratelimit-remaining"] == "0"
+        assert int(rejected.headers["x-ratelimit-reset"]) >= 1
+        assert rejected.json()["error"] == "RATE_LIMITED"
+        assert len(calls) == 2
+
+        # Other client addresses have their own buckets
+        other = self.make_client(SecurityConfig(rate_limit_enabled=True, rate_limit_burst=1), calls, client=("10.0.0.2", 40000))
+        assert other.get("/x").status_code == 200
+
+    def test_rate_limit_applies_before_auth(self) -> None:
+        calls: list[str] = []
+        config = SecurityConfig(rate_limit_enabled=True, rate_limit_burst=2, auth_enabled=True, auth_api_keys=[self.API_KEY], log_auth_failures=False)
+        client = self.make_client(config, calls)
+
+        first = client.get("/x", headers={"X-API-Key": "guess-000000"})
+        assert first.status_code == 401
+        assert first.headers["x-ratelimit-remaining"] == "1"
+        assert client.get("/x", headers={"X-API-Key": "guess-111111"}).status_code == 401
+        assert client.get("/x", headers={"X-API-Key": self.API_KEY}).status_code == 429
+
+    def test_exempt_paths(self) -> None:
+        calls: list[str] = []
+        client = self.make_client(SecurityConfig(auth_enabled=True, auth_api_keys=[self.API_KEY]), calls)
+        assert client.get("/health").status_code == 200
+        assert client.get("/ready").status_code == 200
+        assert client.get("/metrics").status_code == 401
+
+    def test_enforced_on_mcp_http_transports(self) -> None:
+        from src.infrastructure.mcp.config import McpServerConfig
+        from src.infrastructure.mcp.server import MedicalCalculatorServer
+
+        config = SecurityConfig(auth_enabled=True, auth_api_keys=[self.API_KEY], log_auth_failures=False)
+        server = MedicalCalculatorServer(config=McpServerConfig(host="0.0.0.0", port=8893), security_config=config)
+
+        with TestClient(server.mcp.sse_app()) as client:
+            assert client.get("/health").status_code == 200
+            assert client.get("/sse").status_code == 401
+            assert client.post("/messages/?session_id=x", json={}).status_code == 401
+        with TestClient(server.mcp.streamable_http_app()) as client:
+            assert client.post("/mcp", json={"jsonrpc": "2.0", "id": 1, "method": "ping"}).status_code == 401
+            assert client.get("/health", headers={"X-API-Key": self.API_KEY}).status_code == 200
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
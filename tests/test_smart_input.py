@@ -0,0 +1,148 @@
+"""
+Tests for IdentifierResolver
+
+Verifies the prebuilt resolver returns exactly what the original per-call
+resolve_identifier computed, memoizes raw inputs, and is rebuilt by the
+registry when calculators are registered.
+"""
+
+import random
+from collections.abc import Iterable
+
+import pytest
+
+from src.domain.registry.tool_registry import ToolRegistry
+from src.domain.services.calculators import CALCULATORS
+from src.shared.fuzzy_matching import closest_matches
+from src.shared.smart_input import (
+    IdentifierResolver,
+    ResolutionResult,
+    build_identifier_aliases,
+    get_identifier_resolver,
+    normalize_identifier,
+    resolve_identifier,
+)
+
+
+def _legacy_resolve(raw_value: str, candidates: Iterable[str], *, cutoff: float = 0.72) -> ResolutionResult:
+    """Reference implementation: the original per-call resolve_identifier."""
+    candidate_list = sorted(set(candidates))
+    normalized_raw = normalize_identifier(raw_value)
+    if not normalized_raw:
+        return ResolutionResult(raw_value=raw_value, normalized_value=normalized_raw)
+
+    raw_aliases = build_identifier_aliases(raw_value)
+    canonical_by_normalized = {normalize_identifier(candidate): candidate for candidate in candidate_list}
+    matched_exact = next((canonical_by_normalized[alias] for alias in raw_aliases if alias in canonical_by_normalized), None)
+    if matched_exact is not None:
+        return ResolutionResult(raw_value=raw_value, normalized_value=normalized_raw, resolved_value=matched_exact, matched_by="exact")
+
+    alias_map: dict[str, str] = {}
+    ambiguous_aliases: dict[str, set[str]] = {}
+    for canonical_candidate in candidate_list:
+        for alias in build_identifier_aliases(canonical_candidate):
+            if alias in alias_map and alias_map[alias] != canonical_candidate:
+                ambiguous_aliases.setdefault(alias, {alias_map[alias]}).add(canonical_candidate)
+                continue
+            alias_map[alias] = canonical_candidate
+
+    matched_alias = next((alias_map[alias] for alias in raw_aliases if alias in alias_map and alias not in ambiguous_aliases), None)
+    if matched_alias is not None:
+        return ResolutionResult(raw_value=raw_value, normalized_value=normalized_raw, resolved_value=matched_alias, matched_by="alias")
+
+    search_space = sorted(set(canonical_by_normalized) | set(alias_map))
+    close_keys: list[str] = []
+    for alias in sorted(raw_aliases):
+        for key in closest_matches(alias, search_space, limit=5, cutoff=cutoff):
+            if key not in close_keys:
+                close_keys.append(key)
+    suggestions: list[str] = []
+    for key in close_keys:
+        matched_candidate = canonical_by_normalized.get(key) or alias_map.get(key)
+        if matched_candidate and matched_candidate not in suggestions:
+            suggestions.append(matched_candidate)
+
+    ambiguous_values: set[str] = set()
+    for alias in raw_aliases:
+        ambiguous_values.update(ambiguous_aliases.get(alias, ()))
+    return ResolutionResult(
+        raw_value=raw_value,
+        normalized_value=normalized_raw,
+        suggestions=tuple(suggestions),
+        matched_by="fuzzy" if suggestions else "none",
+        ambiguous_matches=tuple(sorted(ambiguous_values)),
+    )
+
+
+@pytest.fixture(scope="module")
+def registry() -> ToolRegistry:
+    reg = ToolRegistry()
+    for calc_cls in CALCULATORS:
+        reg.register(calc_cls())
+    return reg
+
+
+def _typo(rng: random.Random, value: str) -> str:
+    chars = list(value)
+    position = rng.randrange(len(chars))
+    operation = rng.choice(("drop", "swap", "replace"))
+    if operation == "drop" and len(chars) > 1:
+        del chars[position]
+    elif operation == "swap" and position + 1 < len(chars):
+        chars[position], chars[position + 1] = chars[position + 1], chars[position]
+    else:
+        chars[position] = rng.choice("abcdefghijklmnopqrstuvwxyz")
+    return "".join(chars)
+
+
+class TestIdentifierResolverParity:
+    """Prebuilt resolver must match the original per-call implementation."""
+
+    def test_tool_ids_with_variants_and_typos(self, registry: ToolRegistry) -> None:
+        rng = random.Random(7)
+        tool_ids = registry.list_all_ids()
+        resolver = IdentifierResolver(tool_ids)
+        inputs = ["", "  ", "calculate_sofa", "SOFA Score", "gcs", "ckd-epi 2021", "nonexistent_tool"]
+        for tool_id in rng.sample(tool_ids, 40):
+            inputs.extend([tool_id, tool_id.upper().replace("_", " "), f"calculate_{tool_id}", _typo(rng, tool_id)])
+        for raw in inputs:
+            assert resolver.resolve(raw) == _legacy_resolve(raw, tool_ids), raw
+
+    def test_specialties_and_custom_cutoff(self, registry: ToolRegistry) -> None:
+        specialties = [specialty.value for specialty in registry.list_specialties()]
+        for cutoff in (0.5, 0.72, 0.9):
+            resolver = IdentifierResolver(specialties, cutoff=cutoff)
+            for raw in ["cardiology", "cardio", "nephrolgy", "critical care", "emergency_med", "pedatrics", "zz"]:
+                assert resolver.resolve(raw) == _legacy_resolve(raw, specialties, cutoff=cutoff), (raw, cutoff)
+
+    def test_ambiguous_aliases_are_reported(self) -> None:
+        candidates = ["wells_dvt", "wells_pe", "wells_score"]
+        assert IdentifierResolver(candidates).resolve("wells") == _legacy_resolve("wells", candidates)
+
+
+class TestIdentifierResolverCaching:
+    """LRU over raw inputs and shared resolvers per candidate set."""
+
+    def test_repeated_inputs_hit_lru(self) -> None:
+        resolver = IdentifierResolver(["sofa_score", "qsofa_score"], cache_size=8)
+        first = resolver.resolve("SOFA")
+        assert resolver.resolve("SOFA") is first
+        assert resolver.cache_info().hits == 1
+
+    def test_resolve_identifier_shares_resolver_per_candidate_set(self) -> None:
+        candidates = ["apache_ii", "sofa_score"]
+        assert get_identifier_resolver(candidates) is get_identifier_resolver(reversed(candidates))
+        assert get_identifier_resolver(candidates) is not get_identifier_resolver(candidates, cutoff=0.5)
+        assert resolve_identifier("sofa", candidates).resolved_value == "sofa_score"
+
+    def test_registry_rebuilds_resolver_on_register(self) -> None:
+        reg = ToolRegistry()
+        reg.register(CALCULATORS[0]())
+        resolver = reg.get_tool_resolver()
+        assert reg.get_tool_resolver() is resolver
+
+        second = CALCULATORS[1]()
+        reg.register(second)
+        rebuilt = reg.get_tool_resolver()
+        assert rebuilt is not resolver
+        assert rebuilt.resolve(second.tool_id).resolved_value == second.tool_id
@@ -0,0 +1,163 @@
+"""
+Tests for substring indexes and AutoDiscoveryEngine.search
+
+Verifies the Aho-Corasick automaton and n-gram index agree with brute-force
+substring tests, and that the compiled discovery search returns exactly what
+the original nested-scan implementation returned (scores, reasons, order;
+ties by tool_id whatever the hash seed).
+"""
+
+import os
+import random
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from src.domain.registry.auto_discovery import AutoDiscoveryEngine
+from src.domain.registry.substring_index import AhoCorasickAutomaton, ContainmentIndex, SubstringIndex
+from src.domain.registry.tool_registry import ToolRegistry
+from src.domain.services.calculators import CALCULATORS
+
+
+def _random_words(rng: random.Random, count: int, alphabet: str = "abcde") -> list[str]:
+    return ["".join(rng.choice(alphabet) for _ in range(rng.randint(1, 7))) for _ in range(count)]
+
+
+def _linear_search(engine: AutoDiscoveryEngine, query: str, limit: int = 10) -> list[tuple[str, float, list[str]]]:
+    """Reference implementation: the original nested-scan search(), with deterministic ties."""
+    query_words = sorted(set(re.findall(r"\b[a-z]{3,}\b", query.lower())))
+    scores: dict[str, tuple[float, list[str]]] = {}
+
+    def add_score(tool_id: str, points: float, reason: str) -> None:
+        current, reasons = scores.get(tool_id, (0.0, []))
+        scores[tool_id] = (current + points, reasons + [reason])
+
+    dimensions = (
+        (engine._by_condition, 3.0, "condition"),
+        (engine._by_domain, 2.0, "domain"),
+        (engine._by_keyword, 1.5, "keyword"),
+        (engine._by_param, 1.0, "param"),
+    )
+    for index, points, label in dimensions:
+        for word in query_words:
+            for key, tools in index.items():
+                if word in key or key in word:
+                    for tool_id in sorted(tools):
+                        add_score(tool_id, points, f"{label}:{key}")
+
+    for word in query_words:
+        if word in engine._by_question_word:
+            for tool_id in sorted(engine._by_question_word[word]):
+                add_score(tool_id, 0.5, f"question:{word}")
+
+    results = [(tid, score, reasons) for tid, (score, reasons) in scores.items() if score > 0]
+    results.sort(key=lambda x: (-x[1], x[0]))
+    return results[:limit]
+
+
+@pytest.fixture(scope="module")
+def engine() -> AutoDiscoveryEngine:
+    registry = ToolRegistry()
+    for calc_cls in CALCULATORS:
+        registry.register(calc_cls())
+    discovery = AutoDiscoveryEngine()
+    discovery.build_from_registry(registry)
+    return discovery
+
+
+class TestSubstringStructures:
+    """Randomized agreement with brute-force substring tests."""
+
+    def test_substring_index_matches_brute_force(self) -> None:
+        rng = random.Random(1234)
+        strings = _random_words(rng, 200)
+        index = SubstringIndex(strings)
+        for query in _random_words(rng, 300) + [""]:
+            expected = [i for i, text in enumerate(strings) if query in text]
+            assert sorted(index.find(query)) == expected, query
+
+    def test_automaton_matches_brute_force(self) -> None:
+        rng = random.Random(5678)
+        patterns = _random_words(rng, 150)
+        automaton = AhoCorasickAutomaton(patterns)
+        for text in _random_words(rng, 300):
+            expected = {i for i, pattern in enumerate(patterns) if pattern in text}
+            assert automaton.find(text) == expected, text
+
+    def test_automaton_empty_pattern_matches_everything(self) -> None:
+        automaton = AhoCorasickAutomaton(["", "ab"])
+        assert automaton.find("xyz") == {0}
+        assert automaton.find("xaby") == {0, 1}
+
+    def test_containment_index_is_bidirectional_in_key_order(self) -> None:
+        index = ContainmentIndex(["kidney", "aki", "renal", "acute kidney injury", "kid"])
+        assert index.matches("kidney") == [0, 3, 4]
+        assert index.matches("akis") == [1]
+        assert index.matches("xyz") == []
+
+
+class TestDiscoverySearchParity:
+    """Compiled search() must reproduce the original nested scans exactly."""
+
+    QUERIES = [
+        "sepsis",
+        "acute kidney injury in sepsis",
+        "renal function creatinine",
+        "heart failure risk",
+        "what is the bleeding risk for atrial fibrillation",
+        "pneumonia severity",
+        "pediatric dehydration",
+        "liver cirrhosis mortality",
+        "ab",
+        "",
+        "xyzzy nothing matches here",
+    ]
+
+    @pytest.mark.parametrize("query", QUERIES)
+    def test_fixed_queries(self, engine: AutoDiscoveryEngine, query: str) -> None:
+        actual = [(r.tool_id, r.score, r.match_reasons) for r in engine.search(query, limit=1000)]
+        assert actual == _linear_search(engine, query, limit=1000)
+
+    def test_sampled_queries_from_index_keys(self, engine: AutoDiscoveryEngine) -> None:
+        rng = random.Random(42)
+        vocabulary = sorted(set(engine._by_condition) | set(engine._by_keyword) | set(engine._by_param) | set(engine._by_domain))
+        for _ in range(100):
+            words = rng.sample(vocabulary, rng.randint(1, 3))
+            # Mix whole keys with fragments to exercise both containment directions
+            query = " ".join(word[: rng.randint(3, max(3, len(word)))] if rng.random() < 0.5 else word for word in words)
+            actual = [(r.tool_id, r.score, r.match_reasons) for r in engine.search(query, limit=20)]
+            assert actual == _linear_search(engine, query, limit=20), query
+
+    def test_find_tools_by_condition_matches_scan(self, engine: AutoDiscoveryEngine) -> None:
+        for condition in ["sepsis", "kidney", "aki", "heart_failure", "s", "nothing"]:
+            expected: set[str] = set()
+            for key, tools in engine._by_condition.items():
+                if condition in key or key in condition:
+                    expected.update(tools)
+            assert set(engine.find_tools_by_condition(condition)) == expected
+
+    def test_ranking_does_not_depend_on_hash_seed(self) -> None:
+        script = (
+            "import json; from src.domain.registry import ToolRegistry; from src.domain.registry.auto_discovery import AutoDiscoveryEngine;"
+            "from src.domain.services.calculators import CALCULATORS; registry = ToolRegistry()\n"
+            "for calc_cls in CALCULATORS: registry.register(calc_cls())\n"
+            "engine = AutoDiscoveryEngine(); engine.build_from_registry(registry)\n"
+            "queries = ['sepsis', 'renal function creatinine', 'liver cirrhosis mortality']\n"
+            "print(json.dumps([[(r.tool_id, r.score, r.match_reasons) for r in engine.search(q, 50)] for q in queries]"
+            " + [engine.find_tools_by_params(['age', 'creatinine'])]))"
+        )
+        outputs = [
+            subprocess.run(
+                [sys.executable, "-c", script],
+                capture_output=True,
+                text=True,
+                check=True,
+                cwd=Path(__file__).resolve().parents[1],
+                env={**os.environ, "PYTHONHASHSEED": seed},
+            ).stdout
+            for seed in ("1", "2")
+        ]
+        assert outputs[0] == outputs[1]
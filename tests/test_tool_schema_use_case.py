@@ -0,0 +1,81 @@
+"""
+Tests for ToolSchemaUseCase
+
+Schemas are built once per tool and flag combination, serialized ahead of
+time, and shared by the MCP get_tool_schema tool, the
+calculator://{tool_id}/info resource and the REST schema endpoint.
+"""
+
+import json
+from typing import Any
+
+import pytest
+
+from src.application.use_cases import ToolSchemaUseCase
+from src.application.use_cases.tool_schema_use_case import SCHEMA_VARIANTS, build_tool_schema
+from src.infrastructure.mcp.handlers.calculator_handler import CalculatorHandler
+from tests.conftest import FakeContext
+
+
+class MockMCP:
+    def __init__(self) -> None:
+        self.tools: dict[str, Any] = {}
+
+    def tool(self) -> Any:
+        def decorator(func: Any) -> Any:
+            self.tools[func.__name__] = func
+            return func
+
+        return decorator
+
+
+@pytest.fixture
+def use_case(registry: Any) -> ToolSchemaUseCase:
+    return ToolSchemaUseCase(registry)
+
+
+class TestToolSchemaUseCase:
+    def test_precompute_covers_every_variant(self, use_case: ToolSchemaUseCase, registry: Any) -> None:
+        assert use_case.precompute() == len(registry.list_all()) * len(SCHEMA_VARIANTS)
+        schema = use_case.get("ckd_epi_2021")
+        assert schema is not None
+        assert schema is use_case.get("ckd_epi_2021")
+
+    def test_serialized_forms_match_payload(self, use_case: ToolSchemaUseCase, registry: Any) -> None:
+        schema = use_case.get("ckd_epi_2021", include_references=False)
+        assert schema is not None
+        assert schema.payload == build_tool_schema(registry.get("ckd_epi_2021"), include_references=False)
+        assert json.loads(schema.json_bytes) == schema.payload
+        assert json.loads(schema.text) == schema.payload
+        assert "references" not in schema.payload
+        assert schema.payload["param_schemas"]["serum_creatinine"]["unit"] == "mg/dL"
+
+    def test_alias_is_resolved_but_not_cached(self, use_case: ToolSchemaUseCase) -> None:
+        use_case.precompute()
+        cached = len(use_case._schemas)
+        schema = use_case.get("sofa")
+        canonical = use_case.get("sofa_score")
+        assert schema is not None and canonical is not None
+        assert schema.payload["resolved_tool_id"] == "sofa_score"
+        assert "resolved_tool_id" not in canonical.payload
+        assert schema.etag != canonical.etag
+        assert len(use_case._schemas) == cached
+
+    def test_unknown_tool(self, use_case: ToolSchemaUseCase) -> None:
+        assert use_case.get("definitely_not_a_tool") is None
+
+
+class TestGetToolSchemaTool:
+    async def test_returns_precomputed_result(self, registry: Any) -> None:
+        mcp = MockMCP()
+        CalculatorHandler(mcp, registry)  # type: ignore[arg-type]
+        get_tool_schema = mcp.tools["get_tool_schema"]
+
+        result = await get_tool_schema("sofa_score", FakeContext(), include_references=False)
+        assert result.structuredContent["tool_id"] == "sofa_score"
+        assert "references" not in result.structuredContent
+        assert json.loads(result.content[0].text) == result.structuredContent
+
+        missing = await get_tool_schema("definitely_not_a_tool", FakeContext())
+        assert missing.structuredContent["success"] is False
+        assert json.loads(missing.content[0].text) == missing.structuredContent
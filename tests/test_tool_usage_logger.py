@@ -0,0 +1,269 @@
+"""
+Tests for the non-blocking ToolUsageLogger
+
+Callers only enqueue; a background writer serializes, aggregates and writes
+events in batches. A full queue drops (or briefly blocks) and counts what it
+drops, and flush()/close() write out everything still pending.
+"""
+
+import json
+import logging
+import threading
+from collections.abc import Iterable, Iterator, Mapping
+from typing import Any, Optional
+
+import pytest
+
+from src.application.dto import CalculateRequest
+from src.application.use_cases import CalculateUseCase
+from src.application.use_cases.calculate_use_case import CALCULATE_STAGES, STAGE_TIMING_ENV_VAR
+from src.domain.registry.tool_registry import ToolRegistry
+from src.infrastructure.logging import ToolUsageLogger
+
+
+class CollectingHandler(logging.Handler):
+    """Captures emitted JSON lines; optionally blocks until released."""
+
+    def __init__(self, gate: Optional[threading.Event] = None) -> None:
+        super().__init__()
+        self.lines: list[str] = []
+        self.gate = gate
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if self.gate is not None:
+            self.gate.wait(5)
+        self.lines.append(record.getMessage())
+
+
+def make_logger(monkeypatch: pytest.MonkeyPatch, **env: str) -> ToolUsageLogger:
+    ToolUsageLogger.reset_instance()
+    monkeypatch.setenv("TOOL_USAGE_LOGGING_ENABLED", "true")
+    monkeypatch.delenv("TOOL_USAGE_LOG_FILE", raising=False)
+    monkeypatch.setenv("TOOL_USAGE_FLUSH_INTERVAL", "60")
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
+    return ToolUsageLogger.get_instance()
+
+
+@pytest.fixture
+def handler() -> Iterator[CollectingHandler]:
+    # Close the shared instance first so events queued by other modules are not captured
+    ToolUsageLogger.reset_instance()
+    handler = CollectingHandler()
+    tool_logger = logging.getLogger("tool_usage")
+    tool_logger.addHandler(handler)
+    yield handler
+    tool_logger.removeHandler(handler)
+    ToolUsageLogger.reset_instance()
+
+
+class TestToolUsageLogger:
+    def test_events_are_written_by_background_writer(self, monkeypatch: pytest.MonkeyPatch, handler: CollectingHandler) -> None:
+        usage = make_logger(monkeypatch)
+        usage.record_tool_call("sofa_score", ["pao2_fio2_ratio", "platelets"], success=True, duration_ms=1.234)
+        usage.record_tool_call("sofa_score", ["platelets"], success=False, duration_ms=2.0, error_type="validation_error")
+
+        # Nothing is written on the calling thread; the writer sleeps until flushed
+        assert handler.lines == []
+        assert usage.flush()
+
+        events = [json.loads(line) for line in handler.lines]
+        assert [event["success"] for event in events] == [True, False]
+        assert events[0]["param_names"] == ["pao2_fio2_ratio", "platelets"]
+        assert events[0]["duration_ms"] == 1.23
+        assert events[1]["error_type"] == "validation_error"
+
+        stats = usage.get_statistics()
+        assert stats["total_calls"] == 2
+        assert stats["tool_error_rates"]["sofa_score"] == 50.0
+        assert stats["queue"]["written_events"] == 2
+        assert stats["queue"]["dropped_events"] == 0
+
+    def test_full_batch_wakes_writer(self, monkeypatch: pytest.MonkeyPatch, handler: CollectingHandler) -> None:
+        usage = make_logger(monkeypatch, TOOL_USAGE_BATCH_SIZE="4")
+        for _ in range(4):
+            usage.record_tool_call("gcs", ["eye", "verbal", "motor"], success=True, duration_ms=0.1)
+
+        for _ in range(100):
+            if len(handler.lines) == 4:
+                break
+            threading.Event().wait(0.01)
+        assert len(handler.lines) == 4
+
+    def test_drop_policy_counts_dropped_events(self, monkeypatch: pytest.MonkeyPatch, handler: CollectingHandler) -> None:
+        usage = make_logger(monkeypatch, TOOL_USAGE_QUEUE_SIZE="3", TOOL_USAGE_BATCH_SIZE="100")
+        for _ in range(5):
+            usage.record_tool_call("gcs", [], success=True, duration_ms=0.1)
+
+        assert usage.get_queue_statistics()["dropped_events"] == 2
+        assert usage.flush()
+        assert len(handler.lines) == 3
+
+    def test_block_policy_waits_for_writer(self, monkeypatch: pytest.MonkeyPatch, handler: CollectingHandler) -> None:
+        usage = make_logger(monkeypatch, TOOL_USAGE_QUEUE_SIZE="2", TOOL_USAGE_QUEUE_POLICY="block", TOOL_USAGE_BATCH_SIZE="100")
+        for _ in range(10):
+            usage.record_tool_call("gcs", [], success=True, duration_ms=0.1)
+
+        assert usage.flush()
+        assert len(handler.lines) == 10
+        assert usage.get_queue_statistics()["dropped_events"] == 0
+
+    def test_block_policy_drops_after_timeout(self, monkeypatch: pytest.MonkeyPatch, handler: CollectingHandler) -> None:
+        gate = threading.Event()
+        handler.gate = gate
+        usage = make_logger(
+            monkeypatch,
+            TOOL_USAGE_QUEUE_SIZE="1",
+            TOOL_USAGE_QUEUE_POLICY="block",
+            TOOL_USAGE_QUEUE_BLOCK_TIMEOUT="0.05",
+            TOOL_USAGE_BATCH_SIZE="1",
+        )
+        try:
+            # The writer takes the first event and stalls in the handler; the queue then fills up
+            for _ in range(4):
+                usage.record_tool_call("gcs", [], success=True, duration_ms=0.1)
+            assert usage.get_queue_statistics()["dropped_events"] >= 1
+        finally:
+            gate.set()
+        assert usage.flush()
+
+    def test_close_flushes_pending_events(self, monkeypatch: pytest.MonkeyPatch, handler: CollectingHandler) -> None:
+        usage = make_logger(monkeypatch)
+        for _ in range(3):
+            usage.record_tool_call("gcs", [], success=True, duration_ms=0.1)
+        usage.close()
+        assert len(handler.lines) == 3
+
+    def test_context_manager_tracks_session_workflow(self, monkeypatch: pytest.MonkeyPatch, handler: CollectingHandler) -> None:
+        usage = make_logger(monkeypatch)
+        usage.start_session("sess_test")
+        for tool_id in ("qsofa_score", "sofa_score"):
+            with usage.log_tool_call(tool_id, {"value": 1}) as ctx:
+                ctx.set_result(success=True)
+        session = usage.end_session()
+
+        assert session is not None and session.success_count == 2
+        assert usage.get_statistics()["common_workflows"] == {"qsofa_score->sofa_score": 1}
+        events = [json.loads(line) for line in handler.lines]
+        assert [(event["sequence_number"], event["previous_tool"]) for event in events] == [(0, None), (1, "qsofa_score")]
+
+    def test_latency_snapshot_per_tool_and_stage(self, monkeypatch: pytest.MonkeyPatch, handler: CollectingHandler) -> None:
+        usage = make_logger(monkeypatch)
+        for duration_ms in (1.0, 2.0, 3.0, 4.0):
+            usage.record_tool_call("sofa_score", [], success=True, duration_ms=duration_ms, stage_durations_ms={"calculate": duration_ms / 2})
+        usage.record_tool_call("gcs", [], success=True, duration_ms=10.0)
+
+        snapshot = usage.get_latency_snapshot()
+        assert snapshot["unit"] == "ms"
+        assert set(snapshot["windows"]) == {"1m", "5m", "1h", "all"}
+        window = snapshot["windows"]["1m"]
+        assert window["overall"]["count"] == 5
+        assert window["tools"]["sofa_score"]["count"] == 4
+        assert window["tools"]["sofa_score"]["max_ms"] == 4.0
+        assert window["tools"]["gcs"]["p99_ms"] == 10.0
+        assert window["stages"]["calculate"]["count"] == 4
+        assert usage.get_statistics()["avg_durations_ms"]["sofa_score"] == 2.5
+
+        only = usage.get_latency_snapshot(windows=("all",), tool_id="gcs")
+        assert list(only["windows"]) == ["all"]
+        assert list(only["windows"]["all"]["tools"]) == ["gcs"]
+        with pytest.raises(ValueError):
+            usage.get_latency_snapshot(windows=("2d",))
+
+    def test_stage_durations_are_logged_and_exported(self, monkeypatch: pytest.MonkeyPatch, handler: CollectingHandler) -> None:
+        usage = make_logger(monkeypatch)
+        usage.record_tool_call("sofa_score", [], success=True, duration_ms=2.0, stage_durations_ms={"match": 0.0004, "calculate": 1.5})
+        usage.record_tool_call("gcs", [], success=True, duration_ms=0.5)
+        usage.flush()
+
+        events = [json.loads(line) for line in handler.lines]
+        assert events[0]["stage_durations_ms"] == {"match": 0.0, "calculate": 1.5}
+        assert events[1]["stage_durations_ms"] is None
+        assert list(usage.get_latency_snapshot(windows=("all",), tool_id="gcs")["windows"]["all"]["stages"]) == []
+
+        metrics = usage.get_prometheus_metrics().splitlines()
+        assert "# TYPE medcalc_tool_call_duration_seconds histogram" in metrics
+        assert 'medcalc_tool_call_duration_seconds_bucket{tool_id="gcs",le="0.001"} 1' in metrics
+        assert 'medcalc_calculate_stage_duration_seconds_bucket{tool_id="sofa_score",stage="calculate",le="0.001"} 0' in metrics
+        assert 'medcalc_calculate_stage_duration_seconds_count{tool_id="sofa_score",stage="calculate"} 1' in metrics
+
+    def test_disabled_logger_records_nothing(self, monkeypatch: pytest.MonkeyPatch, handler: CollectingHandler) -> None:
+        usage = make_logger(monkeypatch, TOOL_USAGE_LOGGING_ENABLED="false")
+        usage.record_tool_call("gcs", [], success=True, duration_ms=0.1)
+        assert usage.get_statistics()["total_calls"] == 0
+        assert handler.lines == []
+
+
+class RecordingRecorder:
+    def __init__(self) -> None:
+        self.calls: list[dict[str, Any]] = []
+
+    def record_tool_call(
+        self,
+        tool_id: str,
+        param_names: Iterable[str],
+        *,
+        success: bool,
+        duration_ms: float,
+        category: str = "",
+        has_warnings: bool = False,
+        warning_types: Iterable[str] = (),
+        error_type: Optional[str] = None,
+        stage_durations_ms: Optional[Mapping[str, float]] = None,
+    ) -> None:
+        self.calls.append(
+            {
+                "tool_id": tool_id,
+                "param_names": list(param_names),
+                "success": success,
+                "category": category,
+                "error_type": error_type,
+                "duration_ms": duration_ms,
+                "stage_durations_ms": stage_durations_ms,
+            }
+        )
+
+
+class TestCalculateUseCaseUsageLogging:
+    def test_calls_are_recorded_without_values(self, registry: ToolRegistry) -> None:
+        recorder = RecordingRecorder()
+        use_case = CalculateUseCase(registry, usage_logger=recorder)
+
+        use_case.execute(CalculateRequest(tool_id="ckd_epi_2021", params={"serum_creatinine": 1.2, "age": 65, "sex": "female"}))
+        use_case.execute(CalculateRequest(tool_id="not_a_tool", params={"x": 1}))
+        use_case.execute(CalculateRequest(tool_id="ckd_epi_2021", params={}))
+
+        ok, missing, empty = recorder.calls
+        assert ok["success"] and ok["tool_id"] == "ckd_epi_2021"
+        assert ok["param_names"] == ["serum_creatinine", "age", "sex"]
+        assert ok["category"] == "nephrology"
+        assert ok["duration_ms"] > 0
+        assert "1.2" not in json.dumps([{k: v for k, v in call.items() if k != "duration_ms"} for call in recorder.calls])
+        assert (missing["success"], missing["error_type"]) == (False, "tool_not_found")
+        assert empty["error_type"] == "empty_params"
+        assert all(call["stage_durations_ms"] is None for call in recorder.calls)
+
+    def test_stage_timing_is_opt_in(self, registry: ToolRegistry, monkeypatch: pytest.MonkeyPatch) -> None:
+        recorder = RecordingRecorder()
+        monkeypatch.setenv(STAGE_TIMING_ENV_VAR, "true")
+        use_case = CalculateUseCase(registry, usage_logger=recorder)
+
+        response = use_case.execute(CalculateRequest(tool_id="ckd_epi_2021", params={"serum_creatinine": 1.2, "age": 65, "sex": "female"}))
+        use_case.execute(CalculateRequest(tool_id="ckd_epi_2021", params={}))
+
+        ok, empty = recorder.calls
+        assert tuple(ok["stage_durations_ms"]) == CALCULATE_STAGES
+        assert sum(ok["stage_durations_ms"].values()) <= ok["duration_ms"]
+        assert tuple(empty["stage_durations_ms"]) == ("resolve",)
+        assert "_timings" not in response.component_scores
+
+    def test_debug_timings_attach_to_one_response(self, registry: ToolRegistry) -> None:
+        use_case = CalculateUseCase(registry, stage_timing=False)
+        params = {"serum_creatinine": 1.2, "age": 65, "sex": "female"}
+
+        debug = use_case.execute(CalculateRequest(tool_id="ckd_epi_2021", params=params, debug_timings=True))
+        plain = use_case.execute(CalculateRequest(tool_id="ckd_epi_2021", params=params))
+
+        assert list(debug.component_scores["_timings"]) == [*CALCULATE_STAGES, "total"]
+        assert "_timings" not in plain.component_scores
+        assert debug.result == plain.result
@@ -20,6 +20,7 @@ from src.application.dto import (
 from src.application.use_cases import CalculateUseCase, DiscoveryUseCase
 from src.domain.registry import ToolRegistry
 from src.domain.services.calculators import CALCULATORS
+from src.shared.result_cache import ResultCache
 
 
 class TestCalculateUseCase:
@@ -322,6 +323,63 @@ class TestCalculateUseCase:
         assert response.success is True
 
 
+class TestCalculateResultCache:
+    """Test the opt-in result cache of CalculateUseCase"""
+
+    GCS_PARAMS = {"eye_response": 4, "verbal_response": 5, "motor_response": 6}
+
+    @pytest.fixture
+    def use_case(self, registry: Any) -> Any:
+        return CalculateUseCase(registry, result_cache=ResultCache(max_entries=16))
+
+    def test_repeated_call_is_served_from_cache(self, use_case: Any) -> None:
+        first = use_case.execute(CalculateRequest(tool_id="glasgow_coma_scale", params=self.GCS_PARAMS))
+        second = use_case.execute(CalculateRequest(tool_id="glasgow_coma_scale", params=dict(reversed(self.GCS_PARAMS.items()))))
+
+        assert second.to_dict() == first.to_dict()
+        assert second is not first
+        stats = use_case.result_cache.get_stats()
+        assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+
+    def test_hit_keeps_request_specific_fields(self, use_case: Any) -> None:
+        params = {
+            "respiratory_rate": 18,
+            "spo2": 96,
+            "on_supplemental_o2": False,
+            "temperature": 37.0,
+            "systolic_bp": 120,
+            "heart_rate": 80,
+            "consciousness": "A",
+        }
+        canonical = use_case.execute(CalculateRequest(tool_id="news2_score", params=params))
+        aliased = use_case.execute(CalculateRequest(tool_id="calculate-news2-score", params=params))
+        timed = use_case.execute(CalculateRequest(tool_id="news2_score", params=params, debug_timings=True))
+
+        assert use_case.result_cache.hits == 2
+        assert "_tool_resolved_from" not in canonical.component_scores
+        assert aliased.component_scores["_tool_resolved_from"] == "calculate-news2-score"
+        assert aliased.result == canonical.result
+        assert "_timings" in timed.component_scores
+        assert "_timings" not in use_case.execute(CalculateRequest(tool_id="news2_score", params=params)).component_scores
+
+    def test_failures_are_not_cached(self, use_case: Any) -> None:
+        request = CalculateRequest(tool_id="glasgow_coma_scale", params={"eye_response": 9, "verbal_response": 5, "motor_response": 6})
+        assert use_case.execute(request).success is False
+        assert use_case.execute(request).success is False
+        assert len(use_case.result_cache) == 0
+
+    def test_non_cacheable_calculator_opts_out(self, use_case: Any, monkeypatch: pytest.MonkeyPatch) -> None:
+        calculator = use_case._registry.get_calculator("glasgow_coma_scale")
+        monkeypatch.setattr(calculator, "cacheable", False)
+        use_case.execute(CalculateRequest(tool_id="glasgow_coma_scale", params=self.GCS_PARAMS))
+        use_case.execute(CalculateRequest(tool_id="glasgow_coma_scale", params=self.GCS_PARAMS))
+        assert use_case.result_cache.get_stats()["hits"] == 0
+        assert len(use_case.result_cache) == 0
+
+    def test_disabled_by_default(self, registry: Any) -> None:
+        assert CalculateUseCase(registry).result_cache is None
+
+
 class TestDiscoveryUseCase:
     """Test DiscoveryUseCase - tool discovery operations"""
 